@@ -1,6 +1,36 @@
-# Expose all Contracts Language API 400 types at the top level
-from .versions.version_400.common.types import *
+# Expose all Contracts Language API 400 types and the Smart and Supervisor Contracts 400 libs at
+# the top level. These are only imported when first accessed, so that tools and tests that use the
+# utils or another API version do not pay for importing them.
+import importlib
+from typing import Any, List
 
-# Expose Smart and Supervisor Contracts 400 libs at the top level
-from .versions.version_400.smart_contracts import lib as smart_contracts_lib
-from .versions.version_400.supervisor_contracts import lib as supervisor_contracts_lib
+_TYPES_MODULE = ".versions.version_400.common.types"
+_LIB_MODULES = {
+    "smart_contracts_lib": ".versions.version_400.smart_contracts.lib",
+    "supervisor_contracts_lib": ".versions.version_400.supervisor_contracts.lib",
+}
+# subpackages are found by the import system, so looking them up must not import the types
+_SUBPACKAGES = {"example_unit_tests", "utils", "versions"}
+
+
+def _public_type_names() -> List[str]:
+    types = importlib.import_module(_TYPES_MODULE, __name__)
+    return [name for name in dir(types) if not name.startswith("_")]
+
+
+def __getattr__(name: str) -> Any:
+    if name in _LIB_MODULES:
+        value = importlib.import_module(_LIB_MODULES[name], __name__)
+    elif name == "__all__":
+        value = [*_public_type_names(), *_LIB_MODULES]
+    elif not name.startswith("_") and name not in _SUBPACKAGES and name in _public_type_names():
+        value = getattr(importlib.import_module(_TYPES_MODULE, __name__), name)
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    # cache the value so that later lookups do not go through this function
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted({*globals(), *_public_type_names(), *_LIB_MODULES})
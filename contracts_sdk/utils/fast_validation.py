@@ -0,0 +1,47 @@
+"""
+Validated-construction fast path for Contracts API types.
+
+Type checks whose outcome only depends on the types of the checked values, such as the isinstance
+checks in types_utils.validate_type, are run once per combination of types and skipped for later
+instantiations. Checks that depend on the values themselves, such as non-empty strings or positive
+amounts, always run.
+
+The fast path is enabled by default. Set the CONTRACTS_SDK_DISABLE_FAST_VALIDATION environment
+variable, or call set_enabled(False), to run every check on every instantiation.
+"""
+import os
+from typing import Any, Optional, Set, Tuple
+
+DISABLE_ENV_VAR = "CONTRACTS_SDK_DISABLE_FAST_VALIDATION"
+
+_enabled = not os.environ.get(DISABLE_ENV_VAR)
+_validated_type_signatures: Set[Tuple[Any, ...]] = set()
+
+
+def is_enabled() -> bool:
+    return _enabled
+
+
+def set_enabled(enabled: bool) -> None:
+    global _enabled
+    _enabled = enabled
+    _validated_type_signatures.clear()
+
+
+def type_signature(owner: Any, *values: Any) -> Optional[Tuple[Any, ...]]:
+    """
+    Returns the key identifying the types of the values checked by the owner, or None if the fast
+    path is disabled
+    """
+    if not _enabled:
+        return None
+    return (owner, *map(type, values))
+
+
+def is_validated(signature: Optional[Tuple[Any, ...]]) -> bool:
+    return signature is not None and signature in _validated_type_signatures
+
+
+def mark_validated(signature: Optional[Tuple[Any, ...]]) -> None:
+    if signature is not None:
+        _validated_type_signatures.add(signature)
@@ -0,0 +1,173 @@
+import hashlib
+import importlib
+import inspect
+import os
+import pickle
+import stat
+import sys
+import tempfile
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+from . import symbols
+from .types_utils import DecoratorSpec, FixedValueSpec, NativeObjectSpec
+
+SDK_DIR = Path(__file__).resolve().parent.parent
+CACHE_DIR_ENV_VAR = "CONTRACTS_SDK_SPEC_CACHE_DIR"
+
+
+def default_cache_dir() -> str:
+    """
+    The current user's cache directory. Persisted specs are unpickled, so they are never kept in
+    a directory that other users can write to, such as the system temporary directory
+    """
+    cache_home = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return os.path.join(cache_home, "contracts_sdk", "spec_cache")
+
+
+@lru_cache(maxsize=1)
+def source_fingerprint() -> str:
+    """
+    Hash of the source code that the specs are generated from and of the interpreter that pickles
+    them, so that persisted specs are invalidated whenever any type or the interpreter changes
+    """
+    digest = hashlib.sha256()
+    digest.update(f"{sys.implementation.cache_tag}:{pickle.HIGHEST_PROTOCOL}".encode())
+    for path in sorted((SDK_DIR / "versions").rglob("*.py")) + [
+        SDK_DIR / "utils" / "symbols.py",
+        SDK_DIR / "utils" / "types_utils.py",
+    ]:
+        digest.update(str(path.relative_to(SDK_DIR)).encode())
+        digest.update(path.read_bytes())
+    return digest.hexdigest()
+
+
+def _version_types(version: str, executor_type: str) -> Dict[str, Any]:
+    versions_package = ".".join(__package__.split(".")[:-1]) + ".versions"
+    contract_lib = importlib.import_module(
+        f".version_{version}.{executor_type}.lib", versions_package
+    )
+    if hasattr(contract_lib, "types_registry"):
+        return contract_lib.types_registry()
+
+    # Contracts Language v4+ types are plain python classes rather than a registry
+    types = importlib.import_module(f".version_{version}.common.types", versions_package)
+    return {
+        name: item
+        for module in [types, contract_lib]
+        for name, item in vars(module).items()
+        if not name.startswith("_") and inspect.isclass(item) and hasattr(item, "_spec")
+    }
+
+
+def _is_private(path: Path) -> bool:
+    """
+    Whether the path is a directory that is owned by, and only writable by, the current user
+    """
+    try:
+        path_stat = path.lstat()
+    except OSError:
+        return False
+    if not stat.S_ISDIR(path_stat.st_mode):
+        return False
+    if hasattr(os, "getuid") and path_stat.st_uid != os.getuid():
+        return False
+    return not path_stat.st_mode & (stat.S_IWGRP | stat.S_IWOTH)
+
+
+def generate_specs(
+    version: str,
+    executor_type: str = "smart_contracts",
+    language_code: int = symbols.Languages.ENGLISH,
+) -> Dict[str, Any]:
+    """
+    Generates the spec of every type in an API version that defines its own spec. Native objects,
+    decorators and fixed values are excluded, as they are specs already.
+    :param version: the API version, e.g. "3100" or "400"
+    :param executor_type: one of smart_contracts, supervisor_contracts or contract_modules
+    :param language_code: the language of the spec docstrings
+    :return: map of type name to spec
+    """
+    specs = {}
+    for item in _version_types(version, executor_type).values():
+        if isinstance(item, (DecoratorSpec, FixedValueSpec, NativeObjectSpec)) or not hasattr(
+            item, "_spec"
+        ):
+            continue
+        if "language_code" in inspect.signature(item._spec).parameters:
+            spec = item._spec(language_code=language_code)  # noqa: SLF001
+        else:
+            spec = item._spec()  # noqa: SLF001
+        specs[spec.name] = spec
+    return specs
+
+
+class SpecRegistry:
+    """
+    Provides the specs of every type in an API version, generating them once per version,
+    executor type and language. Generated specs are persisted to disk keyed on the hash of the
+    contracts_sdk source, so later processes can load them without importing the version.
+    Entries are only loaded from a cache directory that is owned by, and only writable by, the
+    current user. Otherwise specs are regenerated in each process.
+    """
+
+    def __init__(self, cache_dir: Optional[str] = None):
+        self.cache_dir = Path(cache_dir or os.environ.get(CACHE_DIR_ENV_VAR) or default_cache_dir())
+        self._specs: Dict[Tuple[str, str, int], Dict[str, Any]] = {}
+
+    def _entry_path(self, version: str, executor_type: str, language_code: int) -> Path:
+        return self.cache_dir / (
+            f"{version}_{executor_type}_{language_code}_{source_fingerprint()}.pickle"
+        )
+
+    def get_specs(
+        self,
+        version: str,
+        executor_type: str = "smart_contracts",
+        language_code: int = symbols.Languages.ENGLISH,
+    ) -> Dict[str, Any]:
+        """
+        Returns the specs of every type in an API version, as per generate_specs. The returned
+        specs are shared and must not be modified.
+        """
+        key = (version, executor_type, language_code)
+        if key not in self._specs:
+            entry_path = self._entry_path(version, executor_type, language_code)
+            specs = self._load(entry_path) if _is_private(self.cache_dir) else None
+            if specs is None:
+                specs = generate_specs(version, executor_type, language_code)
+                self._save(entry_path, specs)
+            self._specs[key] = specs
+        return self._specs[key]
+
+    def get_spec(
+        self,
+        version: str,
+        name: str,
+        executor_type: str = "smart_contracts",
+        language_code: int = symbols.Languages.ENGLISH,
+    ) -> Any:
+        return self.get_specs(version, executor_type, language_code)[name]
+
+    @staticmethod
+    def _load(entry_path: Path) -> Optional[Dict[str, Any]]:
+        try:
+            with open(entry_path, "rb") as entry_file:
+                return pickle.load(entry_file)
+        except (OSError, pickle.UnpicklingError, EOFError, AttributeError, ImportError):
+            return None
+
+    def _save(self, entry_path: Path, specs: Dict[str, Any]) -> None:
+        try:
+            self.cache_dir.mkdir(mode=0o700, parents=True, exist_ok=True)
+            if not _is_private(self.cache_dir):
+                return
+            # write to a temporary file first so that readers never see partially written entries
+            fd, temp_path = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+            with os.fdopen(fd, "wb") as temp_file:
+                pickle.dump(specs, temp_file)
+            os.replace(temp_path, entry_path)
+        except OSError:
+            # the on-disk cache is an optimisation only, e.g. the directory may be read-only
+            pass
@@ -0,0 +1,240 @@
+import logging
+import timeit
+import unittest
+from datetime import datetime
+from decimal import Decimal
+from typing import Any, Callable
+from zoneinfo import ZoneInfo
+
+from .. import fast_validation
+from ..exceptions import InvalidSmartContractError, StrongTypingError
+from ...versions.version_400.common.types import (
+    BalanceCoordinate,
+    CalendarEvent,
+    CustomInstruction,
+    Next,
+    Phase,
+    Posting,
+    RelativeDateTime,
+    Shift,
+    TransactionCode,
+)
+
+log = logging.getLogger(__name__)
+
+UTC_DATETIME = datetime(2023, 1, 1, tzinfo=ZoneInfo("UTC"))
+NUMBER = 2000
+
+
+def _posting(**kwargs: Any) -> Posting:
+    return Posting(
+        **{
+            "credit": True,
+            "amount": Decimal("1"),
+            "denomination": "GBP",
+            "account_id": "account",
+            "account_address": "DEFAULT",
+            "asset": "COMMERCIAL_BANK_MONEY",
+            "phase": Phase.COMMITTED,
+            **kwargs,
+        }
+    )
+
+
+class FastValidationTestCase(unittest.TestCase):
+    enabled = True
+
+    def setUp(self):
+        initially_enabled = fast_validation.is_enabled()
+        fast_validation.set_enabled(self.enabled)
+        self.addCleanup(fast_validation.set_enabled, initially_enabled)
+
+
+class FastValidationTest(FastValidationTestCase):
+    def test_type_signature_is_none_when_disabled(self):
+        fast_validation.set_enabled(False)
+
+        self.assertIsNone(fast_validation.type_signature(Shift, 1, None))
+
+    def test_validated_signature_is_recorded(self):
+        signature = fast_validation.type_signature(Shift, 1, None)
+        self.assertFalse(fast_validation.is_validated(signature))
+
+        fast_validation.mark_validated(signature)
+
+        self.assertTrue(fast_validation.is_validated(signature))
+        self.assertTrue(
+            fast_validation.is_validated(fast_validation.type_signature(Shift, 5, None))
+        )
+        self.assertFalse(fast_validation.is_validated(fast_validation.type_signature(Shift, 1, 1)))
+
+    def test_set_enabled_clears_validated_signatures(self):
+        signature = fast_validation.type_signature(Shift, 1, None)
+        fast_validation.mark_validated(signature)
+
+        fast_validation.set_enabled(True)
+
+        self.assertFalse(fast_validation.is_validated(signature))
+
+
+class ValidatedConstructionTest(FastValidationTestCase):
+    """
+    Checks that invalid arguments are still rejected after valid instances of the same type have
+    been constructed
+    """
+
+    def test_posting_phase_is_converted(self):
+        _posting()
+
+        self.assertEqual(_posting(phase="committed").phase, Phase.COMMITTED)
+
+    def test_posting_invalid_phase_raises(self):
+        _posting()
+
+        with self.assertRaises(StrongTypingError) as ctx:
+            _posting(phase="invalid")
+        self.assertEqual(str(ctx.exception), "'phase' must be set to a Phase value")
+
+    def test_posting_value_checks_still_run(self):
+        _posting()
+
+        with self.assertRaises(InvalidSmartContractError) as ctx:
+            _posting(amount=Decimal("0"))
+        self.assertEqual(str(ctx.exception), "Amount must be greater than 0, 0")
+
+    def test_custom_instruction_invalid_posting_raises(self):
+        CustomInstruction(postings=[_posting(), _posting(credit=False)])
+
+        with self.assertRaises(StrongTypingError) as ctx:
+            CustomInstruction(postings=[_posting(), "posting"])
+        self.assertEqual(
+            str(ctx.exception),
+            "'CustomInstruction.postings[1]' expected Posting, got 'posting' of type str",
+        )
+
+    def test_custom_instruction_invalid_instruction_details_raises(self):
+        CustomInstruction(postings=[_posting()], instruction_details={"key": "value"})
+
+        with self.assertRaises(StrongTypingError) as ctx:
+            CustomInstruction(postings=[_posting()], instruction_details=[("key", "value")])
+        self.assertEqual(
+            str(ctx.exception),
+            "'CustomInstruction.instruction_details' expected Dict[str, str] if populated, "
+            "got '[('key', 'value')]' of type list",
+        )
+
+    def test_custom_instruction_empty_postings_raises(self):
+        CustomInstruction(postings=[_posting()])
+
+        with self.assertRaises(InvalidSmartContractError) as ctx:
+            CustomInstruction(postings=[])
+        self.assertEqual(
+            str(ctx.exception), "'CustomInstruction.postings' must be a non empty list, got []"
+        )
+
+    def test_shift_invalid_type_raises(self):
+        Shift(days=1)
+
+        with self.assertRaises(StrongTypingError) as ctx:
+            Shift(days=True)
+        self.assertEqual(
+            str(ctx.exception), "'Shift.days' expected int if populated, got 'True' of type bool"
+        )
+
+    def test_relative_date_time_invalid_find_raises(self):
+        RelativeDateTime(shift=Shift(days=1), find=Next(day=1))
+
+        with self.assertRaises(StrongTypingError) as ctx:
+            RelativeDateTime(shift=Shift(days=1), find=Shift(days=1))
+        self.assertEqual(
+            str(ctx.exception),
+            "'RelativeDateTime.find' expected Union[Next, Previous, Override] if populated, "
+            "got 'Shift'",
+        )
+
+    def test_relative_date_time_value_checks_still_run(self):
+        RelativeDateTime(shift=Shift(days=1))
+
+        with self.assertRaises(InvalidSmartContractError):
+            RelativeDateTime()
+
+    def test_calendar_event_non_utc_datetime_raises(self):
+        CalendarEvent(
+            id="id", calendar_id="calendar", start_datetime=UTC_DATETIME, end_datetime=UTC_DATETIME
+        )
+
+        with self.assertRaises(InvalidSmartContractError) as ctx:
+            CalendarEvent(
+                id="id",
+                calendar_id="calendar",
+                start_datetime=UTC_DATETIME,
+                end_datetime=datetime(2023, 1, 1, tzinfo=ZoneInfo("Europe/London")),
+            )
+        self.assertEqual(
+            str(ctx.exception),
+            "'end_datetime' of CalendarEvent must have timezone UTC, currently Europe/London.",
+        )
+
+
+class ValidatedConstructionDisabledTest(ValidatedConstructionTest):
+    enabled = False
+
+
+class FastValidationBenchmarkTest(unittest.TestCase):
+    """
+    Times constructing each hot type with the fast path disabled and enabled
+    """
+
+    def _benchmark(self, name: str, construct: Callable[[], Any]) -> None:
+        timings = {}
+        initially_enabled = fast_validation.is_enabled()
+        try:
+            for enabled in [False, True]:
+                fast_validation.set_enabled(enabled)
+                timings[enabled] = min(timeit.repeat(construct, number=NUMBER, repeat=3))
+        finally:
+            fast_validation.set_enabled(initially_enabled)
+        log.info(
+            f"{name}: {timings[False] / NUMBER * 1e6:.3f}us without fast validation, "
+            f"{timings[True] / NUMBER * 1e6:.3f}us with fast validation"
+        )
+
+    def test_benchmark_posting(self):
+        self._benchmark("Posting", _posting)
+
+    def test_benchmark_custom_instruction(self):
+        postings = [_posting(), _posting(credit=False)] * 10
+        transaction_code = TransactionCode(domain="A", family="B", subfamily="C")
+        self._benchmark(
+            "CustomInstruction",
+            lambda: CustomInstruction(
+                postings=postings,
+                instruction_details={"description": "accrual"},
+                transaction_code=transaction_code,
+            ),
+        )
+
+    def test_benchmark_balance_coordinate(self):
+        self._benchmark(
+            "BalanceCoordinate",
+            lambda: BalanceCoordinate("DEFAULT", "COMMERCIAL_BANK_MONEY", "GBP", Phase.COMMITTED),
+        )
+
+    def test_benchmark_shift(self):
+        self._benchmark("Shift", lambda: Shift(months=1, days=1))
+
+    def test_benchmark_relative_date_time(self):
+        shift = Shift(days=1)
+        find = Next(day=1)
+        self._benchmark("RelativeDateTime", lambda: RelativeDateTime(shift=shift, find=find))
+
+    def test_benchmark_calendar_event(self):
+        self._benchmark(
+            "CalendarEvent",
+            lambda: CalendarEvent(
+                id="id",
+                calendar_id="calendar",
+                start_datetime=UTC_DATETIME,
+                end_datetime=UTC_DATETIME,
+            ),
+        )
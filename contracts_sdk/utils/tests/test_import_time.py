@@ -0,0 +1,104 @@
+import logging
+import os
+import subprocess
+import sys
+import unittest
+
+log = logging.getLogger(__name__)
+
+# the directory containing the contracts_sdk package
+ROOT_DIR = os.path.dirname(
+    os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+)
+ENTRY_POINTS = [
+    "contracts_sdk",
+    "contracts_sdk.utils.tools",
+    "contracts_sdk.versions.version_3100.smart_contracts.lib",
+    "contracts_sdk.versions.version_3100.supervisor_contracts.lib",
+    "contracts_sdk.versions.version_400.smart_contracts.lib",
+    "contracts_sdk.versions.version_400.supervisor_contracts.lib",
+]
+REPEAT = 3
+
+
+def _run_in_subprocess(code: str) -> str:
+    # a fresh interpreter is needed, as modules imported by this process are cached
+    return subprocess.run(
+        [sys.executable, "-c", code],
+        cwd=ROOT_DIR,
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout.strip()
+
+
+def _loaded_versions(module: str) -> set[str]:
+    output = _run_in_subprocess(
+        f"import sys; import {module}; "
+        "print(' '.join({name.split('.')[2] for name in sys.modules "
+        "if name.startswith('contracts_sdk.versions.version_')}))"
+    )
+    return set(output.split())
+
+
+class LazyVersionLoadingTest(unittest.TestCase):
+    def test_importing_package_does_not_load_any_version(self):
+        self.assertEqual(_loaded_versions("contracts_sdk"), set())
+
+    def test_importing_tools_does_not_load_any_version(self):
+        self.assertEqual(_loaded_versions("contracts_sdk.utils.tools"), set())
+
+    def test_importing_version_lib_does_not_load_later_versions(self):
+        # each version builds on the types of the versions before it
+        loaded_versions = _loaded_versions(
+            "contracts_sdk.versions.version_3100.smart_contracts.lib"
+        )
+
+        self.assertIn("version_3100", loaded_versions)
+        self.assertNotIn("version_3110", loaded_versions)
+        self.assertNotIn("version_3120", loaded_versions)
+        self.assertNotIn("version_400", loaded_versions)
+
+    def test_top_level_types_are_version_400_types(self):
+        import contracts_sdk
+        from contracts_sdk.versions.version_400.common import types
+        from contracts_sdk.versions.version_400.smart_contracts import lib
+
+        self.assertIs(contracts_sdk.Balance, types.Balance)
+        self.assertIs(contracts_sdk.DEFAULT_ADDRESS, types.DEFAULT_ADDRESS)
+        self.assertIs(contracts_sdk.smart_contracts_lib, lib)
+
+    def test_star_import_exposes_types_and_libs(self):
+        namespace: dict = {}
+        exec("from contracts_sdk import *", namespace)
+
+        self.assertIn("BalanceDefaultDict", namespace)
+        self.assertIn("requires", namespace)
+        self.assertIn("supervisor_contracts_lib", namespace)
+
+    def test_unknown_attribute_raises_attribute_error(self):
+        import contracts_sdk
+
+        with self.assertRaises(AttributeError) as ctx:
+            contracts_sdk.NotAType
+
+        self.assertEqual(str(ctx.exception), "module 'contracts_sdk' has no attribute 'NotAType'")
+
+
+class ImportTimeBenchmarkTest(unittest.TestCase):
+    """
+    Measures the time taken to import each entry point in a fresh interpreter
+    """
+
+    def test_benchmark_import_time(self):
+        for module in ENTRY_POINTS:
+            timings = [
+                float(
+                    _run_in_subprocess(
+                        "import time; start = time.perf_counter(); "
+                        f"import {module}; print(time.perf_counter() - start)"
+                    )
+                )
+                for _ in range(REPEAT)
+            ]
+            log.info(f"import {module}: best {min(timings) * 1000:.3f}ms over {REPEAT} repeats")
@@ -0,0 +1,140 @@
+import os
+import stat
+import tempfile
+import unittest
+from typing import Any
+from unittest import mock
+
+from .. import spec_registry
+
+VERSIONS_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__))), "versions")
+EXECUTOR_TYPES = ["smart_contracts", "supervisor_contracts", "contract_modules"]
+
+
+def _comparable(value: Any) -> Any:
+    # specs do not define equality, so they are compared on their type and attributes
+    if isinstance(value, dict):
+        return {key: _comparable(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_comparable(item) for item in value]
+    if hasattr(value, "__dict__") and not isinstance(value, type):
+        return (type(value).__qualname__, _comparable(vars(value)))
+    return value
+
+
+def _version_executor_types() -> list[tuple[str, str]]:
+    return [
+        (version_dir[len("version_") :], executor_type)
+        for version_dir in sorted(os.listdir(VERSIONS_DIR))
+        if version_dir.startswith("version_")
+        for executor_type in EXECUTOR_TYPES
+        if os.path.exists(os.path.join(VERSIONS_DIR, version_dir, executor_type, "lib.py"))
+    ]
+
+
+class SpecRegistryTest(unittest.TestCase):
+    def setUp(self):
+        temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        self.cache_dir = temp_dir.name
+
+    def test_persisted_specs_match_live_generation(self):
+        # populate the on-disk cache, then load every entry in a new registry
+        for version, executor_type in _version_executor_types():
+            spec_registry.SpecRegistry(cache_dir=self.cache_dir).get_specs(version, executor_type)
+
+        registry = spec_registry.SpecRegistry(cache_dir=self.cache_dir)
+        with mock.patch.object(spec_registry, "generate_specs") as mock_generate_specs:
+            persisted = {
+                (version, executor_type): registry.get_specs(version, executor_type)
+                for version, executor_type in _version_executor_types()
+            }
+        mock_generate_specs.assert_not_called()
+
+        for (version, executor_type), specs in persisted.items():
+            with self.subTest(version=version, executor_type=executor_type):
+                live_specs = spec_registry.generate_specs(version, executor_type)
+                self.assertTrue(specs)
+                self.assertEqual(_comparable(specs), _comparable(live_specs))
+
+    def test_specs_are_generated_once_per_version_and_executor_type(self):
+        registry = spec_registry.SpecRegistry(cache_dir=self.cache_dir)
+        with mock.patch.object(
+            spec_registry, "generate_specs", wraps=spec_registry.generate_specs
+        ) as mock_generate_specs:
+            first = registry.get_specs("3100", "smart_contracts")
+            second = registry.get_specs("3100", "smart_contracts")
+            registry.get_specs("3100", "supervisor_contracts")
+
+        self.assertIs(first, second)
+        self.assertEqual(mock_generate_specs.call_count, 2)
+
+    def test_get_spec(self):
+        registry = spec_registry.SpecRegistry(cache_dir=self.cache_dir)
+
+        spec = registry.get_spec("400", "CalendarEvent")
+
+        self.assertEqual(spec.name, "CalendarEvent")
+        self.assertEqual(
+            list(spec.public_attributes), ["id", "calendar_id", "start_datetime", "end_datetime"]
+        )
+
+    def test_persisted_specs_are_invalidated_by_source_changes(self):
+        spec_registry.SpecRegistry(cache_dir=self.cache_dir).get_specs("400")
+
+        with mock.patch.object(
+            spec_registry, "source_fingerprint", return_value="changed"
+        ), mock.patch.object(
+            spec_registry, "generate_specs", return_value={}
+        ) as mock_generate_specs:
+            specs = spec_registry.SpecRegistry(cache_dir=self.cache_dir).get_specs("400")
+
+        mock_generate_specs.assert_called_once_with("400", "smart_contracts", 0)
+        self.assertEqual(specs, {})
+
+    def test_corrupt_entry_is_regenerated(self):
+        registry = spec_registry.SpecRegistry(cache_dir=self.cache_dir)
+        entry_path = registry._entry_path("400", "smart_contracts", 0)
+        entry_path.write_bytes(b"not a pickle")
+
+        specs = registry.get_specs("400")
+
+        self.assertIn("Posting", specs)
+
+    def test_cache_dir_is_created_private(self):
+        cache_dir = os.path.join(self.cache_dir, "spec_cache")
+
+        spec_registry.SpecRegistry(cache_dir=cache_dir).get_specs("400")
+
+        self.assertEqual(stat.S_IMODE(os.stat(cache_dir).st_mode), 0o700)
+        self.assertEqual(len(os.listdir(cache_dir)), 1)
+
+    def test_shared_cache_dir_is_not_used(self):
+        os.chmod(self.cache_dir, 0o777)
+        registry = spec_registry.SpecRegistry(cache_dir=self.cache_dir)
+        registry._entry_path("400", "smart_contracts", 0).write_bytes(b"not trusted")
+
+        with mock.patch.object(spec_registry.pickle, "load") as mock_load:
+            specs = registry.get_specs("400")
+
+        mock_load.assert_not_called()
+        self.assertIn("Posting", specs)
+        self.assertEqual(len(os.listdir(self.cache_dir)), 1)
+
+    def test_default_cache_dir_is_per_user(self):
+        with mock.patch.dict(os.environ, {"XDG_CACHE_HOME": "/home/user/.cache"}):
+            os.environ.pop(spec_registry.CACHE_DIR_ENV_VAR, None)
+            registry = spec_registry.SpecRegistry()
+
+        self.assertEqual(
+            str(registry.cache_dir),
+            os.path.join("/home/user/.cache", "contracts_sdk", "spec_cache"),
+        )
+        self.assertFalse(str(registry.cache_dir).startswith(tempfile.gettempdir()))
+
+    def test_unwritable_cache_dir_does_not_raise(self):
+        registry = spec_registry.SpecRegistry(cache_dir=self.cache_dir)
+        with mock.patch.object(spec_registry.tempfile, "mkstemp", side_effect=PermissionError):
+            specs = registry.get_specs("400")
+
+        self.assertIn("Posting", specs)
@@ -0,0 +1,202 @@
+import logging
+import time
+import unittest
+from unittest import mock
+
+from .. import tools
+
+log = logging.getLogger(__name__)
+
+CONTRACT_CODE = """
+api = '3.10.0'
+hook_execution_ids = []
+
+
+def _make_recorder():
+    def record(hook_execution_id):
+        hook_execution_ids.append(hook_execution_id)
+        return len(hook_execution_ids)
+
+    return record
+
+
+def _record_hook_execution(hook_execution_id):
+    return HOOK_RECORDERS['default'](hook_execution_id)
+
+
+HOOK_RECORDERS = {'default': _make_recorder()}
+
+
+@requires(parameters=True)
+def post_activate_code():
+    return vault, _record_hook_execution(vault.get_hook_execution_id())
+
+
+def get_api():
+    return api
+"""
+
+EXAMPLE_TEST_MODULES = [
+    "contracts_sdk.example_unit_tests.contract_modules.test_simple_v390",
+    "contracts_sdk.example_unit_tests.smart_contracts.test_natives_v360",
+    "contracts_sdk.example_unit_tests.smart_contracts.test_savings_v340",
+    "contracts_sdk.example_unit_tests.smart_contracts.test_simple_v380",
+    "contracts_sdk.example_unit_tests.smart_contracts.test_simple_v3100",
+    "contracts_sdk.example_unit_tests.smart_contracts.test_simple_v3110",
+    "contracts_sdk.example_unit_tests.supervisor_contracts.test_natives_v360",
+    "contracts_sdk.example_unit_tests.supervisor_contracts.test_offsetting_v340",
+    "contracts_sdk.example_unit_tests.supervisor_contracts.test_simple_v380",
+    "contracts_sdk.example_unit_tests.supervisor_contracts.test_simple_v3100",
+    "contracts_sdk.example_unit_tests.supervisor_contracts.test_simple_v3110",
+]
+
+
+class WrappedHooksTestCase(tools.SmartContracts3100TestCase):
+    """
+    Patches the contract differently to CompiledContractCacheTest, as its `requires` decorator
+    replaces each hook
+    """
+
+    def setUp(self):
+        super().setUp()
+
+        def _wrapping_requires_decorator(**kwargs):
+            def inner(func):
+                return lambda: "wrapped"
+
+            return inner
+
+        self.requires = _wrapping_requires_decorator
+
+
+class CompiledContractCacheTest(tools.SmartContracts3100TestCase):
+    def setUp(self):
+        super().setUp()
+        # the cache is kept for the whole class, so start each test with it empty
+        self._compiled_contracts.clear()
+        self.required_parameters = []
+
+        def _recording_requires_decorator(**kwargs):
+            self.required_parameters.append(kwargs)
+
+            def inner(func):
+                return func
+
+            return inner
+
+        self.requires = _recording_requires_decorator
+
+    def test_cache_is_enabled_by_default(self):
+        self.assertTrue(tools.ContractsTestCase.cache_compiled_contracts)
+
+    def test_contract_code_is_compiled_once(self):
+        with mock.patch.object(tools, "compile", create=True, wraps=compile) as mock_compile:
+            self.run_contract_function(CONTRACT_CODE, "get_api")
+            self.run_contract_function(CONTRACT_CODE, "get_api")
+
+        mock_compile.assert_called_once()
+        self.assertEqual(len(self._compiled_contracts), 1)
+
+    def test_contract_code_is_compiled_each_time_when_cache_disabled(self):
+        self.cache_compiled_contracts = False
+        with mock.patch.object(tools, "compile", create=True, wraps=compile) as mock_compile:
+            self.run_contract_function(CONTRACT_CODE, "get_api")
+            self.run_contract_function(CONTRACT_CODE, "get_api")
+
+        self.assertEqual(mock_compile.call_count, 2)
+        self.assertEqual(self._compiled_contracts, {})
+
+    def test_cached_contract_functions_return_same_results(self):
+        first = self.run_contract_function(CONTRACT_CODE, "get_api")
+        second = self.run_contract_function(CONTRACT_CODE, "get_api")
+
+        self.assertEqual(first, "3.10.0")
+        self.assertEqual(second, "3.10.0")
+
+    def test_hook_is_bound_to_the_test_vault(self):
+        self.run_contract_function(CONTRACT_CODE, "post_activate_code")
+        self.vault = mock.create_autospec(self._contract_lib.VaultFunctionsABC)
+
+        vault, _ = self.run_contract_function(CONTRACT_CODE, "post_activate_code")
+
+        self.assertIs(vault, self.vault)
+
+    def test_module_level_state_is_not_shared_between_calls(self):
+        # the hook records through a nested function held in a module level dict, so this also
+        # covers functions that are not defined at module level
+        _, first_count = self.run_contract_function(CONTRACT_CODE, "post_activate_code")
+        _, second_count = self.run_contract_function(CONTRACT_CODE, "post_activate_code")
+
+        self.assertEqual(first_count, 1)
+        self.assertEqual(second_count, 1)
+
+    def test_decorators_are_applied_on_every_call(self):
+        self.run_contract_function(CONTRACT_CODE, "get_api")
+        self.run_contract_function(CONTRACT_CODE, "get_api")
+
+        self.assertEqual(self.required_parameters, [{"parameters": True}, {"parameters": True}])
+
+    def test_test_classes_that_patch_the_contract_differently_are_isolated(self):
+        WrappedHooksTestCase.setUpClass()
+        self.addCleanup(WrappedHooksTestCase.tearDownClass)
+        wrapped_hooks_test = WrappedHooksTestCase()
+        wrapped_hooks_test.setUp()
+
+        vault, _ = self.run_contract_function(CONTRACT_CODE, "post_activate_code")
+        wrapped_result = wrapped_hooks_test.run_contract_function(
+            CONTRACT_CODE, "post_activate_code"
+        )
+        vault_again, _ = self.run_contract_function(CONTRACT_CODE, "post_activate_code")
+
+        self.assertIs(vault, self.vault)
+        self.assertEqual(wrapped_result, "wrapped")
+        self.assertIs(vault_again, self.vault)
+        self.assertIsNot(self._compiled_contracts, WrappedHooksTestCase._compiled_contracts)
+        self.assertEqual(len(WrappedHooksTestCase._compiled_contracts), 1)
+
+    def test_cache_is_cleared_on_class_teardown(self):
+        WrappedHooksTestCase.setUpClass()
+        wrapped_hooks_test = WrappedHooksTestCase()
+        wrapped_hooks_test.setUp()
+        wrapped_hooks_test.run_contract_function(CONTRACT_CODE, "get_api")
+
+        WrappedHooksTestCase.tearDownClass()
+
+        self.assertEqual(WrappedHooksTestCase._compiled_contracts, {})
+
+    def test_missing_function_raises_error(self):
+        with self.assertRaises(ValueError) as ctx:
+            self.run_contract_function(CONTRACT_CODE, "missing_function")
+
+        self.assertEqual(
+            str(ctx.exception),
+            'Function "missing_function" does not exist in provided Smart Contract code',
+        )
+
+
+class CompiledContractCacheBenchmarkTest(unittest.TestCase):
+    """
+    Runs the example contract unit tests with and without the compiled contract cache, logging the
+    wall-clock time of each run
+    """
+
+    def _run_example_tests(self, cache_compiled_contracts: bool) -> float:
+        suite = unittest.defaultTestLoader.loadTestsFromNames(EXAMPLE_TEST_MODULES)
+        with mock.patch.object(
+            tools.ContractsTestCase, "cache_compiled_contracts", cache_compiled_contracts
+        ):
+            start = time.perf_counter()
+            result = unittest.TestResult()
+            suite.run(result)
+            duration = time.perf_counter() - start
+
+        self.assertTrue(result.wasSuccessful(), result.errors + result.failures)
+        return duration
+
+    def test_benchmark_example_unit_tests(self):
+        uncached = self._run_example_tests(cache_compiled_contracts=False)
+        cached = self._run_example_tests(cache_compiled_contracts=True)
+        log.info(
+            f"example contract unit tests: {uncached * 1000:.3f}ms without compiled contract cache, "
+            f"{cached * 1000:.3f}ms with compiled contract cache"
+        )
@@ -1,8 +1,11 @@
 from datetime import datetime
 from zoneinfo import ZoneInfo
 
+from . import fast_validation
 from .exceptions import InvalidSmartContractError
 
+UTC_ZONE = ZoneInfo("UTC")
+
 
 def validate_dateime_is_timezone_aware(datetime: datetime, field_path: str, class_type: str):
     if datetime.tzinfo is None or datetime.tzinfo.utcoffset(datetime) is None:
@@ -10,6 +13,10 @@ def validate_dateime_is_timezone_aware(datetime: datetime, field_path: str, clas
 
 
 def validate_timezone_is_utc(datetime: datetime, field_path: str, class_type: str):
+    # ZoneInfo instances are cached per key, so this covers any datetime created with
+    # ZoneInfo("UTC") and passes the checks below
+    if fast_validation.is_enabled() and datetime.tzinfo is UTC_ZONE:
+        return datetime
     validate_datetime_has_given_timezone(
         datetime,
         field_path,
@@ -1,5 +1,6 @@
+import hashlib
 import importlib
-from types import FunctionType
+from types import CodeType, FunctionType
 from typing import Any, Dict, List
 from unittest import mock, TestCase
 
@@ -13,6 +14,13 @@ from .types_registry import make_contract_version_sandbox
 
 class ContractsTestCase(TestCase):
     supported_hook_names: List[str] = []
+    # Whether to compile each contract source once per test class and reuse the code object across
+    # the class's tests. The code is still executed in a fresh sandbox for every call, so the tests
+    # are isolated from each other either way
+    cache_compiled_contracts: bool = True
+    # Compiled contract code, keyed on the contract source hash. Created in setUpClass and
+    # cleared in tearDownClass, so it is never shared between test classes
+    _compiled_contracts: Dict[str, CodeType]
 
     @classmethod
     def setUpClass(cls):
@@ -21,6 +29,13 @@ class ContractsTestCase(TestCase):
         cls._contract_lib = importlib.import_module(path, versions_package)
         cls._registry = make_contract_version_sandbox(cls._contract_lib)
         cls.builtins = cls._contract_lib.ALLOWED_BUILTINS
+        cls._types = {name: func for name, func in cls._registry.items() if name != "__builtins__"}
+        cls._compiled_contracts = {}
+
+    @classmethod
+    def tearDownClass(cls):
+        cls._compiled_contracts.clear()
+        super().tearDownClass()
 
     @staticmethod
     def load_contract_code(filepath: str) -> str:
@@ -40,10 +55,23 @@ class ContractsTestCase(TestCase):
         allowedNatives = {name: name for name in self._contract_lib.ALLOWED_NATIVES}
         return {"__builtins__": {**importBuiltin, **allowedBuiltins, **allowedNatives, **types}}
 
+    def _compile_contract(self, contract_code: str) -> CodeType:
+        """
+        Compiles the contract code, reusing the code object from a previous compilation of the
+        same contract code by this test class if the cache is enabled
+        """
+        if not self.cache_compiled_contracts:
+            return compile(contract_code, "<string>", "exec")
+
+        key = hashlib.sha256(contract_code.encode()).hexdigest()
+        if key not in self._compiled_contracts:
+            self._compiled_contracts[key] = compile(contract_code, "<string>", "exec")
+        return self._compiled_contracts[key]
+
     def _execute_function_in_sandbox(
         self, contract_code: str, function_name: str, sandbox: Dict[str, Any], *args, **kwargs
     ) -> FunctionType:
-        exec(contract_code, sandbox, sandbox)
+        exec(self._compile_contract(contract_code), sandbox, sandbox)
         func = sandbox.get(function_name)
         if func is None:
             raise ValueError(
@@ -61,8 +89,7 @@ class ContractsTestCase(TestCase):
     def run_contract_function(
         self, contract_code: str, function_name: str, *args, **kwargs
     ) -> FunctionType:
-        types = {name: func for name, func in self._registry.items() if name != "__builtins__"}
-        sandbox = self.create_sandbox(types)
+        sandbox = self.create_sandbox(self._types)
 
         return self._execute_function_in_sandbox(
             contract_code, function_name, sandbox, *args, **kwargs
@@ -71,8 +98,7 @@ class ContractsTestCase(TestCase):
     def run_contract_function_with_imports(
         self, contract_code: str, function_name: str, *args, **kwargs
     ) -> FunctionType:
-        types = {name: func for name, func in self._registry.items() if name != "__builtins__"}
-        sandbox = self.create_sandbox_with_imports(types)
+        sandbox = self.create_sandbox_with_imports(self._types)
 
         return self._execute_function_in_sandbox(
             contract_code, function_name, sandbox, *args, **kwargs
@@ -794,9 +794,11 @@ def dedent_and_strip(string: str) -> str:
 
 
 def get_iterator(items: Iterable, hint: str, name, check_empty=False):
-    exception_message = f"Expected list of {hint} objects for '{name}', got '{items}'"
+    # the message is only built on failure, as formatting the items can be expensive
     if isinstance(items, str):
-        raise exceptions.StrongTypingError(exception_message)
+        raise exceptions.StrongTypingError(
+            f"Expected list of {hint} objects for '{name}', got '{items}'"
+        )
     if check_empty and not items:
         raise exceptions.InvalidSmartContractError(
             f"'{name}' must be a non empty list, got {items}"
@@ -804,7 +806,9 @@ def get_iterator(items: Iterable, hint: str, name, check_empty=False):
     try:
         iterator = iter(items)
     except TypeError:
-        raise exceptions.StrongTypingError(exception_message)
+        raise exceptions.StrongTypingError(
+            f"Expected list of {hint} objects for '{name}', got '{items}'"
+        )
     return iterator
 
 
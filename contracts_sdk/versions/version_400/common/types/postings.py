@@ -5,7 +5,7 @@ from typing import Optional, List, Dict, Union
 from zoneinfo import ZoneInfo
 
 from . import enums
-from .....utils import exceptions, symbols, types_utils
+from .....utils import exceptions, fast_validation, symbols, types_utils
 from ....version_400.common.types import (
     Balance,
     BalanceCoordinate,
@@ -68,6 +68,8 @@ class Posting:
             raise InvalidSmartContractError(f"Postings missing required argument(s): {missing}")
         if self.amount <= 0:
             raise InvalidSmartContractError(f"Amount must be greater than 0, {self.amount}")
+        if fast_validation.is_enabled() and type(self.phase) is Phase:
+            return
         try:
             self.phase = Phase(self.phase)
         except ValueError:
@@ -266,6 +268,11 @@ class PostingInstructionBase:
             self._validate_attributes()
 
     def _validate_attributes(self):
+        signature = fast_validation.type_signature(
+            PostingInstructionBase, self.transaction_code, self.instruction_details
+        )
+        if fast_validation.is_validated(signature):
+            return
         types_utils.validate_type(
             self.transaction_code,
             TransactionCode,
@@ -282,6 +289,7 @@ class PostingInstructionBase:
             is_optional=True,
             prefix=f"{self.type.value}.instruction_details",
         )
+        fast_validation.mark_validated(signature)
 
     def __repr__(self):
         args = []
@@ -787,6 +795,11 @@ class CustomInstruction(PostingInstructionBase):
         iterator = types_utils.get_iterator(
             self.postings, "Posting", name="CustomInstruction.postings", check_empty=True
         )
+        signature = None
+        if type(self.postings) is list:
+            signature = fast_validation.type_signature(CustomInstruction, *self.postings)
+            if fast_validation.is_validated(signature):
+                return
         for index, posting in enumerate(iterator):
             types_utils.validate_type(
                 posting,
@@ -794,6 +807,7 @@ class CustomInstruction(PostingInstructionBase):
                 hint="Posting",
                 prefix=f"CustomInstruction.postings[{index}]",
             )
+        fast_validation.mark_validated(signature)
 
     @classmethod
     @lru_cache()
@@ -1,7 +1,7 @@
 from functools import lru_cache
 
 from .enums import DefinedDateTime
-from .....utils import exceptions, symbols, types_utils
+from .....utils import exceptions, fast_validation, symbols, types_utils
 from typing import Optional, Union
 
 
@@ -147,10 +147,14 @@ class Shift:
                 f"{self} object needs to be populated with at least one attribute."
             )
 
+        signature = fast_validation.type_signature(Shift, *args_types.values())
+        if fast_validation.is_validated(signature):
+            return
         for name, value in args_types.items():
             types_utils.validate_type(
                 value, int, hint="int", is_optional=True, prefix=f"Shift.{name}"
             )
+        fast_validation.mark_validated(signature)
 
     @classmethod
     @lru_cache()
@@ -424,17 +428,20 @@ class RelativeDateTime:
         return "RelativeDateTime"
 
     def _validate_attributes(self):
-        types_utils.validate_type(
-            self.shift, Shift, hint="Shift", is_optional=True, prefix="RelativeDateTime.shift"
-        )
+        signature = fast_validation.type_signature(RelativeDateTime, self.shift, self.find)
+        if not fast_validation.is_validated(signature):
+            types_utils.validate_type(
+                self.shift, Shift, hint="Shift", is_optional=True, prefix="RelativeDateTime.shift"
+            )
 
-        types_utils.validate_type(
-            self.find,
-            (Next, Previous, Override),
-            hint="Union[Next, Previous, Override]",
-            is_optional=True,
-            prefix="RelativeDateTime.find",
-        )
+            types_utils.validate_type(
+                self.find,
+                (Next, Previous, Override),
+                hint="Union[Next, Previous, Override]",
+                is_optional=True,
+                prefix="RelativeDateTime.find",
+            )
+            fast_validation.mark_validated(signature)
 
         if self.shift is None and self.find is None:
             raise exceptions.InvalidSmartContractError(
@@ -0,0 +1,466 @@
+# standard libs
+import random
+import threading
+import time
+import zlib
+from collections import deque
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Any, Callable, Iterator
+from unittest.mock import patch
+
+# third party
+from confluent_kafka import (
+    OFFSET_BEGINNING,
+    OFFSET_END,
+    TIMESTAMP_CREATE_TIME,
+    KafkaError,
+    TopicPartition,
+)
+
+# inception sdk
+import inception_sdk.common.kafka as kafka
+
+EARLIEST_OFFSET_RESETS = {"earliest", "smallest", "beginning"}
+
+
+class InMemoryMessage:
+    """
+    Equivalent of confluent_kafka.Message for messages produced to an InMemoryKafkaBroker
+    """
+
+    def __init__(
+        self,
+        topic: str,
+        partition: int,
+        offset: int,
+        key: bytes | None = None,
+        value: bytes | None = None,
+        headers: list[tuple[str, bytes]] | None = None,
+        timestamp: int = 0,
+        error: KafkaError | None = None,
+    ):
+        self._topic = topic
+        self._partition = partition
+        self._offset = offset
+        self._key = key
+        self._value = value
+        self._headers = headers
+        self._timestamp = timestamp
+        self._error = error
+
+    def topic(self) -> str:
+        return self._topic
+
+    def partition(self) -> int:
+        return self._partition
+
+    def offset(self) -> int:
+        return self._offset
+
+    def key(self) -> bytes | None:
+        return self._key
+
+    def value(self) -> bytes | None:
+        return self._value
+
+    def headers(self) -> list[tuple[str, bytes]] | None:
+        return self._headers
+
+    def timestamp(self) -> tuple[int, int]:
+        return TIMESTAMP_CREATE_TIME, self._timestamp
+
+    def error(self) -> KafkaError | None:
+        return self._error
+
+    def __len__(self) -> int:
+        return len(self._value or b"")
+
+
+@dataclass
+class _Partition:
+    messages: list[InMemoryMessage] = field(default_factory=list)
+    # monotonic time at which each message becomes visible to consumers
+    visible_at: list[float] = field(default_factory=list)
+
+
+def _encode(data: str | bytes | None) -> bytes | None:
+    return data.encode("utf-8") if isinstance(data, str) else data
+
+
+class InMemoryKafkaBroker:
+    """
+    In-process stand-in for a Kafka cluster, implementing the subset of the confluent_kafka
+    Producer/Consumer interface used by the inception_sdk Kafka helpers. Topics are created on first
+    use, with `num_partitions` partitions. Each message only becomes visible to consumers after
+    `latency` seconds, plus up to `jitter` seconds, while preserving per-partition ordering
+    """
+
+    def __init__(
+        self,
+        num_partitions: int = 1,
+        latency: float = 0.0,
+        jitter: float = 0.0,
+        seed: int | None = None,
+    ):
+        """
+        :param num_partitions: default number of partitions for new topics
+        :param latency: minimum delay between a message being produced and being consumable
+        :param jitter: maximum random delay added to the latency
+        :param seed: seed for the jitter and partitioning of messages without keys
+        """
+        self.num_partitions = num_partitions
+        self.latency = latency
+        self.jitter = jitter
+        self._random = random.Random(seed)
+        # consumers wait on this condition, which is notified whenever a message is produced
+        self._condition = threading.Condition(threading.RLock())
+        self._topics: dict[str, list[_Partition]] = {}
+        # (group id, topic, partition) to the committed offset
+        self._committed_offsets: dict[tuple[str, str, int], int] = {}
+
+    def create_topic(self, topic: str, num_partitions: int | None = None) -> None:
+        with self._condition:
+            if topic in self._topics:
+                raise ValueError(f"Topic {topic} already exists")
+            self._topics[topic] = [
+                _Partition() for _ in range(num_partitions or self.num_partitions)
+            ]
+
+    def _partitions(self, topic: str) -> list[_Partition]:
+        with self._condition:
+            if topic not in self._topics:
+                self.create_topic(topic)
+            return self._topics[topic]
+
+    def partition_count(self, topic: str) -> int:
+        return len(self._partitions(topic))
+
+    def watermark_offsets(self, topic: str, partition: int) -> tuple[int, int]:
+        return 0, len(self._partitions(topic)[partition].messages)
+
+    def append(
+        self,
+        topic: str,
+        value: str | bytes | None = None,
+        key: str | bytes | None = None,
+        partition: int = -1,
+        headers: list[tuple[str, bytes]] | None = None,
+    ) -> InMemoryMessage:
+        """
+        Appends a message to a topic partition
+        :param partition: the partition to append to. If negative, the partition is derived from
+        the key's hash, or chosen at random if there is no key
+        :return: the appended message
+        """
+        key = _encode(key)
+        with self._condition:
+            partitions = self._partitions(topic)
+            if partition < 0:
+                partition = (
+                    zlib.crc32(key) % len(partitions)
+                    if key is not None
+                    else self._random.randrange(len(partitions))
+                )
+            topic_partition = partitions[partition]
+            message = InMemoryMessage(
+                topic=topic,
+                partition=partition,
+                offset=len(topic_partition.messages),
+                key=key,
+                value=_encode(value),
+                headers=headers,
+                timestamp=int(time.time() * 1000),
+            )
+            delay = self.latency + (self._random.uniform(0, self.jitter) if self.jitter else 0)
+            last_visible_at = topic_partition.visible_at[-1] if topic_partition.visible_at else 0
+            topic_partition.messages.append(message)
+            topic_partition.visible_at.append(max(last_visible_at, time.monotonic() + delay))
+            self._condition.notify_all()
+        return message
+
+    def commit(self, group_id: str, topic: str, partition: int, offset: int) -> None:
+        with self._condition:
+            self._committed_offsets[(group_id, topic, partition)] = offset
+
+    def committed(self, group_id: str, topic: str, partition: int) -> int | None:
+        return self._committed_offsets.get((group_id, topic, partition))
+
+    def Consumer(self, config: dict[str, Any]) -> "InMemoryConsumer":
+        return InMemoryConsumer(self, config)
+
+    def Producer(self, config: dict[str, Any] | None = None) -> "InMemoryProducer":
+        return InMemoryProducer(self, config)
+
+    @contextmanager
+    def patch_kafka_clients(self) -> Iterator["InMemoryKafkaBroker"]:
+        """
+        Makes the inception_sdk Kafka helpers, e.g. `initialise_consumer`, `subscribe_to_topics`
+        and `initialise_producer`, use this broker instead of a real cluster
+        """
+        with patch.object(kafka, "Consumer", self.Consumer), patch.object(
+            kafka, "Producer", self.Producer
+        ):
+            yield self
+
+
+class InMemoryProducer:
+    def __init__(self, broker: InMemoryKafkaBroker, config: dict[str, Any] | None = None):
+        self.broker = broker
+        self.config = config or {}
+        self._delivery_reports: deque[tuple[Callable, InMemoryMessage]] = deque()
+
+    def produce(
+        self,
+        topic: str,
+        value: str | bytes | None = None,
+        key: str | bytes | None = None,
+        partition: int = -1,
+        on_delivery: Callable | None = None,
+        callback: Callable | None = None,
+        headers: list[tuple[str, bytes]] | None = None,
+        **kwargs: Any,
+    ) -> None:
+        message = self.broker.append(
+            topic=topic, value=value, key=key, partition=partition, headers=headers
+        )
+        delivery_callback = on_delivery or callback
+        if delivery_callback:
+            self._delivery_reports.append((delivery_callback, message))
+
+    def poll(self, timeout: float | None = None) -> int:
+        """
+        Serves delivery reports for produced messages
+        :return: the number of delivery reports served
+        """
+        served = 0
+        while self._delivery_reports:
+            delivery_callback, message = self._delivery_reports.popleft()
+            delivery_callback(None, message)
+            served += 1
+        return served
+
+    def flush(self, timeout: float | None = None) -> int:
+        self.poll(0)
+        return 0
+
+    def __len__(self) -> int:
+        return len(self._delivery_reports)
+
+
+class InMemoryConsumer:
+    def __init__(self, broker: InMemoryKafkaBroker, config: dict[str, Any]):
+        if not config.get("group.id"):
+            raise ValueError("Consumer config must include a group.id")
+        self.broker = broker
+        self.config = config
+        self.group_id: str = config["group.id"]
+        self._auto_offset_reset = str(config.get("auto.offset.reset", "latest"))
+        self._enable_auto_commit = config.get("enable.auto.commit", True) in {True, "true"}
+        self._enable_partition_eof = config.get("enable.partition.eof", False) in {True, "true"}
+        self._subscription: list[str] = []
+        self._on_assign: Callable | None = None
+        self._on_revoke: Callable | None = None
+        self._rebalance_pending = False
+        self._assigned_in_callback = False
+        # (topic, partition) to the offset of the next message to consume
+        self._positions: dict[tuple[str, int], int] = {}
+        self._eof_reported: set[tuple[str, int]] = set()
+        self._next_partition = 0
+        self._closed = False
+
+    def subscribe(
+        self,
+        topics: list[str],
+        on_assign: Callable | None = None,
+        on_revoke: Callable | None = None,
+        on_lost: Callable | None = None,
+    ) -> None:
+        # as per confluent_kafka, partitions are assigned by a subsequent call to poll
+        self._subscription = list(topics)
+        self._on_assign = on_assign
+        self._on_revoke = on_revoke
+        self._rebalance_pending = True
+
+    def unsubscribe(self) -> None:
+        self._revoke()
+        self._subscription = []
+        self._rebalance_pending = False
+
+    def assign(self, partitions: list[TopicPartition]) -> None:
+        self._assigned_in_callback = True
+        self._positions = {
+            (partition.topic, partition.partition): self._resolve_offset(partition)
+            for partition in partitions
+        }
+        self._eof_reported.clear()
+
+    def unassign(self) -> None:
+        self._positions = {}
+
+    def assignment(self) -> list[TopicPartition]:
+        return [
+            TopicPartition(topic, partition, offset)
+            for (topic, partition), offset in self._positions.items()
+        ]
+
+    def position(self, partitions: list[TopicPartition]) -> list[TopicPartition]:
+        return [
+            TopicPartition(
+                partition.topic,
+                partition.partition,
+                self._positions.get((partition.topic, partition.partition), OFFSET_END),
+            )
+            for partition in partitions
+        ]
+
+    def get_watermark_offsets(
+        self, partition: TopicPartition, timeout: float | None = None, cached: bool = False
+    ) -> tuple[int, int]:
+        return self.broker.watermark_offsets(partition.topic, partition.partition)
+
+    def committed(
+        self, partitions: list[TopicPartition], timeout: float | None = None
+    ) -> list[TopicPartition]:
+        committed_partitions = []
+        for partition in partitions:
+            offset = self.broker.committed(self.group_id, partition.topic, partition.partition)
+            committed_partitions.append(
+                TopicPartition(
+                    partition.topic,
+                    partition.partition,
+                    offset if offset is not None else partition.offset,
+                )
+            )
+        return committed_partitions
+
+    def commit(
+        self,
+        message: InMemoryMessage | None = None,
+        offsets: list[TopicPartition] | None = None,
+        asynchronous: bool = True,
+    ) -> None:
+        if message is not None:
+            offsets = [TopicPartition(message.topic(), message.partition(), message.offset() + 1)]
+        elif offsets is None:
+            offsets = self.assignment()
+        for partition in offsets:
+            self.broker.commit(
+                self.group_id, partition.topic, partition.partition, partition.offset
+            )
+
+    def poll(self, timeout: float | None = None) -> InMemoryMessage | None:
+        """
+        Returns the next visible message from the assigned partitions, waiting up to `timeout`
+        seconds for one. Partitions are served round-robin
+        """
+        self._check_open()
+        self._rebalance()
+        deadline = None if timeout is None or timeout < 0 else time.monotonic() + timeout
+        with self.broker._condition:
+            while True:
+                now = time.monotonic()
+                message, next_visible_at = self._next_message(now)
+                if message is not None:
+                    return message
+                wait = None if deadline is None else deadline - now
+                if wait is not None and wait <= 0:
+                    return None
+                if next_visible_at is not None:
+                    wait = (
+                        next_visible_at - now if wait is None else min(wait, next_visible_at - now)
+                    )
+                self.broker._condition.wait(wait)
+
+    def consume(self, num_messages: int = 1, timeout: float = -1) -> list[InMemoryMessage]:
+        messages: list[InMemoryMessage] = []
+        deadline = None if timeout < 0 else time.monotonic() + timeout
+        while len(messages) < num_messages:
+            remaining = None if deadline is None else max(deadline - time.monotonic(), 0)
+            message = self.poll(remaining)
+            if message is None:
+                break
+            messages.append(message)
+        return messages
+
+    def close(self) -> None:
+        if self._enable_auto_commit and self._positions:
+            self.commit(asynchronous=False)
+        self._positions = {}
+        self._closed = True
+
+    def _check_open(self) -> None:
+        if self._closed:
+            raise RuntimeError("Consumer closed")
+
+    def _resolve_offset(self, partition: TopicPartition) -> int:
+        low, high = self.broker.watermark_offsets(partition.topic, partition.partition)
+        if partition.offset >= 0:
+            return min(max(partition.offset, low), high)
+        if partition.offset == OFFSET_BEGINNING:
+            return low
+        if partition.offset == OFFSET_END:
+            return high
+        # stored or invalid offsets fall back to the group's committed offset and then the reset
+        committed = self.broker.committed(self.group_id, partition.topic, partition.partition)
+        if committed is not None:
+            return committed
+        return low if self._auto_offset_reset in EARLIEST_OFFSET_RESETS else high
+
+    def _revoke(self) -> None:
+        if self._positions and self._on_revoke:
+            self._on_revoke(self, self.assignment())
+        self._positions = {}
+
+    def _rebalance(self) -> None:
+        if not self._rebalance_pending:
+            return
+        self._rebalance_pending = False
+        self._revoke()
+        partitions = [
+            TopicPartition(topic, partition)
+            for topic in self._subscription
+            for partition in range(self.broker.partition_count(topic))
+        ]
+        self._assigned_in_callback = False
+        if self._on_assign:
+            self._on_assign(self, partitions)
+        # as per confluent_kafka, the partitions are assigned if the callback doesn't assign them
+        if not self._assigned_in_callback:
+            self.assign(partitions)
+
+    def _next_message(self, now: float) -> tuple[InMemoryMessage | None, float | None]:
+        """
+        :return: the next visible message, if any, and the earliest time that a message that is
+        not yet visible will become visible
+        """
+        positions = list(self._positions.items())
+        next_visible_at: float | None = None
+        for i in range(len(positions)):
+            index = (self._next_partition + i) % len(positions)
+            (topic, partition_id), position = positions[index]
+            partition = self.broker._topics[topic][partition_id]
+            if position >= len(partition.messages):
+                if self._enable_partition_eof and (topic, partition_id) not in self._eof_reported:
+                    self._eof_reported.add((topic, partition_id))
+                    return (
+                        InMemoryMessage(
+                            topic,
+                            partition_id,
+                            position,
+                            error=KafkaError(KafkaError._PARTITION_EOF),
+                        ),
+                        None,
+                    )
+                continue
+            visible_at = partition.visible_at[position]
+            if visible_at > now:
+                next_visible_at = min(visible_at, next_visible_at or visible_at)
+                continue
+            self._next_partition = index + 1
+            self._positions[(topic, partition_id)] = position + 1
+            self._eof_reported.discard((topic, partition_id))
+            if self._enable_auto_commit:
+                self.broker.commit(self.group_id, topic, partition_id, position + 1)
+            return partition.messages[position], None
+        return None, next_visible_at
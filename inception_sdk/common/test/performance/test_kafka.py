@@ -0,0 +1,155 @@
+# standard libs
+import json
+import logging
+import statistics
+import threading
+import time
+from typing import Any
+from unittest import TestCase
+
+# inception sdk
+import inception_sdk.common.kafka as kafka
+from inception_sdk.common.test.mocks.kafka_broker import InMemoryKafkaBroker
+from inception_sdk.test_framework.common.benchmark import run_benchmark
+
+log = logging.getLogger(__name__)
+
+TOPIC = "vault.core_api.v1.balances.account_balance.events"
+NUM_PARTITIONS = 4
+# emulates a broker on a remote cluster, i.e. a few ms between producing and consuming a message
+BROKER_LATENCY = 0.002
+BROKER_JITTER = 0.003
+# number of unique message ids that wait_for_messages is matching at once
+MATCHER_COUNTS = [1000, 5000]
+# number of consumers each waiting for their own messages at the same time
+CONCURRENT_CONSUMERS = 4
+# messages for other tests/accounts that are consumed but not matched, per matched message
+UNRELATED_MESSAGES_PER_MATCH = 1
+
+
+def _matcher(event_msg: dict[str, Any], unique_message_ids: dict[str, Any]) -> tuple:
+    account_id = event_msg["account_id"]
+    if account_id in unique_message_ids:
+        return account_id, event_msg["event_id"], True
+    return "", event_msg["event_id"], False
+
+
+class _LatencyRecorder:
+    def __init__(self):
+        self.latencies: list[float] = []
+
+    def callback(self, event_msg: dict[str, Any]) -> None:
+        self.latencies.append(time.time() - event_msg["produced_at"])
+
+
+def _produce(broker: InMemoryKafkaBroker, account_ids: list[str]) -> None:
+    producer = broker.Producer()
+    for account_id in account_ids:
+        for i in range(UNRELATED_MESSAGES_PER_MATCH):
+            producer.produce(
+                TOPIC,
+                value=json.dumps(
+                    {
+                        "account_id": f"unrelated_{account_id}_{i}",
+                        "event_id": f"unrelated_{account_id}_{i}",
+                        "produced_at": time.time(),
+                    }
+                ),
+            )
+        producer.produce(
+            TOPIC,
+            key=account_id,
+            value=json.dumps(
+                {"account_id": account_id, "event_id": account_id, "produced_at": time.time()}
+            ),
+        )
+
+
+def _subscribe(broker: InMemoryKafkaBroker, consumer_count: int) -> list[Any]:
+    with broker.patch_kafka_clients():
+        return [kafka.subscribe_to_topics([TOPIC])[TOPIC] for _ in range(consumer_count)]
+
+
+def _wait_for_all(
+    broker: InMemoryKafkaBroker, consumers: list[Any], consumer_account_ids: list[list[str]]
+) -> tuple[list[dict[str, Any]], list[float]]:
+    """
+    Produces the messages in the background and waits for each consumer to match its account ids
+    concurrently
+    :return: the unmatched account ids for each consumer, and the latency of each matched message
+    """
+    recorder = _LatencyRecorder()
+    results: list[dict[str, Any]] = [{} for _ in consumers]
+
+    def wait(index: int) -> None:
+        results[index] = kafka.wait_for_messages(
+            consumers[index],
+            matcher=_matcher,
+            callback=recorder.callback,
+            unique_message_ids={account_id: None for account_id in consumer_account_ids[index]},
+            inter_message_timeout=5,
+            matched_message_timeout=5,
+        )
+
+    threads = [threading.Thread(target=wait, args=(i,)) for i in range(len(consumers))]
+    for thread in threads:
+        thread.start()
+    # every consumer sees every message, as they are in different consumer groups
+    _produce(broker, [account_id for ids in consumer_account_ids for account_id in ids])
+    for thread in threads:
+        thread.join()
+    return results, recorder.latencies
+
+
+class WaitForMessagesPerformanceTest(TestCase):
+    """
+    Measures wait_for_messages throughput and end-to-end latency against an in-memory broker
+    """
+
+    def _benchmark(self, name: str, consumer_account_ids: list[list[str]]) -> None:
+        def setup():
+            # subscribing waits for partition assignment, which isn't part of the benchmark
+            self.broker = InMemoryKafkaBroker(
+                num_partitions=NUM_PARTITIONS,
+                latency=BROKER_LATENCY,
+                jitter=BROKER_JITTER,
+                seed=0,
+            )
+            self.consumers = _subscribe(self.broker, len(consumer_account_ids))
+
+        result = run_benchmark(
+            name,
+            lambda: _wait_for_all(self.broker, self.consumers, consumer_account_ids),
+            repeat=3,
+            setup=setup,
+        )
+        unmatched, latencies = result.return_value
+        self.assertEqual(unmatched, [{} for _ in consumer_account_ids])
+
+        consumed_messages = sum(len(ids) for ids in consumer_account_ids) * (
+            1 + UNRELATED_MESSAGES_PER_MATCH
+        )
+        percentiles = statistics.quantiles(latencies, n=100)
+        log.info(
+            f"{name}: {consumed_messages * len(consumer_account_ids) / result.best:.0f} "
+            f"messages/s consumed, matched message latency p50 {percentiles[49] * 1000:.1f}ms, "
+            f"p99 {percentiles[98] * 1000:.1f}ms"
+        )
+
+    def test_benchmark_single_consumer(self):
+        for matcher_count in MATCHER_COUNTS:
+            with self.subTest(matcher_count=matcher_count):
+                self._benchmark(
+                    f"1 consumer matching {matcher_count} messages",
+                    [[f"account_{i}" for i in range(matcher_count)]],
+                )
+
+    def test_benchmark_concurrent_consumers(self):
+        matcher_count = MATCHER_COUNTS[0]
+        self._benchmark(
+            f"{CONCURRENT_CONSUMERS} consumers each matching {matcher_count} messages",
+            [
+                [f"consumer_{consumer}_account_{i}" for i in range(matcher_count)]
+                for consumer in range(CONCURRENT_CONSUMERS)
+            ],
+        )
@@ -0,0 +1,219 @@
+# standard libs
+import json
+import threading
+import time
+from unittest import TestCase
+from unittest.mock import Mock
+
+# third party
+from confluent_kafka import OFFSET_BEGINNING, KafkaError, TopicPartition
+
+# inception sdk
+import inception_sdk.common.kafka as kafka
+from inception_sdk.common.test.mocks.kafka_broker import InMemoryKafkaBroker
+
+TOPIC = "vault.core_api.v1.balances.account_balance.events"
+
+
+def _matcher(event_msg, unique_message_ids):
+    account_id = event_msg["account_id"]
+    if account_id in unique_message_ids:
+        return account_id, event_msg["event_id"], True
+    return "", event_msg["event_id"], False
+
+
+def _event(account_id: str, event_id: str | None = None) -> str:
+    return json.dumps({"account_id": account_id, "event_id": event_id or f"event_{account_id}"})
+
+
+class InMemoryKafkaBrokerTest(TestCase):
+    def setUp(self) -> None:
+        self.broker = InMemoryKafkaBroker(num_partitions=3, seed=0)
+
+    def _consumer(self, **config):
+        consumer = self.broker.Consumer({"group.id": "group", **config})
+        consumer.subscribe([TOPIC])
+        return consumer
+
+    def test_messages_with_the_same_key_go_to_the_same_partition_in_order(self):
+        producer = self.broker.Producer()
+        for i in range(5):
+            producer.produce(TOPIC, value=f"message_{i}", key="account_1")
+
+        consumer = self._consumer(**{"auto.offset.reset": "earliest"})
+        messages = consumer.consume(num_messages=5, timeout=1)
+
+        self.assertEqual(
+            [message.value() for message in messages],
+            [b"message_0", b"message_1", b"message_2", b"message_3", b"message_4"],
+        )
+        self.assertEqual({message.partition() for message in messages}, {messages[0].partition()})
+        self.assertEqual([message.offset() for message in messages], [0, 1, 2, 3, 4])
+        self.assertEqual(messages[0].key(), b"account_1")
+        self.assertIsNone(consumer.poll(0))
+
+    def test_partitions_are_consumed_round_robin(self):
+        producer = self.broker.Producer()
+        for partition in range(3):
+            for i in range(2):
+                producer.produce(TOPIC, value=f"{partition}_{i}", partition=partition)
+
+        consumer = self._consumer(**{"auto.offset.reset": "earliest"})
+        messages = consumer.consume(num_messages=6, timeout=1)
+
+        self.assertEqual([message.partition() for message in messages], [0, 1, 2, 0, 1, 2])
+
+    def test_latest_offset_reset_skips_existing_messages(self):
+        producer = self.broker.Producer()
+        producer.produce(TOPIC, value="before", key="a")
+        consumer = self._consumer()
+        self.assertIsNone(consumer.poll(0))
+
+        producer.produce(TOPIC, value="after", key="a")
+
+        self.assertEqual(consumer.poll(1).value(), b"after")
+
+    def test_committed_offsets_are_resumed_by_group(self):
+        producer = self.broker.Producer()
+        for i in range(4):
+            producer.produce(TOPIC, value=str(i), partition=0)
+        consumer = self._consumer(**{"auto.offset.reset": "earliest"})
+        consumer.consume(num_messages=2, timeout=1)
+        consumer.close()
+
+        consumer = self._consumer()
+
+        self.assertEqual(consumer.poll(1).value(), b"2")
+        partition = TopicPartition(TOPIC, 0)
+        self.assertEqual(consumer.committed([partition])[0].offset, 3)
+        self.assertEqual(consumer.get_watermark_offsets(partition), (0, 4))
+
+    def test_closed_consumer_cannot_be_polled(self):
+        consumer = self._consumer()
+        consumer.close()
+
+        with self.assertRaisesRegex(RuntimeError, "Consumer closed"):
+            consumer.poll(0)
+
+    def test_assignment_callbacks(self):
+        on_assign = Mock()
+        on_revoke = Mock()
+        consumer = self.broker.Consumer({"group.id": "group"})
+        consumer.subscribe([TOPIC], on_assign=on_assign, on_revoke=on_revoke)
+        on_assign.assert_not_called()
+
+        consumer.poll(0)
+
+        on_assign.assert_called_once_with(consumer, [TopicPartition(TOPIC, p) for p in range(3)])
+        self.assertEqual(len(consumer.assignment()), 3)
+
+        consumer.subscribe([TOPIC, "other_topic"], on_assign=on_assign, on_revoke=on_revoke)
+        consumer.poll(0)
+
+        on_revoke.assert_called_once()
+        self.assertEqual(len(consumer.assignment()), 6)
+
+    def test_assign_callback_can_override_offsets(self):
+        producer = self.broker.Producer()
+        producer.produce(TOPIC, value="existing", partition=1)
+
+        def on_assign(consumer, partitions):
+            for partition in partitions:
+                partition.offset = OFFSET_BEGINNING
+            consumer.assign(partitions)
+
+        consumer = self.broker.Consumer({"group.id": "group"})
+        consumer.subscribe([TOPIC], on_assign=on_assign)
+
+        self.assertEqual(consumer.poll(1).value(), b"existing")
+
+    def test_partition_eof_is_reported_once(self):
+        self.broker.create_topic("single", num_partitions=1)
+        consumer = self.broker.Consumer({"group.id": "group", "enable.partition.eof": True})
+        consumer.subscribe(["single"])
+
+        message = consumer.poll(0)
+
+        self.assertEqual(message.error().code(), KafkaError._PARTITION_EOF)
+        self.assertIsNone(consumer.poll(0))
+
+    def test_latency_delays_visibility_and_preserves_order(self):
+        broker = InMemoryKafkaBroker(num_partitions=1, latency=0.05, jitter=0.02, seed=1)
+        consumer = broker.Consumer({"group.id": "group"})
+        consumer.subscribe([TOPIC])
+        consumer.poll(0)
+        producer = broker.Producer()
+        start = time.monotonic()
+        for i in range(5):
+            producer.produce(TOPIC, value=str(i))
+
+        self.assertIsNone(consumer.poll(0.01))
+        messages = consumer.consume(num_messages=5, timeout=1)
+
+        self.assertGreaterEqual(time.monotonic() - start, 0.05)
+        self.assertEqual([message.value() for message in messages], [b"0", b"1", b"2", b"3", b"4"])
+
+    def test_poll_wakes_up_when_a_message_is_produced(self):
+        consumer = self._consumer()
+        consumer.poll(0)
+        producer = self.broker.Producer()
+        timer = threading.Timer(0.05, lambda: producer.produce(TOPIC, value="late"))
+        timer.start()
+        self.addCleanup(timer.cancel)
+
+        self.assertEqual(consumer.poll(5).value(), b"late")
+
+    def test_delivery_reports_are_served_on_poll(self):
+        producer = self.broker.Producer()
+        on_delivery = Mock()
+        producer.produce(TOPIC, value="message", on_delivery=on_delivery)
+        self.assertEqual(len(producer), 1)
+
+        self.assertEqual(producer.poll(0), 1)
+
+        error, message = on_delivery.call_args.args
+        self.assertIsNone(error)
+        self.assertEqual(message.value(), b"message")
+        self.assertEqual(producer.flush(), 0)
+
+    def test_missing_group_id_raises(self):
+        with self.assertRaisesRegex(ValueError, "group.id"):
+            self.broker.Consumer({})
+
+
+class InMemoryKafkaBrokerHelpersTest(TestCase):
+    def setUp(self) -> None:
+        self.broker = InMemoryKafkaBroker(num_partitions=2, seed=0)
+        patcher = self.broker.patch_kafka_clients()
+        patcher.__enter__()
+        self.addCleanup(patcher.__exit__, None, None, None)
+
+    def test_subscribe_to_topics_waits_for_assignment(self):
+        self.broker.Producer().produce(TOPIC, value=_event("old"))
+
+        consumers = kafka.subscribe_to_topics([TOPIC, "other_topic"])
+
+        self.assertEqual(list(consumers), [TOPIC, "other_topic"])
+        # the assign callback moves the offsets to the high watermark, so old messages are skipped
+        self.assertEqual(
+            sorted(partition.offset for partition in consumers[TOPIC].assignment()), [0, 1]
+        )
+
+    def test_wait_for_messages_matches_produced_messages(self):
+        consumer = kafka.subscribe_to_topics([TOPIC])[TOPIC]
+        producer = kafka.initialise_producer()
+        for account_id in ["1", "2", "unrelated", "2"]:
+            kafka.produce_message(producer, TOPIC, _event(account_id), key=account_id)
+        callback = Mock()
+
+        result = kafka.wait_for_messages(
+            consumer,
+            matcher=_matcher,
+            callback=callback,
+            unique_message_ids={"1": None, "2": None, "3": None},
+            inter_message_timeout=0.2,  # type: ignore
+            matched_message_timeout=0,
+        )
+
+        self.assertEqual(result, {"3": None})
+        self.assertEqual(callback.call_count, 2)
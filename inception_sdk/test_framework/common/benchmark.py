@@ -0,0 +1,357 @@
+# standard libs
+import gc
+import json
+import logging
+import math
+import os
+import platform
+import re
+import statistics
+import time
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from decimal import Decimal
+from typing import Any, Callable, Iterable, Sequence
+
+log = logging.getLogger(__name__)
+logging.basicConfig(
+    level=os.environ.get("LOGLEVEL", "INFO"),
+    format="%(asctime)s.%(msecs)03d - %(levelname)s: %(message)s",
+    datefmt="%Y-%m-%d %H:%M:%S",
+)
+
+DEFAULT_MICRO_BENCHMARK_REPEAT = 15
+DEFAULT_SIGNIFICANCE_LEVEL = 0.01
+DEFAULT_MIN_SLOWDOWN = 0.1
+# calls of the reference workload per reference timing
+REFERENCE_WORKLOAD_NUMBER = 50
+RESULTS_FORMAT_VERSION = 1
+
+
+@dataclass
+class BenchmarkResult:
+    name: str
+    # wall-clock duration of each repeat, per call, in seconds
+    timings: list[float] = field(default_factory=list)
+    # the value returned by the last call to the benchmarked function
+    return_value: Any = None
+
+    @property
+    def best(self) -> float:
+        return min(self.timings)
+
+    @property
+    def mean(self) -> float:
+        return statistics.mean(self.timings)
+
+    @property
+    def median(self) -> float:
+        return statistics.median(self.timings)
+
+    def __str__(self) -> str:
+        return (
+            f"{self.name}: best {self.best * 1000:.3f}ms, median {self.median * 1000:.3f}ms "
+            f"over {len(self.timings)} repeats"
+        )
+
+
+def run_benchmark(
+    name: str,
+    func: Callable[[], Any],
+    repeat: int = 5,
+    setup: Callable[[], Any] | None = None,
+    number: int = 1,
+) -> BenchmarkResult:
+    """
+    Times repeated calls to a function and logs the result
+    :param name: name used to identify the benchmark in logs
+    :param func: the function to benchmark. It is called without arguments
+    :param repeat: number of timings to take
+    :param setup: optional function called before each timing, which is not timed
+    :param number: number of calls per timing. Each timing is the mean duration of these calls, so
+    that functions which only take microseconds can be timed reliably
+    :return: the benchmark result
+    """
+    result = BenchmarkResult(name=name)
+    calls = range(number)
+    for _ in range(repeat):
+        if setup is not None:
+            setup()
+        start = time.perf_counter()
+        for _ in calls:
+            result.return_value = func()
+        result.timings.append((time.perf_counter() - start) / number)
+    log.info(str(result))
+    return result
+
+
+@dataclass
+class MicroBenchmark:
+    """
+    A benchmark of a single function on synthetic inputs. The inputs are only created when the
+    benchmark is prepared, so suites of benchmarks are cheap to define at import time
+    """
+
+    name: str
+    # creates the inputs and returns the function to time, which is called without arguments
+    prepare: Callable[[], Callable[[], Any]]
+    # number of calls per timing, see run_benchmark
+    number: int = 1
+
+
+@dataclass
+class BenchmarkRun:
+    """
+    The timings of a run of micro-benchmarks, which can be stored as a baseline and compared
+    against later runs with compare_runs
+    """
+
+    # benchmark name to the per-call duration of each timing, in seconds
+    timings: dict[str, list[float]]
+    # benchmark name to the mean duration of the reference workload timed just before and after
+    # each of the benchmark's timings, see run_micro_benchmarks
+    reference_timings: dict[str, list[float]]
+    metadata: dict[str, str] = field(default_factory=dict)
+
+    def relative_timings(self, name: str) -> list[float]:
+        """
+        :return: each timing of the benchmark divided by its reference timing
+        """
+        return [
+            timing / reference_timing
+            for timing, reference_timing in zip(self.timings[name], self.reference_timings[name])
+        ]
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "version": RESULTS_FORMAT_VERSION,
+            "metadata": self.metadata,
+            "timings": _rounded_timings(self.timings),
+            "reference_timings": _rounded_timings(self.reference_timings),
+        }
+
+    @classmethod
+    def from_dict(cls, run: dict[str, Any]) -> "BenchmarkRun":
+        """
+        :raises ValueError: if the run was written in an unsupported format
+        """
+        if run.get("version") != RESULTS_FORMAT_VERSION:
+            raise ValueError(
+                f"Unsupported benchmark results version {run.get('version')!r}, expected "
+                f"{RESULTS_FORMAT_VERSION}"
+            )
+        return cls(
+            timings=run["timings"],
+            reference_timings=run["reference_timings"],
+            metadata=run.get("metadata", {}),
+        )
+
+    def write(self, path: str) -> None:
+        with open(path, "w", encoding="utf-8") as results_file:
+            json.dump(self.to_dict(), results_file, indent=2)
+            results_file.write("\n")
+
+    @classmethod
+    def read(cls, path: str) -> "BenchmarkRun":
+        with open(path, encoding="utf-8") as results_file:
+            return cls.from_dict(json.load(results_file))
+
+
+def _rounded_timings(timings: dict[str, list[float]]) -> dict[str, list[float]]:
+    # 4 significant figures is well within the noise of any timing, and keeps baselines readable
+    return {
+        name: [float(f"{timing:.4g}") for timing in benchmark_timings]
+        for name, benchmark_timings in sorted(timings.items())
+    }
+
+
+def _reference_workload() -> Decimal:
+    # decimal arithmetic, dictionary lookups and string formatting, like most library features
+    amounts = {f"ADDRESS_{i}": Decimal(i) / 7 for i in range(50)}
+    total = Decimal("0")
+    details = []
+    for address, amount in amounts.items():
+        total += amount.quantize(Decimal("0.01"))
+        details.append(f"{address} {total:.2f}")
+    return total
+
+
+def _time(func: Callable[[], Any], number: int) -> float:
+    calls = range(number)
+    start = time.perf_counter()
+    for _ in calls:
+        func()
+    return (time.perf_counter() - start) / number
+
+
+def run_micro_benchmarks(
+    benchmarks: Iterable[MicroBenchmark],
+    repeat: int = DEFAULT_MICRO_BENCHMARK_REPEAT,
+    name_pattern: str | None = None,
+) -> BenchmarkRun:
+    """
+    Runs micro-benchmarks one after the other. A fixed reference workload is timed before and after
+    each timing, so that the timings can be normalised for the speed of the machine at the time,
+    which can vary by tens of percent during a run due to frequency scaling and other processes,
+    and between machines. Each benchmarked function is called once before it is timed
+    to warm up any caches, and garbage collection is disabled while it is timed, as with timeit
+    :param benchmarks: the benchmarks to run
+    :param repeat: number of timings to take for each benchmark
+    :param name_pattern: optional regex, only benchmarks whose name matches it are run
+    :raises ValueError: if two benchmarks have the same name
+    :return: the timings of each benchmark that was run
+    """
+    run = BenchmarkRun(
+        timings={},
+        reference_timings={},
+        metadata={
+            "created": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "machine": platform.machine(),
+            "python": f"{platform.python_implementation()} {platform.python_version()}",
+        },
+    )
+    names = set()
+    for benchmark in benchmarks:
+        if benchmark.name in names:
+            raise ValueError(f"Duplicate benchmark name {benchmark.name!r}")
+        names.add(benchmark.name)
+        if name_pattern is not None and not re.search(name_pattern, benchmark.name):
+            continue
+        func = benchmark.prepare()
+        func()
+        timings: list[float] = []
+        reference_timings: list[float] = []
+        gc_enabled = gc.isenabled()
+        gc.collect()
+        gc.disable()
+        try:
+            previous_reference_timing = _time(_reference_workload, REFERENCE_WORKLOAD_NUMBER)
+            for _ in range(repeat):
+                timings.append(_time(func, benchmark.number))
+                reference_timing = _time(_reference_workload, REFERENCE_WORKLOAD_NUMBER)
+                reference_timings.append((previous_reference_timing + reference_timing) / 2)
+                previous_reference_timing = reference_timing
+        finally:
+            if gc_enabled:
+                gc.enable()
+        run.timings[benchmark.name] = timings
+        run.reference_timings[benchmark.name] = reference_timings
+        log.info(str(BenchmarkResult(name=benchmark.name, timings=timings)))
+    return run
+
+
+def slowdown_p_value(baseline: Sequence[float], current: Sequence[float]) -> float:
+    """
+    One-sided Mann-Whitney U test of whether the current timings tend to be larger than the
+    baseline timings. The test makes no assumption about the distribution of the timings, which
+    are usually skewed by outliers. The normal approximation with a tie correction is used, which
+    is accurate enough for the 10 or more timings per benchmark that are needed to detect a
+    slowdown at typical significance levels
+    :param baseline: the baseline timings
+    :param current: the current timings
+    :raises ValueError: if either set of timings is empty
+    :return: the p-value, i.e. the probability of timings at least this much slower than the
+    baseline if the current code was no slower
+    """
+    if not baseline or not current:
+        raise ValueError("Timings are required to compare benchmarks")
+    current_count = len(current)
+    baseline_count = len(baseline)
+    count = current_count + baseline_count
+    ordered = sorted(
+        [(timing, True) for timing in current] + [(timing, False) for timing in baseline]
+    )
+    current_rank_sum = 0.0
+    tie_correction = 0
+    start = 0
+    while start < count:
+        end = start
+        while end + 1 < count and ordered[end + 1][0] == ordered[start][0]:
+            end += 1
+        # tied timings share the mean of their ranks, which start at 1
+        rank = (start + end) / 2 + 1
+        current_rank_sum += rank * sum(
+            1 for _, is_current in ordered[start : end + 1] if is_current
+        )
+        ties = end - start + 1
+        tie_correction += ties**3 - ties
+        start = end + 1
+
+    u_statistic = current_rank_sum - current_count * (current_count + 1) / 2
+    mean = current_count * baseline_count / 2
+    variance = (
+        current_count * baseline_count / 12 * ((count + 1) - tie_correction / (count * (count - 1)))
+        if count > 1
+        else 0
+    )
+    if variance == 0:
+        # all timings are identical, so there is no evidence of a slowdown
+        return 1.0
+    # with a continuity correction, as U only takes discrete values
+    z_score = (u_statistic - mean - 0.5) / math.sqrt(variance)
+    return 0.5 * math.erfc(z_score / math.sqrt(2))
+
+
+@dataclass
+class BenchmarkComparison:
+    name: str
+    baseline_median: float
+    # median of the current timings. If normalised, this is scaled to the speed of the machine
+    # during the baseline run
+    current_median: float
+    p_value: float
+    regression: bool
+
+    @property
+    def change(self) -> float:
+        return self.current_median / self.baseline_median - 1
+
+    def __str__(self) -> str:
+        return (
+            f"{self.name}: {self.baseline_median * 1e6:.2f}us -> "
+            f"{self.current_median * 1e6:.2f}us ({self.change:+.1%}, p={self.p_value:.4f})"
+            f"{' REGRESSION' if self.regression else ''}"
+        )
+
+
+def compare_runs(
+    baseline: BenchmarkRun,
+    current: BenchmarkRun,
+    significance_level: float = DEFAULT_SIGNIFICANCE_LEVEL,
+    min_slowdown: float = DEFAULT_MIN_SLOWDOWN,
+    normalise: bool = True,
+) -> list[BenchmarkComparison]:
+    """
+    Compares the timings of benchmarks in both runs. A benchmark has regressed if its timings are
+    significantly slower than the baseline's and its median has slowed down by more than
+    min_slowdown, so that tiny but consistent slowdowns aren't reported
+    :param baseline: the baseline run
+    :param current: the run to compare against the baseline
+    :param significance_level: the p-value below which a slowdown is significant
+    :param min_slowdown: the smallest relative slowdown of the median that is reported, e.g. 0.1
+    for 10%
+    :param normalise: if True, the relative timings are compared (see BenchmarkRun), so that runs
+    from machines of different speeds can be compared
+    :return: the comparison for each benchmark in both runs, in name order
+    """
+    comparisons = []
+    for name in sorted(baseline.timings.keys() & current.timings.keys()):
+        if normalise:
+            baseline_samples = baseline.relative_timings(name)
+            current_samples = current.relative_timings(name)
+        else:
+            baseline_samples = baseline.timings[name]
+            current_samples = current.timings[name]
+        p_value = slowdown_p_value(baseline_samples, current_samples)
+        change = statistics.median(current_samples) / statistics.median(baseline_samples) - 1
+        baseline_median = statistics.median(baseline.timings[name])
+        comparisons.append(
+            BenchmarkComparison(
+                name=name,
+                baseline_median=baseline_median,
+                current_median=baseline_median * (1 + change),
+                p_value=p_value,
+                regression=p_value < significance_level and change > min_slowdown,
+            )
+        )
+    return comparisons
@@ -0,0 +1,274 @@
+"""
+Runs suites of micro-benchmarks and compares their timings against the baselines stored alongside
+each suite, exiting with a non-zero status if any benchmark has significantly slowed down.
+
+A suite is a module with a `BENCHMARKS` list of MicroBenchmark. Its baseline is the
+`<module>_baseline.json` file next to it, e.g.:
+
+    python -m inception_sdk.test_framework.common.benchmark_runner \
+        --suites=library.features.lending.test.performance.benchmarks
+
+Baselines are created or updated with `--update_baselines`. This is refused while the git repo
+has other uncommitted changes, so that baseline updates are committed and reviewed on their own
+rather than alongside the changes they measure. Runs can also be written to a file with `--output`
+and compared later without re-running, e.g. to compare two commits on the same machine:
+
+    python -m inception_sdk.test_framework.common.benchmark_runner \
+        --baseline=before.json --current=after.json
+"""
+# standard libs
+import importlib
+import logging
+import os
+import sys
+from types import ModuleType
+
+# third party
+import git
+from git.repo import Repo
+
+# inception sdk
+from inception_sdk.common.python.flag_utils import FLAGS, flags, parse_flags
+from inception_sdk.test_framework.common.benchmark import (
+    DEFAULT_MICRO_BENCHMARK_REPEAT,
+    DEFAULT_MIN_SLOWDOWN,
+    DEFAULT_SIGNIFICANCE_LEVEL,
+    BenchmarkComparison,
+    BenchmarkRun,
+    MicroBenchmark,
+    compare_runs,
+    run_micro_benchmarks,
+)
+
+log = logging.getLogger(__name__)
+logging.basicConfig(
+    level=os.environ.get("LOGLEVEL", "INFO"),
+    format="%(asctime)s.%(msecs)03d - %(levelname)s: %(message)s",
+    datefmt="%Y-%m-%d %H:%M:%S",
+)
+
+SUITES = "suites"
+REPEAT = "repeat"
+NAME_PATTERN = "name_pattern"
+UPDATE_BASELINES = "update_baselines"
+OUTPUT = "output"
+BASELINE = "baseline"
+CURRENT = "current"
+SIGNIFICANCE_LEVEL = "significance_level"
+MIN_SLOWDOWN = "min_slowdown"
+NORMALISE = "normalise"
+
+flags.DEFINE_list(
+    name=SUITES,
+    default=[],
+    help="comma-separated module names of the suites to run, each with a BENCHMARKS list",
+)
+
+flags.DEFINE_integer(
+    name=REPEAT,
+    default=DEFAULT_MICRO_BENCHMARK_REPEAT,
+    lower_bound=1,
+    help="number of timings to take for each benchmark. At least 10 are needed for slowdowns to "
+    "be significant at the default significance level",
+)
+
+flags.DEFINE_string(
+    name=NAME_PATTERN,
+    default=None,
+    help="if set, only benchmarks whose name matches this regex are run",
+)
+
+flags.DEFINE_bool(
+    name=UPDATE_BASELINES,
+    default=False,
+    help="if set, the suites' baselines are overwritten with this run instead of being compared. "
+    "Refused if the git repo has uncommitted changes other than the baselines, so that baseline "
+    "updates are committed and reviewed on their own",
+)
+
+flags.DEFINE_string(
+    name=OUTPUT,
+    default=None,
+    help="if set, the timings of all suites in this run are written to this file",
+)
+
+flags.DEFINE_string(
+    name=BASELINE,
+    default=None,
+    help="a file written with --output to compare --current against, instead of running suites",
+)
+
+flags.DEFINE_string(
+    name=CURRENT,
+    default=None,
+    help="a file written with --output to compare against --baseline",
+)
+
+flags.DEFINE_float(
+    name=SIGNIFICANCE_LEVEL,
+    default=DEFAULT_SIGNIFICANCE_LEVEL,
+    help="the p-value below which a slowdown is considered significant",
+)
+
+flags.DEFINE_float(
+    name=MIN_SLOWDOWN,
+    default=DEFAULT_MIN_SLOWDOWN,
+    help="the smallest relative slowdown of a benchmark's median that is reported as a "
+    "regression, e.g. 0.1 for 10%",
+)
+
+flags.DEFINE_bool(
+    name=NORMALISE,
+    default=True,
+    help="if set, timings are compared relative to the reference workload timed alongside them, "
+    "so that runs from machines of different speeds can be compared",
+)
+
+
+def baseline_path(suite: ModuleType) -> str:
+    return f"{os.path.splitext(suite.__file__)[0]}_baseline.json"  # type: ignore
+
+
+def load_suite(module_name: str) -> ModuleType:
+    """
+    :raises ValueError: if the module has no BENCHMARKS list
+    """
+    suite = importlib.import_module(module_name)
+    benchmarks = getattr(suite, "BENCHMARKS", None)
+    if not isinstance(benchmarks, list) or not all(
+        isinstance(benchmark, MicroBenchmark) for benchmark in benchmarks
+    ):
+        raise ValueError(f"Suite {module_name} must define a BENCHMARKS list of MicroBenchmark")
+    return suite
+
+
+def get_uncommitted_changes(baseline_paths: list[str]) -> list[str]:
+    """
+    :param baseline_paths: paths of the baselines to update, which are ignored
+    :return: the paths, relative to the repo root, of the other files with uncommitted changes in
+    the git repo containing the first baseline. Empty if the baselines are not in a git repo
+    """
+    try:
+        repo = Repo(os.path.dirname(baseline_paths[0]), search_parent_directories=True)
+    except (git.InvalidGitRepositoryError, git.NoSuchPathError):
+        return []
+    if repo.working_tree_dir is None:
+        return []
+    excluded_paths = {
+        os.path.relpath(os.path.realpath(path), os.path.realpath(repo.working_tree_dir))
+        for path in baseline_paths
+    }
+    changed_paths = {diff.a_path for diff in repo.index.diff(None)}
+    if repo.head.is_valid():
+        changed_paths.update(diff.a_path for diff in repo.index.diff(repo.head.commit))
+    changed_paths.update(repo.untracked_files)
+    return sorted(changed_paths - excluded_paths)
+
+
+def report(name: str, baseline: BenchmarkRun, current: BenchmarkRun) -> list[BenchmarkComparison]:
+    """
+    Compares the runs using the flag values and logs the outcome for each benchmark
+    :return: the comparisons that are regressions
+    """
+    comparisons = compare_runs(
+        baseline,
+        current,
+        significance_level=getattr(FLAGS, SIGNIFICANCE_LEVEL),
+        min_slowdown=getattr(FLAGS, MIN_SLOWDOWN),
+        normalise=getattr(FLAGS, NORMALISE),
+    )
+    log.info(f"Comparing {name} against its baseline")
+    for comparison in comparisons:
+        if comparison.regression:
+            log.warning(str(comparison))
+        else:
+            log.info(str(comparison))
+    for benchmark in sorted(current.timings.keys() - baseline.timings.keys()):
+        log.info(f"{benchmark}: not in the baseline")
+    for benchmark in sorted(baseline.timings.keys() - current.timings.keys()):
+        log.info(f"{benchmark}: not run")
+    return [comparison for comparison in comparisons if comparison.regression]
+
+
+def run_suites(
+    module_names: list[str],
+    repeat: int,
+    name_pattern: str | None,
+    update_baselines: bool,
+    output: str | None,
+) -> list[BenchmarkComparison]:
+    """
+    Runs each suite and compares it against its baseline, or updates its baseline
+    :return: the comparisons that are regressions
+    """
+    suites = [load_suite(module_name) for module_name in module_names]
+    if update_baselines and suites:
+        uncommitted_changes = get_uncommitted_changes([baseline_path(suite) for suite in suites])
+        if uncommitted_changes:
+            sys.exit(
+                f"--{UPDATE_BASELINES} must be committed separately from other changes. Commit or "
+                f"stash the changes to {', '.join(uncommitted_changes)} first"
+            )
+    runs: list[BenchmarkRun] = []
+    regressions: list[BenchmarkComparison] = []
+    for suite in suites:
+        run = run_micro_benchmarks(suite.BENCHMARKS, repeat=repeat, name_pattern=name_pattern)
+        runs.append(run)
+        path = baseline_path(suite)
+        if update_baselines:
+            baseline = run
+            if name_pattern is not None and os.path.exists(path):
+                # keep the baselines of the benchmarks that weren't run
+                existing_baseline = BenchmarkRun.read(path)
+                baseline = BenchmarkRun(
+                    timings={**existing_baseline.timings, **run.timings},
+                    reference_timings={
+                        **existing_baseline.reference_timings,
+                        **run.reference_timings,
+                    },
+                    metadata=run.metadata,
+                )
+            baseline.write(path)
+            log.info(f"Updated baseline {path}")
+        elif os.path.exists(path):
+            regressions += report(suite.__name__, BenchmarkRun.read(path), run)
+        else:
+            log.warning(f"No baseline for {suite.__name__}, run with --{UPDATE_BASELINES}")
+
+    if output and runs:
+        BenchmarkRun(
+            timings={name: timings for run in runs for name, timings in run.timings.items()},
+            reference_timings={
+                name: timings for run in runs for name, timings in run.reference_timings.items()
+            },
+            metadata=runs[0].metadata,
+        ).write(output)
+        log.info(f"Written timings to {output}")
+    return regressions
+
+
+def main(argv: list[str]):
+    parse_flags(argv, positional=False)
+    baseline = getattr(FLAGS, BASELINE)
+    current = getattr(FLAGS, CURRENT)
+    if bool(baseline) != bool(current):
+        sys.exit(f"--{BASELINE} and --{CURRENT} must be used together")
+    if baseline:
+        regressions = report(current, BenchmarkRun.read(baseline), BenchmarkRun.read(current))
+    elif getattr(FLAGS, SUITES):
+        regressions = run_suites(
+            module_names=getattr(FLAGS, SUITES),
+            repeat=getattr(FLAGS, REPEAT),
+            name_pattern=getattr(FLAGS, NAME_PATTERN),
+            update_baselines=getattr(FLAGS, UPDATE_BASELINES),
+            output=getattr(FLAGS, OUTPUT),
+        )
+    else:
+        sys.exit(f"Either --{SUITES} or --{BASELINE} and --{CURRENT} must be set")
+
+    if regressions:
+        sys.exit(f"{len(regressions)} benchmark(s) significantly slower than the baseline")
+
+
+if __name__ == "__main__":
+    main(sys.argv)
@@ -0,0 +1,197 @@
+# standard libs
+import gc
+import os
+from tempfile import TemporaryDirectory
+from unittest import TestCase
+from unittest.mock import Mock
+
+# inception sdk
+from inception_sdk.test_framework.common.benchmark import (
+    BenchmarkRun,
+    MicroBenchmark,
+    compare_runs,
+    run_benchmark,
+    run_micro_benchmarks,
+    slowdown_p_value,
+)
+
+BASELINE_TIMINGS = [1.0, 1.1, 0.9, 1.0, 1.05, 0.95, 1.0, 1.02, 0.98, 1.0]
+REFERENCE_TIMINGS = [0.1] * len(BASELINE_TIMINGS)
+
+
+def _run(timings: dict[str, list[float]], reference_scale: float = 1.0) -> BenchmarkRun:
+    return BenchmarkRun(
+        timings=timings,
+        reference_timings={
+            name: [timing * reference_scale for timing in REFERENCE_TIMINGS] for name in timings
+        },
+    )
+
+
+class RunBenchmarkTest(TestCase):
+    def test_timings_are_per_call(self):
+        func = Mock(return_value="result")
+
+        result = run_benchmark("benchmark", func, repeat=3, number=4)
+
+        self.assertEqual(func.call_count, 12)
+        self.assertEqual(len(result.timings), 3)
+        self.assertEqual(result.return_value, "result")
+
+
+class RunMicroBenchmarksTest(TestCase):
+    def test_benchmarks_are_prepared_warmed_up_and_timed(self):
+        func = Mock()
+        prepare = Mock(return_value=func)
+
+        run = run_micro_benchmarks(
+            [MicroBenchmark(name="benchmark", prepare=prepare, number=5)], repeat=3
+        )
+
+        prepare.assert_called_once_with()
+        # one warm-up call, then 3 timings of 5 calls
+        self.assertEqual(func.call_count, 16)
+        self.assertEqual(len(run.timings["benchmark"]), 3)
+        self.assertEqual(len(run.reference_timings["benchmark"]), 3)
+        self.assertTrue(gc.isenabled())
+
+    def test_name_pattern_filters_benchmarks(self):
+        skipped = Mock()
+
+        run = run_micro_benchmarks(
+            [
+                MicroBenchmark(name="utils.a 10", prepare=lambda: lambda: None),
+                MicroBenchmark(name="utils.a 100", prepare=lambda: lambda: None),
+                MicroBenchmark(name="payments.b 10", prepare=skipped),
+            ],
+            repeat=1,
+            name_pattern="^utils",
+        )
+
+        self.assertEqual(sorted(run.timings), ["utils.a 10", "utils.a 100"])
+        skipped.assert_not_called()
+
+    def test_duplicate_names_raise(self):
+        with self.assertRaisesRegex(ValueError, "Duplicate benchmark name 'benchmark'"):
+            run_micro_benchmarks(
+                [
+                    MicroBenchmark(name="benchmark", prepare=lambda: lambda: None),
+                    MicroBenchmark(name="benchmark", prepare=lambda: lambda: None),
+                ],
+                repeat=1,
+            )
+
+
+class BenchmarkRunTest(TestCase):
+    def test_relative_timings(self):
+        run = BenchmarkRun(
+            timings={"benchmark": [1.0, 3.0]}, reference_timings={"benchmark": [0.5, 2.0]}
+        )
+
+        self.assertEqual(run.relative_timings("benchmark"), [2.0, 1.5])
+
+    def test_write_and_read(self):
+        run = BenchmarkRun(
+            timings={"b": [0.000123456789, 2.0], "a": [1.0]},
+            reference_timings={"b": [0.1, 0.2], "a": [0.3]},
+            metadata={"python": "CPython 3.11.7"},
+        )
+
+        with TemporaryDirectory() as directory:
+            path = os.path.join(directory, "baseline.json")
+            run.write(path)
+            read_run = BenchmarkRun.read(path)
+
+        self.assertEqual(read_run.timings, {"a": [1.0], "b": [0.0001235, 2.0]})
+        self.assertEqual(read_run.reference_timings, run.reference_timings)
+        self.assertEqual(read_run.metadata, run.metadata)
+
+    def test_unsupported_version_raises(self):
+        with self.assertRaisesRegex(ValueError, "Unsupported benchmark results version 2"):
+            BenchmarkRun.from_dict({"version": 2, "timings": {}, "reference_timings": {}})
+
+
+class SlowdownPValueTest(TestCase):
+    def test_separated_timings(self):
+        # U = 100 for 10 timings each, with a mean of 50 and a variance of 175
+        p_value = slowdown_p_value(
+            [float(timing) for timing in range(1, 11)], [float(timing) for timing in range(11, 21)]
+        )
+
+        self.assertAlmostEqual(p_value, 9.13359e-05, places=9)
+
+    def test_faster_timings_are_not_a_slowdown(self):
+        p_value = slowdown_p_value(
+            [float(timing) for timing in range(11, 21)], [float(timing) for timing in range(1, 11)]
+        )
+
+        self.assertGreater(p_value, 0.999)
+
+    def test_identical_timings_are_not_a_slowdown(self):
+        self.assertEqual(slowdown_p_value([1.0] * 5, [1.0] * 5), 1.0)
+
+    def test_ties_are_corrected_for(self):
+        # the tie correction reduces the variance, so the same U is more significant
+        tied = slowdown_p_value([1.0, 1.0, 2.0, 2.0], [2.0, 2.0, 3.0, 3.0])
+        untied = slowdown_p_value([1.0, 1.1, 2.0, 2.1], [2.2, 2.3, 3.0, 3.1])
+
+        self.assertLess(tied, 0.5)
+        self.assertLess(untied, tied)
+
+    def test_empty_timings_raise(self):
+        with self.assertRaisesRegex(ValueError, "Timings are required"):
+            slowdown_p_value([], [1.0])
+
+
+class CompareRunsTest(TestCase):
+    def test_significant_slowdown_is_a_regression(self):
+        baseline = _run({"benchmark": BASELINE_TIMINGS})
+        current = _run({"benchmark": [timing * 1.5 for timing in BASELINE_TIMINGS]})
+
+        comparisons = compare_runs(baseline, current)
+
+        self.assertEqual(len(comparisons), 1)
+        self.assertTrue(comparisons[0].regression)
+        self.assertAlmostEqual(comparisons[0].change, 0.5)
+        self.assertLess(comparisons[0].p_value, 0.01)
+        self.assertIn("REGRESSION", str(comparisons[0]))
+
+    def test_slowdown_below_min_slowdown_is_not_a_regression(self):
+        baseline = _run({"benchmark": BASELINE_TIMINGS})
+        current = _run({"benchmark": [timing * 1.05 + 0.2 for timing in BASELINE_TIMINGS]})
+
+        comparison = compare_runs(baseline, current, min_slowdown=0.25)[0]
+
+        self.assertLess(comparison.p_value, 0.01)
+        self.assertFalse(comparison.regression)
+
+    def test_noise_is_not_a_regression(self):
+        baseline = _run({"benchmark": BASELINE_TIMINGS})
+        current = _run({"benchmark": list(reversed(BASELINE_TIMINGS))})
+
+        comparison = compare_runs(baseline, current, min_slowdown=0.0)[0]
+
+        self.assertGreater(comparison.p_value, 0.01)
+        self.assertFalse(comparison.regression)
+
+    def test_timings_are_normalised_by_reference_timings(self):
+        # e.g. a machine that is twice as slow
+        baseline = _run({"benchmark": BASELINE_TIMINGS})
+        current = _run(
+            {"benchmark": [timing * 2 for timing in BASELINE_TIMINGS]}, reference_scale=2.0
+        )
+
+        normalised = compare_runs(baseline, current)[0]
+        not_normalised = compare_runs(baseline, current, normalise=False)[0]
+
+        self.assertFalse(normalised.regression)
+        self.assertAlmostEqual(normalised.current_median, normalised.baseline_median)
+        self.assertTrue(not_normalised.regression)
+
+    def test_only_benchmarks_in_both_runs_are_compared(self):
+        baseline = _run({"b": BASELINE_TIMINGS, "a": BASELINE_TIMINGS, "removed": [1.0]})
+        current = _run({"a": BASELINE_TIMINGS, "b": BASELINE_TIMINGS, "new": [1.0]})
+
+        comparisons = compare_runs(baseline, current)
+
+        self.assertEqual([comparison.name for comparison in comparisons], ["a", "b"])
@@ -0,0 +1,172 @@
+# standard libs
+import os
+from tempfile import TemporaryDirectory
+from unittest import TestCase
+from unittest.mock import patch
+
+# third party
+from absl.testing import flagsaver
+from git import Actor
+from git.repo import Repo
+
+# inception sdk
+import inception_sdk.test_framework.common.benchmark_runner as benchmark_runner
+from inception_sdk.common.python.flag_utils import FLAGS
+from inception_sdk.test_framework.common.benchmark import BenchmarkRun, MicroBenchmark
+from inception_sdk.test_framework.common.benchmark_runner import main
+
+# this module is used as the suite
+BENCHMARKS = [
+    MicroBenchmark(name="sum 10", prepare=lambda: lambda: sum(range(10)), number=10),
+    MicroBenchmark(name="sum 100", prepare=lambda: lambda: sum(range(100)), number=10),
+]
+
+
+class BenchmarkRunnerTest(TestCase):
+    def setUp(self) -> None:
+        # other modules register flags with validators that a command line parsed here would fail,
+        # so the flags are marked as parsed and each test only overrides the runner's flags
+        FLAGS.unparse_flags()
+        FLAGS.mark_as_parsed()
+        self.addCleanup(FLAGS.unparse_flags)
+        directory = TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.directory = directory.name
+        self.baseline_path = os.path.join(self.directory, "baseline.json")
+        patcher = patch.object(benchmark_runner, "baseline_path", return_value=self.baseline_path)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        patcher = patch.object(benchmark_runner, "get_uncommitted_changes", return_value=[])
+        self.mock_get_uncommitted_changes = patcher.start()
+        self.addCleanup(patcher.stop)
+        patcher = patch.object(benchmark_runner, "parse_flags")
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def _main(self, **flag_values) -> None:
+        with flagsaver.flagsaver(**flag_values):
+            main(["benchmark_runner.py"])
+
+    def _run_suite(self, **flag_values) -> None:
+        self._main(suites=[__name__], repeat=10, **flag_values)
+
+    def test_update_baselines_and_compare(self):
+        self._run_suite(update_baselines=True)
+
+        baseline = BenchmarkRun.read(self.baseline_path)
+        self.assertEqual(sorted(baseline.timings), ["sum 10", "sum 100"])
+        self.assertEqual(len(baseline.timings["sum 10"]), 10)
+
+        # a run compared against its own baseline is very unlikely to be 10x slower
+        with self.assertLogs(benchmark_runner.log, level="INFO") as logs:
+            self._run_suite(min_slowdown=10)
+        self.assertIn(f"Comparing {__name__} against its baseline", logs.output[0])
+
+    def test_regression_exits(self):
+        self._run_suite(update_baselines=True)
+        baseline = BenchmarkRun.read(self.baseline_path)
+        baseline.timings["sum 100"] = [timing / 100 for timing in baseline.timings["sum 100"]]
+        baseline.write(self.baseline_path)
+
+        with self.assertRaisesRegex(SystemExit, "1 benchmark\\(s\\) significantly slower"):
+            self._run_suite()
+
+    def test_update_baselines_with_name_pattern_keeps_other_baselines(self):
+        BenchmarkRun(
+            timings={"sum 10": [1.0], "removed": [2.0]},
+            reference_timings={"sum 10": [1.0], "removed": [1.0]},
+        ).write(self.baseline_path)
+
+        self._run_suite(update_baselines=True, name_pattern="100$")
+
+        baseline = BenchmarkRun.read(self.baseline_path)
+        self.assertEqual(sorted(baseline.timings), ["removed", "sum 10", "sum 100"])
+        self.assertEqual(baseline.timings["sum 10"], [1.0])
+
+    def test_update_baselines_with_uncommitted_changes_exits(self):
+        self.mock_get_uncommitted_changes.return_value = ["library/feature.py"]
+
+        with self.assertRaisesRegex(SystemExit, "stash the changes to library/feature.py first"):
+            self._run_suite(update_baselines=True)
+
+        self.mock_get_uncommitted_changes.assert_called_once_with([self.baseline_path])
+        self.assertFalse(os.path.exists(self.baseline_path))
+
+    def test_uncommitted_changes_do_not_prevent_comparisons(self):
+        self.mock_get_uncommitted_changes.return_value = ["library/feature.py"]
+
+        self._run_suite()
+
+        self.mock_get_uncommitted_changes.assert_not_called()
+
+    def test_output_and_compare_files(self):
+        output = os.path.join(self.directory, "output.json")
+        self._run_suite(output=output)
+
+        self._main(baseline=output, current=output)
+
+        self.assertEqual(sorted(BenchmarkRun.read(output).timings), ["sum 10", "sum 100"])
+
+    def test_missing_flags_exit(self):
+        with self.assertRaisesRegex(SystemExit, "must be used together"):
+            self._main(baseline="baseline.json")
+
+        with self.assertRaisesRegex(SystemExit, "Either --suites or"):
+            self._main()
+
+    def test_suite_without_benchmarks_raises(self):
+        with self.assertRaisesRegex(ValueError, "must define a BENCHMARKS list"):
+            benchmark_runner.load_suite("inception_sdk.test_framework.common.benchmark")
+
+
+class GetUncommittedChangesTest(TestCase):
+    def setUp(self) -> None:
+        directory = TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.directory = directory.name
+        self.repo = Repo.init(self.directory)
+        self.addCleanup(self.repo.close)
+        self.baseline_path = os.path.join(self.directory, "suite_baseline.json")
+        self._write("suite_baseline.json", "{}")
+        self._write("feature.py", "")
+        self.repo.index.add(["suite_baseline.json", "feature.py"])
+        author = Actor("test", "test@example.com")
+        self.repo.index.commit("initial", author=author, committer=author)
+
+    def _write(self, path: str, content: str) -> None:
+        with open(os.path.join(self.directory, path), "w", encoding="utf-8") as file:
+            file.write(content)
+
+    def test_clean_repo_has_no_changes(self):
+        self.assertEqual(benchmark_runner.get_uncommitted_changes([self.baseline_path]), [])
+
+    def test_baseline_changes_are_ignored(self):
+        self._write("suite_baseline.json", '{"timings": {}}')
+        self._write("other_suite_baseline.json", "{}")
+
+        self.assertEqual(
+            benchmark_runner.get_uncommitted_changes(
+                [self.baseline_path, os.path.join(self.directory, "other_suite_baseline.json")]
+            ),
+            [],
+        )
+
+    def test_other_changes_are_returned(self):
+        self._write("feature.py", "x = 1")
+        self._write("staged.py", "")
+        self.repo.index.add(["staged.py"])
+        self._write("untracked.py", "")
+
+        self.assertEqual(
+            benchmark_runner.get_uncommitted_changes([self.baseline_path]),
+            ["feature.py", "staged.py", "untracked.py"],
+        )
+
+    def test_baselines_outside_a_repo_have_no_changes(self):
+        with TemporaryDirectory() as directory:
+            self.assertEqual(
+                benchmark_runner.get_uncommitted_changes(
+                    [os.path.join(directory, "suite_baseline.json")]
+                ),
+                [],
+            )
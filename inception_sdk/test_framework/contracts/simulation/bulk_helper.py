@@ -0,0 +1,576 @@
+# Copyright @ 2024 Thought Machine Group Limited. All rights reserved.
+"""
+Bulk equivalents of the posting instruction helpers in `simulation/helper.py`, for scenarios that
+need hundreds of thousands of postings. Each helper builds the invariant parts of its instruction
+type once, fills in the amounts, accounts, ids and timestamps from columnar inputs, and lazily
+yields SimulationEvents identical to those the single-event helpers would create.
+
+Column arguments accept either a list/tuple with one value per event, or a single value that is
+used for every event. All other arguments apply to every event.
+"""
+# standard libs
+import uuid
+from datetime import datetime
+from itertools import repeat
+from typing import Any, Iterable, Iterator, Sequence, TypeVar
+
+# inception sdk
+from inception_sdk.test_framework.contracts.simulation.data_objects.data_objects import (
+    SimulationEvent,
+)
+from inception_sdk.vault.postings.posting_classes import (
+    DEFAULT_ADVICE,
+    DEFAULT_ASSET,
+    DEFAULT_BATCH_DETAILS,
+    DEFAULT_CLIENT_ID,
+    DEFAULT_DENOMINATION,
+    DEFAULT_FINAL,
+    DEFAULT_INSTRUCTION_DETAILS,
+    DEFAULT_INTERNAL_ACCOUNT,
+    DEFAULT_TARGET_ACCOUNT,
+)
+
+T = TypeVar("T")
+Column = T | Sequence[T]
+
+DEFAULT_ACCOUNT_ADDRESS = "DEFAULT"
+DEFAULT_PHASE = "POSTING_PHASE_COMMITTED"
+
+
+def _column(name: str, values: Any, length: int) -> Iterable:
+    if isinstance(values, (list, tuple)):
+        if len(values) != length:
+            raise ValueError(f"Expected {length} {name} but got {len(values)}")
+        return values
+    return repeat(values, length)
+
+
+def _posting_instruction_batch_events(
+    instruction_type: str,
+    instructions: Iterable[dict[str, Any]],
+    event_datetimes: Sequence[datetime],
+    client_transaction_ids: Column[str],
+    instruction_details: dict[str, str] | None,
+    batch_details: dict[str, str] | None,
+    client_batch_ids: Column[str],
+    value_timestamps: Column[datetime | None],
+) -> Iterator[SimulationEvent]:
+    """
+    Validates the columns eagerly and returns a lazy iterator of the events, each wrapping a
+    single instruction in a posting instruction batch
+    """
+    length = len(event_datetimes)
+    return _generate_batch_events(
+        instruction_type,
+        instructions,
+        event_datetimes,
+        _column("client_transaction_ids", client_transaction_ids, length),
+        instruction_details or DEFAULT_INSTRUCTION_DETAILS,
+        batch_details or DEFAULT_BATCH_DETAILS,
+        _column("client_batch_ids", client_batch_ids, length),
+        _column("value_timestamps", value_timestamps, length),
+    )
+
+
+def _generate_batch_events(
+    instruction_type: str,
+    instructions: Iterable[dict[str, Any]],
+    event_datetimes: Iterable[datetime],
+    client_transaction_ids: Iterable[str],
+    instruction_details: dict[str, str],
+    batch_details: dict[str, str],
+    client_batch_ids: Iterable[str],
+    value_timestamps: Iterable[datetime | None],
+) -> Iterator[SimulationEvent]:
+    for (
+        instruction,
+        event_datetime,
+        client_transaction_id,
+        client_batch_id,
+        value_timestamp,
+    ) in zip(
+        instructions, event_datetimes, client_transaction_ids, client_batch_ids, value_timestamps
+    ):
+        # ids are generated in the same order as the single-event helpers
+        client_batch_id = client_batch_id or str(uuid.uuid4())
+        client_transaction_id = client_transaction_id or str(uuid.uuid4())
+        yield SimulationEvent(
+            event_datetime,
+            {
+                "create_posting_instruction_batch": {
+                    "client_id": DEFAULT_CLIENT_ID,
+                    "client_batch_id": client_batch_id,
+                    "posting_instructions": [
+                        {
+                            "client_transaction_id": client_transaction_id,
+                            "instruction_details": instruction_details,
+                            "override": {},
+                            instruction_type: instruction,
+                        }
+                    ],
+                    "batch_details": batch_details,
+                    "value_timestamp": (value_timestamp or event_datetime).isoformat(),
+                }
+            },
+        )
+
+
+def _account_instructions(
+    amounts: Iterable[str],
+    target_account_ids: Iterable[str | None],
+    internal_account_ids: Iterable[str | None],
+    denomination: str,
+    advice: bool | None,
+) -> Iterator[dict[str, Any]]:
+    for amount, target_account_id, internal_account_id in zip(
+        amounts, target_account_ids, internal_account_ids
+    ):
+        yield {
+            "amount": amount,
+            "denomination": denomination,
+            "target_account": {"account_id": target_account_id or DEFAULT_TARGET_ACCOUNT},
+            "internal_account_id": internal_account_id or DEFAULT_INTERNAL_ACCOUNT,
+            "advice": advice,
+            "instruction_details": None,
+        }
+
+
+def _create_account_instructions(
+    instruction_type: str,
+    amounts: Column[str],
+    event_datetimes: Sequence[datetime],
+    target_account_ids: Column[str | None],
+    internal_account_ids: Column[str | None],
+    denomination: str | None,
+    client_transaction_ids: Column[str],
+    instruction_details: dict[str, str] | None,
+    batch_details: dict[str, str] | None,
+    client_batch_ids: Column[str],
+    value_timestamps: Column[datetime | None],
+    advice: bool | None = DEFAULT_ADVICE,
+) -> Iterator[SimulationEvent]:
+    length = len(event_datetimes)
+    return _posting_instruction_batch_events(
+        instruction_type,
+        _account_instructions(
+            _column("amounts", amounts, length),
+            _column("target_account_ids", target_account_ids, length),
+            _column("internal_account_ids", internal_account_ids, length),
+            denomination or DEFAULT_DENOMINATION,
+            advice,
+        ),
+        event_datetimes,
+        client_transaction_ids,
+        instruction_details,
+        batch_details,
+        client_batch_ids,
+        value_timestamps,
+    )
+
+
+def create_inbound_authorisation_instructions(
+    amounts: Column[str],
+    event_datetimes: Sequence[datetime],
+    target_account_ids: Column[str | None] = None,
+    internal_account_ids: Column[str | None] = None,
+    denomination: str | None = None,
+    client_transaction_ids: Column[str] = "",
+    instruction_details: dict[str, str] | None = None,
+    batch_details: dict[str, str] | None = None,
+    client_batch_ids: Column[str] = "",
+    value_timestamps: Column[datetime | None] = None,
+) -> Iterator[SimulationEvent]:
+    """
+    Bulk equivalent of `create_inbound_authorisation_instruction`
+    :param amounts: column of string representations of the amounts to be sent
+    :param event_datetimes: the datetimes at which the events will be applied in the simulation.
+    There is one event per datetime
+    :param target_account_ids: column of target customer account ids
+    :param internal_account_ids: column of internal account ids
+    :param denomination: the denomination the posting instructions will be in
+    :param client_transaction_ids: column of client transaction ids. Empty ids are generated
+    :param instruction_details: instruction-level metadata for every event
+    :param batch_details: batch-level metadata for every event
+    :param client_batch_ids: column of client batch ids. Empty ids are generated
+    :param value_timestamps: column of value timestamps. If None, defaults to the event datetime
+    :return: iterator of SimulationEvents with InboundAuthorisation Posting Instruction Batches
+    """
+    return _create_account_instructions(
+        "inbound_authorisation",
+        amounts,
+        event_datetimes,
+        target_account_ids,
+        internal_account_ids,
+        denomination,
+        client_transaction_ids,
+        instruction_details,
+        batch_details,
+        client_batch_ids,
+        value_timestamps,
+    )
+
+
+def create_inbound_hard_settlement_instructions(
+    amounts: Column[str],
+    event_datetimes: Sequence[datetime],
+    target_account_ids: Column[str | None] = None,
+    internal_account_ids: Column[str | None] = None,
+    denomination: str | None = None,
+    client_transaction_ids: Column[str] = "",
+    instruction_details: dict[str, str] | None = None,
+    batch_details: dict[str, str] | None = None,
+    client_batch_ids: Column[str] = "",
+    value_timestamps: Column[datetime | None] = None,
+) -> Iterator[SimulationEvent]:
+    """
+    Bulk equivalent of `create_inbound_hard_settlement_instruction`. See
+    `create_inbound_authorisation_instructions` for the parameters
+    :return: iterator of SimulationEvents with InboundHardSettlement Posting Instruction Batches
+    """
+    return _create_account_instructions(
+        "inbound_hard_settlement",
+        amounts,
+        event_datetimes,
+        target_account_ids,
+        internal_account_ids,
+        denomination,
+        client_transaction_ids,
+        instruction_details,
+        batch_details,
+        client_batch_ids,
+        value_timestamps,
+    )
+
+
+def create_outbound_authorisation_instructions(
+    amounts: Column[str],
+    event_datetimes: Sequence[datetime],
+    target_account_ids: Column[str | None] = None,
+    internal_account_ids: Column[str | None] = None,
+    denomination: str | None = None,
+    client_transaction_ids: Column[str] = "",
+    instruction_details: dict[str, str] | None = None,
+    batch_details: dict[str, str] | None = None,
+    client_batch_ids: Column[str] = "",
+    value_timestamps: Column[datetime | None] = None,
+) -> Iterator[SimulationEvent]:
+    """
+    Bulk equivalent of `create_outbound_authorisation_instruction`. See
+    `create_inbound_authorisation_instructions` for the parameters
+    :return: iterator of SimulationEvents with OutboundAuthorisation Posting Instruction Batches
+    """
+    return _create_account_instructions(
+        "outbound_authorisation",
+        amounts,
+        event_datetimes,
+        target_account_ids,
+        internal_account_ids,
+        denomination,
+        client_transaction_ids,
+        instruction_details,
+        batch_details,
+        client_batch_ids,
+        value_timestamps,
+    )
+
+
+def create_outbound_hard_settlement_instructions(
+    amounts: Column[str],
+    event_datetimes: Sequence[datetime],
+    target_account_ids: Column[str | None] = None,
+    internal_account_ids: Column[str | None] = None,
+    denomination: str | None = None,
+    client_transaction_ids: Column[str] = "",
+    instruction_details: dict[str, str] | None = None,
+    batch_details: dict[str, str] | None = None,
+    client_batch_ids: Column[str] = "",
+    value_timestamps: Column[datetime | None] = None,
+    advice: bool | None = None,
+) -> Iterator[SimulationEvent]:
+    """
+    Bulk equivalent of `create_outbound_hard_settlement_instruction`. See
+    `create_inbound_authorisation_instructions` for the other parameters
+    :param advice: if true, the amounts will be authorised regardless of balance check
+    :return: iterator of SimulationEvents with OutboundHardSettlement Posting Instruction Batches
+    """
+    return _create_account_instructions(
+        "outbound_hard_settlement",
+        amounts,
+        event_datetimes,
+        target_account_ids,
+        internal_account_ids,
+        denomination,
+        client_transaction_ids,
+        instruction_details,
+        batch_details,
+        client_batch_ids,
+        value_timestamps,
+        advice=advice,
+    )
+
+
+def _transfer_instructions(
+    amounts: Iterable[str],
+    creditor_target_account_ids: Iterable[str],
+    debtor_target_account_ids: Iterable[str],
+    denomination: str,
+) -> Iterator[dict[str, Any]]:
+    for amount, creditor_target_account_id, debtor_target_account_id in zip(
+        amounts, creditor_target_account_ids, debtor_target_account_ids
+    ):
+        yield {
+            "amount": amount,
+            "denomination": denomination,
+            "debtor_target_account": {"account_id": debtor_target_account_id},
+            "creditor_target_account": {"account_id": creditor_target_account_id},
+            "instruction_details": None,
+        }
+
+
+def create_transfer_instructions(
+    amounts: Column[str],
+    event_datetimes: Sequence[datetime],
+    creditor_target_account_ids: Column[str],
+    debtor_target_account_ids: Column[str],
+    denomination: str = "",
+    client_transaction_ids: Column[str] = "",
+    instruction_details: dict[str, str] | None = None,
+    batch_details: dict[str, str] | None = None,
+    client_batch_ids: Column[str] = "",
+    value_timestamps: Column[datetime | None] = None,
+) -> Iterator[SimulationEvent]:
+    """
+    Bulk equivalent of `create_transfer_instruction`. See
+    `create_inbound_authorisation_instructions` for the other parameters
+    :param creditor_target_account_ids: column of accounts to credit
+    :param debtor_target_account_ids: column of accounts to debit
+    :return: iterator of SimulationEvents with Transfer Posting Instruction Batches
+    """
+    length = len(event_datetimes)
+    return _posting_instruction_batch_events(
+        "transfer",
+        _transfer_instructions(
+            _column("amounts", amounts, length),
+            _column("creditor_target_account_ids", creditor_target_account_ids, length),
+            _column("debtor_target_account_ids", debtor_target_account_ids, length),
+            denomination or DEFAULT_DENOMINATION,
+        ),
+        event_datetimes,
+        client_transaction_ids,
+        instruction_details,
+        batch_details,
+        client_batch_ids,
+        value_timestamps,
+    )
+
+
+def _posting(
+    account_id: str, amount: str, credit: bool, denomination: str, account_address: str
+) -> dict[str, Any]:
+    return {
+        "account_id": account_id,
+        "amount": amount,
+        "denomination": denomination,
+        "asset": DEFAULT_ASSET,
+        "account_address": account_address or DEFAULT_ACCOUNT_ADDRESS,
+        "phase": DEFAULT_PHASE,
+        "credit": credit,
+    }
+
+
+def _custom_instructions(
+    amounts: Iterable[str],
+    debtor_target_account_ids: Iterable[str],
+    creditor_target_account_ids: Iterable[str],
+    debtor_target_account_addresses: Iterable[str],
+    creditor_target_account_addresses: Iterable[str],
+    denomination: str,
+) -> Iterator[dict[str, Any]]:
+    for (
+        amount,
+        debtor_target_account_id,
+        creditor_target_account_id,
+        debtor_target_account_address,
+        creditor_target_account_address,
+    ) in zip(
+        amounts,
+        debtor_target_account_ids,
+        creditor_target_account_ids,
+        debtor_target_account_addresses,
+        creditor_target_account_addresses,
+    ):
+        yield {
+            "postings": [
+                _posting(
+                    debtor_target_account_id,
+                    amount,
+                    False,
+                    denomination,
+                    debtor_target_account_address,
+                ),
+                _posting(
+                    creditor_target_account_id,
+                    amount,
+                    True,
+                    denomination,
+                    creditor_target_account_address,
+                ),
+            ],
+            "instruction_details": None,
+        }
+
+
+def create_custom_instructions(
+    amounts: Column[str],
+    debtor_target_account_ids: Column[str],
+    creditor_target_account_ids: Column[str],
+    debtor_target_account_addresses: Column[str],
+    creditor_target_account_addresses: Column[str],
+    event_datetimes: Sequence[datetime],
+    client_transaction_ids: Column[str] = "",
+    denomination: str | None = None,
+    instruction_details: dict[str, str] | None = None,
+    batch_details: dict[str, str] | None = None,
+    client_batch_ids: Column[str] = "",
+    value_timestamps: Column[datetime | None] = None,
+) -> Iterator[SimulationEvent]:
+    """
+    Bulk equivalent of `create_custom_instruction`. See
+    `create_inbound_authorisation_instructions` for the other parameters
+    :param debtor_target_account_ids: column of accounts to debit
+    :param creditor_target_account_ids: column of accounts to credit
+    :param debtor_target_account_addresses: column of addresses to debit
+    :param creditor_target_account_addresses: column of addresses to credit
+    :return: iterator of SimulationEvents with Custom Instruction Posting Instruction Batches
+    """
+    length = len(event_datetimes)
+    return _posting_instruction_batch_events(
+        "custom_instruction",
+        _custom_instructions(
+            _column("amounts", amounts, length),
+            _column("debtor_target_account_ids", debtor_target_account_ids, length),
+            _column("creditor_target_account_ids", creditor_target_account_ids, length),
+            _column("debtor_target_account_addresses", debtor_target_account_addresses, length),
+            _column("creditor_target_account_addresses", creditor_target_account_addresses, length),
+            denomination or DEFAULT_DENOMINATION,
+        ),
+        event_datetimes,
+        client_transaction_ids,
+        instruction_details,
+        batch_details,
+        client_batch_ids,
+        value_timestamps,
+    )
+
+
+def _settlement_instructions(
+    amounts: Iterable[str], final: bool, require_pre_posting_hook_execution: bool
+) -> Iterator[dict[str, Any]]:
+    for amount in amounts:
+        yield {
+            "amount": amount,
+            "final": final,
+            "require_pre_posting_hook_execution": require_pre_posting_hook_execution,
+            "instruction_details": None,
+        }
+
+
+def create_settlement_events(
+    amounts: Column[str],
+    client_transaction_ids: Column[str],
+    event_datetimes: Sequence[datetime],
+    instruction_details: dict[str, str] | None = None,
+    batch_details: dict[str, str] | None = None,
+    client_batch_ids: Column[str] = "",
+    final: bool = DEFAULT_FINAL,
+    value_timestamps: Column[datetime | None] = None,
+    require_pre_posting_hook_execution: bool = False,
+) -> Iterator[SimulationEvent]:
+    """
+    Bulk equivalent of `create_settlement_event`. See
+    `create_inbound_authorisation_instructions` for the other parameters
+    :param client_transaction_ids: column of the client transactions to settle
+    :param final: if true, no further settlements are allowed for the client transactions
+    :param require_pre_posting_hook_execution: if true, the pre-posting hook is executed when
+    the settlements are processed
+    :return: iterator of SimulationEvents with Settlement Posting Instruction Batches
+    """
+    return _posting_instruction_batch_events(
+        "settlement",
+        _settlement_instructions(
+            _column("amounts", amounts, len(event_datetimes)),
+            final,
+            require_pre_posting_hook_execution,
+        ),
+        event_datetimes,
+        client_transaction_ids,
+        instruction_details,
+        batch_details,
+        client_batch_ids,
+        value_timestamps,
+    )
+
+
+def create_release_events(
+    client_transaction_ids: Column[str],
+    event_datetimes: Sequence[datetime],
+    instruction_details: dict[str, str] | None = None,
+    batch_details: dict[str, str] | None = None,
+    client_batch_ids: Column[str] = "",
+    value_timestamps: Column[datetime | None] = None,
+    require_pre_posting_hook_execution: bool = False,
+) -> Iterator[SimulationEvent]:
+    """
+    Bulk equivalent of `create_release_event`. See `create_inbound_authorisation_instructions`
+    for the other parameters
+    :param client_transaction_ids: column of the client transactions to release
+    :param require_pre_posting_hook_execution: if true, the pre-posting hook is executed when
+    the releases are processed
+    :return: iterator of SimulationEvents with Release Posting Instruction Batches
+    """
+    return _posting_instruction_batch_events(
+        "release",
+        (
+            {
+                "require_pre_posting_hook_execution": require_pre_posting_hook_execution,
+                "instruction_details": None,
+            }
+            for _ in event_datetimes
+        ),
+        event_datetimes,
+        client_transaction_ids,
+        instruction_details,
+        batch_details,
+        client_batch_ids,
+        value_timestamps,
+    )
+
+
+def create_auth_adjustment_instructions(
+    amounts: Column[str],
+    event_datetimes: Sequence[datetime],
+    client_transaction_ids: Column[str],
+    instruction_details: dict[str, str] | None = None,
+    batch_details: dict[str, str] | None = None,
+    client_batch_ids: Column[str] = "",
+    value_timestamps: Column[datetime | None] = None,
+) -> Iterator[SimulationEvent]:
+    """
+    Bulk equivalent of `create_auth_adjustment_instruction`. See
+    `create_inbound_authorisation_instructions` for the other parameters
+    :param client_transaction_ids: column of the client transactions to adjust
+    :return: iterator of SimulationEvents with AuthorisationAdjustment Posting Instruction Batches
+    """
+    return _posting_instruction_batch_events(
+        "authorisation_adjustment",
+        (
+            {"amount": amount, "advice": DEFAULT_ADVICE, "instruction_details": None}
+            for amount in _column("amounts", amounts, len(event_datetimes))
+        ),
+        event_datetimes,
+        client_transaction_ids,
+        instruction_details,
+        batch_details,
+        client_batch_ids,
+        value_timestamps,
+    )
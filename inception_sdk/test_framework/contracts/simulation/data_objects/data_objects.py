@@ -3,6 +3,7 @@
 import enum
 from dataclasses import dataclass
 from datetime import datetime
+from typing import Iterable
 
 # inception sdk
 from inception_sdk.test_framework.contracts.simulation.data_objects.events.parameter_events import (
@@ -124,6 +125,9 @@ class SubTest:
     expected_derived_parameters: list[ExpectedDerivedParameter] | None = None
     expected_contract_notifications: list[ExpectedContractNotification] | None = None
     events: list[SimulationEvent] | None = None
+    # lazily generated events, e.g. from a scenario_compiler.RecurringEventRule. Each rule must
+    # yield its events in chronological order
+    event_rules: list[Iterable[SimulationEvent]] | None = None
 
 
 @dataclass
@@ -0,0 +1,255 @@
+# Copyright @ 2024 Thought Machine Group Limited. All rights reserved.
+"""
+Compiles the events of a SimulationTestScenario into a single chronological stream without
+materialising or re-sorting them. Each subtest's events are treated as a sorted stream, which
+may include lazily generated events from compact rules such as `RecurringEventRule`, and all
+streams are merged with a k-way heap merge.
+"""
+# standard libs
+import heapq
+import logging
+import os
+from datetime import datetime, timedelta, timezone
+from dateutil.relativedelta import relativedelta
+from itertools import count as counter
+from typing import Callable, Iterable, Iterator, Sequence
+
+# inception sdk
+from inception_sdk.test_framework.contracts.simulation.data_objects.data_objects import (
+    SimulationEvent,
+    SimulationTestScenario,
+    SubTest,
+)
+from inception_sdk.test_framework.contracts.simulation.helper import (
+    create_instance_parameter_change_event,
+    create_transfer_instruction,
+)
+
+log = logging.getLogger(__name__)
+logging.basicConfig(
+    level=os.environ.get("LOGLEVEL", "INFO"),
+    format="%(asctime)s.%(msecs)03d - %(levelname)s: %(message)s",
+    datefmt="%Y-%m-%d %H:%M:%S",
+)
+
+MIN_DATETIME = datetime.min.replace(tzinfo=timezone.utc)
+
+
+def _event_time(event: SimulationEvent) -> datetime:
+    return event.time
+
+
+class RecurringEventRule:
+    """
+    Lazily generates events at a fixed interval, e.g. a daily transfer or a monthly parameter
+    change. Occurrences are calculated from the start rather than the previous occurrence, so
+    monthly intervals don't drift at month ends
+    """
+
+    def __init__(
+        self,
+        start: datetime,
+        interval: relativedelta | timedelta,
+        event_factory: Callable[[datetime, int], SimulationEvent | Sequence[SimulationEvent]],
+        end: datetime | None = None,
+        count: int | None = None,
+    ):
+        """
+        :param start: the time of the first occurrence
+        :param interval: the time between occurrences
+        :param event_factory: creates the event(s) for an occurrence, given its time and index.
+        Events for a single occurrence are assumed to be in chronological order
+        :param end: if specified, no occurrences are generated after this time
+        :param count: if specified, the maximum number of occurrences
+        """
+        if end is None and count is None:
+            raise ValueError("RecurringEventRule requires an end or a count")
+        self.start = start
+        self.interval = interval
+        self.event_factory = event_factory
+        self.end = end
+        self.count = count
+
+    def occurrences(self) -> Iterator[datetime]:
+        for i in counter():
+            if self.count is not None and i >= self.count:
+                return
+            occurrence = self.start + self.interval * i
+            if self.end is not None and occurrence > self.end:
+                return
+            yield occurrence
+
+    def __iter__(self) -> Iterator[SimulationEvent]:
+        for i, occurrence in enumerate(self.occurrences()):
+            events = self.event_factory(occurrence, i)
+            if isinstance(events, SimulationEvent):
+                yield events
+            else:
+                yield from events
+
+
+def recurring_transfer_rule(
+    start: datetime,
+    amount: str,
+    creditor_target_account_id: str,
+    debtor_target_account_id: str,
+    denomination: str = "",
+    interval: relativedelta | timedelta = relativedelta(days=1),
+    end: datetime | None = None,
+    count: int | None = None,
+    **kwargs,
+) -> RecurringEventRule:
+    """
+    Creates a rule for a transfer repeated at a fixed interval, daily by default. Additional
+    kwargs are passed to `create_transfer_instruction`
+    """
+    return RecurringEventRule(
+        start=start,
+        interval=interval,
+        event_factory=lambda event_datetime, _: create_transfer_instruction(
+            amount=amount,
+            event_datetime=event_datetime,
+            creditor_target_account_id=creditor_target_account_id,
+            debtor_target_account_id=debtor_target_account_id,
+            denomination=denomination,
+            **kwargs,
+        ),
+        end=end,
+        count=count,
+    )
+
+
+def recurring_instance_parameter_change_rule(
+    start: datetime,
+    account_id: str,
+    parameter_values: Sequence[dict[str, str]],
+    interval: relativedelta | timedelta = relativedelta(months=1),
+) -> RecurringEventRule:
+    """
+    Creates a rule that applies each set of instance parameter values in turn, monthly by default
+    :param parameter_values: the parameter name to value mappings for each occurrence
+    """
+    return RecurringEventRule(
+        start=start,
+        interval=interval,
+        event_factory=lambda timestamp, i: create_instance_parameter_change_event(
+            timestamp, account_id, **parameter_values[i]
+        ),
+        count=len(parameter_values),
+    )
+
+
+def _sorted_stream(events: list[SimulationEvent]) -> list[SimulationEvent]:
+    """
+    Returns the events if they are already sorted, which is usually the case, otherwise a stably
+    sorted copy
+    """
+    if all(events[i].time <= events[i + 1].time for i in range(len(events) - 1)):
+        return events
+    return sorted(events, key=_event_time)
+
+
+def _sub_test_streams(sub_test: SubTest) -> list[Iterable[SimulationEvent]]:
+    streams: list[Iterable[SimulationEvent]] = []
+    if sub_test.events:
+        streams.append(_sorted_stream(sub_test.events))
+    streams.extend(sub_test.event_rules or [])
+    return streams
+
+
+def _get_assertion_timestamps(sub_test: SubTest) -> list[datetime]:
+    assertion_ts: list[datetime] = []
+    if sub_test.expected_balances_at_ts:
+        assertion_ts.extend(sub_test.expected_balances_at_ts.keys())
+    if sub_test.expected_posting_rejections:
+        assertion_ts.extend(
+            expected_rejection.timestamp
+            for expected_rejection in sub_test.expected_posting_rejections
+        )
+    if sub_test.expected_parameter_change_rejections:
+        assertion_ts.extend(
+            expected_rejection.timestamp
+            for expected_rejection in sub_test.expected_parameter_change_rejections
+        )
+    if sub_test.expected_schedules:
+        assertion_ts.extend(
+            runtime
+            for expected_schedule in sub_test.expected_schedules
+            for runtime in expected_schedule.run_times
+        )
+    if sub_test.expected_derived_parameters:
+        assertion_ts.extend(
+            expected_derived_param.timestamp
+            for expected_derived_param in sub_test.expected_derived_parameters
+        )
+    return assertion_ts
+
+
+def _warn_on_late_events(events: Iterator[SimulationEvent], end: datetime) -> Iterator:
+    # generated events are only known once streamed, so they are checked as they are yielded
+    warned = False
+    for event in events:
+        if not warned and event.time > end:
+            log.warning("last assertion or event happens outside of simulation window")
+            warned = True
+        yield event
+
+
+def compile_event_stream(
+    test_scenario: SimulationTestScenario, setup_events: list[SimulationEvent]
+) -> tuple[Iterator[SimulationEvent], list[tuple[str, datetime]]]:
+    """
+    Lazily merges setup events with the events and event rules from the test scenario subtests.
+    The output is identical to stably sorting all of the events, but each stream only needs to
+    be sorted on its own and generated events are only created as the stream is consumed
+
+    :param test_scenario: SimulationTestScenario
+    :param setup_events: SimulationEvents generated by helper methods, e.g.
+    account/plan creations or plan association events
+    :returns: iterator of setup events + custom scenario events, and list of required derived param
+     outputs as tuple of account id and datetime
+    """
+    previous_subtest_last_event_ts = MIN_DATETIME
+    previous_subtest_last_assertion_ts = MIN_DATETIME
+    streams: list[Iterable[SimulationEvent]] = [_sorted_stream(setup_events)]
+    derived_param_outputs: list[tuple[str, datetime]] = []
+    has_event_rules = False
+
+    for sub_test in test_scenario.sub_tests:
+        if sub_test.events:
+            if sub_test.events[0].time < previous_subtest_last_event_ts:
+                log.warning(
+                    f'Subtest "{sub_test.description}" contains '
+                    "event timestamp before the previous one."
+                )
+            previous_subtest_last_event_ts = sub_test.events[-1].time
+        streams.extend(_sub_test_streams(sub_test))
+        has_event_rules = has_event_rules or bool(sub_test.event_rules)
+
+        assertion_ts = _get_assertion_timestamps(sub_test)
+        if assertion_ts:
+            if min(assertion_ts) < previous_subtest_last_assertion_ts:
+                log.warning(
+                    f'Subtest "{sub_test.description}" contains '
+                    "assertion timestamp before the previous one."
+                )
+            previous_subtest_last_assertion_ts = max(assertion_ts)
+
+        derived_param_outputs.extend(
+            (expected_derived_param.account_id, expected_derived_param.timestamp)
+            for expected_derived_param in sub_test.expected_derived_parameters or []
+        )
+
+    if (
+        previous_subtest_last_event_ts > test_scenario.end
+        or previous_subtest_last_assertion_ts > test_scenario.end
+    ):
+        log.warning("last assertion or event happens outside of simulation window")
+        has_event_rules = False
+
+    # heapq.merge yields equal elements in the order of their streams, so this matches a stable
+    # sort of the concatenated events
+    events: Iterator[SimulationEvent] = heapq.merge(*streams, key=_event_time)
+    if has_event_rules:
+        events = _warn_on_late_events(events, test_scenario.end)
+    return events, derived_param_outputs
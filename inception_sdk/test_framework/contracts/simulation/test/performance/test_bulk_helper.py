@@ -0,0 +1,135 @@
+# standard libs
+import logging
+from datetime import datetime, timedelta, timezone
+from typing import Iterator
+from unittest import TestCase
+
+# inception sdk
+from inception_sdk.test_framework.common.benchmark import run_benchmark
+from inception_sdk.test_framework.contracts.simulation import bulk_helper, helper
+from inception_sdk.test_framework.contracts.simulation.data_objects.data_objects import (
+    SimulationEvent,
+)
+
+log = logging.getLogger(__name__)
+
+START = datetime(2020, 1, 1, tzinfo=timezone.utc)
+EVENT_COUNTS = [10_000, 100_000]
+ACCOUNT_COUNT = 100
+
+
+def _columns(event_count: int) -> dict[str, list]:
+    return {
+        "amounts": [str(i % 1000) for i in range(event_count)],
+        "event_datetimes": [START + timedelta(minutes=i) for i in range(event_count)],
+        "target_account_ids": [f"account_{i % ACCOUNT_COUNT}" for i in range(event_count)],
+        # ids are generated per event by both approaches unless given, so they are fixed here to
+        # make the outputs comparable
+        "client_transaction_ids": [f"ctx_{i}" for i in range(event_count)],
+        "client_batch_ids": [f"batch_{i}" for i in range(event_count)],
+    }
+
+
+def _iter_per_event(columns: dict[str, list]) -> Iterator[SimulationEvent]:
+    return (
+        helper.create_inbound_hard_settlement_instruction(
+            amount=amount,
+            event_datetime=event_datetime,
+            target_account_id=target_account_id,
+            denomination="GBP",
+            client_transaction_id=client_transaction_id,
+            client_batch_id=client_batch_id,
+        )
+        for amount, event_datetime, target_account_id, client_transaction_id, client_batch_id in zip(
+            *columns.values()
+        )
+    )
+
+
+def _create_per_event(columns: dict[str, list]) -> list[SimulationEvent]:
+    return list(_iter_per_event(columns))
+
+
+def _create_bulk(columns: dict[str, list]) -> list[SimulationEvent]:
+    return list(
+        bulk_helper.create_inbound_hard_settlement_instructions(**columns, denomination="GBP")
+    )
+
+
+class BulkHelperPerformanceTest(TestCase):
+    """
+    Compares creating posting instruction events one at a time with the single-event helpers
+    against the bulk helpers
+    """
+
+    def test_benchmark_inbound_hard_settlements(self):
+        for event_count in EVENT_COUNTS:
+            with self.subTest(event_count=event_count):
+                columns = _columns(event_count)
+                per_event = run_benchmark(
+                    f"{event_count} inbound hard settlements, per event",
+                    lambda: _create_per_event(columns),
+                    repeat=3,
+                )
+                bulk = run_benchmark(
+                    f"{event_count} inbound hard settlements, bulk",
+                    lambda: _create_bulk(columns),
+                    repeat=3,
+                )
+                self.assertEqual(bulk.return_value, per_event.return_value)
+                log.info(f"{event_count} events: {per_event.best / bulk.best:.1f}x speedup")
+
+    def test_benchmark_streamed_inbound_hard_settlements(self):
+        # events that are streamed into the simulation request are released as soon as they are
+        # serialised, so far less time is spent in garbage collection than when they're all kept
+        event_count = EVENT_COUNTS[-1]
+        columns = _columns(event_count)
+        per_event = run_benchmark(
+            f"{event_count} streamed inbound hard settlements, per event",
+            lambda: sum(1 for _ in _iter_per_event(columns)),
+            repeat=3,
+        )
+        bulk = run_benchmark(
+            f"{event_count} streamed inbound hard settlements, bulk",
+            lambda: sum(
+                1
+                for _ in bulk_helper.create_inbound_hard_settlement_instructions(
+                    **columns, denomination="GBP"
+                )
+            ),
+            repeat=3,
+        )
+        self.assertEqual(bulk.return_value, per_event.return_value)
+        log.info(f"{event_count} events: {per_event.best / bulk.best:.1f}x speedup")
+
+    def test_benchmark_generated_ids(self):
+        event_count = EVENT_COUNTS[-1]
+        columns = _columns(event_count)
+        del columns["client_transaction_ids"], columns["client_batch_ids"]
+        per_event = run_benchmark(
+            f"{event_count} transfers with generated ids, per event",
+            lambda: [
+                helper.create_transfer_instruction(
+                    amount=amount,
+                    event_datetime=event_datetime,
+                    creditor_target_account_id=account_id,
+                    debtor_target_account_id="internal",
+                )
+                for amount, event_datetime, account_id in zip(*columns.values())
+            ],
+            repeat=3,
+        )
+        bulk = run_benchmark(
+            f"{event_count} transfers with generated ids, bulk",
+            lambda: list(
+                bulk_helper.create_transfer_instructions(
+                    amounts=columns["amounts"],
+                    event_datetimes=columns["event_datetimes"],
+                    creditor_target_account_ids=columns["target_account_ids"],
+                    debtor_target_account_ids="internal",
+                )
+            ),
+            repeat=3,
+        )
+        self.assertEqual(len(bulk.return_value), len(per_event.return_value))
+        log.info(f"{event_count} events: {per_event.best / bulk.best:.1f}x speedup")
@@ -0,0 +1,163 @@
+# standard libs
+import json
+import logging
+import os
+import tracemalloc
+from datetime import datetime, timedelta, timezone
+from typing import Any, Callable
+from unittest import TestCase, skipUnless
+
+# inception sdk
+import inception_sdk.test_framework.contracts.simulation.vault_caller as vault_caller
+from inception_sdk.test_framework.common.benchmark import run_benchmark
+from inception_sdk.test_framework.contracts.simulation.data_objects.data_objects import (
+    SimulationEvent,
+    SimulationTestScenario,
+    SubTest,
+)
+from inception_sdk.test_framework.contracts.simulation.scenario_compiler import (
+    RecurringEventRule,
+    compile_event_stream,
+)
+
+log = logging.getLogger(__name__)
+
+START = datetime(2020, 1, 1, tzinfo=timezone.utc)
+# a multi-year scenario with daily postings across many accounts
+YEARS = 10
+DAYS = 365 * YEARS
+# ~100k events by default. ~1M events takes minutes with memory tracing, so it is opt-in
+ACCOUNT_COUNT = 28
+LARGE_ACCOUNT_COUNT = 274
+RUN_LARGE_BENCHMARKS = os.environ.get("RUN_LARGE_BENCHMARKS", "") == "true"
+# each account's postings are split across subtests, one per year
+SUB_TESTS_PER_ACCOUNT = YEARS
+
+
+def _posting_event(account_id: str) -> Callable[[datetime, int], SimulationEvent]:
+    def factory(timestamp: datetime, i: int) -> SimulationEvent:
+        # a minimal posting instruction batch, as the helpers' uuid generation would dominate
+        return SimulationEvent(
+            timestamp,
+            {
+                "create_posting_instruction_batch": {
+                    "client_batch_id": f"{account_id}_{i}",
+                    "posting_instructions": [{"account_id": account_id, "amount": "10"}],
+                }
+            },
+        )
+
+    return factory
+
+
+def _rules(account_count: int) -> list[list[RecurringEventRule]]:
+    days_per_sub_test = DAYS // SUB_TESTS_PER_ACCOUNT
+    return [
+        [
+            RecurringEventRule(
+                start=START + timedelta(days=sub_test * days_per_sub_test),
+                interval=timedelta(days=1),
+                event_factory=_posting_event(f"account_{account}"),
+                count=days_per_sub_test,
+            )
+            for account in range(account_count)
+        ]
+        for sub_test in range(SUB_TESTS_PER_ACCOUNT)
+    ]
+
+
+def _setup_events(account_count: int) -> list[SimulationEvent]:
+    return [
+        SimulationEvent(START, {"create_account": {"id": f"account_{account}"}})
+        for account in range(account_count)
+    ]
+
+
+def _compile_materialised(account_count: int) -> tuple[int, int]:
+    """
+    The previous approach: every subtest's events are materialised, concatenated and re-sorted,
+    then the whole request body is serialised at once
+    """
+    sub_tests = [
+        SubTest(f"year {year}", events=[event for rule in rules for event in rule])
+        for year, rules in enumerate(_rules(account_count))
+    ]
+    events = [event for sub_test in sub_tests for event in sub_test.events or []]
+    all_events = sorted(_setup_events(account_count) + events, key=lambda event: event.time)
+    body = json.dumps(
+        {"instructions": [vault_caller._event_to_json(event) for event in all_events]}
+    ).encode()
+    return len(all_events), len(body)
+
+
+def _compile_streamed(account_count: int) -> tuple[int, int]:
+    scenario = SimulationTestScenario(
+        sub_tests=[
+            SubTest(f"year {year}", event_rules=rules)
+            for year, rules in enumerate(_rules(account_count))
+        ],
+        start=START,
+        end=START + timedelta(days=DAYS),
+    )
+    events, _ = compile_event_stream(scenario, _setup_events(account_count))
+    event_count = 0
+
+    def counted(events):
+        nonlocal event_count
+        for event in events:
+            event_count += 1
+            yield event
+
+    body_length = sum(
+        len(chunk)
+        for chunk in vault_caller._iter_json_chunks(
+            {"instructions": vault_caller._events_to_json([], counted(events))}
+        )
+    )
+    return event_count, body_length
+
+
+def _peak_memory(func: Callable[[], Any]) -> int:
+    tracemalloc.start()
+    try:
+        func()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+class ScenarioCompilerPerformanceTest(TestCase):
+    """
+    Compares materialising and sorting all scenario events against streaming them through the
+    scenario compiler into the request body
+    """
+
+    def _benchmark(self, account_count: int) -> None:
+        materialised = run_benchmark(
+            f"{account_count} accounts, materialised events",
+            lambda: _compile_materialised(account_count),
+            repeat=1,
+        )
+        streamed = run_benchmark(
+            f"{account_count} accounts, streamed events",
+            lambda: _compile_streamed(account_count),
+            repeat=1,
+        )
+        # same number of events and an identically sized request body
+        self.assertEqual(streamed.return_value, materialised.return_value)
+
+        materialised_peak = _peak_memory(lambda: _compile_materialised(account_count))
+        streamed_peak = _peak_memory(lambda: _compile_streamed(account_count))
+        log.info(
+            f"{materialised.return_value[0]} events: peak memory "
+            f"{materialised_peak / 2**20:.1f}MiB materialised vs "
+            f"{streamed_peak / 2**20:.1f}MiB streamed"
+        )
+        self.assertLess(streamed_peak, materialised_peak)
+
+    def test_benchmark_compile_time_and_peak_memory(self):
+        self._benchmark(ACCOUNT_COUNT)
+
+    @skipUnless(RUN_LARGE_BENCHMARKS, "set RUN_LARGE_BENCHMARKS=true to benchmark ~1M events")
+    def test_benchmark_compile_time_and_peak_memory_at_1m_events(self):
+        self._benchmark(LARGE_ACCOUNT_COUNT)
@@ -0,0 +1,111 @@
+# standard libs
+from typing import Any
+from unittest import TestCase
+
+# inception sdk
+import inception_sdk.test_framework.contracts.simulation.utils as utils
+from inception_sdk.test_framework.common.balance_helpers import BalanceDimensions
+from inception_sdk.test_framework.common.benchmark import run_benchmark
+
+SUPERVISOR_RESPONSE_FILE = (
+    "inception_sdk/test_framework/contracts/simulation/test/sample_supervisor_response"
+)
+# the recorded response is repeated to emulate a long simulation
+RESPONSE_REPEATS = 20
+# number of times each query is made, e.g. once per sub test. Each lookup table costs about as
+# much as a scan to build, so the index pays off from the second query onwards
+QUERY_ROUNDS = [1, 10]
+ACCOUNT_IDS = ["Savings Account", "Checking Account", "Youth Account", "1"]
+SCHEDULED_EVENTS = [
+    ("ACCRUE_INTEREST", "Savings Account", ""),
+    ("PUBLISH_EXTRACT", "Checking Account", ""),
+    ("APPLY_MAINTENANCE_FEE", "", "1"),
+]
+
+
+def _scan_account_logs(res: list[dict[str, Any]], account_id: str) -> str:
+    account_substr = f'account "{account_id}"'
+    return "; ".join(
+        log
+        for result in res
+        for log in result["result"]["logs"]
+        if account_substr in "".join(result["result"]["logs"])
+    )
+
+
+def _scan_postings(res: list[dict[str, Any]], account_id: str) -> list[dict[str, Any]]:
+    return [
+        committed_posting
+        for result in res
+        for pib in result["result"]["posting_instruction_batches"]
+        for pi in pib["posting_instructions"]
+        for committed_posting in pi["committed_postings"]
+        if committed_posting["account_address"] == BalanceDimensions().address
+        and committed_posting["account_id"] == account_id
+    ]
+
+
+def _scan_processed_scheduled_events(
+    res: list[dict[str, Any]], event_id: str, account_id: str, plan_id: str
+) -> list[str]:
+    return [
+        result["result"]["timestamp"]
+        for result in res
+        if utils.has_matching_processed_scheduled_event(
+            result["result"]["logs"], event_id, account_id, plan_id
+        )
+    ]
+
+
+class SimulationResultIndexPerformanceTest(TestCase):
+    """
+    Compares assertion helpers that rescan the simulation results on every call against queries
+    on an index built once over the results
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        with open(SUPERVISOR_RESPONSE_FILE, "r", encoding="utf-8") as simulator_response_file:
+            cls.res = eval(simulator_response_file.read()) * RESPONSE_REPEATS
+
+    def _scan(self, query_rounds: int) -> list:
+        return [
+            [
+                [_scan_account_logs(self.res, account_id) for account_id in ACCOUNT_IDS],
+                [_scan_postings(self.res, account_id) for account_id in ACCOUNT_IDS],
+                [
+                    _scan_processed_scheduled_events(self.res, *scheduled_event)
+                    for scheduled_event in SCHEDULED_EVENTS
+                ],
+            ]
+            for _ in range(query_rounds)
+        ]
+
+    def _query_index(self, query_rounds: int) -> list:
+        index = utils.SimulationResultIndex(self.res)
+        return [
+            [
+                [utils.get_account_logs(index, account_id) for account_id in ACCOUNT_IDS],
+                [utils.get_postings(index, account_id) for account_id in ACCOUNT_IDS],
+                [
+                    utils.get_processed_scheduled_events(index, *scheduled_event)
+                    for scheduled_event in SCHEDULED_EVENTS
+                ],
+            ]
+            for _ in range(query_rounds)
+        ]
+
+    def test_benchmark_assertion_helpers(self):
+        for query_rounds in QUERY_ROUNDS:
+            with self.subTest(query_rounds=query_rounds):
+                unindexed = run_benchmark(
+                    f"{query_rounds} query rounds over {len(self.res)} results without index",
+                    lambda: self._scan(query_rounds),
+                    repeat=3,
+                )
+                indexed = run_benchmark(
+                    f"{query_rounds} query rounds over {len(self.res)} results with index",
+                    lambda: self._query_index(query_rounds),
+                    repeat=3,
+                )
+                self.assertListEqual(indexed.return_value, unindexed.return_value)
@@ -0,0 +1,222 @@
+# standard libs
+import json
+from datetime import datetime, timedelta, timezone
+from itertools import count
+from typing import Callable, Iterable
+from unittest import TestCase
+from unittest.mock import patch
+from uuid import UUID
+
+# inception sdk
+from inception_sdk.test_framework.contracts.simulation import bulk_helper, helper
+from inception_sdk.test_framework.contracts.simulation.data_objects.data_objects import (
+    SimulationEvent,
+)
+
+START = datetime(2023, 1, 1, tzinfo=timezone.utc)
+EVENT_DATETIMES = [START + timedelta(hours=i) for i in range(4)]
+AMOUNTS = ["1", "20.5", "300", "0.01"]
+ACCOUNT_IDS = ["account_1", "account_2", None, "account_1"]
+CLIENT_TRANSACTION_IDS = ["ctx_1", "", "ctx_3", ""]
+CLIENT_BATCH_IDS = ["", "batch_2", "", "batch_4"]
+VALUE_TIMESTAMPS = [None, START - timedelta(days=1), None, START]
+
+
+def _deterministic_uuids() -> Callable[[], UUID]:
+    ids = count()
+    return lambda: UUID(int=next(ids))
+
+
+class BulkHelperParityTest(TestCase):
+    """
+    Each bulk helper must produce exactly the same events as calling its single-event helper for
+    each row, including generated ids and key order
+    """
+
+    def assert_parity(
+        self,
+        create_bulk_events: Callable[[], Iterable[SimulationEvent]],
+        create_event: Callable[[int], SimulationEvent],
+    ):
+        with patch("uuid.uuid4", side_effect=_deterministic_uuids()):
+            expected = [create_event(i) for i in range(len(EVENT_DATETIMES))]
+        with patch("uuid.uuid4", side_effect=_deterministic_uuids()):
+            actual = list(create_bulk_events())
+
+        self.assertEqual(actual, expected)
+        self.assertEqual(
+            [json.dumps(event.event) for event in actual],
+            [json.dumps(event.event) for event in expected],
+        )
+
+    def test_account_instruction_types(self):
+        for bulk_helper_func, helper_func in [
+            (
+                bulk_helper.create_inbound_authorisation_instructions,
+                helper.create_inbound_authorisation_instruction,
+            ),
+            (
+                bulk_helper.create_inbound_hard_settlement_instructions,
+                helper.create_inbound_hard_settlement_instruction,
+            ),
+            (
+                bulk_helper.create_outbound_authorisation_instructions,
+                helper.create_outbound_authorisation_instruction,
+            ),
+            (
+                bulk_helper.create_outbound_hard_settlement_instructions,
+                helper.create_outbound_hard_settlement_instruction,
+            ),
+        ]:
+            with self.subTest(helper_func.__name__):
+                self.assert_parity(
+                    lambda: bulk_helper_func(
+                        amounts=AMOUNTS,
+                        event_datetimes=EVENT_DATETIMES,
+                        target_account_ids=ACCOUNT_IDS,
+                        internal_account_ids="internal",
+                        denomination="USD",
+                        client_transaction_ids=CLIENT_TRANSACTION_IDS,
+                        batch_details={"key": "value"},
+                        client_batch_ids=CLIENT_BATCH_IDS,
+                        value_timestamps=VALUE_TIMESTAMPS,
+                    ),
+                    lambda i: helper_func(
+                        amount=AMOUNTS[i],
+                        event_datetime=EVENT_DATETIMES[i],
+                        target_account_id=ACCOUNT_IDS[i],
+                        internal_account_id="internal",
+                        denomination="USD",
+                        client_transaction_id=CLIENT_TRANSACTION_IDS[i],
+                        batch_details={"key": "value"},
+                        client_batch_id=CLIENT_BATCH_IDS[i],
+                        value_timestamp=VALUE_TIMESTAMPS[i],
+                    ),
+                )
+
+    def test_account_instruction_defaults(self):
+        self.assert_parity(
+            lambda: bulk_helper.create_outbound_hard_settlement_instructions(
+                amounts="10", event_datetimes=EVENT_DATETIMES
+            ),
+            lambda i: helper.create_outbound_hard_settlement_instruction(
+                amount="10", event_datetime=EVENT_DATETIMES[i]
+            ),
+        )
+
+    def test_transfer_instructions(self):
+        self.assert_parity(
+            lambda: bulk_helper.create_transfer_instructions(
+                amounts=AMOUNTS,
+                event_datetimes=EVENT_DATETIMES,
+                creditor_target_account_ids=ACCOUNT_IDS,
+                debtor_target_account_ids="debtor",
+                instruction_details={"description": "transfer"},
+                client_batch_ids=CLIENT_BATCH_IDS,
+            ),
+            lambda i: helper.create_transfer_instruction(
+                amount=AMOUNTS[i],
+                event_datetime=EVENT_DATETIMES[i],
+                creditor_target_account_id=ACCOUNT_IDS[i],
+                debtor_target_account_id="debtor",
+                instruction_details={"description": "transfer"},
+                client_batch_id=CLIENT_BATCH_IDS[i],
+            ),
+        )
+
+    def test_custom_instructions(self):
+        self.assert_parity(
+            lambda: bulk_helper.create_custom_instructions(
+                amounts=AMOUNTS,
+                debtor_target_account_ids=ACCOUNT_IDS,
+                creditor_target_account_ids="creditor",
+                debtor_target_account_addresses=["ADDRESS", "", "ADDRESS", ""],
+                creditor_target_account_addresses="DEFAULT",
+                event_datetimes=EVENT_DATETIMES,
+                client_transaction_ids=CLIENT_TRANSACTION_IDS,
+                value_timestamps=VALUE_TIMESTAMPS,
+            ),
+            lambda i: helper.create_custom_instruction(
+                amount=AMOUNTS[i],
+                debtor_target_account_id=ACCOUNT_IDS[i],  # type: ignore
+                creditor_target_account_id="creditor",
+                debtor_target_account_address=["ADDRESS", "", "ADDRESS", ""][i],
+                creditor_target_account_address="DEFAULT",
+                event_datetime=EVENT_DATETIMES[i],
+                client_transaction_id=CLIENT_TRANSACTION_IDS[i],
+                value_timestamp=VALUE_TIMESTAMPS[i],
+            ),
+        )
+
+    def test_settlement_events(self):
+        self.assert_parity(
+            lambda: bulk_helper.create_settlement_events(
+                amounts=AMOUNTS,
+                client_transaction_ids=CLIENT_TRANSACTION_IDS,
+                event_datetimes=EVENT_DATETIMES,
+                final=True,
+                require_pre_posting_hook_execution=True,
+            ),
+            lambda i: helper.create_settlement_event(
+                amount=AMOUNTS[i],
+                client_transaction_id=CLIENT_TRANSACTION_IDS[i],
+                event_datetime=EVENT_DATETIMES[i],
+                final=True,
+                require_pre_posting_hook_execution=True,
+            ),
+        )
+
+    def test_release_events(self):
+        self.assert_parity(
+            lambda: bulk_helper.create_release_events(
+                client_transaction_ids=CLIENT_TRANSACTION_IDS,
+                event_datetimes=EVENT_DATETIMES,
+                client_batch_ids=CLIENT_BATCH_IDS,
+            ),
+            lambda i: helper.create_release_event(
+                client_transaction_id=CLIENT_TRANSACTION_IDS[i],
+                event_datetime=EVENT_DATETIMES[i],
+                client_batch_id=CLIENT_BATCH_IDS[i],
+            ),
+        )
+
+    def test_auth_adjustment_instructions(self):
+        self.assert_parity(
+            lambda: bulk_helper.create_auth_adjustment_instructions(
+                amounts=AMOUNTS,
+                event_datetimes=EVENT_DATETIMES,
+                client_transaction_ids="ctx",
+                value_timestamps=VALUE_TIMESTAMPS,
+            ),
+            lambda i: helper.create_auth_adjustment_instruction(
+                amount=AMOUNTS[i],
+                event_datetime=EVENT_DATETIMES[i],
+                client_transaction_id="ctx",
+                value_timestamp=VALUE_TIMESTAMPS[i],
+            ),
+        )
+
+
+class BulkHelperColumnsTest(TestCase):
+    def test_events_are_generated_lazily(self):
+        with patch("uuid.uuid4", side_effect=_deterministic_uuids()) as mock_uuid4:
+            events = bulk_helper.create_transfer_instructions(
+                amounts="10",
+                event_datetimes=EVENT_DATETIMES,
+                creditor_target_account_ids="creditor",
+                debtor_target_account_ids="debtor",
+            )
+            mock_uuid4.assert_not_called()
+
+            next(events)
+
+        self.assertEqual(mock_uuid4.call_count, 2)
+
+    def test_mismatched_column_lengths_raise_immediately(self):
+        with self.assertRaisesRegex(ValueError, "Expected 4 creditor_target_account_ids but got 2"):
+            bulk_helper.create_transfer_instructions(
+                amounts=AMOUNTS,
+                event_datetimes=EVENT_DATETIMES,
+                creditor_target_account_ids=["a", "b"],
+                debtor_target_account_ids="debtor",
+            )
@@ -0,0 +1,251 @@
+# standard libs
+import json
+from datetime import datetime, timedelta, timezone
+from dateutil.relativedelta import relativedelta
+from unittest import TestCase
+from unittest.mock import Mock
+
+# inception sdk
+import inception_sdk.test_framework.contracts.simulation.vault_caller as vault_caller
+from inception_sdk.test_framework.contracts.simulation.data_objects.data_objects import (
+    ExpectedDerivedParameter,
+    SimulationEvent,
+    SimulationTestScenario,
+    SubTest,
+)
+from inception_sdk.test_framework.contracts.simulation.helper import (
+    create_instance_parameter_change_event,
+    create_transfer_instruction,
+)
+from inception_sdk.test_framework.contracts.simulation.scenario_compiler import (
+    RecurringEventRule,
+    compile_event_stream,
+    recurring_instance_parameter_change_rule,
+    recurring_transfer_rule,
+)
+from inception_sdk.test_framework.contracts.simulation.utils import compile_chrono_events
+
+START = datetime(2023, 1, 1, tzinfo=timezone.utc)
+END = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+
+def _event(days: int, name: str) -> SimulationEvent:
+    return SimulationEvent(START + timedelta(days=days), {"name": name})
+
+
+def _names(events) -> list[str]:
+    return [event.event["name"] for event in events]
+
+
+class CompileEventStreamTest(TestCase):
+    def test_output_matches_stable_sort_of_all_events(self):
+        setup_events = [_event(0, "setup_1"), _event(0, "setup_2")]
+        sub_tests = [
+            SubTest("first", events=[_event(0, "a_0"), _event(2, "a_2"), _event(5, "a_5")]),
+            # unsorted events are still supported
+            SubTest("second", events=[_event(3, "b_3"), _event(2, "b_2"), _event(5, "b_5")]),
+            SubTest("no events"),
+            SubTest("third", events=[_event(1, "c_1"), _event(5, "c_5")]),
+        ]
+        scenario = SimulationTestScenario(sub_tests=sub_tests, start=START, end=END)
+
+        events, _ = compile_event_stream(scenario, setup_events)
+
+        expected = sorted(
+            setup_events + [event for sub_test in sub_tests for event in sub_test.events or []],
+            key=lambda event: event.time,
+        )
+        self.assertEqual(_names(events), _names(expected))
+
+    def test_event_rules_are_merged_lazily(self):
+        factory = Mock(side_effect=lambda timestamp, i: SimulationEvent(timestamp, {"name": i}))
+        rule = RecurringEventRule(
+            start=START, interval=timedelta(days=1), event_factory=factory, end=END
+        )
+        scenario = SimulationTestScenario(
+            sub_tests=[SubTest("rules", events=[_event(1, "explicit")], event_rules=[rule])],
+            start=START,
+            end=END,
+        )
+
+        events, _ = compile_event_stream(scenario, [])
+        first_events = [next(events) for _ in range(3)]
+
+        self.assertEqual(_names(first_events), [0, "explicit", 1])
+        # only the events consumed so far have been generated
+        self.assertEqual(factory.call_count, 2)
+        self.assertEqual(len(list(events)), 364)
+
+    def test_derived_parameter_outputs_are_collected(self):
+        derived_parameter = ExpectedDerivedParameter(
+            timestamp=START, account_id="account", name="param", value="1"
+        )
+        scenario = SimulationTestScenario(
+            sub_tests=[SubTest("derived", expected_derived_parameters=[derived_parameter])],
+            start=START,
+            end=END,
+        )
+
+        _, derived_param_outputs = compile_event_stream(scenario, [])
+
+        self.assertEqual(derived_param_outputs, [("account", START)])
+
+    def test_out_of_order_subtests_and_late_events_are_logged(self):
+        scenario = SimulationTestScenario(
+            sub_tests=[
+                SubTest("first", events=[_event(5, "a")]),
+                SubTest("second", events=[_event(1, "b"), _event(3, "c")]),
+            ],
+            start=START,
+            end=START + timedelta(days=2),
+        )
+
+        with self.assertLogs(level="WARNING") as logs:
+            compile_event_stream(scenario, [])
+
+        self.assertEqual(
+            [record.getMessage() for record in logs.records],
+            [
+                'Subtest "second" contains event timestamp before the previous one.',
+                "last assertion or event happens outside of simulation window",
+            ],
+        )
+
+    def test_late_generated_events_are_logged_when_streamed(self):
+        rule = recurring_transfer_rule(
+            start=START,
+            amount="10",
+            creditor_target_account_id="a",
+            debtor_target_account_id="b",
+            count=3,
+        )
+        scenario = SimulationTestScenario(
+            sub_tests=[SubTest("rules", event_rules=[rule])],
+            start=START,
+            end=START + timedelta(days=1),
+        )
+
+        events, _ = compile_event_stream(scenario, [])
+        with self.assertLogs(level="WARNING") as logs:
+            self.assertEqual(len(list(events)), 3)
+
+        self.assertEqual(len(logs.records), 1)
+
+    def test_compile_chrono_events_returns_a_list_unless_lazy(self):
+        scenario = SimulationTestScenario(
+            sub_tests=[SubTest("first", events=[_event(1, "a")])], start=START, end=END
+        )
+
+        events, _ = compile_chrono_events(scenario, [_event(0, "setup")])
+        lazy_events, _ = compile_chrono_events(scenario, [_event(0, "setup")], lazy=True)
+
+        self.assertIsInstance(events, list)
+        self.assertNotIsInstance(lazy_events, list)
+        self.assertEqual(_names(lazy_events), _names(events))
+
+
+class RecurringEventRuleTest(TestCase):
+    def test_monthly_occurrences_do_not_drift(self):
+        rule = RecurringEventRule(
+            start=datetime(2024, 1, 31, tzinfo=timezone.utc),
+            interval=relativedelta(months=1),
+            event_factory=Mock(),
+            count=3,
+        )
+
+        self.assertEqual(
+            [occurrence.date().isoformat() for occurrence in rule.occurrences()],
+            ["2024-01-31", "2024-02-29", "2024-03-31"],
+        )
+
+    def test_end_or_count_is_required(self):
+        with self.assertRaisesRegex(ValueError, "requires an end or a count"):
+            RecurringEventRule(start=START, interval=timedelta(days=1), event_factory=Mock())
+
+    def test_factories_can_create_several_events_per_occurrence(self):
+        rule = RecurringEventRule(
+            start=START,
+            interval=timedelta(days=1),
+            event_factory=lambda timestamp, i: [_event(i, f"{i}_a"), _event(i, f"{i}_b")],
+            end=START + timedelta(days=1),
+        )
+
+        self.assertEqual(_names(rule), ["0_a", "0_b", "1_a", "1_b"])
+
+    def test_recurring_transfer_rule(self):
+        rule = recurring_transfer_rule(
+            start=START,
+            amount="10",
+            creditor_target_account_id="a",
+            debtor_target_account_id="b",
+            denomination="GBP",
+            end=START + timedelta(days=2),
+            client_transaction_id="ctx",
+        )
+
+        events = list(rule)
+
+        self.assertEqual(
+            [event.time for event in events], [START + timedelta(days=days) for days in range(3)]
+        )
+        # batch ids are random, so only the instruction is compared
+        expected_instruction = create_transfer_instruction(
+            amount="10",
+            event_datetime=START,
+            creditor_target_account_id="a",
+            debtor_target_account_id="b",
+            denomination="GBP",
+            client_transaction_id="ctx",
+        ).event["create_posting_instruction_batch"]["posting_instructions"]
+        self.assertEqual(
+            events[0].event["create_posting_instruction_batch"]["posting_instructions"],
+            expected_instruction,
+        )
+
+    def test_recurring_instance_parameter_change_rule(self):
+        rule = recurring_instance_parameter_change_rule(
+            start=START,
+            account_id="account",
+            parameter_values=[{"rate": "0.01"}, {"rate": "0.02"}],
+        )
+
+        self.assertEqual(
+            list(rule),
+            [
+                create_instance_parameter_change_event(START, "account", rate="0.01"),
+                create_instance_parameter_change_event(
+                    datetime(2023, 2, 1, tzinfo=timezone.utc), "account", rate="0.02"
+                ),
+            ],
+        )
+
+
+class StreamedRequestBodyTest(TestCase):
+    def test_streamed_body_matches_materialised_body(self):
+        events = [_event(i, str(i)) for i in range(2500)]
+        default_events = [_event(0, "default")]
+        payload = {"start_timestamp": "2023", "smart_contracts": [{"code": "x"}], "outputs": []}
+
+        streamed = b"".join(
+            vault_caller._iter_json_chunks(
+                {
+                    **payload,
+                    "instructions": vault_caller._events_to_json(default_events, iter(events)),
+                }
+            )
+        )
+
+        self.assertEqual(
+            json.loads(streamed),
+            {**payload, "instructions": vault_caller._events_to_json(default_events, events)},
+        )
+
+    def test_payloads_with_iterators_are_posted_as_chunked_bodies(self):
+        client = vault_caller.Client(core_api_url="http://core-api", auth_token="token")
+        client._session = Mock()
+        client._session.post.return_value.iter_lines.return_value = []
+
+        client._api_post("/v1/contracts:simulate", {"instructions": iter([{"a": 1}])}, "10S")
+
+        body = client._session.post.call_args.kwargs["data"]
+        self.assertEqual(json.loads(b"".join(body)), {"instructions": [{"a": 1}]})
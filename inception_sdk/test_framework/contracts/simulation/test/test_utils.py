@@ -9,7 +9,7 @@ from decimal import Decimal
 from json.decoder import JSONDecodeError
 from time import time
 from unittest import TestCase, mock
-from unittest.mock import MagicMock, Mock, call, mock_open, patch
+from unittest.mock import MagicMock, Mock, call, mock_open, patch, sentinel
 
 # inception sdk
 import inception_sdk.test_framework.contracts.simulation.utils as utils
@@ -32,6 +32,7 @@ from inception_sdk.test_framework.contracts.simulation.utils import (
     get_balances,
     get_contract_contents,
     get_contract_notifications,
+    get_derived_parameters,
     get_flag_created,
     get_flag_definition_created,
     get_logs,
@@ -707,6 +708,55 @@ class UtilsTest(SimulationTestCase):
             debug=False,
         )
 
+    @mock.patch.object(utils, "compile_chrono_events")
+    @mock.patch.object(utils, "load_file_contents")
+    def test_run_test_scenario_only_streams_events_with_event_rules(
+        self, load_file_contents_mock, compile_chrono_events_mock
+    ):
+        compile_chrono_events_mock.return_value = [], []
+        load_file_contents_mock.side_effect = lambda x: x + "_contents"
+        sample_config = ContractConfig(
+            contract_file_path="contract_file_1",
+            template_params={},
+            smart_contract_version_id="contract_id_1_version",
+            account_configs=[
+                AccountConfig(
+                    account_id_base="contract_id_1_account",
+                    instance_params={},
+                    number_of_accounts=1,
+                )
+            ],
+        )
+
+        with self.subTest("events_are_materialised_without_event_rules"):
+            with mock.patch.object(self, "client") as client_mock:
+                client_mock.simulate_smart_contract.return_value = []
+                self.run_test_scenario(
+                    SimulationTestScenario(
+                        sub_tests=[SubTest(description="events", events=[])],
+                        start=datetime(2020, 1, 1),
+                        end=datetime(2020, 1, 2),
+                        contract_config=sample_config,
+                    )
+                )
+            self.assertFalse(compile_chrono_events_mock.call_args.kwargs["lazy"])
+
+        with self.subTest("events_are_streamed_with_event_rules"):
+            with mock.patch.object(self, "client") as client_mock:
+                client_mock.simulate_smart_contract.return_value = []
+                self.run_test_scenario(
+                    SimulationTestScenario(
+                        sub_tests=[
+                            SubTest(description="events", events=[]),
+                            SubTest(description="rules", event_rules=[iter([])]),
+                        ],
+                        start=datetime(2020, 1, 1),
+                        end=datetime(2020, 1, 2),
+                        contract_config=sample_config,
+                    )
+                )
+            self.assertTrue(compile_chrono_events_mock.call_args.kwargs["lazy"])
+
     @mock.patch.object(utils, "compile_chrono_events")
     @mock.patch.object(utils, "load_file_contents")
     def test_run_test_scenario_error_expectation(
@@ -948,3 +998,137 @@ class TestDataObjects(TestCase):
                 supervisee_contract_account.number_of_accounts,
                 expected_supervisee_contracts[i].instances,
             )
+
+
+def _result(timestamp: str, logs: list[str], **sections) -> dict:
+    return {"result": {"timestamp": timestamp, "logs": logs, **sections}}
+
+
+class SimulationResultIndexTest(TestCase):
+    def setUp(self):
+        with open(SIMULATOR_RESPONSE_FILE, "r", encoding="utf-8") as simulator_response_file:
+            self.sample_res = eval(simulator_response_file.read())
+
+    def test_index_is_reused_for_indexed_results(self):
+        index = utils.SimulationResultIndex(self.sample_res)
+        results = utils.SimulationResults(self.sample_res)
+
+        self.assertIs(utils.SimulationResultIndex.of(index), index)
+        self.assertIs(utils.SimulationResultIndex.of(results), results.index)
+        self.assertIsNot(
+            utils.SimulationResultIndex.of(self.sample_res),
+            utils.SimulationResultIndex.of(self.sample_res),
+        )
+
+    def test_helpers_return_the_same_values_for_results_and_index(self):
+        index = utils.SimulationResultIndex(self.sample_res)
+
+        self.assertEqual(get_logs(index), get_logs(self.sample_res))
+        self.assertEqual(
+            get_account_logs(index, account_id="1"), get_account_logs(self.sample_res, "1")
+        )
+        self.assertEqual(
+            get_postings(index, balance_dimensions=BalanceDimensions(address="DEFAULT")),
+            get_postings(self.sample_res, balance_dimensions=BalanceDimensions(address="DEFAULT")),
+        )
+        self.assertEqual(
+            get_processed_scheduled_events(index, event_id="ACCRUE_INTEREST", account_id="1"),
+            get_processed_scheduled_events(
+                self.sample_res, event_id="ACCRUE_INTEREST", account_id="1"
+            ),
+        )
+        self.assertEqual(get_logs_with_timestamp(index), get_logs_with_timestamp(self.sample_res))
+
+    def test_account_logs_include_every_log_of_results_mentioning_the_account(self):
+        res = [
+            _result("2020-01-01T00:00:00Z", ['created account "1"', "unrelated log"]),
+            # the account is only mentioned across the two log lines
+            _result("2020-01-02T00:00:00Z", ['account "', '1" and account "2"']),
+            _result("2020-01-03T00:00:00Z", ['created account "12"']),
+            _result("2020-01-04T00:00:00Z", ['created account "with "quotes""']),
+        ]
+
+        self.assertEqual(
+            get_account_logs(res, "1"),
+            'created account "1"; unrelated log; account "; 1" and account "2"',
+        )
+        self.assertEqual(get_account_logs(res, "2"), 'account "; 1" and account "2"')
+        self.assertEqual(get_account_logs(res, 'with "quotes"'), 'created account "with "quotes""')
+        self.assertEqual(get_account_logs(res, "3"), "")
+
+    def test_processed_scheduled_events_are_counted_once_per_result(self):
+        processed_log = 'processed scheduled event "ACCRUE" for plan "1"'
+        res = [
+            _result("2020-01-01T00:00:00Z", [processed_log, processed_log]),
+            _result("2020-01-02T00:00:00Z", [processed_log + " and more"]),
+            _result("2020-01-03T00:00:00Z", [processed_log]),
+        ]
+
+        self.assertEqual(
+            get_processed_scheduled_events(res, event_id="ACCRUE", plan_id="1"),
+            ["2020-01-01T00:00:00Z", "2020-01-03T00:00:00Z"],
+        )
+        with self.assertRaisesRegex(ValueError, "account_id or plan_id must be provided"):
+            get_processed_scheduled_events(res, event_id="ACCRUE")
+
+    def test_rejections_are_indexed_by_timestamp_account_and_type(self):
+        index = utils.SimulationResultIndex(
+            [
+                _result(
+                    "2020-01-01T00:00:00Z",
+                    [
+                        'posting instruction batch for account "1" rejected with rejection type '
+                        '"InsufficientFunds" and reason "Not enough funds"',
+                        "account parameters update rejected: invalid value",
+                    ],
+                )
+            ]
+        )
+        timestamp = datetime(2020, 1, 1, tzinfo=timezone.utc)
+
+        self.assertTrue(index.has_posting_rejection(timestamp, "1", "InsufficientFunds", "Not"))
+        self.assertFalse(index.has_posting_rejection(timestamp, "1", "InsufficientFunds", "Too"))
+        self.assertFalse(index.has_posting_rejection(timestamp, "1", "AgainstTNC", ""))
+        self.assertFalse(index.has_posting_rejection(timestamp, "2", "InsufficientFunds", ""))
+        self.assertTrue(index.has_parameter_change_rejection(timestamp, "invalid value"))
+        self.assertFalse(
+            index.has_parameter_change_rejection(datetime(2020, 1, 2, tzinfo=timezone.utc), "")
+        )
+
+    def test_lookup_tables_are_only_built_when_queried(self):
+        index = utils.SimulationResultIndex(self.sample_res)
+
+        get_postings(index, balance_dimensions=BalanceDimensions(address="DEFAULT"))
+
+        self.assertIn("_postings", index.__dict__)
+        self.assertNotIn("_balance_timeseries", index.__dict__)
+        self.assertNotIn("_joined_result_logs", index.__dict__)
+
+    def test_helpers_return_copies_of_the_index(self):
+        notification = {"notification_type": "TYPE", "notification_details": {}}
+        index = utils.SimulationResultIndex(
+            [
+                _result(
+                    "2020-01-01T00:00:00Z",
+                    ['account "1" rejected'],
+                    contract_notification_events={
+                        "1": {"contract_notification_events": [notification]}
+                    },
+                    derived_params={"1": {"values": {"param": "1"}}},
+                )
+            ]
+        )
+        timestamp = datetime(2020, 1, 1, tzinfo=timezone.utc)
+
+        get_contract_notifications(index)["1"]["TYPE"].append(sentinel.notification)
+        get_contract_notifications(index)["2"]["TYPE"].append(sentinel.notification)
+        get_balances(index)["1"].append(sentinel.balances)
+        get_derived_parameters(index)["1"].append(sentinel.derived_parameters)
+        get_logs_with_timestamp(index)[timestamp].append(sentinel.log)
+
+        self.assertEqual(
+            get_contract_notifications(index), {"1": {"TYPE": [(timestamp, notification)]}}
+        )
+        self.assertEqual(get_balances(index), {})
+        self.assertEqual(get_derived_parameters(index), {"1": [(timestamp, {"param": "1"})]})
+        self.assertEqual(get_logs_with_timestamp(index), {timestamp: ['account "1" rejected']})
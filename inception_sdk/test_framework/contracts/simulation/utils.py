@@ -4,15 +4,17 @@ import ast
 import json
 import logging
 import os
+import re
 from collections import defaultdict
-from copy import deepcopy
-from datetime import datetime, timezone
+from copy import copy, deepcopy
+from datetime import datetime
 from dateutil import parser
 from decimal import Decimal
+from functools import cached_property
 from json.decoder import JSONDecodeError
 from pathlib import Path
 from time import time
-from typing import Any, Callable, DefaultDict, Generator
+from typing import Any, Callable, DefaultDict, Generator, Iterable
 from unittest import TestCase
 
 # third party
@@ -52,12 +54,25 @@ from inception_sdk.test_framework.contracts.simulation.helper import (
     get_contract_setup_events,
     get_supervisor_setup_events,
 )
+from inception_sdk.test_framework.contracts.simulation.scenario_compiler import (
+    compile_event_stream,
+)
 from inception_sdk.tools.renderer.render_utils import is_file_renderable
 from inception_sdk.tools.renderer.renderer import RendererConfig, SmartContractRenderer
 
 DEFAULT = "DEFAULT"
 MAIN_ACCOUNT = "Main account"
 
+PROCESSED_SCHEDULED_EVENT_PREFIX = 'processed scheduled event "'
+# The lookaheads find overlapping matches, so that the index matches the same log lines as a
+# substring search for the expected rejection would
+POSTING_REJECTION_PATTERN = re.compile(
+    r'(?=account "([^"]*)" rejected with rejection type "([^"]*)" and reason "(.*))', re.DOTALL
+)
+PARAMETER_CHANGE_REJECTION_PATTERN = re.compile(
+    r"(?=account parameters update rejected: (.*))", re.DOTALL
+)
+
 log = logging.getLogger(__name__)
 logging.basicConfig(
     level=os.environ.get("LOGLEVEL", "INFO"),
@@ -329,19 +344,29 @@ class SimulationTestCase(TestCase):
     def check_posting_rejections(
         self,
         expected_rejections: list[ExpectedRejection],
-        logs_with_timestamp: dict,
+        logs_with_timestamp: "dict | SimulationResultIndex",
         description: str = "",
     ) -> None:
+        def has_rejection(expected_rejection, logs_with_timestamp):
+            if isinstance(logs_with_timestamp, SimulationResultIndex):
+                return logs_with_timestamp.has_posting_rejection(
+                    expected_rejection.timestamp,
+                    expected_rejection.account_id,
+                    expected_rejection.rejection_type,
+                    expected_rejection.rejection_reason,
+                )
+            return any(
+                f'account "{expected_rejection.account_id}" rejected with '
+                f'rejection type "{expected_rejection.rejection_type}" and '
+                f'reason "{expected_rejection.rejection_reason}' in log
+                for log in logs_with_timestamp.get(expected_rejection.timestamp, [])
+            )
+
         def get_missing_rejections(expected_rejections, logs_with_timestamp):
             return [
                 expected_rejection
                 for expected_rejection in expected_rejections
-                if not any(
-                    f'account "{expected_rejection.account_id}" rejected with '
-                    f'rejection type "{expected_rejection.rejection_type}" and '
-                    f'reason "{expected_rejection.rejection_reason}' in log
-                    for log in logs_with_timestamp.get(expected_rejection.timestamp, [])
-                )
+                if not has_rejection(expected_rejection, logs_with_timestamp)
             ]
 
         self.assertExpectations(
@@ -354,7 +379,7 @@ class SimulationTestCase(TestCase):
     def check_parameter_change_rejections(
         self,
         expected_rejections: list[ExpectedRejection],
-        logs_with_timestamp: dict,
+        logs_with_timestamp: "dict | SimulationResultIndex",
         description: str = "",
     ) -> None:
         """
@@ -362,20 +387,27 @@ class SimulationTestCase(TestCase):
         response to the simulate API
 
         :param expected_rejections: rejections that should be generated during the simulation
-        :param logs_with_timestamp: logs retrieved from the result of calling the API
+        :param logs_with_timestamp: logs retrieved from the result of calling the API, or an index
+        over the result
         :param description: description of the subtest used to identify the subtest in case the
         assertion fails
         """
 
+        def has_rejection(expected_rejection, logs_with_timestamp):
+            if isinstance(logs_with_timestamp, SimulationResultIndex):
+                return logs_with_timestamp.has_parameter_change_rejection(
+                    expected_rejection.timestamp, expected_rejection.rejection_reason
+                )
+            return any(
+                f"account parameters update rejected: {expected_rejection.rejection_reason}" in log
+                for log in logs_with_timestamp.get(expected_rejection.timestamp, [])
+            )
+
         def get_missing_rejections(expected_rejections, logs_with_timestamp):
             return [
                 expected_rejection
                 for expected_rejection in expected_rejections
-                if not any(
-                    f"account parameters update rejected: {expected_rejection.rejection_reason}"
-                    in log
-                    for log in logs_with_timestamp.get(expected_rejection.timestamp, [])
-                )
+                if not has_rejection(expected_rejection, logs_with_timestamp)
             ]
 
         self.assertExpectations(
@@ -468,7 +500,7 @@ class SimulationTestCase(TestCase):
     def check_schedule_processed(
         self,
         expected_schedule_runs: list[ExpectedSchedule],
-        res: list[dict[str, Any]],
+        res: "list[dict[str, Any]] | SimulationResultIndex",
         description: str = "",
     ) -> None:
         def get_missing_schedule_runs(expected_schedules, simulator_results):
@@ -605,7 +637,13 @@ class SimulationTestCase(TestCase):
             )
         internal_accounts = test_scenario.internal_accounts or self.internal_accounts
 
-        events, derived_param_outputs = compile_chrono_events(test_scenario, setup_events)
+        # event rules may generate too many events to materialise, so they are streamed into the
+        # simulation request. Otherwise the events are sent as a regular JSON request
+        events, derived_param_outputs = compile_chrono_events(
+            test_scenario,
+            setup_events,
+            lazy=any(sub_test.event_rules for sub_test in test_scenario.sub_tests),
+        )
 
         contract_codes = get_contract_contents(smart_contracts)
 
@@ -638,10 +676,12 @@ class SimulationTestCase(TestCase):
             if expected_simulation_error:
                 return
 
-        actual_balances = get_balances(res)
-        logs_with_timestamp = get_logs_with_timestamp(res)
-        derived_parameters = get_derived_parameters(res)
-        contract_notifications = get_contract_notifications(res)
+        # all assertions query the same index rather than rescanning the results
+        res = SimulationResults(res)
+        index = res.index
+        actual_balances = index.balances
+        derived_parameters = index.derived_parameters
+        contract_notifications = index.contract_notifications
 
         for sub_test in test_scenario.sub_tests:
             if sub_test.expected_balances_at_ts:
@@ -652,18 +692,18 @@ class SimulationTestCase(TestCase):
                 )
             if sub_test.expected_schedules:
                 self.check_schedule_processed(
-                    sub_test.expected_schedules, res, sub_test.description
+                    sub_test.expected_schedules, index, sub_test.description
                 )
             if sub_test.expected_posting_rejections:
                 self.check_posting_rejections(
                     sub_test.expected_posting_rejections,
-                    logs_with_timestamp,
+                    index,
                     sub_test.description,
                 )
             if sub_test.expected_parameter_change_rejections:
                 self.check_parameter_change_rejections(
                     sub_test.expected_parameter_change_rejections,
-                    logs_with_timestamp,
+                    index,
                     sub_test.description,
                 )
             if sub_test.expected_derived_parameters:
@@ -702,91 +742,24 @@ def get_contract_contents(contract_configs: list[ContractConfig]) -> list[str]:
 
 
 def compile_chrono_events(
-    test_scenario: SimulationTestScenario, setup_events: list[SimulationEvent]
-) -> tuple[list[SimulationEvent], list[tuple[str, datetime]]]:
+    test_scenario: SimulationTestScenario,
+    setup_events: list[SimulationEvent],
+    lazy: bool = False,
+) -> tuple[Iterable[SimulationEvent], list[tuple[str, datetime]]]:
     """
-    Combines setup events with custom events from test scenario subtests.
+    Combines setup events with custom events and event rules from test scenario subtests.
     Sorts events chronologically.
 
     :param test_scenario: SimulationTestScenario
     :param setup_events: SimulationEvents generated by helper methods, e.g.
     account/plan creations or plan association events
-    :returns: list of setup events + custom scenario events, and list of require derived param
+    :param lazy: if True, the events are returned as an iterator that merges the subtest events
+    as it is consumed, rather than a list
+    :returns: setup events + custom scenario events, and list of require derived param
      outputs as tuple of account id and datetime
     """
-    previous_subtest_last_event_ts = datetime.min.replace(tzinfo=timezone.utc)
-    previous_subtest_last_assertion_ts = datetime.min.replace(tzinfo=timezone.utc)
-    current_subtest_first_event_ts = datetime.max.replace(tzinfo=timezone.utc)
-    current_subtest_first_assertion_ts = datetime.max.replace(tzinfo=timezone.utc)
-    assertion_ts = []
-    events: list[SimulationEvent] = []
-    derived_param_outputs: list[tuple[str, datetime]] = []
-
-    for sub_test in test_scenario.sub_tests:
-        if sub_test.events:
-            current_subtest_first_event_ts = sub_test.events[0].time
-
-            if current_subtest_first_event_ts < previous_subtest_last_event_ts:
-                log.warning(
-                    f'Subtest "{sub_test.description}" contains '
-                    "event timestamp before the previous one."
-                )
-
-            previous_subtest_last_event_ts = sub_test.events[-1].time
-            events.extend(sub_test.events)
-
-        if sub_test.expected_balances_at_ts:
-            assertion_ts.extend(sub_test.expected_balances_at_ts.keys())
-
-        if sub_test.expected_posting_rejections:
-            assertion_ts.extend(
-                expected_rejection.timestamp
-                for expected_rejection in sub_test.expected_posting_rejections
-            )
-        if sub_test.expected_parameter_change_rejections:
-            assertion_ts.extend(
-                expected_rejection.timestamp
-                for expected_rejection in sub_test.expected_parameter_change_rejections
-            )
-        if sub_test.expected_schedules:
-            assertion_ts.extend(
-                runtime
-                for expected_schedule in sub_test.expected_schedules
-                for runtime in expected_schedule.run_times
-            )
-
-        if sub_test.expected_derived_parameters:
-            for expected_derived_param in sub_test.expected_derived_parameters:
-                assertion_ts.append(expected_derived_param.timestamp)
-                derived_param_outputs.append(
-                    (
-                        expected_derived_param.account_id,
-                        expected_derived_param.timestamp,
-                    )
-                )
-
-        if assertion_ts:
-            sorted_assertion_ts = sorted(assertion_ts)
-            current_subtest_first_assertion_ts = sorted_assertion_ts[0]
-
-            if current_subtest_first_assertion_ts < previous_subtest_last_assertion_ts:
-                log.warning(
-                    f'Subtest "{sub_test.description}" contains '
-                    "assertion timestamp before the previous one."
-                )
-
-            previous_subtest_last_assertion_ts = sorted_assertion_ts[-1]
-            assertion_ts.clear()
-
-    if (
-        previous_subtest_last_event_ts > test_scenario.end
-        or previous_subtest_last_assertion_ts > test_scenario.end
-    ):
-        log.warning("last assertion or event happens outside of simulation window")
-
-    all_events = sorted(setup_events + events, key=lambda event: event.time)
-
-    return all_events, derived_param_outputs
+    events, derived_param_outputs = compile_event_stream(test_scenario, setup_events)
+    return events if lazy else list(events), derived_param_outputs
 
 
 def convert_sim_balance(sim_balance: dict[str, str]) -> tuple[BalanceDimensions, Balance]:
@@ -809,7 +782,337 @@ def convert_sim_balance(sim_balance: dict[str, str]) -> tuple[BalanceDimensions,
     )
 
 
-def get_balances(res: list[dict[str, Any]]) -> DefaultDict[str, TimeSeries]:
+class SimulationResultIndex:
+    """
+    Indexed view over the output of the simulation endpoint, with lookup tables by timestamp,
+    scheduled event, rejection and balance address, so that repeated assertions against the same
+    results do not rescan them. Each result's logs are joined once for substring searches.
+    Each table is only built when it is first queried, so a single query costs about as much as
+    scanning the results, and each timestamp string is only parsed once, however many results
+    share it.
+    """
+
+    def __init__(self, res: list[dict[str, Any]]):
+        """
+        :param res: output from simulation endpoint
+        """
+        self.res = res
+        self._parsed_timestamps: dict[str, datetime] = {}
+
+    @classmethod
+    def of(cls, res: "list[dict[str, Any]] | SimulationResultIndex") -> "SimulationResultIndex":
+        """
+        Returns the index for simulation results, reusing an existing index where possible
+        :param res: output from simulation endpoint, or an existing index
+        """
+        if isinstance(res, SimulationResultIndex):
+            return res
+        if isinstance(res, SimulationResults):
+            return res.index
+        return cls(res)
+
+    def _parse_timestamp(self, timestamp: str) -> datetime:
+        if timestamp not in self._parsed_timestamps:
+            self._parsed_timestamps[timestamp] = parser.parse(timestamp)
+        return self._parsed_timestamps[timestamp]
+
+    @cached_property
+    def _result_logs(self) -> list[list[str]]:
+        # per result, in result order
+        return [result["result"].get("logs") or [] for result in self.res]
+
+    @cached_property
+    def _joined_result_logs(self) -> list[str]:
+        return ["".join(logs) for logs in self._result_logs]
+
+    @cached_property
+    def _logs_with_timestamp(self) -> dict[datetime, list[str]]:
+        logs_with_timestamp: dict[datetime, list[str]] = defaultdict(list)
+        for result, logs in zip(self.res, self._result_logs):
+            if logs:
+                logs_with_timestamp[self._parse_timestamp(result["result"]["timestamp"])] += logs
+        return logs_with_timestamp
+
+    @cached_property
+    def _processed_scheduled_events(self) -> dict[str, list[str]]:
+        # processed scheduled event log -> raw timestamps of the results that contain it
+        processed_scheduled_events: dict[str, list[str]] = defaultdict(list)
+        for result, logs in zip(self.res, self._result_logs):
+            # each result is only counted once per processed event, however many times it is logged
+            for log_line in dict.fromkeys(logs):
+                if log_line.startswith(PROCESSED_SCHEDULED_EVENT_PREFIX):
+                    processed_scheduled_events[log_line].append(result["result"]["timestamp"])
+        return processed_scheduled_events
+
+    def _rejection_logs(self) -> Generator:
+        """
+        Yields the timestamp and log of each distinct rejection log of each result
+        """
+        for result, logs in zip(self.res, self._result_logs):
+            for log_line in dict.fromkeys(logs):
+                if "rejected" in log_line:
+                    yield self._parse_timestamp(result["result"]["timestamp"]), log_line
+
+    @cached_property
+    def _posting_rejections(self) -> dict[tuple[datetime, str, str], list[str]]:
+        # (timestamp, account id, rejection type) -> remainder of each log from the reason onwards
+        posting_rejections: dict[tuple[datetime, str, str], list[str]] = defaultdict(list)
+        for timestamp, log_line in self._rejection_logs():
+            for account_id, rejection_type, reason in POSTING_REJECTION_PATTERN.findall(log_line):
+                posting_rejections[(timestamp, account_id, rejection_type)].append(reason)
+        return posting_rejections
+
+    @cached_property
+    def _parameter_change_rejections(self) -> dict[datetime, list[str]]:
+        # timestamp -> remainder of each log from the reason onwards
+        parameter_change_rejections: dict[datetime, list[str]] = defaultdict(list)
+        for timestamp, log_line in self._rejection_logs():
+            parameter_change_rejections[timestamp].extend(
+                PARAMETER_CHANGE_REJECTION_PATTERN.findall(log_line)
+            )
+        return parameter_change_rejections
+
+    def _posting_instruction_records(self) -> Generator:
+        """
+        Yields the result timestamp and each posting instruction of each result
+        """
+        for result in self.res:
+            pibs = result["result"].get("posting_instruction_batches")
+            if pibs:
+                timestamp = result["result"]["timestamp"]
+                for pib in pibs:
+                    for pi in pib["posting_instructions"]:
+                        yield timestamp, pi
+
+    @cached_property
+    def _postings(self) -> dict[tuple[str, str], list[dict[str, Any]]]:
+        # (account id, account address) -> committed postings
+        postings: dict[tuple[str, str], list[dict[str, Any]]] = defaultdict(list)
+        for result in self.res:
+            for pib in result["result"].get("posting_instruction_batches") or []:
+                for pi in pib["posting_instructions"]:
+                    for committed_posting in pi.get("committed_postings", []):
+                        postings[
+                            (committed_posting["account_id"], committed_posting["account_address"])
+                        ].append(committed_posting)
+        return postings
+
+    @cached_property
+    def _posting_instructions(self) -> dict[str, dict[str, dict[datetime, list]]]:
+        # event type -> target account id -> timestamp -> posting instruction records
+        posting_instructions: dict[str, dict[str, dict[datetime, list]]] = defaultdict(
+            lambda: defaultdict(lambda: defaultdict(list))
+        )
+        for raw_timestamp, pi in self._posting_instruction_records():
+            for event_type, record in pi.items():
+                if isinstance(record, dict) and "target_account_id" in record:
+                    posting_instructions[event_type][record["target_account_id"]][
+                        self._parse_timestamp(raw_timestamp)
+                    ].append(record)
+        return posting_instructions
+
+    @cached_property
+    def _balance_timeseries(self) -> DefaultDict[str, TimeSeries]:
+        # This stores account id -> value_timestamp -> BalanceDimensions -> (event_timestamp, balance)
+        account_balance_updates = defaultdict(lambda: defaultdict(lambda: defaultdict(lambda: [])))
+        # This stores account id -> TimeSeries -> BalanceDimensions -> Balance
+        account_balance_timeseries = defaultdict(
+            lambda: TimeSeries([], return_on_empty=defaultdict(lambda: Balance()))
+        )
+
+        # results are ordered by event_timestamp so if there are multiple per value_timestamp we
+        # don't need to worry about ordering them
+        for result in self.res:
+            balances_by_account = result["result"].get("balances")
+            if not balances_by_account:
+                continue
+            event_timestamp = self._parse_timestamp(result["result"]["timestamp"])
+            for balances in balances_by_account.values():
+                for sim_balance in balances["balances"]:
+                    value_timestamp = self._parse_timestamp(sim_balance["value_time"])
+                    dimensions, balance = convert_sim_balance(sim_balance)
+                    account_balance_updates[sim_balance["account_id"]][value_timestamp][
+                        dimensions
+                    ].append((event_timestamp, balance))
+
+        for account_id, balance_map in account_balance_updates.items():
+            # By not resetting the entries for each value_timestamp, we ensure we get the most
+            # recent non-default value for given dimensions
+            value_timestamp_entries = []
+            dimension_entries = defaultdict(lambda: Balance())
+
+            for value_timestamp, balance_dict in balance_map.items():
+                for dimensions, event_ts_balance_list in balance_dict.items():
+                    dimension_entries[dimensions] = event_ts_balance_list[-1][1]
+
+                value_timestamp_entries.append((value_timestamp, deepcopy(dimension_entries)))
+
+            account_balance_timeseries[account_id] = TimeSeries(
+                value_timestamp_entries, return_on_empty=defaultdict(lambda: Balance())
+            )
+        return account_balance_timeseries
+
+    @property
+    def balances(self) -> DefaultDict[str, TimeSeries]:
+        """
+        Balance timeseries by value_timestamp for each account. See get_balances. The timeseries
+        are built once and each call returns a copy of them
+        """
+        balances = copy(self._balance_timeseries)
+        for account_id, timeseries in balances.items():
+            balances[account_id] = TimeSeries(
+                timeseries, return_on_empty=timeseries.return_on_empty
+            )
+        return balances
+
+    @cached_property
+    def _derived_parameter_timeseries(self) -> dict[str, list[tuple[datetime, Any]]]:
+        derived_parameters: dict[str, list[tuple[datetime, Any]]] = defaultdict(list)
+        for result in self.res:
+            derived_params = result["result"].get("derived_params")
+            if derived_params:
+                timestamp = self._parse_timestamp(result["result"]["timestamp"])
+                for account_id, account_derived_params in derived_params.items():
+                    derived_parameters[account_id].append(
+                        (timestamp, account_derived_params["values"])
+                    )
+        return derived_parameters
+
+    @property
+    def derived_parameters(self) -> dict[str, TimeSeries]:
+        return {
+            account_id: TimeSeries(outputs)
+            for account_id, outputs in self._derived_parameter_timeseries.items()
+        }
+
+    @cached_property
+    def _contract_notifications(
+        self,
+    ) -> dict[str, dict[str, list[tuple[datetime, dict[str, str]]]]]:
+        # resource id -> notification type -> [(datetime, notification contents)]
+        contract_notifications: dict[
+            str, dict[str, list[tuple[datetime, dict[str, str]]]]
+        ] = defaultdict(lambda: defaultdict(list))
+        for result in self.res:
+            notifications_by_resource = result["result"].get("contract_notification_events")
+            if not notifications_by_resource:
+                continue
+            timestamp = self._parse_timestamp(result["result"]["timestamp"])
+            for resource_id, notifications in notifications_by_resource.items():
+                for notification in notifications["contract_notification_events"]:
+                    contract_notifications[resource_id][notification["notification_type"]].append(
+                        (timestamp, notification)
+                    )
+        return contract_notifications
+
+    @property
+    def contract_notifications(self) -> dict[str, dict[str, list[tuple[datetime, dict[str, str]]]]]:
+        contract_notifications: dict[
+            str, dict[str, list[tuple[datetime, dict[str, str]]]]
+        ] = defaultdict(lambda: defaultdict(list))
+        for resource_id, notifications_by_type in self._contract_notifications.items():
+            for notification_type, notifications in notifications_by_type.items():
+                contract_notifications[resource_id][notification_type] = list(notifications)
+        return contract_notifications
+
+    @property
+    def logs_with_timestamp(self) -> dict[datetime, list[str]]:
+        logs_with_timestamp: dict[datetime, list[str]] = defaultdict(list)
+        for timestamp, logs in self._logs_with_timestamp.items():
+            logs_with_timestamp[timestamp] = list(logs)
+        return logs_with_timestamp
+
+    @cached_property
+    def logs(self) -> str:
+        return "; ".join(log for logs in self._result_logs for log in logs)
+
+    def postings(self, account_id: str, address: str) -> list[dict[str, Any]]:
+        return list(self._postings.get((account_id, address), []))
+
+    def posting_instruction_batch(self, event_type: str) -> dict[str, TimeSeries]:
+        # this stores target_account_id -> (timestamp, posting instruction records)
+        posting_instructions_timeseries = defaultdict(lambda: TimeSeries([]))
+        for account, timeseries in self._posting_instructions.get(event_type, {}).items():
+            posting_instructions_timeseries[account] = TimeSeries(
+                [(timestamp, pi) for timestamp, pi in timeseries.items()],
+                return_on_empty={},
+            )
+        return posting_instructions_timeseries
+
+    def logs_with_substring(self, substring: str) -> Generator:
+        """
+        Yields all logs of each result whose logs contain the substring
+        """
+        return (
+            log
+            for logs, joined_logs in zip(self._result_logs, self._joined_result_logs)
+            if substring in joined_logs
+            for log in logs
+        )
+
+    def has_logs_with_substring(self, substring: str) -> bool:
+        return any(substring in joined_logs for joined_logs in self._joined_result_logs)
+
+    def account_logs(self, account_id: str) -> Generator:
+        """
+        Yields all logs of each result whose logs mention the account
+        """
+        return self.logs_with_substring(f'account "{account_id}"')
+
+    def plan_logs(self, plan_id: str) -> Generator:
+        """
+        Yields all logs of each result whose logs mention the plan
+        """
+        return self.logs_with_substring(f'plan "{plan_id}"')
+
+    def processed_scheduled_events(
+        self, event_id: str, account_id: str = "", plan_id: str = ""
+    ) -> list[str]:
+        """
+        Returns the raw timestamps of the results that processed the scheduled event. See
+        get_processed_scheduled_events
+        """
+        return list(
+            self._processed_scheduled_events.get(
+                _processed_scheduled_event_log(event_id, account_id, plan_id), []
+            )
+        )
+
+    def has_posting_rejection(
+        self, timestamp: datetime, account_id: str, rejection_type: str, rejection_reason: str
+    ) -> bool:
+        if '"' in account_id or '"' in rejection_type:
+            rejection = (
+                f'account "{account_id}" rejected with rejection type "{rejection_type}" and '
+                f'reason "{rejection_reason}'
+            )
+            return any(rejection in log for log in self._logs_with_timestamp.get(timestamp, []))
+        return any(
+            reason.startswith(rejection_reason)
+            for reason in self._posting_rejections.get((timestamp, account_id, rejection_type), [])
+        )
+
+    def has_parameter_change_rejection(self, timestamp: datetime, rejection_reason: str) -> bool:
+        return any(
+            reason.startswith(rejection_reason)
+            for reason in self._parameter_change_rejections.get(timestamp, [])
+        )
+
+
+class SimulationResults(list):
+    """
+    Output from simulation endpoint, which keeps the SimulationResultIndex built over it so that
+    helpers called with these results can reuse it. The results must not be modified once indexed
+    """
+
+    @cached_property
+    def index(self) -> SimulationResultIndex:
+        return SimulationResultIndex(self)
+
+
+def get_balances(
+    res: list[dict[str, Any]] | SimulationResultIndex,
+) -> DefaultDict[str, TimeSeries]:
     """
     Returns a Balance timeseries by value_timestamp for each account
     The timeseries entries map a given datetime to a DefaultDict of BalanceDimensions to either
@@ -822,7 +1125,7 @@ def get_balances(res: list[dict[str, Any]]) -> DefaultDict[str, TimeSeries]:
     simulator may enable this, it is not reflective of real Vault behaviour as balance consistency
     constraints and timing would not allow identical insertion_timestamps
 
-    :param res: output from simulation endpoint
+    :param res: output from simulation endpoint, or an index over it
     :param return_latest_event_timestamp: If False, the balance timeseries
     maps BalanceDimensions to a Timeseries of Balances. If True it maps BalanceDimensions to the
     last available Balance for the value_timestamp. Use False if you are expecting backdating and
@@ -830,110 +1133,52 @@ def get_balances(res: list[dict[str, Any]]) -> DefaultDict[str, TimeSeries]:
     :return: account ids to corresponding balance timeseries
     """
 
-    # This stores account id -> value_timestamp -> BalanceDimensions -> (event_timestamp, balance)
-    account_balance_updates = defaultdict(lambda: defaultdict(lambda: defaultdict(lambda: [])))
-    # This stores account id -> TimeSeries -> BalanceDimensions -> Balance
-    account_balance_timeseries = defaultdict(
-        lambda: TimeSeries([], return_on_empty=defaultdict(lambda: Balance()))
-    )
-
-    # result data structure for balances is 'balances' -> account_id -> 'balances' -> list[balance]
-    for result in res:
-        result_inner = result["result"]
-        for balances in result_inner["balances"].values():
-            balances_inner = balances["balances"]
-            for sim_balance in balances_inner:
-                # results are ordered by event_timestamp so if there are multiple per
-                #  value_timestamp we don't need to worry about ordering them
-                event_timestamp = parser.parse(result_inner["timestamp"])
-                value_timestamp = parser.parse(sim_balance["value_time"])
-                dimensions, balance = convert_sim_balance(sim_balance)
-                account_balance_updates[sim_balance["account_id"]][value_timestamp][
-                    dimensions
-                ].append((event_timestamp, balance))
-
-    for account_id, balance_map in account_balance_updates.items():
-        # By not resetting the entries for each value_timestamp, we ensure we get the most recent
-        # non-default value for given dimensions
-        value_timestamp_entries = []
-        dimension_entries = defaultdict(lambda: Balance())
-
-        for value_timestamp, balance_dict in balance_map.items():
-            for dimensions, event_ts_balance_list in balance_dict.items():
-                dimension_entries[dimensions] = event_ts_balance_list[-1][1]
-
-            value_timestamp_entries.append((value_timestamp, deepcopy(dimension_entries)))
-
-        account_balance_timeseries[account_id] = TimeSeries(
-            value_timestamp_entries, return_on_empty=defaultdict(lambda: Balance())
-        )
-
-    return account_balance_timeseries
+    return SimulationResultIndex.of(res).balances
 
 
-def get_derived_parameters(res: list[dict[str, Any]]) -> dict[str, TimeSeries]:
+def get_derived_parameters(
+    res: list[dict[str, Any]] | SimulationResultIndex,
+) -> dict[str, TimeSeries]:
     """
     Returns a dictionary of derived parameters timeseries, using the account id as a key
-    :param res: The response from simulation endpoint
+    :param res: The response from simulation endpoint, or an index over it
     """
-
-    outputs = defaultdict(lambda: [])
-
-    for result in res:
-        derived_params = result["result"]["derived_params"]
-        if derived_params:
-            timestamp = parser.parse(result["result"]["timestamp"])
-            for account_id in derived_params:
-                outputs[account_id].append((timestamp, derived_params[account_id]["values"]))
-
-    return {k: TimeSeries(outputs[k]) for k in outputs}
+    return SimulationResultIndex.of(res).derived_parameters
 
 
 def get_contract_notifications(
-    res: list[dict[str, Any]],
+    res: list[dict[str, Any]] | SimulationResultIndex,
 ) -> dict[str, dict[str, list[tuple[datetime, dict[str, str]]]]]:
     """
     Extract notifications from simulation response
-    :param res: output from simulation endpoint
+    :param res: output from simulation endpoint, or an index over it
     :return: dict of resource id to notification type to list of notifications
     """
+    return SimulationResultIndex.of(res).contract_notifications
 
-    # resource id -> notification type -> [(datetime, notification contents)]
-    outputs: dict[str, dict[str, list[tuple[datetime, dict[str, str]]]]] = defaultdict(
-        lambda: defaultdict(lambda: ([]))
-    )
 
-    for result in res:
-        if "contract_notification_events" in result["result"]:
-            timestamp = parser.parse(result["result"]["timestamp"])
-            for resource_id, notifications in result["result"][
-                "contract_notification_events"
-            ].items():
-                for notification in notifications["contract_notification_events"]:
-                    outputs[resource_id][notification["notification_type"]].append(
-                        (timestamp, notification)
-                    )
-    return outputs
-
-
-def get_flag_definition_created(res: list[dict[str, Any]], flag_definition_id: str) -> bool:
+def get_flag_definition_created(
+    res: list[dict[str, Any]] | SimulationResultIndex, flag_definition_id: str
+) -> bool:
     """
     Returns True if log found for create_flag_definition_event
-    :param res: output from simulation endpoint
+    :param res: output from simulation endpoint, or an index over it
     :return: true if event found in logs
     """
 
     flag_definition_created_substr = f'created flag definition "{flag_definition_id}"'
 
-    return any(_get_logs_with_substring(res, flag_definition_created_substr))
+    return SimulationResultIndex.of(res).has_logs_with_substring(flag_definition_created_substr)
 
 
 def get_flag_created(
-    res: list[dict[str, Any]], flag_definition_id: str, account_id: str = MAIN_ACCOUNT
+    res: list[dict[str, Any]] | SimulationResultIndex,
+    flag_definition_id: str,
+    account_id: str = MAIN_ACCOUNT,
 ) -> bool:
     """
     Returns True if log found for create_flag_event
-    :param res: output from simulation endpoint
+    :param res: output from simulation endpoint, or an index over it
     :param flag_definition_id: flag definition id
     :param account_id: internal or customer account id
     :return: true if event found in logs
@@ -941,83 +1186,45 @@ def get_flag_created(
 
     flag_created_substr = f'"{flag_definition_id}" for account "{account_id}"'
 
-    return any(_get_logs_with_substring(res, flag_created_substr))
+    return SimulationResultIndex.of(res).has_logs_with_substring(flag_created_substr)
 
 
 def get_postings(
-    res: list[dict[str, Any]],
+    res: list[dict[str, Any]] | SimulationResultIndex,
     account_id: str = MAIN_ACCOUNT,
     balance_dimensions: BalanceDimensions | None = None,
 ) -> list[dict[str, Any]]:
     """
     Returns committed postings for specified account_id and balance address
-    :param res: output from simulation endpoint
+    :param res: output from simulation endpoint, or an index over it
     :param account_id: internal or customer account id
     :param balance_dimensions: balance dimensions
     :return: committed postings
     """
     balance_dimensions = balance_dimensions or BalanceDimensions()
-    pibs = (
-        pibs
-        for response in res
-        for pibs in response["result"]["posting_instruction_batches"]
-        if response["result"]["posting_instruction_batches"]
-    )
-
-    posting_instructions = (pi for pib in pibs for pi in pib["posting_instructions"])
-
-    return [
-        committed_posting
-        for pi in posting_instructions
-        for committed_posting in pi["committed_postings"]
-        if committed_posting["account_address"] == balance_dimensions.address
-        and committed_posting["account_id"] == account_id
-    ]
+    return SimulationResultIndex.of(res).postings(account_id, balance_dimensions.address)
 
 
 def get_posting_instruction_batch(
-    res: list[dict[str, Any]], event_type: str
+    res: list[dict[str, Any]] | SimulationResultIndex, event_type: str
 ) -> dict[str, TimeSeries]:
     """
     Returns a posting instruction timeseries by timestamp for each target_account_id.
-    :param res: output from simulation endpoint
+    :param res: output from simulation endpoint, or an index over it
     :param event_type: event type
     :return: list of posting instruction events
     """
-    # this stores target_account_id -> timestamp -> posting instruction records
-    posting_instructions = defaultdict(lambda: defaultdict(lambda: []))
-    for result in res:
-        result_data = result["result"]
-        event_timestamp = parser.parse(result_data["timestamp"])
-
-        for pibs in result_data["posting_instruction_batches"]:
-            for pis in pibs["posting_instructions"]:
-                if event_type not in pis:
-                    continue
-
-                posting_instructions[pis[event_type]["target_account_id"]][event_timestamp].append(
-                    pis[event_type]
-                )
-
-    # this stores target_account_id -> (timestamp, posting instruction records)
-    posting_instructions_timeseries = defaultdict(lambda: TimeSeries([]))
-    for account, timeseries in posting_instructions.items():
-        posting_instructions_timeseries[account] = TimeSeries(
-            [(timestamp, pi) for timestamp, pi in timeseries.items()],
-            return_on_empty={},
-        )
-
-    return posting_instructions_timeseries
+    return SimulationResultIndex.of(res).posting_instruction_batch(event_type)
 
 
 def get_num_postings(
-    res: list[dict[str, Any]],
+    res: list[dict[str, Any]] | SimulationResultIndex,
     account_id: str = MAIN_ACCOUNT,
     balance_dimensions: BalanceDimensions | None = None,
 ) -> int:
     """
     Returns number of committed postings for specified account_id and balance address
-    :param res: output from simulation endpoint
+    :param res: output from simulation endpoint, or an index over it
     :param account_id: internal or customer account id
     :param balance_dimensions: balance dimensions
     :return: number of comitted postings
@@ -1026,27 +1233,26 @@ def get_num_postings(
     return len(get_postings(res, account_id, balance_dimensions))
 
 
-def get_logs(res: list[dict[str, Any]]) -> str:
+def get_logs(res: list[dict[str, Any]] | SimulationResultIndex) -> str:
     """
     Returns all logs from simulation result
-    :param res: output from simulation endpoint
+    :param res: output from simulation endpoint, or an index over it
     :return: logs from simulation endpoint
     """
 
-    return "; ".join(
-        (log for list_of_log_lists in res for log in list_of_log_lists["result"]["logs"])
-    )
+    return SimulationResultIndex.of(res).logs
 
 
-def get_account_logs(res: list[dict[str, Any]], account_id: str = MAIN_ACCOUNT) -> str:
+def get_account_logs(
+    res: list[dict[str, Any]] | SimulationResultIndex, account_id: str = MAIN_ACCOUNT
+) -> str:
     """
     Returns logs from simulation result for a specific account_id
-    :param res: output from simulation endpoint
+    :param res: output from simulation endpoint, or an index over it
     :param account_id: internal or customer account id
     :return: logs from simulation endpoint for specific account ID
     """
-    account_substr = f'account "{account_id}"'
-    return "; ".join(_get_logs_with_substring(res, account_substr))
+    return "; ".join(SimulationResultIndex.of(res).account_logs(account_id))
 
 
 def create_supervisor_config(
@@ -1090,24 +1296,23 @@ def create_supervisor_config(
     )
 
 
-def get_plan_logs(res: list[dict[str, Any]], plan_id: str) -> str:
+def get_plan_logs(res: list[dict[str, Any]] | SimulationResultIndex, plan_id: str) -> str:
     """
     Returns plan logs from simulation result for a specific plan id
-    :param res: output from simulation endpoint
+    :param res: output from simulation endpoint, or an index over it
     :param plan_id: plan instruction id
     :return: plan logs
     """
-    plan_substr = f'plan "{plan_id}"'
-    return "; ".join(_get_logs_with_substring(res, plan_substr))
+    return "; ".join(SimulationResultIndex.of(res).plan_logs(plan_id))
 
 
 def get_plan_created(
-    res: list[dict[str, Any]], plan_id: str, supervisor_version_id: str = ""
+    res: list[dict[str, Any]] | SimulationResultIndex, plan_id: str, supervisor_version_id: str = ""
 ) -> bool:
     """
     Returns True if plan has been created and False if plan creation information cannot be found
     in logs
-    :param res: output from simulation endpoint
+    :param res: output from simulation endpoint, or an index over it
     :param plan_id: plan instruction id
     :param supervisor_version_id: supervisor contract version id
     :return: True if plan creation log exists in response
@@ -1116,14 +1321,16 @@ def get_plan_created(
     if supervisor_version_id:
         plan_created += f' for supervisor contract version "{supervisor_version_id}"'
 
-    return any(_get_logs_with_substring(res, plan_created))
+    return SimulationResultIndex.of(res).has_logs_with_substring(plan_created)
 
 
-def get_plan_assoc_created(res: list[dict[str, Any]], plan_id: str, account_id: str) -> bool:
+def get_plan_assoc_created(
+    res: list[dict[str, Any]] | SimulationResultIndex, plan_id: str, account_id: str
+) -> bool:
     """
     Returns True if plan association has been created and False if plan association
     information cannot be found in logs
-    :param res: output from simulation endpoint
+    :param res: output from simulation endpoint, or an index over it
     :param plan_id: plan instruction id
     :param account_id: customer account id
     :return: True if plan association creation log exists in response
@@ -1131,16 +1338,18 @@ def get_plan_assoc_created(res: list[dict[str, Any]], plan_id: str, account_id:
     plan_assoc_created = f'created account plan association for account "{account_id}"'
     plan_assoc_created += f' and plan "{plan_id}"'
 
-    return any(_get_logs_with_substring(res, plan_assoc_created))
+    return SimulationResultIndex.of(res).has_logs_with_substring(plan_assoc_created)
 
 
 def get_module_link_created(
-    res: list[dict[str, Any]], aliases: list[str], smart_contract_version_id: str
+    res: list[dict[str, Any]] | SimulationResultIndex,
+    aliases: list[str],
+    smart_contract_version_id: str,
 ) -> bool:
     """
     Returns True if contract module links have been created and False if contract module links
     information cannot be found in logs
-    :param res: output from simulation endpoint
+    :param res: output from simulation endpoint, or an index over it
     :param module_alias: alias of the contract module
     :param account_id: customer account id
     :return: True if contract module link log exists in response
@@ -1150,32 +1359,28 @@ def get_module_link_created(
     contract_module_link_created += (
         f'"sim_link_modules_{aliases_as_str}_with_contract_{smart_contract_version_id}"'
     )
-    return any(_get_logs_with_substring(res, contract_module_link_created))
+    return SimulationResultIndex.of(res).has_logs_with_substring(contract_module_link_created)
 
 
-def get_logs_with_timestamp(res: list[dict[str, Any]]) -> dict[datetime, list[str]]:
+def get_logs_with_timestamp(
+    res: list[dict[str, Any]] | SimulationResultIndex
+) -> dict[datetime, list[str]]:
     """
     Returns all logs from simulation result with logs grouped by timestamp
-    :param res: output from simulation endpoint
+    :param res: output from simulation endpoint, or an index over it
     :return: logs grouped by timestamp
     """
 
-    list_of_logs = (
-        {log["result"]["timestamp"]: log["result"]["logs"]} for log in res if log["result"]["logs"]
-    )
-
-    logs_with_timestamp = defaultdict(list)
-
-    for result in list_of_logs:
-        k, v = list(result.items())[0]
-        logs_with_timestamp[parser.parse(k)] += v
-
-    return logs_with_timestamp
+    return SimulationResultIndex.of(res).logs_with_timestamp
 
 
 def has_matching_processed_scheduled_event(
     logs: list[str], event_id: str, account_id: str = "", plan_id: str = ""
 ) -> bool:
+    return _processed_scheduled_event_log(event_id, account_id, plan_id) in logs
+
+
+def _processed_scheduled_event_log(event_id: str, account_id: str = "", plan_id: str = "") -> str:
     for_str = ""
     if account_id:
         for_str = f'for account "{account_id}"'
@@ -1183,11 +1388,11 @@ def has_matching_processed_scheduled_event(
         for_str = f'for plan "{plan_id}"'
     else:
         raise ValueError("account_id or plan_id must be provided")
-    return f'processed scheduled event "{event_id}" {for_str}' in logs
+    return f'{PROCESSED_SCHEDULED_EVENT_PREFIX}{event_id}" {for_str}'
 
 
 def get_processed_scheduled_events(
-    res: list[dict[str, Any]],
+    res: list[dict[str, Any]] | SimulationResultIndex,
     event_id: str,
     account_id: str = "",
     plan_id: str = "",
@@ -1195,19 +1400,13 @@ def get_processed_scheduled_events(
     """
     Returns a list of timestamps for processed scheduled events found for specific
     account id or plan id
-    :param res: output from simulation endpoint
+    :param res: output from simulation endpoint, or an index over it
     :param event_id: id of the event
     :param account_id: internal or customer account id
     :param plan_id: account plan association id
     :return: list of timestamps
     """
-    return [
-        result["result"]["timestamp"]
-        for result in res
-        if has_matching_processed_scheduled_event(
-            result["result"]["logs"], event_id, account_id, plan_id
-        )
-    ]
+    return SimulationResultIndex.of(res).processed_scheduled_events(event_id, account_id, plan_id)
 
 
 def print_json(print_identifier: str, json_obj: Any) -> None:
@@ -1218,7 +1417,7 @@ def print_json(print_identifier: str, json_obj: Any) -> None:
 
 
 def print_postings(
-    res: list[dict[str, Any]],
+    res: list[dict[str, Any]] | SimulationResultIndex,
     account_id: str = MAIN_ACCOUNT,
     balance_dimensions: BalanceDimensions | None = None,
 ) -> None:
@@ -1227,19 +1426,10 @@ def print_postings(
     print_json("Postings", postings)
 
 
-def print_log(res: list[dict[str, Any]]) -> None:
+def print_log(res: list[dict[str, Any]] | SimulationResultIndex) -> None:
     print_json("Event log", get_logs(res))
 
 
-def _get_logs_with_substring(res: list[dict[str, Any]], substring: str) -> Generator:
-    return (
-        log
-        for list_of_log_lists in res
-        for log in list_of_log_lists["result"]["logs"]
-        if substring in "".join(list_of_log_lists["result"]["logs"])
-    )
-
-
 class DecimalEncoder(json.JSONEncoder):
     def default(self, o):
         if isinstance(o, Decimal):
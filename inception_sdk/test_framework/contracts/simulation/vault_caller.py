@@ -5,8 +5,10 @@ import json
 import logging
 import os
 import uuid
+from collections.abc import Iterator
 from datetime import datetime
-from typing import Any
+from itertools import chain, islice
+from typing import Any, Iterable
 
 # third party
 import requests
@@ -38,6 +40,8 @@ response_logger.setLevel(os.environ.get("LOGLEVEL", "INFO"))
 
 
 _DEFAULT_OPS_AUTH_HEADER_NAME = "tm_ops_auth_token"
+# Number of streamed payload items that are serialised per request body chunk
+_STREAMED_ITEMS_PER_CHUNK = 1000
 
 
 class AuthCookieNotFound(Exception):
@@ -89,6 +93,8 @@ class Client:
     def _api_post(
         self, url: str, payload: dict[str, Any], timeout: str, debug=False
     ) -> list[dict[str, Any]]:
+        if any(isinstance(value, Iterator) for value in payload.values()):
+            return self._api_post_streamed(url, payload, timeout, debug)
         response: requests.Response = self._session.post(
             self._core_api_url + url,
             headers={"grpc-timeout": timeout},
@@ -98,6 +104,33 @@ class Client:
         request_logger.debug(json.dumps(payload))
         return self._handle_response(response, debug)
 
+    def _api_post_streamed(
+        self, url: str, payload: dict[str, Any], timeout: str, debug=False
+    ) -> list[dict[str, Any]]:
+        """
+        Posts a payload containing iterators as a chunked request body, so that the iterators
+        never have to be materialised
+        """
+        logged_chunks: list[bytes] | None = (
+            [] if request_logger.isEnabledFor(logging.DEBUG) else None
+        )
+
+        def body() -> Iterator[bytes]:
+            for chunk in _iter_json_chunks(payload):
+                if logged_chunks is not None:
+                    logged_chunks.append(chunk)
+                yield chunk
+
+        response: requests.Response = self._session.post(
+            self._core_api_url + url,
+            headers={"grpc-timeout": timeout},
+            data=body(),
+            stream=debug,
+        )
+        if logged_chunks is not None:
+            request_logger.debug(b"".join(logged_chunks).decode())
+        return self._handle_response(response, debug)
+
     def _handle_response(self, response: requests.Response, debug=False) -> list[dict[str, Any]]:
         try:
             response.raise_for_status()
@@ -154,7 +187,7 @@ class Client:
         self,
         start_timestamp: datetime,
         end_timestamp: datetime,
-        events: list[SimulationEvent],
+        events: Iterable[SimulationEvent],
         timeout: str = "360S",
         supervisor_contract_code: str | None = None,
         supervisor_contract_version_id: str | None = None,
@@ -265,7 +298,7 @@ class Client:
                     supervisor_contract_code, supervisor_contract_version_id
                 ),
                 "contract_modules": contract_modules_to_simulate,
-                "instructions": [_event_to_json(event) for event in default_events + events],
+                "instructions": _events_to_json(default_events, events),
                 "outputs": create_derived_parameters_instructions(
                     output_account_ids, output_timestamps
                 ),
@@ -285,6 +318,35 @@ def _datetime_to_rfc_3339(dt):
     return dt.astimezone().isoformat()
 
 
+def _events_to_json(
+    default_events: list[SimulationEvent], events: Iterable[SimulationEvent]
+) -> list[dict[str, Any]] | Iterator[dict[str, Any]]:
+    # lazily generated events are streamed into the request body rather than materialised
+    if isinstance(events, list):
+        return [_event_to_json(event) for event in default_events + events]
+    return map(_event_to_json, chain(default_events, events))
+
+
+def _iter_json_chunks(payload: dict[str, Any]) -> Iterator[bytes]:
+    """
+    Serialises a JSON object whose values may include iterators, which are serialised as arrays
+    in chunks of _STREAMED_ITEMS_PER_CHUNK items
+    """
+    yield b"{"
+    for i, (key, value) in enumerate(payload.items()):
+        prefix = ", " if i else ""
+        if not isinstance(value, Iterator):
+            yield f"{prefix}{json.dumps(key)}: {json.dumps(value)}".encode()
+            continue
+        yield f"{prefix}{json.dumps(key)}: [".encode()
+        separator = ""
+        while items := list(islice(value, _STREAMED_ITEMS_PER_CHUNK)):
+            yield (separator + ", ".join(json.dumps(item) for item in items)).encode()
+            separator = ", "
+        yield b"]"
+    yield b"}"
+
+
 def _event_to_json(event):
     instruction = {
         "timestamp": _datetime_to_rfc_3339(event.time),
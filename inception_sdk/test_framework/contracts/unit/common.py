@@ -3,8 +3,10 @@
 import logging
 import os
 from collections import defaultdict
+from contextlib import contextmanager
 from datetime import datetime
 from decimal import Decimal
+from typing import Any, Iterator
 from unittest import TestCase
 from unittest.mock import Mock
 from zoneinfo import ZoneInfo
@@ -46,6 +48,14 @@ from contracts_api import (
     UnionItemValue,
 )
 
+# inception sdk
+from inception_sdk.test_framework.contracts.unit.fake_vault import FakeVault
+from inception_sdk.test_framework.contracts.unit.structural_equality import (
+    StructuralAssertionError,
+    format_structural_diff,
+    structural_diff,
+)
+
 PostingInstruction = (
     AuthorisationAdjustment
     | CustomInstruction
@@ -117,6 +127,33 @@ class ContractTest(TestCase):
                 "You must supply the Tside of the product at the start of the test class"
             )
 
+    @contextmanager
+    def _structural_diff_on_failure(self, first: Any, second: Any) -> Iterator[None]:
+        # the diff is only computed once the comparison has failed, as it is much more expensive
+        try:
+            yield
+        except StructuralAssertionError:
+            raise
+        except self.failureException as e:
+            diff = structural_diff(first, second)
+            if diff is None:
+                raise
+            raise StructuralAssertionError(
+                f"{e}\n\nStructural diff:\n{format_structural_diff(diff)}"
+            ) from None
+
+    def assertEqual(self, first: Any, second: Any, msg: Any = None) -> None:
+        with self._structural_diff_on_failure(first, second):
+            super().assertEqual(first, second, msg)
+
+    def assertListEqual(self, list1: list, list2: list, msg: Any = None) -> None:
+        with self._structural_diff_on_failure(list1, list2):
+            super().assertListEqual(list1, list2, msg)
+
+    def assertDictEqual(self, d1: dict, d2: dict, msg: Any = None) -> None:
+        with self._structural_diff_on_failure(d1, d2):
+            super().assertDictEqual(d1, d2, msg)
+
     def create_mock(
         self,
         account_id: str = ACCOUNT_ID,
@@ -360,6 +397,59 @@ class ContractTest(TestCase):
 
         return mock_vault
 
+    def create_fake_vault(
+        self,
+        account_id: str = ACCOUNT_ID,
+        balances_observation_fetchers_mapping: dict[str, BalancesObservation] | None = None,
+        balances_interval_fetchers_mapping: (
+            dict[str, defaultdict[BalanceCoordinate, BalanceTimeseries]] | None
+        ) = None,
+        calendar_events: list[CalendarEvent] | None = None,
+        client_transactions_mapping: dict[str, dict[str, ClientTransaction]] | None = None,
+        creation_date: datetime = DEFAULT_DATETIME,
+        flags_ts: dict[str, FlagTimeseries] | None = None,
+        last_execution_datetimes: dict[str, datetime] | None = None,
+        parameter_ts: dict[str, ParameterTimeseries] | None = None,
+        postings_interval_mapping: dict[str, PostingInstructionTypeList] | None = None,
+        requires_fetched_balances: defaultdict[BalanceCoordinate, BalanceTimeseries] | None = None,
+        requires_fetched_client_transactions: dict[str, ClientTransaction] | None = None,
+        requires_fetched_postings: PostingInstructionTypeList | None = None,
+        supervisee_alias: str | None = None,
+        supervisee_hook_result: (
+            PostPostingHookResult | PrePostingHookResult | ScheduledEventHookResult | None
+        ) = None,
+        is_supervisee_vault: bool = False,
+    ) -> FakeVault:
+        """
+        Create a FakeVault object for the test. This is a faster alternative to create_mock for
+        tests that do not assert on or patch vault methods. Variants of a shared FakeVault can be
+        derived with FakeVault.clone
+
+        See create_mock for the description of each parameter
+        """
+        return FakeVault(
+            account_id=account_id,
+            creation_date=creation_date,
+            tside=self.tside,
+            events_timezone=self.events_timezone,
+            permitted_denominations=[self.default_denomination],
+            hook_execution_id=DEFAULT_HOOK_EXECUTION_ID,
+            balances_observation_fetchers_mapping=balances_observation_fetchers_mapping,
+            balances_interval_fetchers_mapping=balances_interval_fetchers_mapping,
+            calendar_events=calendar_events,
+            client_transactions_mapping=client_transactions_mapping,
+            flags_ts=flags_ts,
+            last_execution_datetimes=last_execution_datetimes,
+            parameter_ts=parameter_ts,
+            postings_interval_mapping=postings_interval_mapping,
+            requires_fetched_balances=requires_fetched_balances,
+            requires_fetched_client_transactions=requires_fetched_client_transactions,
+            requires_fetched_postings=requires_fetched_postings,
+            supervisee_alias=supervisee_alias,
+            supervisee_hook_result=supervisee_hook_result,
+            is_supervisee_vault=is_supervisee_vault,
+        )
+
     # Posting Instruction types
     def inbound_auth(
         self,
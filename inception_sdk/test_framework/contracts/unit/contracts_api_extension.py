@@ -2,14 +2,17 @@
 """
 This file extends the contract_api custom classes to define the __eq__ method for classes that
 have an __init__ constructor method defined but no __eq__ method. This can be extended further to
-all custom classes if required.
+all custom classes if required. The comparison of each class is defined by the comparison plan it
+is registered with, see structural_equality.py. Differences are reported by ContractTest when an
+equality assertion fails.
 
 Note this is a workaround until the __eq__ method is implemented for all classes in the
 contracts_api
 """
 
 # standard libs
-from collections import defaultdict
+import operator
+from typing import Any
 
 # contracts api
 from contracts_api import (
@@ -118,1487 +121,422 @@ from contracts_api import (
     requires,
 )
 
+# inception sdk
+from inception_sdk.test_framework.contracts.unit.structural_equality import (
+    register_comparison_plan,
+    structurally_equal,
+)
+
+
+def _postings_equal(first: list[_Posting], second: list[_Posting]) -> bool:
+    # postings are compared on their attributes, regardless of whether they are extension types.
+    # As per the other attributes, only the postings of the second instruction must be matched
+    return len(second) <= len(first) and all(
+        first_posting.__dict__ == second_posting.__dict__
+        for first_posting, second_posting in zip(first, second)
+    )
+
+
+def _str_equal(first: Any, second: Any) -> bool:
+    return str(first) == str(second)
 
+
+@register_comparison_plan(_AccountNotificationDirective)
 class AccountNotificationDirective(_AccountNotificationDirective):
     # attributes: notification_type, notification_details
-
-    def __eq__(self, other):
-        if isinstance(other, _AccountNotificationDirective):
-            difference_dict = dict()
-            for key in other.__dict__:
-                if other.__dict__[key] != self.__dict__[key]:
-                    difference_dict[key] = {
-                        "self": self.__dict__[key],
-                        "other": other.__dict__[key],
-                    }
-            if len(difference_dict) != 0:
-                print(f"Object: {self.__class__.__name__} \nAttributes differ: {difference_dict}")
-                return False
-            return True
-        print(
-            f"Objects are of different type, type(self)={self.__class__.__name__}, type(other)={other.__class__.__name__}"
-        )
-        return False
+    pass
 
 
+@register_comparison_plan(_ActivationHookResult)
 class ActivationHookResult(_ActivationHookResult):
     # attributes: account_notification_directives, posting_instructions_directives, scheduled_events_return_value
-
-    def __eq__(self, other):
-        if isinstance(other, _ActivationHookResult):
-            difference_dict = dict()
-            for key in other.__dict__:
-                if other.__dict__[key] != self.__dict__[key]:
-                    difference_dict[key] = {
-                        "self": self.__dict__[key],
-                        "other": other.__dict__[key],
-                    }
-            if len(difference_dict) != 0:
-                print(f"Object: {self.__class__.__name__} \nAttributes differ: {difference_dict}")
-                return False
-            return True
-        print(
-            f"Objects are of different type, type(self)={self.__class__.__name__}, type(other)={other.__class__.__name__}"
-        )
-        return False
+    pass
 
 
+@register_comparison_plan(_AdjustmentAmount)
 class AdjustmentAmount(_AdjustmentAmount):
     # attributes: amount, replacement_amount
-
-    def __eq__(self, other):
-        if isinstance(other, _AdjustmentAmount):
-            difference_dict = dict()
-            for key in other.__dict__:
-                if other.__dict__[key] != self.__dict__[key]:
-                    difference_dict[key] = {
-                        "self": self.__dict__[key],
-                        "other": other.__dict__[key],
-                    }
-            if len(difference_dict) != 0:
-                print(f"Object: {self.__class__.__name__} \nAttributes differ: {difference_dict}")
-                return False
-            return True
-        print(
-            f"Objects are of different type, type(self)={self.__class__.__name__}, type(other)={other.__class__.__name__}"
-        )
-        return False
+    pass
 
 
+@register_comparison_plan(_AuthorisationAdjustment)
 class AuthorisationAdjustment(_AuthorisationAdjustment):
     # attributes: amount, replacement_amount
-
-    def __eq__(self, other):
-        if isinstance(other, _AuthorisationAdjustment):
-            difference_dict = dict()
-            for key in other.__dict__:
-                if other.__dict__[key] != self.__dict__[key]:
-                    difference_dict[key] = {
-                        "self": self.__dict__[key],
-                        "other": other.__dict__[key],
-                    }
-            if len(difference_dict) != 0:
-                print(f"Object: {self.__class__.__name__} \nAttributes differ: {difference_dict}")
-                return False
-            return True
-        print(
-            f"Objects are of different type, type(self)={self.__class__.__name__}, type(other)={other.__class__.__name__}"
-        )
-        return False
+    pass
 
 
+@register_comparison_plan(_BalanceDefaultDict)
 class BalanceDefaultDict(_BalanceDefaultDict):
     # attributes:
-
-    def __eq__(self, other):
-        if isinstance(other, _BalanceDefaultDict):
-            difference_dict = dict()
-            for key in other.__dict__:
-                if other.__dict__[key] != self.__dict__[key]:
-                    difference_dict[key] = {
-                        "self": self.__dict__[key],
-                        "other": other.__dict__[key],
-                    }
-            if len(difference_dict) != 0:
-                print(f"Object: {self.__class__.__name__} \nAttributes differ: {difference_dict}")
-                return False
-            return True
-        print(
-            f"Objects are of different type, type(self)={self.__class__.__name__}, type(other)={other.__class__.__name__}"
-        )
-        return False
+    pass
 
 
+@register_comparison_plan(_BalanceTimeseries)
 class BalanceTimeseries(_BalanceTimeseries):
     # attributes: extend
-
-    def __eq__(self, other):
-        if isinstance(other, _BalanceTimeseries):
-            difference_dict = dict()
-            for key in other.__dict__:
-                if other.__dict__[key] != self.__dict__[key]:
-                    difference_dict[key] = {
-                        "self": self.__dict__[key],
-                        "other": other.__dict__[key],
-                    }
-            if len(difference_dict) != 0:
-                print(f"Object: {self.__class__.__name__} \nAttributes differ: {difference_dict}")
-                return False
-            return True
-        print(
-            f"Objects are of different type, type(self)={self.__class__.__name__}, type(other)={other.__class__.__name__}"
-        )
-        return False
+    pass
 
 
+@register_comparison_plan(_BalancesFilter)
 class BalancesFilter(_BalancesFilter):
     # attributes: addresses
-
-    def __eq__(self, other):
-        if isinstance(other, _BalancesFilter):
-            difference_dict = dict()
-            for key in other.__dict__:
-                if other.__dict__[key] != self.__dict__[key]:
-                    difference_dict[key] = {
-                        "self": self.__dict__[key],
-                        "other": other.__dict__[key],
-                    }
-            if len(difference_dict) != 0:
-                print(f"Object: {self.__class__.__name__} \nAttributes differ: {difference_dict}")
-                return False
-            return True
-        print(
-            f"Objects are of different type, type(self)={self.__class__.__name__}, type(other)={other.__class__.__name__}"
-        )
-        return False
+    pass
 
 
+@register_comparison_plan(_BalancesIntervalFetcher)
 class BalancesIntervalFetcher(_BalancesIntervalFetcher):
     # attributes: class_name, filter
-
-    def __eq__(self, other):
-        if isinstance(other, _BalancesIntervalFetcher):
-            difference_dict = dict()
-            for key in other.__dict__:
-                if other.__dict__[key] != self.__dict__[key]:
-                    difference_dict[key] = {
-                        "self": self.__dict__[key],
-                        "other": other.__dict__[key],
-                    }
-            if len(difference_dict) != 0:
-                print(f"Object: {self.__class__.__name__} \nAttributes differ: {difference_dict}")
-                return False
-            return True
-        print(
-            f"Objects are of different type, type(self)={self.__class__.__name__}, type(other)={other.__class__.__name__}"
-        )
-        return False
+    pass
 
 
+@register_comparison_plan(_BalancesObservation)
 class BalancesObservation(_BalancesObservation):
     # attributes: value_datetime, balances
-
-    def __eq__(self, other):
-        if isinstance(other, _BalancesObservation):
-            difference_dict = dict()
-            for key in other.__dict__:
-                if other.__dict__[key] != self.__dict__[key]:
-                    difference_dict[key] = {
-                        "self": self.__dict__[key],
-                        "other": other.__dict__[key],
-                    }
-            if len(difference_dict) != 0:
-                print(f"Object: {self.__class__.__name__} \nAttributes differ: {difference_dict}")
-                return False
-            return True
-        print(
-            f"Objects are of different type, type(self)={self.__class__.__name__}, type(other)={other.__class__.__name__}"
-        )
-        return False
+    pass
 
 
+@register_comparison_plan(_BalancesObservationFetcher)
 class BalancesObservationFetcher(_BalancesObservationFetcher):
     # attributes: fetcher_id, at, filter
-
-    def __eq__(self, other):
-        if isinstance(other, _BalancesObservationFetcher):
-            difference_dict = dict()
-            for key in other.__dict__:
-                if other.__dict__[key] != self.__dict__[key]:
-                    difference_dict[key] = {
-                        "self": self.__dict__[key],
-                        "other": other.__dict__[key],
-                    }
-            if len(difference_dict) != 0:
-                print(f"Object: {self.__class__.__name__} \nAttributes differ: {difference_dict}")
-                return False
-            return True
-        print(
-            f"Objects are of different type, type(self)={self.__class__.__name__}, type(other)={other.__class__.__name__}"
-        )
-        return False
+    pass
 
 
+@register_comparison_plan(_CalendarEvent)
 class CalendarEvent(_CalendarEvent):
     # attributes: id, calendar_id, start_datetime, end_datetime
-
-    def __eq__(self, other):
-        if isinstance(other, _CalendarEvent):
-            difference_dict = dict()
-            for key in other.__dict__:
-                if other.__dict__[key] != self.__dict__[key]:
-                    difference_dict[key] = {
-                        "self": self.__dict__[key],
-                        "other": other.__dict__[key],
-                    }
-            if len(difference_dict) != 0:
-                print(f"Object: {self.__class__.__name__} \nAttributes differ: {difference_dict}")
-                return False
-            return True
-        print(
-            f"Objects are of different type, type(self)={self.__class__.__name__}, type(other)={other.__class__.__name__}"
-        )
-        return False
+    pass
 
 
+@register_comparison_plan(_CalendarEvents, item_comparator=structurally_equal)
 class CalendarEvents(_CalendarEvents):
-    # since CalendarEvents extends `list`, __dict__ method returns
-    # an empty dict, so we have to manually compare the _CalendarEvent objects
-    # of the list
-    def __eq__(self, other):
-        if isinstance(other, _CalendarEvents):
-            # The length of each list needs to be checked since zip() returns an object of length
-            # equal to the shortest list.
-            if len(self) != len(other):
-                print(
-                    f"Objects are of different length, len(self)={len(self)}, len(other)={len(other)}"
-                )
-                return False
-            # cast the internal _CalendarEvent objects to the extended
-            # CalendarEvent object to get the difference information
-            calendar_events = [
-                (CalendarEvent(**x.__dict__), CalendarEvent(**y.__dict__))
-                for (x, y) in zip(self, other)
-            ]
-            return all(x == y for x, y in calendar_events)
-        return False
+    # since CalendarEvents extends `list`, its _CalendarEvent items are compared as CalendarEvents
+    pass
 
 
+@register_comparison_plan(_ClientTransaction, ignored_attributes=frozenset({"_client_transaction"}))
 class ClientTransaction(_ClientTransaction):
-    def __eq__(self, other):
-        if isinstance(other, _ClientTransaction):
-            difference_dict = dict()
-            for key in other.__dict__:
-                if key == "_client_transaction":
-                    continue
-                if other.__dict__[key] != self.__dict__[key]:
-                    difference_dict[key] = {
-                        "self": self.__dict__[key],
-                        "other": other.__dict__[key],
-                    }
-            if len(difference_dict) != 0:
-                print(f"Object: {self.__class__.__name__} \nAttributes differ: {difference_dict}")
-                return False
-            return True
-        print(
-            f"Objects are of different type, type(self)={self.__class__.__name__}, type(other)={other.__class__.__name__}"
-        )
-        return False
+    pass
 
 
+@register_comparison_plan(_ConversionHookResult)
 class ConversionHookResult(_ConversionHookResult):
     # attributes: account_notification_directives, posting_instructions_directives, scheduled_events_return_value
-
-    def __eq__(self, other):
-        if isinstance(other, _ConversionHookResult):
-            difference_dict = dict()
-            for key in other.__dict__:
-                if other.__dict__[key] != self.__dict__[key]:
-                    difference_dict[key] = {
-                        "self": self.__dict__[key],
-                        "other": other.__dict__[key],
-                    }
-            if len(difference_dict) != 0:
-                print(f"Object: {self.__class__.__name__} \nAttributes differ: {difference_dict}")
-                return False
-            return True
-        print(
-            f"Objects are of different type, type(self)={self.__class__.__name__}, type(other)={other.__class__.__name__}"
-        )
-        return False
+    pass
 
 
+@register_comparison_plan(
+    _CustomInstruction,
+    ignored_attributes=frozenset({"_committed_postings"}),
+    attribute_comparators={"postings": _postings_equal},
+)
 class CustomInstruction(_CustomInstruction):
-    #  attributes: postings, instruction_details, transaction_code, override_all_restrictions
-
-    def __eq__(self, other):
-        if isinstance(other, _CustomInstruction):
-            difference_dict = defaultdict(dict)
-            for key in other.__dict__:
-                if key == "_committed_postings":
-                    continue
-                if key != "postings":
-                    if other.__dict__[key] != self.__dict__[key]:
-                        difference_dict[key] = {
-                            "self": self.__dict__[key],
-                            "other": other.__dict__[key],
-                        }
-                else:
-                    for index, posting in enumerate(other.__dict__[key]):
-                        if posting.__dict__ != self.__dict__[key][index].__dict__:
-                            difference_dict[key][str(index)] = {
-                                "self": self.__dict__[key][index],
-                                "other": posting.__dict__,
-                            }
-
-            if len(difference_dict) != 0:
-                print(f"Object: {self.__class__.__name__} \nAttributes differ: {difference_dict}")
-                return False
-            return True
-        print(
-            f"Objects are of different type, type(self)={self.__class__.__name__}, type(other)={other.__class__.__name__}"
-        )
-        return False
+    # attributes: postings, instruction_details, transaction_code, override_all_restrictions
+    pass
 
 
+@register_comparison_plan(_DateShape)
 class DateShape(_DateShape):
     # attributes: min_date, max_date
-
-    def __eq__(self, other):
-        if isinstance(other, _DateShape):
-            difference_dict = dict()
-            for key in other.__dict__:
-                if other.__dict__[key] != self.__dict__[key]:
-                    difference_dict[key] = {
-                        "self": self.__dict__[key],
-                        "other": other.__dict__[key],
-                    }
-            if len(difference_dict) != 0:
-                print(f"Object: {self.__class__.__name__} \nAttributes differ: {difference_dict}")
-                return False
-            return True
-        print(
-            f"Objects are of different type, type(self)={self.__class__.__name__}, type(other)={other.__class__.__name__}"
-        )
-        return False
+    pass
 
 
+@register_comparison_plan(_DeactivationHookResult)
 class DeactivationHookResult(_DeactivationHookResult):
     # attributes: account_notification_directives, posting_instructions_directives, rejection
-
-    def __eq__(self, other):
-        if isinstance(other, _DeactivationHookResult):
-            difference_dict = dict()
-            for key in other.__dict__:
-                if other.__dict__[key] != self.__dict__[key]:
-                    difference_dict[key] = {
-                        "self": self.__dict__[key],
-                        "other": other.__dict__[key],
-                    }
-            if len(difference_dict) != 0:
-                print(f"Object: {self.__class__.__name__} \nAttributes differ: {difference_dict}")
-                return False
-            return True
-        print(
-            f"Objects are of different type, type(self)={self.__class__.__name__}, type(other)={other.__class__.__name__}"
-        )
-        return False
+    pass
 
 
+@register_comparison_plan(_DenominationShape)
 class DenominationShape(_DenominationShape):
     # attributes: permitted_denominations
-
-    def __eq__(self, other):
-        if isinstance(other, _DenominationShape):
-            difference_dict = dict()
-            for key in other.__dict__:
-                if other.__dict__[key] != self.__dict__[key]:
-                    difference_dict[key] = {
-                        "self": self.__dict__[key],
-                        "other": other.__dict__[key],
-                    }
-            if len(difference_dict) != 0:
-                print(f"Object: {self.__class__.__name__} \nAttributes differ: {difference_dict}")
-                return False
-            return True
-        print(
-            f"Objects are of different type, type(self)={self.__class__.__name__}, type(other)={other.__class__.__name__}"
-        )
-        return False
+    pass
 
 
+@register_comparison_plan(_DerivedParameterHookResult)
 class DerivedParameterHookResult(_DerivedParameterHookResult):
     # attributes: parameters_return_value
-
-    def __eq__(self, other):
-        if isinstance(other, _DerivedParameterHookResult):
-            difference_dict = dict()
-            for key in other.__dict__:
-                if other.__dict__[key] != self.__dict__[key]:
-                    difference_dict[key] = {
-                        "self": self.__dict__[key],
-                        "other": other.__dict__[key],
-                    }
-            if len(difference_dict) != 0:
-                print(f"Object: {self.__class__.__name__} \nAttributes differ: {difference_dict}")
-                return False
-            return True
-        print(
-            f"Objects are of different type, type(self)={self.__class__.__name__}, type(other)={other.__class__.__name__}"
-        )
-        return False
+    pass
 
 
+@register_comparison_plan(_EndOfMonthSchedule)
 class EndOfMonthSchedule(_EndOfMonthSchedule):
     # attributes: day, hour, minute, second, failover
-
-    def __eq__(self, other):
-        if isinstance(other, _EndOfMonthSchedule):
-            difference_dict = dict()
-            for key in other.__dict__:
-                if other.__dict__[key] != self.__dict__[key]:
-                    difference_dict[key] = {
-                        "self": self.__dict__[key],
-                        "other": other.__dict__[key],
-                    }
-            if len(difference_dict) != 0:
-                print(f"Object: {self.__class__.__name__} \nAttributes differ: {difference_dict}")
-                return False
-            return True
-        print(
-            f"Objects are of different type, type(self)={self.__class__.__name__}, type(other)={other.__class__.__name__}"
-        )
-        return False
+    pass
 
 
+@register_comparison_plan(_EventTypesGroup)
 class EventTypesGroup(_EventTypesGroup):
     # attributes: name, event_types_order
-
-    def __eq__(self, other):
-        if isinstance(other, _EventTypesGroup):
-            difference_dict = dict()
-            for key in other.__dict__:
-                if other.__dict__[key] != self.__dict__[key]:
-                    difference_dict[key] = {
-                        "self": self.__dict__[key],
-                        "other": other.__dict__[key],
-                    }
-            if len(difference_dict) != 0:
-                print(f"Object: {self.__class__.__name__} \nAttributes differ: {difference_dict}")
-                return False
-            return True
-        print(
-            f"Objects are of different type, type(self)={self.__class__.__name__}, type(other)={other.__class__.__name__}"
-        )
-        return False
+    pass
 
 
+@register_comparison_plan(_FlagTimeseries, item_comparator=operator.eq)
 class FlagTimeseries(_FlagTimeseries):
-    # attributes: extend
-
-    def __eq__(self, other):
-        if isinstance(other, _FlagTimeseries):
-            # The length of each list needs to be checked since zip() returns an object of length
-            # equal to the shortest list.
-            if len(self) != len(other):
-                print(
-                    f"Objects are of different length, len(self)={len(self)}, len(other)={len(other)}"
-                )
-                return False
-
-            if not all(x == y for x, y in zip(self, other)):
-                print("Iterable elements differ")
-                return False
-            else:
-                return True
-
-        print(
-            f"Objects are of different type, type(self)={self.__class__.__name__}, type(other)={other.__class__.__name__}"
-        )
-        return False
+    # since FlagTimeseries extends `list`, its items are compared
+    pass
 
 
+@register_comparison_plan(_InboundAuthorisation)
 class InboundAuthorisation(_InboundAuthorisation):
-    def __eq__(self, other):
-        if isinstance(other, _InboundAuthorisation):
-            difference_dict = dict()
-            for key in other.__dict__:
-                if other.__dict__[key] != self.__dict__[key]:
-                    difference_dict[key] = {
-                        "self": self.__dict__[key],
-                        "other": other.__dict__[key],
-                    }
-            if len(difference_dict) != 0:
-                print(f"Object: {self.__class__.__name__} \nAttributes differ: {difference_dict}")
-                return False
-            return True
-        print(
-            f"Objects are of different type, type(self)={self.__class__.__name__}, type(other)={other.__class__.__name__}"
-        )
-        return False
+    pass
 
 
+@register_comparison_plan(_Logger)
 class Logger(_Logger):
     # attributes: Exception
-
-    def __eq__(self, other):
-        if isinstance(other, _Logger):
-            difference_dict = dict()
-            for key in other.__dict__:
-                if other.__dict__[key] != self.__dict__[key]:
-                    difference_dict[key] = {
-                        "self": self.__dict__[key],
-                        "other": other.__dict__[key],
-                    }
-            if len(difference_dict) != 0:
-                print(f"Object: {self.__class__.__name__} \nAttributes differ: {difference_dict}")
-                return False
-            return True
-        print(
-            f"Objects are of different type, type(self)={self.__class__.__name__}, type(other)={other.__class__.__name__}"
-        )
-        return False
+    pass
 
 
+@register_comparison_plan(_Next)
 class Next(_Next):
     # attributes: month, day, hour, minute, second
-
-    def __eq__(self, other):
-        if isinstance(other, _Next):
-            difference_dict = dict()
-            for key in other.__dict__:
-                if other.__dict__[key] != self.__dict__[key]:
-                    difference_dict[key] = {
-                        "self": self.__dict__[key],
-                        "other": other.__dict__[key],
-                    }
-            if len(difference_dict) != 0:
-                print(f"Object: {self.__class__.__name__} \nAttributes differ: {difference_dict}")
-                return False
-            return True
-        print(
-            f"Objects are of different type, type(self)={self.__class__.__name__}, type(other)={other.__class__.__name__}"
-        )
-        return False
+    pass
 
 
+@register_comparison_plan(_NumberShape)
 class NumberShape(_NumberShape):
     # attributes: min_value, max_value, step
-
-    def __eq__(self, other):
-        if isinstance(other, _NumberShape):
-            difference_dict = dict()
-            for key in other.__dict__:
-                if other.__dict__[key] != self.__dict__[key]:
-                    difference_dict[key] = {
-                        "self": self.__dict__[key],
-                        "other": other.__dict__[key],
-                    }
-            if len(difference_dict) != 0:
-                print(f"Object: {self.__class__.__name__} \nAttributes differ: {difference_dict}")
-                return False
-            return True
-        print(
-            f"Objects are of different type, type(self)={self.__class__.__name__}, type(other)={other.__class__.__name__}"
-        )
-        return False
+    pass
 
 
+@register_comparison_plan(_OptionalShape)
 class OptionalShape(_OptionalShape):
     # attributes: shape
-
-    def __eq__(self, other):
-        if isinstance(other, _OptionalShape):
-            difference_dict = dict()
-            for key in other.__dict__:
-                if other.__dict__[key] != self.__dict__[key]:
-                    difference_dict[key] = {
-                        "self": self.__dict__[key],
-                        "other": other.__dict__[key],
-                    }
-            if len(difference_dict) != 0:
-                print(f"Object: {self.__class__.__name__} \nAttributes differ: {difference_dict}")
-                return False
-            return True
-        print(
-            f"Objects are of different type, type(self)={self.__class__.__name__}, type(other)={other.__class__.__name__}"
-        )
-        return False
+    pass
 
 
+@register_comparison_plan(_OptionalValue)
 class OptionalValue(_OptionalValue):
     # attributes: value
-
-    def __eq__(self, other):
-        if isinstance(other, _OptionalValue):
-            difference_dict = dict()
-            for key in other.__dict__:
-                if other.__dict__[key] != self.__dict__[key]:
-                    difference_dict[key] = {
-                        "self": self.__dict__[key],
-                        "other": other.__dict__[key],
-                    }
-            if len(difference_dict) != 0:
-                print(f"Object: {self.__class__.__name__} \nAttributes differ: {difference_dict}")
-                return False
-            return True
-        print(
-            f"Objects are of different type, type(self)={self.__class__.__name__}, type(other)={other.__class__.__name__}"
-        )
-        return False
+    pass
 
 
+@register_comparison_plan(_OutboundAuthorisation)
 class OutboundAuthorisation(_OutboundAuthorisation):
-    def __eq__(self, other):
-        if isinstance(other, _OutboundAuthorisation):
-            difference_dict = dict()
-            for key in other.__dict__:
-                if other.__dict__[key] != self.__dict__[key]:
-                    difference_dict[key] = {
-                        "self": self.__dict__[key],
-                        "other": other.__dict__[key],
-                    }
-            if len(difference_dict) != 0:
-                print(f"Object: {self.__class__.__name__} \nAttributes differ: {difference_dict}")
-                return False
-            return True
-        print(
-            f"Objects are of different type, type(self)={self.__class__.__name__}, type(other)={other.__class__.__name__}"
-        )
-        return False
+    pass
 
 
+@register_comparison_plan(_Override)
 class Override(_Override):
     # attributes: year, month, day, hour, minute, second
-
-    def __eq__(self, other):
-        if isinstance(other, _Override):
-            difference_dict = dict()
-            for key in other.__dict__:
-                if other.__dict__[key] != self.__dict__[key]:
-                    difference_dict[key] = {
-                        "self": self.__dict__[key],
-                        "other": other.__dict__[key],
-                    }
-            if len(difference_dict) != 0:
-                print(f"Object: {self.__class__.__name__} \nAttributes differ: {difference_dict}")
-                return False
-            return True
-        print(
-            f"Objects are of different type, type(self)={self.__class__.__name__}, type(other)={other.__class__.__name__}"
-        )
-        return False
+    pass
 
 
+@register_comparison_plan(_Parameter)
 class Parameter(_Parameter):
     # attributes: name, shape, level, derived, display_name, description, default_value, update_permission
-
-    def __eq__(self, other):
-        if isinstance(other, _Parameter):
-            difference_dict = dict()
-            for key in other.__dict__:
-                if other.__dict__[key] != self.__dict__[key]:
-                    difference_dict[key] = {
-                        "self": self.__dict__[key],
-                        "other": other.__dict__[key],
-                    }
-            if len(difference_dict) != 0:
-                print(f"Object: {self.__class__.__name__} \nAttributes differ: {difference_dict}")
-                return False
-            return True
-        print(
-            f"Objects are of different type, type(self)={self.__class__.__name__}, type(other)={other.__class__.__name__}"
-        )
-        return False
+    pass
 
 
+@register_comparison_plan(_ParameterTimeseries, item_comparator=operator.eq)
 class ParameterTimeseries(_ParameterTimeseries):
-    # attributes: extend
-
-    def __eq__(self, other):
-        if isinstance(other, _ParameterTimeseries):
-            # The length of each list needs to be checked since zip() returns an object of length
-            # equal to the shortest list.
-            if len(self) != len(other):
-                print(
-                    f"Objects are of different length, len(self)={len(self)}, len(other)={len(other)}"
-                )
-                return False
-
-            if not all(x == y for x, y in zip(self, other)):
-                print("Iterable elements differ")
-                return False
-            else:
-                return True
-
-        print(
-            f"Objects are of different type, type(self)={self.__class__.__name__}, type(other)={other.__class__.__name__}"
-        )
-        return False
+    # since ParameterTimeseries extends `list`, its items are compared
+    pass
 
 
+@register_comparison_plan(_PlanNotificationDirective)
 class PlanNotificationDirective(_PlanNotificationDirective):
     # attributes: notification_type, notification_details
-
-    def __eq__(self, other):
-        if isinstance(other, _PlanNotificationDirective):
-            difference_dict = dict()
-            for key in other.__dict__:
-                if other.__dict__[key] != self.__dict__[key]:
-                    difference_dict[key] = {
-                        "self": self.__dict__[key],
-                        "other": other.__dict__[key],
-                    }
-            if len(difference_dict) != 0:
-                print(f"Object: {self.__class__.__name__} \nAttributes differ: {difference_dict}")
-                return False
-            return True
-        print(
-            f"Objects are of different type, type(self)={self.__class__.__name__}, type(other)={other.__class__.__name__}"
-        )
-        return False
+    pass
 
 
+@register_comparison_plan(_Posting)
 class Posting(_Posting):
-    def __eq__(self, other):
-        if isinstance(other, _Posting):
-            difference_dict = dict()
-            for key in other.__dict__:
-                if other.__dict__[key] != self.__dict__[key]:
-                    difference_dict[key] = {
-                        "self": self.__dict__[key],
-                        "other": other.__dict__[key],
-                    }
-            if len(difference_dict) != 0:
-                print(f"Object: {self.__class__.__name__} \nAttributes differ: {difference_dict}")
-                return False
-            return True
-        print(
-            f"Objects are of different type, type(self)={self.__class__.__name__}, type(other)={other.__class__.__name__}"
-        )
-        return False
-
     def __repr__(self):
         return str(self.__dict__)
 
 
+@register_comparison_plan(_PostParameterChangeHookResult)
 class PostParameterChangeHookResult(_PostParameterChangeHookResult):
     # attributes: account_notification_directives, posting_instructions_directives, update_account_event_type_directives
-
-    def __eq__(self, other):
-        if isinstance(other, _PostParameterChangeHookResult):
-            difference_dict = dict()
-            for key in other.__dict__:
-                if other.__dict__[key] != self.__dict__[key]:
-                    difference_dict[key] = {
-                        "self": self.__dict__[key],
-                        "other": other.__dict__[key],
-                    }
-            if len(difference_dict) != 0:
-                print(f"Object: {self.__class__.__name__} \nAttributes differ: {difference_dict}")
-                return False
-            return True
-        print(
-            f"Objects are of different type, type(self)={self.__class__.__name__}, type(other)={other.__class__.__name__}"
-        )
-        return False
+    pass
 
 
+@register_comparison_plan(_PostPostingHookResult)
 class PostPostingHookResult(_PostPostingHookResult):
     # attributes: account_notification_directives, posting_instructions_directives, update_account_event_type_directives
-
-    def __eq__(self, other):
-        if isinstance(other, _PostPostingHookResult):
-            difference_dict = dict()
-            for key in other.__dict__:
-                if other.__dict__[key] != self.__dict__[key]:
-                    difference_dict[key] = {
-                        "self": self.__dict__[key],
-                        "other": other.__dict__[key],
-                    }
-            if len(difference_dict) != 0:
-                print(f"Object: {self.__class__.__name__} \nAttributes differ: {difference_dict}")
-                return False
-            return True
-        print(
-            f"Objects are of different type, type(self)={self.__class__.__name__}, type(other)={other.__class__.__name__}"
-        )
-        return False
+    pass
 
 
+@register_comparison_plan(_PostingInstructionsDirective)
 class PostingInstructionsDirective(_PostingInstructionsDirective):
     # attributes: posting_instructions, client_batch_id, value_datetime
-
-    def __eq__(self, other):
-        if isinstance(other, _PostingInstructionsDirective):
-            difference_dict = dict()
-            for key in other.__dict__:
-                if other.__dict__[key] != self.__dict__[key]:
-                    difference_dict[key] = {
-                        "self": self.__dict__[key],
-                        "other": other.__dict__[key],
-                    }
-            if len(difference_dict) != 0:
-                print(f"Object: {self.__class__.__name__} \nAttributes differ: {difference_dict}")
-                return False
-            return True
-        print(
-            f"Objects are of different type, type(self)={self.__class__.__name__}, type(other)={other.__class__.__name__}"
-        )
-        return False
+    pass
 
 
+@register_comparison_plan(_PostingsIntervalFetcher)
 class PostingsIntervalFetcher(_PostingsIntervalFetcher):
     # attributes: class_name
-
-    def __eq__(self, other):
-        if isinstance(other, _PostingsIntervalFetcher):
-            difference_dict = dict()
-            for key in other.__dict__:
-                if other.__dict__[key] != self.__dict__[key]:
-                    difference_dict[key] = {
-                        "self": self.__dict__[key],
-                        "other": other.__dict__[key],
-                    }
-            if len(difference_dict) != 0:
-                print(f"Object: {self.__class__.__name__} \nAttributes differ: {difference_dict}")
-                return False
-            return True
-        print(
-            f"Objects are of different type, type(self)={self.__class__.__name__}, type(other)={other.__class__.__name__}"
-        )
-        return False
+    pass
 
 
+@register_comparison_plan(_PreParameterChangeHookResult)
 class PreParameterChangeHookResult(_PreParameterChangeHookResult):
     # attributes: rejection
-
-    def __eq__(self, other):
-        if isinstance(other, _PreParameterChangeHookResult):
-            difference_dict = dict()
-            for key in other.__dict__:
-                if other.__dict__[key] != self.__dict__[key]:
-                    difference_dict[key] = {
-                        "self": self.__dict__[key],
-                        "other": other.__dict__[key],
-                    }
-            if len(difference_dict) != 0:
-                print(f"Object: {self.__class__.__name__} \nAttributes differ: {difference_dict}")
-                return False
-            return True
-        print(
-            f"Objects are of different type, type(self)={self.__class__.__name__}, type(other)={other.__class__.__name__}"
-        )
-        return False
+    pass
 
 
+@register_comparison_plan(_PrePostingHookResult)
 class PrePostingHookResult(_PrePostingHookResult):
     # attributes: rejection
-
-    def __eq__(self, other):
-        if isinstance(other, _PrePostingHookResult):
-            difference_dict = dict()
-            for key in other.__dict__:
-                if other.__dict__[key] != self.__dict__[key]:
-                    difference_dict[key] = {
-                        "self": self.__dict__[key],
-                        "other": other.__dict__[key],
-                    }
-            if len(difference_dict) != 0:
-                print(f"Object: {self.__class__.__name__} \nAttributes differ: {difference_dict}")
-                return False
-            return True
-        print(
-            f"Objects are of different type, type(self)={self.__class__.__name__}, type(other)={other.__class__.__name__}"
-        )
-        return False
+    pass
 
 
+@register_comparison_plan(_Previous)
 class Previous(_Previous):
     # attributes: month, day, hour, minute, second
-
-    def __eq__(self, other):
-        if isinstance(other, _Previous):
-            difference_dict = dict()
-            for key in other.__dict__:
-                if other.__dict__[key] != self.__dict__[key]:
-                    difference_dict[key] = {
-                        "self": self.__dict__[key],
-                        "other": other.__dict__[key],
-                    }
-            if len(difference_dict) != 0:
-                print(f"Object: {self.__class__.__name__} \nAttributes differ: {difference_dict}")
-                return False
-            return True
-        print(
-            f"Objects are of different type, type(self)={self.__class__.__name__}, type(other)={other.__class__.__name__}"
-        )
-        return False
+    pass
 
 
+@register_comparison_plan(_Rejection)
 class Rejection(_Rejection):
     # attributes: message, reason_code
-
-    def __eq__(self, other):
-        if isinstance(other, _Rejection):
-            difference_dict = dict()
-            for key in other.__dict__:
-                if other.__dict__[key] != self.__dict__[key]:
-                    difference_dict[key] = {
-                        "self": self.__dict__[key],
-                        "other": other.__dict__[key],
-                    }
-            if len(difference_dict) != 0:
-                print(f"Object: {self.__class__.__name__} \nAttributes differ: {difference_dict}")
-                return False
-            return True
-        print(
-            f"Objects are of different type, type(self)={self.__class__.__name__}, type(other)={other.__class__.__name__}"
-        )
-        return False
+    pass
 
 
+@register_comparison_plan(_RelativeDateTime)
 class RelativeDateTime(_RelativeDateTime):
     # attributes: shift, find, origin
-
-    def __eq__(self, other):
-        if isinstance(other, _RelativeDateTime):
-            difference_dict = dict()
-            for key in other.__dict__:
-                if other.__dict__[key] != self.__dict__[key]:
-                    difference_dict[key] = {
-                        "self": self.__dict__[key],
-                        "other": other.__dict__[key],
-                    }
-            if len(difference_dict) != 0:
-                print(f"Object: {self.__class__.__name__} \nAttributes differ: {difference_dict}")
-                return False
-            return True
-        print(
-            f"Objects are of different type, type(self)={self.__class__.__name__}, type(other)={other.__class__.__name__}"
-        )
-        return False
+    pass
 
 
+@register_comparison_plan(_ScheduleExpression, default_comparator=_str_equal)
 class ScheduleExpression(_ScheduleExpression):
     # attributes: day, day_of_week, hour, minute, second, month, year
-
-    def __eq__(self, other):
-        if isinstance(other, _ScheduleExpression):
-            difference_dict = dict()
-            for key in other.__dict__:
-                if str(other.__dict__[key]) != str(self.__dict__[key]):
-                    difference_dict[key] = {
-                        "self": self.__dict__[key],
-                        "other": other.__dict__[key],
-                    }
-            if len(difference_dict) != 0:
-                print(f"Object: {self.__class__.__name__} \nAttributes differ: {difference_dict}")
-                return False
-            return True
-        print(
-            f"Objects are of different type, type(self)={self.__class__.__name__}, type(other)={other.__class__.__name__}"
-        )
-        return False
+    pass
 
 
+@register_comparison_plan(_ScheduleSkip)
 class ScheduleSkip(_ScheduleSkip):
     # attributes: end
-
-    def __eq__(self, other):
-        if isinstance(other, _ScheduleSkip):
-            difference_dict = dict()
-            for key in other.__dict__:
-                if other.__dict__[key] != self.__dict__[key]:
-                    difference_dict[key] = {
-                        "self": self.__dict__[key],
-                        "other": other.__dict__[key],
-                    }
-            if len(difference_dict) != 0:
-                print(f"Object: {self.__class__.__name__} \nAttributes differ: {difference_dict}")
-                return False
-            return True
-        print(
-            f"Objects are of different type, type(self)={self.__class__.__name__}, type(other)={other.__class__.__name__}"
-        )
-        return False
+    pass
 
 
+@register_comparison_plan(_Release)
 class Release(_Release):
-    def __eq__(self, other):
-        if isinstance(other, _Release):
-            difference_dict = dict()
-            for key in other.__dict__:
-                if other.__dict__[key] != self.__dict__[key]:
-                    difference_dict[key] = {
-                        "self": self.__dict__[key],
-                        "other": other.__dict__[key],
-                    }
-            if len(difference_dict) != 0:
-                print(f"Object: {self.__class__.__name__} \nAttributes differ: {difference_dict}")
-                return False
-            return True
-        print(
-            f"Objects are of different type, type(self)={self.__class__.__name__}, type(other)={other.__class__.__name__}"
-        )
-        return False
+    pass
 
 
+@register_comparison_plan(_Settlement)
 class Settlement(_Settlement):
-    def __eq__(self, other):
-        if isinstance(other, _Settlement):
-            difference_dict = dict()
-            for key in other.__dict__:
-                if other.__dict__[key] != self.__dict__[key]:
-                    difference_dict[key] = {
-                        "self": self.__dict__[key],
-                        "other": other.__dict__[key],
-                    }
-            if len(difference_dict) != 0:
-                print(f"Object: {self.__class__.__name__} \nAttributes differ: {difference_dict}")
-                return False
-            return True
-        print(
-            f"Objects are of different type, type(self)={self.__class__.__name__}, type(other)={other.__class__.__name__}"
-        )
-        return False
+    pass
 
 
+@register_comparison_plan(_ScheduledEvent)
 class ScheduledEvent(_ScheduledEvent):
     # attributes: start_datetime, end_datetime, expression, schedule_method, skip
-
-    def __eq__(self, other):
-        if isinstance(other, _ScheduledEvent):
-            difference_dict = dict()
-            for key in other.__dict__:
-                if other.__dict__[key] != self.__dict__[key]:
-                    difference_dict[key] = {
-                        "self": self.__dict__[key],
-                        "other": other.__dict__[key],
-                    }
-            if len(difference_dict) != 0:
-                print(f"Object: {self.__class__.__name__} \nAttributes differ: {difference_dict}")
-                return False
-            return True
-        print(
-            f"Objects are of different type, type(self)={self.__class__.__name__}, type(other)={other.__class__.__name__}"
-        )
-        return False
+    pass
 
 
+@register_comparison_plan(_ScheduledEventHookResult)
 class ScheduledEventHookResult(_ScheduledEventHookResult):
     # attributes: account_notification_directives, posting_instructions_directives, update_account_event_type_directives
-
-    def __eq__(self, other):
-        if isinstance(other, _ScheduledEventHookResult):
-            difference_dict = dict()
-            for key in other.__dict__:
-                if other.__dict__[key] != self.__dict__[key]:
-                    difference_dict[key] = {
-                        "self": self.__dict__[key],
-                        "other": other.__dict__[key],
-                    }
-            if len(difference_dict) != 0:
-                print(f"Object: {self.__class__.__name__} \nAttributes differ: {difference_dict}")
-                return False
-            return True
-        print(
-            f"Objects are of different type, type(self)={self.__class__.__name__}, type(other)={other.__class__.__name__}"
-        )
-        return False
+    pass
 
 
+@register_comparison_plan(_Shift)
 class Shift(_Shift):
     # attributes: years, months, days, hours, minutes, seconds
-
-    def __eq__(self, other):
-        if isinstance(other, _Shift):
-            difference_dict = dict()
-            for key in other.__dict__:
-                if other.__dict__[key] != self.__dict__[key]:
-                    difference_dict[key] = {
-                        "self": self.__dict__[key],
-                        "other": other.__dict__[key],
-                    }
-            if len(difference_dict) != 0:
-                print(f"Object: {self.__class__.__name__} \nAttributes differ: {difference_dict}")
-                return False
-            return True
-        print(
-            f"Objects are of different type, type(self)={self.__class__.__name__}, type(other)={other.__class__.__name__}"
-        )
-        return False
+    pass
 
 
+@register_comparison_plan(_SmartContractDescriptor)
 class SmartContractDescriptor(_SmartContractDescriptor):
     # attributes: alias, smart_contract_version_id, supervise_post_posting_hook, supervised_hooks
-
-    def __eq__(self, other):
-        if isinstance(other, _SmartContractDescriptor):
-            difference_dict = dict()
-            for key in other.__dict__:
-                if other.__dict__[key] != self.__dict__[key]:
-                    difference_dict[key] = {
-                        "self": self.__dict__[key],
-                        "other": other.__dict__[key],
-                    }
-            if len(difference_dict) != 0:
-                print(f"Object: {self.__class__.__name__} \nAttributes differ: {difference_dict}")
-                return False
-            return True
-        print(
-            f"Objects are of different type, type(self)={self.__class__.__name__}, type(other)={other.__class__.__name__}"
-        )
-        return False
+    pass
 
 
+@register_comparison_plan(_SmartContractEventType)
 class SmartContractEventType(_SmartContractEventType):
     # attributes: name, scheduler_tag_ids
-
-    def __eq__(self, other):
-        if isinstance(other, _SmartContractEventType):
-            difference_dict = dict()
-            for key in other.__dict__:
-                if other.__dict__[key] != self.__dict__[key]:
-                    difference_dict[key] = {
-                        "self": self.__dict__[key],
-                        "other": other.__dict__[key],
-                    }
-            if len(difference_dict) != 0:
-                print(f"Object: {self.__class__.__name__} \nAttributes differ: {difference_dict}")
-                return False
-            return True
-        print(
-            f"Objects are of different type, type(self)={self.__class__.__name__}, type(other)={other.__class__.__name__}"
-        )
-        return False
+    pass
 
 
+@register_comparison_plan(_SupervisedHooks)
 class SupervisedHooks(_SupervisedHooks):
     # attributes: pre_posting_hook
-
-    def __eq__(self, other):
-        if isinstance(other, _SupervisedHooks):
-            difference_dict = dict()
-            for key in other.__dict__:
-                if other.__dict__[key] != self.__dict__[key]:
-                    difference_dict[key] = {
-                        "self": self.__dict__[key],
-                        "other": other.__dict__[key],
-                    }
-            if len(difference_dict) != 0:
-                print(f"Object: {self.__class__.__name__} \nAttributes differ: {difference_dict}")
-                return False
-            return True
-        print(
-            f"Objects are of different type, type(self)={self.__class__.__name__}, type(other)={other.__class__.__name__}"
-        )
-        return False
+    pass
 
 
+@register_comparison_plan(_SupervisorActivationHookResult)
 class SupervisorActivationHookResult(_SupervisorActivationHookResult):
     # attributes: scheduled_events_return_value
-
-    def __eq__(self, other):
-        if isinstance(other, _SupervisorActivationHookResult):
-            difference_dict = dict()
-            for key in other.__dict__:
-                if other.__dict__[key] != self.__dict__[key]:
-                    difference_dict[key] = {
-                        "self": self.__dict__[key],
-                        "other": other.__dict__[key],
-                    }
-            if len(difference_dict) != 0:
-                print(f"Object: {self.__class__.__name__} \nAttributes differ: {difference_dict}")
-                return False
-            return True
-        print(
-            f"Objects are of different type, type(self)={self.__class__.__name__}, type(other)={other.__class__.__name__}"
-        )
-        return False
+    pass
 
 
+@register_comparison_plan(_SupervisorContractEventType)
 class SupervisorContractEventType(_SupervisorContractEventType):
     # attributes: overrides_event_types
-
-    def __eq__(self, other):
-        if isinstance(other, _SupervisorContractEventType):
-            difference_dict = dict()
-            for key in other.__dict__:
-                if other.__dict__[key] != self.__dict__[key]:
-                    difference_dict[key] = {
-                        "self": self.__dict__[key],
-                        "other": other.__dict__[key],
-                    }
-            if len(difference_dict) != 0:
-                print(f"Object: {self.__class__.__name__} \nAttributes differ: {difference_dict}")
-                return False
-            return True
-        print(
-            f"Objects are of different type, type(self)={self.__class__.__name__}, type(other)={other.__class__.__name__}"
-        )
-        return False
+    pass
 
 
+@register_comparison_plan(_SupervisorConversionHookResult)
 class SupervisorConversionHookResult(_SupervisorConversionHookResult):
     # attributes: scheduled_events_return_value
-
-    def __eq__(self, other):
-        if isinstance(other, _SupervisorConversionHookResult):
-            difference_dict = dict()
-            for key in other.__dict__:
-                if other.__dict__[key] != self.__dict__[key]:
-                    difference_dict[key] = {
-                        "self": self.__dict__[key],
-                        "other": other.__dict__[key],
-                    }
-            if len(difference_dict) != 0:
-                print(f"Object: {self.__class__.__name__} \nAttributes differ: {difference_dict}")
-                return False
-            return True
-        print(
-            f"Objects are of different type, type(self)={self.__class__.__name__}, type(other)={other.__class__.__name__}"
-        )
-        return False
+    pass
 
 
+@register_comparison_plan(_SupervisorPostPostingHookResult)
 class SupervisorPostPostingHookResult(_SupervisorPostPostingHookResult):
     # attributes: plan_notification_directives, update_plan_event_type_directives, defaultdict, list, supervisee_account_notification_directives, supervisee_posting_instructions_directives, supervisee_update_account_event_type_directives
-
-    def __eq__(self, other):
-        if isinstance(other, _SupervisorPostPostingHookResult):
-            difference_dict = dict()
-            for key in other.__dict__:
-                if other.__dict__[key] != self.__dict__[key]:
-                    difference_dict[key] = {
-                        "self": self.__dict__[key],
-                        "other": other.__dict__[key],
-                    }
-            if len(difference_dict) != 0:
-                print(f"Object: {self.__class__.__name__} \nAttributes differ: {difference_dict}")
-                return False
-            return True
-        print(
-            f"Objects are of different type, type(self)={self.__class__.__name__}, type(other)={other.__class__.__name__}"
-        )
-        return False
+    pass
 
 
+@register_comparison_plan(_SupervisorPrePostingHookResult)
 class SupervisorPrePostingHookResult(_SupervisorPrePostingHookResult):
     # attributes: rejection
-
-    def __eq__(self, other):
-        if isinstance(other, _SupervisorPrePostingHookResult):
-            difference_dict = dict()
-            for key in other.__dict__:
-                if other.__dict__[key] != self.__dict__[key]:
-                    difference_dict[key] = {
-                        "self": self.__dict__[key],
-                        "other": other.__dict__[key],
-                    }
-            if len(difference_dict) != 0:
-                print(f"Object: {self.__class__.__name__} \nAttributes differ: {difference_dict}")
-                return False
-            return True
-        print(
-            f"Objects are of different type, type(self)={self.__class__.__name__}, type(other)={other.__class__.__name__}"
-        )
-        return False
+    pass
 
 
+@register_comparison_plan(_SupervisorScheduledEventHookResult)
 class SupervisorScheduledEventHookResult(_SupervisorScheduledEventHookResult):
     # attributes: plan_notification_directives, update_plan_event_type_directives, defaultdict, list, supervisee_account_notification_directives, supervisee_posting_instructions_directives, supervisee_update_account_event_type_directives
-
-    def __eq__(self, other):
-        if isinstance(other, _SupervisorScheduledEventHookResult):
-            difference_dict = dict()
-            for key in other.__dict__:
-                if other.__dict__[key] != self.__dict__[key]:
-                    difference_dict[key] = {
-                        "self": self.__dict__[key],
-                        "other": other.__dict__[key],
-                    }
-            if len(difference_dict) != 0:
-                print(f"Object: {self.__class__.__name__} \nAttributes differ: {difference_dict}")
-                return False
-            return True
-        print(
-            f"Objects are of different type, type(self)={self.__class__.__name__}, type(other)={other.__class__.__name__}"
-        )
-        return False
+    pass
 
 
+@register_comparison_plan(_TimeseriesItem)
 class TimeseriesItem(_TimeseriesItem):
     # attributes: validate_timezone_is_utc, at_datetime, value
-
-    def __eq__(self, other):
-        if isinstance(other, _TimeseriesItem):
-            difference_dict = dict()
-            for key in other.__dict__:
-                if other.__dict__[key] != self.__dict__[key]:
-                    difference_dict[key] = {
-                        "self": self.__dict__[key],
-                        "other": other.__dict__[key],
-                    }
-            if len(difference_dict) != 0:
-                print(f"Object: {self.__class__.__name__} \nAttributes differ: {difference_dict}")
-                return False
-            return True
-        print(
-            f"Objects are of different type, type(self)={self.__class__.__name__}, type(other)={other.__class__.__name__}"
-        )
-        return False
+    pass
 
 
+@register_comparison_plan(_TransactionCode)
 class TransactionCode(_TransactionCode):
     # attributes: domain, family, subfamily
-
-    def __eq__(self, other):
-        if isinstance(other, _TransactionCode):
-            difference_dict = dict()
-            for key in other.__dict__:
-                if other.__dict__[key] != self.__dict__[key]:
-                    difference_dict[key] = {
-                        "self": self.__dict__[key],
-                        "other": other.__dict__[key],
-                    }
-            if len(difference_dict) != 0:
-                print(f"Object: {self.__class__.__name__} \nAttributes differ: {difference_dict}")
-                return False
-            return True
-        print(
-            f"Objects are of different type, type(self)={self.__class__.__name__}, type(other)={other.__class__.__name__}"
-        )
-        return False
+    pass
 
 
+@register_comparison_plan(_Transfer)
 class Transfer(_Transfer):
     # attributes: domain, family, subfamily
-
-    def __eq__(self, other):
-        if isinstance(other, _Transfer):
-            difference_dict = dict()
-            for key in other.__dict__:
-                if other.__dict__[key] != self.__dict__[key]:
-                    difference_dict[key] = {
-                        "self": self.__dict__[key],
-                        "other": other.__dict__[key],
-                    }
-            if len(difference_dict) != 0:
-                print(f"Object: {self.__class__.__name__} \nAttributes differ: {difference_dict}")
-                return False
-            return True
-        print(
-            f"Objects are of different type, type(self)={self.__class__.__name__}, type(other)={other.__class__.__name__}"
-        )
-        return False
+    pass
 
 
+@register_comparison_plan(_UnionItem)
 class UnionItem(_UnionItem):
     # attributes: key, display_name
-
-    def __eq__(self, other):
-        if isinstance(other, _UnionItem):
-            difference_dict = dict()
-            for key in other.__dict__:
-                if other.__dict__[key] != self.__dict__[key]:
-                    difference_dict[key] = {
-                        "self": self.__dict__[key],
-                        "other": other.__dict__[key],
-                    }
-            if len(difference_dict) != 0:
-                print(f"Object: {self.__class__.__name__} \nAttributes differ: {difference_dict}")
-                return False
-            return True
-        print(
-            f"Objects are of different type, type(self)={self.__class__.__name__}, type(other)={other.__class__.__name__}"
-        )
-        return False
+    pass
 
 
+@register_comparison_plan(_UnionItemValue)
 class UnionItemValue(_UnionItemValue):
     # attributes: key
-
-    def __eq__(self, other):
-        if isinstance(other, _UnionItemValue):
-            difference_dict = dict()
-            for key in other.__dict__:
-                if other.__dict__[key] != self.__dict__[key]:
-                    difference_dict[key] = {
-                        "self": self.__dict__[key],
-                        "other": other.__dict__[key],
-                    }
-            if len(difference_dict) != 0:
-                print(f"Object: {self.__class__.__name__} \nAttributes differ: {difference_dict}")
-                return False
-            return True
-        print(
-            f"Objects are of different type, type(self)={self.__class__.__name__}, type(other)={other.__class__.__name__}"
-        )
-        return False
+    pass
 
 
+@register_comparison_plan(_UnionShape)
 class UnionShape(_UnionShape):
     # attributes: items, exceptions, StrongTypingError, args
-
-    def __eq__(self, other):
-        if isinstance(other, _UnionShape):
-            difference_dict = dict()
-            for key in other.__dict__:
-                if other.__dict__[key] != self.__dict__[key]:
-                    difference_dict[key] = {
-                        "self": self.__dict__[key],
-                        "other": other.__dict__[key],
-                    }
-            if len(difference_dict) != 0:
-                print(f"Object: {self.__class__.__name__} \nAttributes differ: {difference_dict}")
-                return False
-            return True
-        print(
-            f"Objects are of different type, type(self)={self.__class__.__name__}, type(other)={other.__class__.__name__}"
-        )
-        return False
+    pass
 
 
+@register_comparison_plan(_UpdateAccountEventTypeDirective)
 class UpdateAccountEventTypeDirective(_UpdateAccountEventTypeDirective):
     # attributes: event_type, expression, end_datetime, skip, schedule_method
-
-    def __eq__(self, other):
-        if isinstance(other, _UpdateAccountEventTypeDirective):
-            difference_dict = dict()
-            for key in other.__dict__:
-                if other.__dict__[key] != self.__dict__[key]:
-                    difference_dict[key] = {
-                        "self": self.__dict__[key],
-                        "other": other.__dict__[key],
-                    }
-            if len(difference_dict) != 0:
-                print(f"Object: {self.__class__.__name__} \nAttributes differ: {difference_dict}")
-                return False
-            return True
-        print(
-            f"Objects are of different type, type(self)={self.__class__.__name__}, type(other)={other.__class__.__name__}"
-        )
-        return False
+    pass
 
 
+@register_comparison_plan(_UpdatePlanEventTypeDirective)
 class UpdatePlanEventTypeDirective(_UpdatePlanEventTypeDirective):
     # attributes: event_type, expression, schedule_method, end_datetime, skip
-
-    def __eq__(self, other):
-        if isinstance(other, _UpdatePlanEventTypeDirective):
-            difference_dict = dict()
-            for key in other.__dict__:
-                if other.__dict__[key] != self.__dict__[key]:
-                    difference_dict[key] = {
-                        "self": self.__dict__[key],
-                        "other": other.__dict__[key],
-                    }
-            if len(difference_dict) != 0:
-                print(f"Object: {self.__class__.__name__} \nAttributes differ: {difference_dict}")
-                return False
-            return True
-        print(
-            f"Objects are of different type, type(self)={self.__class__.__name__}, type(other)={other.__class__.__name__}"
-        )
-        return False
+    pass
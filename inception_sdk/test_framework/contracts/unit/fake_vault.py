@@ -0,0 +1,394 @@
+# Copyright @ 2024 Thought Machine Group Limited. All rights reserved.
+"""
+A lightweight alternative to the Mock vault objects built by ContractTest.create_mock.
+
+FakeVault implements the same vault methods with the same behaviour and error messages, but all
+inputs are normalised and indexed once on construction rather than on every call, and timeseries
+lookups bisect over pre-computed datetimes. Instances are immutable, so variants of a shared
+fixture can be derived with `clone`, which only copies the overridden inputs.
+
+Unlike a Mock, a FakeVault does not record calls and raises AttributeError for methods it does not
+implement. Tests that assert on vault calls or patch vault methods should keep using create_mock.
+"""
+# standard libs
+import bisect
+from collections import defaultdict
+from datetime import datetime
+from typing import Any, Collection, TypeVar
+from zoneinfo import ZoneInfo
+
+# contracts api
+# As per common.py, the types returned to the contract must be exactly as per the API, so the
+# indexed timeseries only override the lookup methods of the contracts api classes
+from contracts_api import (
+    BalanceCoordinate,
+    BalancesObservation,
+    BalanceTimeseries,
+    CalendarEvent,
+    CalendarEvents,
+    ClientTransaction,
+    FlagTimeseries,
+    ParameterTimeseries,
+    PostPostingHookResult,
+    PrePostingHookResult,
+    ScheduledEventHookResult,
+    Tside,
+)
+from contracts_api.utils.timezone_utils import validate_timezone_is_utc
+
+_TimeseriesType = TypeVar("_TimeseriesType", BalanceTimeseries, FlagTimeseries, ParameterTimeseries)
+
+
+def _strip_clu_dependency_syntax(name: str) -> str:
+    # unit tests run the contract directly as a python module, so CLU dependency syntax is never
+    # rendered out of flag and calendar ids. As in ContractTest.create_mock, it is stripped from
+    # both the test inputs and the ids the contract requests
+    return name.replace("&{", "").replace("}", "")
+
+
+class _IndexedTimeseriesMixin:
+    """
+    Overrides Timeseries.at() to bisect over datetimes computed once, instead of on every call
+    """
+
+    # the index is held in a slot so that it is not compared by the contracts api extension types
+    __slots__ = ()
+    _start_datetimes: list[datetime]
+
+    def _index(self) -> list[datetime]:
+        # the index is rebuilt if items were added or removed since it was computed
+        if len(self._start_datetimes) != len(self):  # type: ignore
+            self._start_datetimes = [entry.at_datetime for entry in self]  # type: ignore
+        return self._start_datetimes
+
+    def at(self, *, at_datetime: datetime, inclusive: bool = True) -> Any:
+        validate_timezone_is_utc(at_datetime, "at_datetime", f"{self.__repr__()}.at()")
+        start_datetimes = self._index()
+        if inclusive:
+            index = bisect.bisect_right(start_datetimes, at_datetime) - 1
+        else:
+            index = bisect.bisect_left(start_datetimes, at_datetime) - 1
+        if index >= 0:
+            return self[index].value  # type: ignore
+        # the original implementation handles empty timeseries and the associated errors
+        return super().at(at_datetime=at_datetime, inclusive=inclusive)  # type: ignore
+
+
+class IndexedBalanceTimeseries(_IndexedTimeseriesMixin, BalanceTimeseries):
+    __slots__ = ("_start_datetimes",)
+
+
+class IndexedFlagTimeseries(_IndexedTimeseriesMixin, FlagTimeseries):
+    __slots__ = ("_start_datetimes",)
+
+
+class IndexedParameterTimeseries(_IndexedTimeseriesMixin, ParameterTimeseries):
+    __slots__ = ("_start_datetimes",)
+
+
+_INDEXED_TIMESERIES_TYPES: dict[type, type] = {
+    BalanceTimeseries: IndexedBalanceTimeseries,
+    FlagTimeseries: IndexedFlagTimeseries,
+    ParameterTimeseries: IndexedParameterTimeseries,
+}
+
+
+def index_timeseries(timeseries: _TimeseriesType) -> _TimeseriesType:
+    """
+    Returns an indexed copy of a balance, flag or parameter timeseries. The items are shared with
+    the original timeseries rather than re-validated
+    :param timeseries: the timeseries to index. Already indexed timeseries are returned as is
+    :return: the indexed timeseries
+    """
+    if isinstance(timeseries, _IndexedTimeseriesMixin):
+        return timeseries
+    indexed_type = next(
+        (
+            indexed_type
+            for timeseries_type, indexed_type in _INDEXED_TIMESERIES_TYPES.items()
+            if isinstance(timeseries, timeseries_type)
+        ),
+        None,
+    )
+    if indexed_type is None:
+        return timeseries
+    indexed = indexed_type()
+    indexed.extend(timeseries)
+    indexed._start_datetimes = [entry.at_datetime for entry in indexed]
+    return indexed  # type: ignore
+
+
+class FakeVault:
+    """
+    Fake vault object for contract unit tests, equivalent to ContractTest.create_mock. See
+    create_mock for the description of each argument
+    """
+
+    def __init__(
+        self,
+        *,
+        account_id: str,
+        creation_date: datetime,
+        tside: Tside,
+        events_timezone: ZoneInfo,
+        permitted_denominations: list[str],
+        hook_execution_id: str,
+        balances_observation_fetchers_mapping: dict[str, BalancesObservation] | None = None,
+        balances_interval_fetchers_mapping: (
+            dict[str, defaultdict[BalanceCoordinate, BalanceTimeseries]] | None
+        ) = None,
+        calendar_events: list[CalendarEvent] | None = None,
+        client_transactions_mapping: dict[str, dict[str, ClientTransaction]] | None = None,
+        flags_ts: dict[str, FlagTimeseries] | None = None,
+        last_execution_datetimes: dict[str, datetime] | None = None,
+        parameter_ts: dict[str, ParameterTimeseries] | None = None,
+        postings_interval_mapping: dict[str, list] | None = None,
+        requires_fetched_balances: defaultdict[BalanceCoordinate, BalanceTimeseries] | None = None,
+        requires_fetched_client_transactions: dict[str, ClientTransaction] | None = None,
+        requires_fetched_postings: list | None = None,
+        supervisee_alias: str | None = None,
+        supervisee_hook_result: (
+            PostPostingHookResult | PrePostingHookResult | ScheduledEventHookResult | None
+        ) = None,
+        is_supervisee_vault: bool = False,
+    ):
+        # the inputs as passed in, so that clones only need to re-index the overridden inputs
+        self._inputs: dict[str, Any] = {
+            "account_id": account_id,
+            "creation_date": creation_date,
+            "tside": tside,
+            "events_timezone": events_timezone,
+            "permitted_denominations": permitted_denominations,
+            "hook_execution_id": hook_execution_id,
+            "balances_observation_fetchers_mapping": balances_observation_fetchers_mapping,
+            "balances_interval_fetchers_mapping": balances_interval_fetchers_mapping,
+            "calendar_events": calendar_events,
+            "client_transactions_mapping": client_transactions_mapping,
+            "flags_ts": flags_ts,
+            "last_execution_datetimes": last_execution_datetimes,
+            "parameter_ts": parameter_ts,
+            "postings_interval_mapping": postings_interval_mapping,
+            "requires_fetched_balances": requires_fetched_balances,
+            "requires_fetched_client_transactions": requires_fetched_client_transactions,
+            "requires_fetched_postings": requires_fetched_postings,
+            "supervisee_alias": supervisee_alias,
+            "supervisee_hook_result": supervisee_hook_result,
+            "is_supervisee_vault": is_supervisee_vault,
+        }
+        # id of each timeseries or balances input to the input and its indexed copy. This is shared
+        # with clones, so that inputs they have in common are only indexed once
+        self._indexed_inputs: dict[int, tuple[Any, Any]] = {}
+        self._apply_inputs(self._inputs.keys())
+
+    def _apply_inputs(self, changed_inputs: Collection[str]) -> None:
+        inputs = self._inputs
+        self.account_id = inputs["account_id"]
+        self.tside = inputs["tside"]
+        self.events_timezone = inputs["events_timezone"]
+        self._creation_date = inputs["creation_date"]
+        self._permitted_denominations = inputs["permitted_denominations"]
+        self._hook_execution_id = inputs["hook_execution_id"]
+        self._is_supervisee_vault = inputs["is_supervisee_vault"]
+        self._supervisee_alias = inputs["supervisee_alias"]
+        self._supervisee_hook_result = inputs["supervisee_hook_result"]
+        self._last_execution_datetimes = inputs["last_execution_datetimes"] or {}
+        self._balances_observations = inputs["balances_observation_fetchers_mapping"] or {}
+        self._client_transactions = inputs["client_transactions_mapping"] or {}
+        self._postings = inputs["postings_interval_mapping"] or {}
+        self._requires_fetched_client_transactions = inputs["requires_fetched_client_transactions"]
+        self._requires_fetched_postings = inputs["requires_fetched_postings"]
+        if "parameter_ts" in changed_inputs:
+            self._parameters = {
+                name: self._indexed(timeseries)
+                for name, timeseries in (inputs["parameter_ts"] or {}).items()
+            }
+        if "flags_ts" in changed_inputs:
+            self._flags = {
+                _strip_clu_dependency_syntax(flag): self._indexed(timeseries)
+                for flag, timeseries in (inputs["flags_ts"] or {}).items()
+            }
+        if "balances_interval_fetchers_mapping" in changed_inputs:
+            self._balances = {
+                fetcher_id: self._indexed_balances(balances)
+                for fetcher_id, balances in (
+                    inputs["balances_interval_fetchers_mapping"] or {}
+                ).items()
+            }
+        if "requires_fetched_balances" in changed_inputs:
+            self._requires_fetched_balances = (
+                self._indexed_balances(inputs["requires_fetched_balances"])
+                if inputs["requires_fetched_balances"] is not None
+                else None
+            )
+        if "calendar_events" in changed_inputs:
+            self._index_calendar_events()
+
+    def _indexed(self, timeseries: _TimeseriesType) -> _TimeseriesType:
+        input_and_indexed = self._indexed_inputs.get(id(timeseries))
+        # the input is kept alongside its indexed copy, so its id cannot be reused
+        if input_and_indexed is None or input_and_indexed[0] is not timeseries:
+            input_and_indexed = (timeseries, index_timeseries(timeseries))
+            self._indexed_inputs[id(timeseries)] = input_and_indexed
+        return input_and_indexed[1]
+
+    def _indexed_balances(
+        self, balances: defaultdict[BalanceCoordinate, BalanceTimeseries]
+    ) -> defaultdict[BalanceCoordinate, BalanceTimeseries]:
+        input_and_indexed = self._indexed_inputs.get(id(balances))
+        if input_and_indexed is None or input_and_indexed[0] is not balances:
+            indexed_balances = defaultdict(
+                balances.default_factory,
+                {
+                    coordinate: self._indexed(timeseries)
+                    for coordinate, timeseries in balances.items()
+                },
+            )
+            input_and_indexed = (balances, indexed_balances)
+            self._indexed_inputs[id(balances)] = input_and_indexed
+        return input_and_indexed[1]
+
+    def _index_calendar_events(self) -> None:
+        # calendar id to the events of that calendar and their position in the input list, so that
+        # events for multiple calendars can be returned in the original order
+        self._calendar_events: dict[str, list[tuple[int, CalendarEvent]]] = {}
+        for position, calendar_event in enumerate(self._inputs["calendar_events"] or []):
+            calendar_id = _strip_clu_dependency_syntax(calendar_event.calendar_id)
+            self._calendar_events.setdefault(calendar_id, []).append(
+                (
+                    position,
+                    CalendarEvent(
+                        id=calendar_event.id,
+                        calendar_id=calendar_id,
+                        start_datetime=calendar_event.start_datetime,
+                        end_datetime=calendar_event.end_datetime,
+                    ),
+                )
+            )
+
+    def clone(self, **overrides: Any) -> "FakeVault":
+        """
+        Derives a new FakeVault from this one. Inputs that are not overridden are shared with this
+        FakeVault, including their indexes, so cloning a large fixture is cheap
+        :param overrides: any of the constructor arguments
+        :return: the new FakeVault
+        """
+        unknown_inputs = overrides.keys() - self._inputs.keys()
+        if unknown_inputs:
+            raise TypeError(f"Unexpected FakeVault inputs {sorted(unknown_inputs)}")
+        clone = object.__new__(FakeVault)
+        clone.__dict__.update(self.__dict__)
+        clone._inputs = {**self._inputs, **overrides}
+        clone._apply_inputs(overrides.keys())
+        return clone
+
+    def get_account_creation_datetime(self) -> datetime:
+        return self._creation_date
+
+    def get_hook_execution_id(self) -> str:
+        return self._hook_execution_id
+
+    def get_permitted_denominations(self) -> list[str]:
+        return self._permitted_denominations
+
+    def get_parameter_timeseries(self, *, name: str) -> ParameterTimeseries:
+        try:
+            return self._parameters[name]
+        except KeyError:
+            raise KeyError(f"Parameter {name} not found in parameter timeseries.")
+
+    def get_flag_timeseries(self, *, flag: str) -> FlagTimeseries:
+        flag_timeseries = self._flags.get(_strip_clu_dependency_syntax(flag))
+        if flag_timeseries is None:
+            # No setting supplied for flag, so it is False as per Vault behaviour. A new timeseries
+            # is returned each time, as the caller may modify it
+            flag_timeseries = FlagTimeseries([(self._creation_date, False)])
+        return flag_timeseries
+
+    def get_balances_timeseries(
+        self, *, fetcher_id: str | None = None
+    ) -> defaultdict[BalanceCoordinate, BalanceTimeseries]:
+        if self._is_supervisee_vault and self._requires_fetched_balances is not None:
+            return self._requires_fetched_balances
+        if not fetcher_id:
+            raise ValueError("You must provide a fetcher ID")
+        balance_interval_ts = self._balances.get(fetcher_id)
+        if not balance_interval_ts:
+            raise ValueError(f"Missing balance interval in test setup for {fetcher_id=}")
+        return balance_interval_ts
+
+    def get_balances_observation(self, *, fetcher_id: str) -> BalancesObservation:
+        balance_observation = self._balances_observations.get(fetcher_id)
+        if not balance_observation:
+            raise ValueError(f"Missing balance observation in test setup for {fetcher_id=}")
+        return balance_observation
+
+    def get_posting_instructions(self, *, fetcher_id: str | None = None) -> list:
+        if self._is_supervisee_vault and self._requires_fetched_postings is not None:
+            return self._requires_fetched_postings
+        if not fetcher_id:
+            raise ValueError("You must provide a fetcher ID")
+        posting_instructions = self._postings.get(fetcher_id)
+        if posting_instructions is None:
+            raise ValueError(f"Missing posting interval in test setup for {fetcher_id=}")
+        return posting_instructions
+
+    def get_client_transactions(
+        self, *, fetcher_id: str | None = None
+    ) -> dict[str, ClientTransaction]:
+        if self._is_supervisee_vault:
+            if fetcher_id:
+                raise ValueError(
+                    "Supervisee vault object cannot provide fetcher_id to "
+                    "get_client_transactions()"
+                )
+            if self._requires_fetched_client_transactions is None:
+                raise ValueError("Missing requires fetched client transactions in test setup")
+            return self._requires_fetched_client_transactions
+        if not fetcher_id:
+            raise ValueError("You must provide a fetcher ID")
+        client_transactions = self._client_transactions.get(fetcher_id)
+        if client_transactions is None:
+            raise ValueError(f"Missing client transactions in test setup for {fetcher_id=}")
+        return client_transactions
+
+    def get_calendar_events(self, *, calendar_ids: list[str]) -> CalendarEvents:
+        calendar_events = [
+            position_and_event
+            for calendar_id in dict.fromkeys(map(_strip_clu_dependency_syntax, calendar_ids))
+            for position_and_event in self._calendar_events.get(calendar_id, [])
+        ]
+        if len(calendar_ids) > 1:
+            calendar_events.sort(key=lambda position_and_event: position_and_event[0])
+        return CalendarEvents(calendar_events=[event for _, event in calendar_events])
+
+    def get_last_execution_datetime(self, *, event_type: str) -> datetime | None:
+        try:
+            return self._last_execution_datetimes[event_type]
+        except KeyError:
+            raise ValueError("Missing event_type in last_execution_datetimes mapping.")
+
+    # supervisee specific methods
+    def get_alias(self) -> str:
+        if not self._is_supervisee_vault:
+            raise ValueError(
+                "get_alias method cannot be called on a non-supervisee Vault object, "
+                "make sure the create_mock argument is set correctly"
+            )
+        if self._supervisee_alias is None:
+            raise ValueError("No supervisee alias provided")
+        return self._supervisee_alias
+
+    def get_hook_result(
+        self,
+    ) -> PrePostingHookResult | PostPostingHookResult | ScheduledEventHookResult:
+        if not self._is_supervisee_vault:
+            raise ValueError(
+                "get_hook_result method cannot be called on a non-supervisee Vault object, "
+                "make sure the create_mock argument is set correctly"
+            )
+        if not self._supervisee_hook_result:
+            raise ValueError(
+                "get_hook_result must return one of PrePostingHookResult, "
+                "PostPostingHookResult, ScheduledEventHookResult"
+            )
+        return self._supervisee_hook_result
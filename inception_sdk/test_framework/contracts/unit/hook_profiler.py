@@ -0,0 +1,344 @@
+# Copyright @ 2024 Thought Machine Group Limited. All rights reserved.
+"""
+An opt-in profiler for contract hooks run locally against the unit test vault objects, i.e. a Mock
+from ContractTest.create_mock or a FakeVault.
+
+Wall time, call counts and net allocations are attributed to each function and module called by
+the hook, so the cost of library features such as `utils.get_parameter` can be told apart from
+the contract's own logic. Calls to vault accessors are counted and appear as `vault.<method>`
+frames. Profiles can be written as collapsed stacks, which flamegraph.pl, speedscope and similar
+tools accept, and as a JSON summary with sorted keys so that profiles from different commits can
+be diffed.
+
+Timings include the profiler's own overhead, which is roughly constant per call, so they are best
+used to compare functions within a profile, or the same hook between commits.
+"""
+# standard libs
+import json
+import sys
+import time
+import tracemalloc
+from collections import Counter
+from dataclasses import asdict, dataclass
+from types import FrameType
+from typing import Any, Callable
+
+DEFAULT_FEATURE_PACKAGE = "library.features"
+# frames from these modules are attributed to their caller, so that the machinery behind the
+# vault accessors doesn't appear in the profile
+DEFAULT_IGNORED_MODULES = (
+    "unittest.mock",
+    "inception_sdk.test_framework.contracts.unit.fake_vault",
+    __name__,
+)
+VAULT_FRAME_PREFIX = "vault."
+
+
+@dataclass
+class ProfileStats:
+    calls: int = 0
+    # seconds spent in the function or module, including its callees. Recursive calls are only
+    # counted once
+    total_time: float = 0.0
+    # seconds spent in the function or module itself
+    self_time: float = 0.0
+    # net bytes allocated and not freed by the calls, as traced by tracemalloc, including callees
+    allocated_bytes: int = 0
+    self_allocated_bytes: int = 0
+
+
+@dataclass
+class HookProfile:
+    hook: str
+    runs: int
+    # seconds taken by all runs of the hook, including the profiler overhead
+    wall_time: float
+    feature_package: str
+    # keyed by `module:qualified function name`
+    functions: dict[str, ProfileStats]
+    modules: dict[str, ProfileStats]
+    vault_calls: Counter[str]
+    # each call stack as a tuple of function names, to the self time of the innermost function in
+    # nanoseconds
+    stacks: Counter[tuple[str, ...]]
+    # the value returned by the last run of the hook
+    result: Any = None
+
+    def is_feature_module(self, module: str) -> bool:
+        return module == self.feature_package or module.startswith(f"{self.feature_package}.")
+
+    def feature_modules(self) -> dict[str, ProfileStats]:
+        return {
+            module: stats
+            for module, stats in self.modules.items()
+            if self.is_feature_module(module)
+        }
+
+    def feature_functions(self) -> dict[str, ProfileStats]:
+        return {
+            function: stats
+            for function, stats in self.functions.items()
+            if self.is_feature_module(function.partition(":")[0])
+        }
+
+    def to_dict(self, features_only: bool = False) -> dict[str, Any]:
+        """
+        :param features_only: if True, only feature modules and functions are included
+        :return: the JSON-serialisable summary of the profile
+        """
+        modules = self.feature_modules() if features_only else self.modules
+        functions = self.feature_functions() if features_only else self.functions
+        return {
+            "hook": self.hook,
+            "runs": self.runs,
+            "wall_time": round(self.wall_time, 6),
+            "vault_calls": dict(sorted(self.vault_calls.items())),
+            "modules": {module: _rounded(stats) for module, stats in sorted(modules.items())},
+            "functions": {
+                function: _rounded(stats) for function, stats in sorted(functions.items())
+            },
+        }
+
+    def to_json(self, features_only: bool = False) -> str:
+        return json.dumps(self.to_dict(features_only=features_only), indent=2, sort_keys=True)
+
+    def write_json(self, path: str, features_only: bool = False) -> None:
+        with open(path, "w", encoding="utf-8") as summary_file:
+            summary_file.write(self.to_json(features_only=features_only))
+
+    def collapsed_stacks(self) -> str:
+        """
+        :return: the profile in collapsed stack format, i.e. one `frame;frame;frame value` line per
+        call stack, where the value is the self time of the innermost frame in microseconds
+        """
+        lines = []
+        for stack, self_time_ns in sorted(self.stacks.items()):
+            self_time_us = self_time_ns // 1000
+            if self_time_us > 0:
+                lines.append(f"{';'.join(stack)} {self_time_us}")
+        return "\n".join(lines)
+
+    def write_collapsed_stacks(self, path: str) -> None:
+        with open(path, "w", encoding="utf-8") as stacks_file:
+            stacks_file.write(self.collapsed_stacks())
+            stacks_file.write("\n")
+
+
+def _rounded(stats: ProfileStats) -> dict[str, Any]:
+    return {
+        key: round(value, 6) if isinstance(value, float) else value
+        for key, value in asdict(stats).items()
+    }
+
+
+class _Frame:
+    __slots__ = (
+        "function",
+        "module",
+        "stack",
+        "start",
+        "start_memory",
+        "child_time",
+        "child_memory",
+    )
+
+    def __init__(
+        self, function: str, module: str, stack: tuple[str, ...], start: int, start_memory: int
+    ):
+        self.function = function
+        self.module = module
+        self.stack = stack
+        self.start = start
+        self.start_memory = start_memory
+        self.child_time = 0
+        self.child_memory = 0
+
+
+class _CountingVault:
+    """
+    Wraps a vault object to count calls to its methods. Supervisee vaults are wrapped too, and
+    their calls are counted under the same method names
+    """
+
+    def __init__(self, vault: Any, calls: Counter[str]):
+        self._vault = vault
+        self._calls = calls
+
+    def __getattr__(self, name: str) -> Any:
+        attribute = getattr(self._vault, name)
+        if name == "supervisees" and isinstance(attribute, dict):
+            return {
+                alias: _CountingVault(supervisee, self._calls)
+                for alias, supervisee in attribute.items()
+            }
+        if not callable(attribute):
+            return attribute
+        return _counted_call(name, attribute, self._calls)
+
+
+def _counted_call(name: str, method: Callable, calls: Counter[str]) -> Callable:
+    def vault_call(*args: Any, **kwargs: Any) -> Any:
+        calls[name] += 1
+        return method(*args, **kwargs)
+
+    return vault_call
+
+
+_VAULT_CALL_CODE = _counted_call("", lambda: None, Counter()).__code__
+
+
+class HookProfiler:
+    """
+    Profiles contract hooks. A profiler can be reused, but each call to `profile` returns a new
+    HookProfile
+    """
+
+    def __init__(
+        self,
+        feature_package: str = DEFAULT_FEATURE_PACKAGE,
+        ignored_modules: tuple[str, ...] = DEFAULT_IGNORED_MODULES,
+        trace_allocations: bool = True,
+    ):
+        """
+        :param feature_package: the package whose modules are reported as features
+        :param ignored_modules: modules whose frames are attributed to their caller. Submodules are
+        ignored too
+        :param trace_allocations: if True, net allocations are traced with tracemalloc. This slows
+        the hook down by around an order of magnitude, mostly in allocation-heavy code, so timings
+        are best compared with allocations traced in both or neither profile
+        """
+        self.feature_package = feature_package
+        self.ignored_modules = ignored_modules
+        self.trace_allocations = trace_allocations
+
+    def profile(
+        self, hook: Callable, vault: Any, hook_arguments: Any, runs: int = 1
+    ) -> HookProfile:
+        """
+        Runs a hook with the given arguments and profiles it
+        :param hook: the hook function, e.g. `contract.pre_posting_hook`
+        :param vault: the vault object to pass to the hook
+        :param hook_arguments: the hook arguments to pass to the hook
+        :param runs: number of times to run the hook. Short hooks may need several runs for the
+        timings to be meaningful
+        :return: the profile of all runs
+        """
+        functions: dict[str, ProfileStats] = {}
+        modules: dict[str, ProfileStats] = {}
+        vault_calls: Counter[str] = Counter()
+        stacks: Counter[tuple[str, ...]] = Counter()
+        # the frames being profiled, and whether each frame event was for an ignored frame
+        frames: list[_Frame] = []
+        events: list[bool] = []
+        # number of active frames per function and module, to only count recursive time once
+        active: Counter[str] = Counter()
+        ignored_modules = self.ignored_modules
+        ignored_module_prefixes = tuple(f"{module}." for module in ignored_modules)
+        start_tracing = self.trace_allocations and not tracemalloc.is_tracing()
+        trace_allocations = self.trace_allocations
+        perf_counter_ns = time.perf_counter_ns
+        get_traced_memory = tracemalloc.get_traced_memory
+
+        def on_call(frame: FrameType) -> None:
+            code = frame.f_code
+            if code is _VAULT_CALL_CODE:
+                module = "vault"
+                function = f"{VAULT_FRAME_PREFIX}{frame.f_locals['name']}"
+            else:
+                module = frame.f_globals.get("__name__", "")
+                if module in ignored_modules or module.startswith(ignored_module_prefixes):
+                    events.append(False)
+                    return
+                function = f"{module}:{getattr(code, 'co_qualname', code.co_name)}"
+            stack = frames[-1].stack + (function,) if frames else (function,)
+            frames.append(
+                _Frame(
+                    function,
+                    module,
+                    stack,
+                    perf_counter_ns(),
+                    get_traced_memory()[0] if trace_allocations else 0,
+                )
+            )
+            events.append(True)
+            active[function] += 1
+            active[module] += 1
+
+        def on_return() -> None:
+            if not events or not events.pop():
+                return
+            entry = frames.pop()
+            elapsed = perf_counter_ns() - entry.start
+            allocated = (get_traced_memory()[0] - entry.start_memory) if trace_allocations else 0
+            self_elapsed = elapsed - entry.child_time
+            self_allocated = allocated - entry.child_memory
+            for key, stats_by_key in [(entry.function, functions), (entry.module, modules)]:
+                stats = stats_by_key.get(key)
+                if stats is None:
+                    stats = stats_by_key[key] = ProfileStats()
+                stats.self_time += self_elapsed / 1e9
+                stats.self_allocated_bytes += self_allocated
+                active[key] -= 1
+                if active[key] == 0:
+                    stats.total_time += elapsed / 1e9
+                    stats.allocated_bytes += allocated
+            functions[entry.function].calls += 1
+            # module calls are calls into the module from outside of it
+            if not frames or frames[-1].module != entry.module:
+                modules[entry.module].calls += 1
+            stacks[entry.stack] += self_elapsed
+            if frames:
+                frames[-1].child_time += elapsed
+                frames[-1].child_memory += allocated
+
+        def profiler(frame: FrameType, event: str, arg: Any) -> None:
+            if event == "call":
+                on_call(frame)
+            elif event == "return":
+                on_return()
+
+        counting_vault = _CountingVault(vault, vault_calls)
+        result = None
+        previous_profiler = sys.getprofile()
+        if start_tracing:
+            tracemalloc.start()
+        start = time.perf_counter()
+        try:
+            for _ in range(runs):
+                sys.setprofile(profiler)
+                try:
+                    result = hook(counting_vault, hook_arguments)
+                finally:
+                    sys.setprofile(previous_profiler)
+        finally:
+            wall_time = time.perf_counter() - start
+            if start_tracing:
+                tracemalloc.stop()
+
+        return HookProfile(
+            hook=f"{hook.__module__}:{hook.__qualname__}",
+            runs=runs,
+            wall_time=wall_time,
+            feature_package=self.feature_package,
+            functions=functions,
+            modules=modules,
+            vault_calls=vault_calls,
+            stacks=stacks,
+            result=result,
+        )
+
+
+def profile_hook(
+    hook: Callable,
+    vault: Any,
+    hook_arguments: Any,
+    runs: int = 1,
+    feature_package: str = DEFAULT_FEATURE_PACKAGE,
+    trace_allocations: bool = True,
+) -> HookProfile:
+    """
+    Profiles a contract hook. See HookProfiler for details of the arguments
+    """
+    return HookProfiler(
+        feature_package=feature_package, trace_allocations=trace_allocations
+    ).profile(hook, vault, hook_arguments, runs=runs)
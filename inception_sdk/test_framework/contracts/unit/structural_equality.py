@@ -0,0 +1,262 @@
+# Copyright @ 2024 Thought Machine Group Limited. All rights reserved.
+"""
+Structural equality and diffs for contracts api types that do not define a suitable __eq__.
+
+Each class is registered with a ComparisonPlan, which describes how its instances are compared.
+Equality checks short-circuit on the first difference and have no side effects, so that they stay
+cheap when used by `assertIn` or list comparisons. A structured diff is only computed on request,
+typically once an assertion has already failed.
+"""
+# standard libs
+from dataclasses import dataclass, field
+from pprint import pformat
+from typing import Any, Callable
+
+
+class StructuralAssertionError(AssertionError):
+    """
+    Assertion failure that already includes a structural diff of the compared values
+    """
+
+
+class _Missing:
+    def __repr__(self) -> str:
+        return "<missing>"
+
+
+# the value of attributes, items and keys that an object does not have
+MISSING = _Missing()
+
+
+def _default_equal(first: Any, second: Any) -> bool:
+    # `second` is compared first for consistency with the original extension types, so that its
+    # __ne__ is used if neither operand type is a subclass of the other
+    return not second != first
+
+
+@dataclass(frozen=True)
+class ValueDifference:
+    first: Any
+    second: Any
+
+
+@dataclass(frozen=True)
+class ComparisonPlan:
+    # class that both compared objects must be an instance of
+    base_class: type
+    # instance attributes that are not compared, e.g. attributes derived from compared attributes
+    ignored_attributes: frozenset[str] = frozenset()
+    # attribute name to function deciding whether the attribute values are equal
+    attribute_comparators: dict[str, Callable[[Any, Any], bool]] = field(default_factory=dict)
+    # function deciding whether attribute values are equal, unless overridden per attribute
+    default_comparator: Callable[[Any, Any], bool] = _default_equal
+    # for list-based classes, function deciding whether items at the same index are equal. The
+    # items are compared instead of the instance attributes
+    item_comparator: Callable[[Any, Any], bool] | None = None
+    # for dict-based classes, whether the items are compared in addition to the instance attributes
+    compare_mapping: bool = False
+
+    def attribute_equal(self, name: str, first_value: Any, second_value: Any) -> bool:
+        return self.attribute_comparators.get(name, self.default_comparator)(
+            first_value, second_value
+        )
+
+    def equal(self, first: Any, second: Any) -> bool:
+        """
+        Whether two objects are structurally equal, as per this plan. Only the attributes of the
+        second object are compared, so that subclasses with additional attributes can be compared
+        to the base class
+        """
+        if not isinstance(second, self.base_class):
+            return False
+        if self.item_comparator is not None:
+            return len(first) == len(second) and all(
+                self.item_comparator(first_item, second_item)
+                for first_item, second_item in zip(first, second)
+            )
+        if self.compare_mapping and not dict.__eq__(first, second):
+            return False
+        first_attributes = first.__dict__
+        for name, second_value in second.__dict__.items():
+            if name in self.ignored_attributes:
+                continue
+            if name not in first_attributes or not self.attribute_equal(
+                name, first_attributes[name], second_value
+            ):
+                return False
+        return True
+
+
+# registered class to its comparison plan. Both the extension classes and their contracts api
+# base classes are registered
+_comparison_plans: dict[type, ComparisonPlan] = {}
+# plans resolved for any type, including unregistered subclasses. None for types without a plan
+_resolved_plans: dict[type, ComparisonPlan | None] = {}
+
+
+def register_comparison_plan(
+    base_class: type,
+    *,
+    ignored_attributes: frozenset[str] = frozenset(),
+    attribute_comparators: dict[str, Callable[[Any, Any], bool]] | None = None,
+    default_comparator: Callable[[Any, Any], bool] = _default_equal,
+    item_comparator: Callable[[Any, Any], bool] | None = None,
+    compare_mapping: bool = False,
+) -> Callable[[type], type]:
+    """
+    Class decorator that registers a comparison plan for a subclass of a contracts api class and
+    uses the plan for the subclass' __eq__
+    :param base_class: the contracts api class being extended
+    :param ignored_attributes: instance attributes that are not compared
+    :param attribute_comparators: attribute name to function deciding whether the attribute values
+    are equal
+    :param default_comparator: function deciding whether attribute values are equal, unless
+    overridden per attribute
+    :param item_comparator: for list-based classes, function deciding whether items are equal
+    :param compare_mapping: for dict-based classes, whether the items are compared
+    """
+    plan = ComparisonPlan(
+        base_class=base_class,
+        ignored_attributes=ignored_attributes,
+        attribute_comparators=attribute_comparators or {},
+        default_comparator=default_comparator,
+        item_comparator=item_comparator,
+        compare_mapping=compare_mapping,
+    )
+
+    def decorator(cls: type) -> type:
+        _comparison_plans[cls] = plan
+        _comparison_plans.setdefault(base_class, plan)
+        _resolved_plans.clear()
+
+        def __eq__(self, other: Any) -> bool:
+            return plan.equal(self, other)
+
+        cls.__eq__ = __eq__  # type: ignore
+        # as per classes that define __eq__ in their body, instances are not hashable
+        cls.__hash__ = None  # type: ignore
+        return cls
+
+    return decorator
+
+
+def get_comparison_plan(value_type: type) -> ComparisonPlan | None:
+    """
+    Returns the comparison plan of the nearest registered class in the type's hierarchy
+    """
+    if value_type not in _resolved_plans:
+        _resolved_plans[value_type] = next(
+            (_comparison_plans[cls] for cls in value_type.__mro__ if cls in _comparison_plans),
+            None,
+        )
+    return _resolved_plans[value_type]
+
+
+def structurally_equal(first: Any, second: Any) -> bool:
+    plan = get_comparison_plan(type(first))
+    if plan is None:
+        return first == second
+    return isinstance(first, plan.base_class) and plan.equal(first, second)
+
+
+def _sequence_diff(
+    first: list | tuple, second: list | tuple, item_equal: Callable[[Any, Any], bool]
+) -> dict[str, Any]:
+    diff: dict[str, Any] = {}
+    if len(first) != len(second):
+        diff["length"] = ValueDifference(len(first), len(second))
+    for index, (first_item, second_item) in enumerate(zip(first, second)):
+        if not item_equal(first_item, second_item):
+            diff[f"[{index}]"] = structural_diff(first_item, second_item) or ValueDifference(
+                first_item, second_item
+            )
+    # items beyond the shorter sequence are reported as missing from the other sequence
+    for index in range(len(second), len(first)):
+        diff[f"[{index}]"] = ValueDifference(first[index], MISSING)
+    for index in range(len(first), len(second)):
+        diff[f"[{index}]"] = ValueDifference(MISSING, second[index])
+    return diff
+
+
+def _mapping_diff(first: dict, second: dict) -> dict[str, Any]:
+    diff: dict[str, Any] = {}
+    for key in [*first, *(key for key in second if key not in first)]:
+        first_value = first[key] if key in first else MISSING
+        second_value = second[key] if key in second else MISSING
+        if first_value is MISSING or second_value is MISSING:
+            diff[f"[{key!r}]"] = ValueDifference(first_value, second_value)
+        elif not _default_equal(first_value, second_value):
+            diff[f"[{key!r}]"] = structural_diff(first_value, second_value) or ValueDifference(
+                first_value, second_value
+            )
+    return diff
+
+
+def _planned_diff(plan: ComparisonPlan, first: Any, second: Any) -> dict[str, Any]:
+    if plan.item_comparator is not None:
+        return _sequence_diff(first, second, plan.item_comparator)
+    diff = _mapping_diff(first, second) if plan.compare_mapping else {}
+    first_attributes = first.__dict__
+    for name, second_value in second.__dict__.items():
+        if name in plan.ignored_attributes:
+            continue
+        first_value = first_attributes.get(name, MISSING)
+        if first_value is MISSING:
+            diff[name] = ValueDifference(MISSING, second_value)
+        elif not plan.attribute_equal(name, first_value, second_value):
+            diff[name] = structural_diff(first_value, second_value) or ValueDifference(
+                first_value, second_value
+            )
+    return diff
+
+
+def structural_diff(first: Any, second: Any) -> dict[str, Any] | ValueDifference | None:
+    """
+    Computes the minimal structured difference between two values. Registered contracts api types,
+    lists, tuples and dicts are compared recursively, so that only the differing attributes, items
+    and keys are included
+    :param first: the first value
+    :param second: the second value
+    :return: None if the values are equal. Otherwise either a ValueDifference, or a dict of
+    attribute names, `[index]` or `[key]` to their nested differences
+    """
+    plan = get_comparison_plan(type(first)) or get_comparison_plan(type(second))
+    if plan is not None:
+        if not isinstance(first, plan.base_class) or not isinstance(second, plan.base_class):
+            return {"type": ValueDifference(type(first).__name__, type(second).__name__)}
+        return _planned_diff(plan, first, second) or None
+    if _default_equal(first, second):
+        return None
+    if isinstance(first, (list, tuple)) and isinstance(second, (list, tuple)):
+        return _sequence_diff(first, second, _default_equal) or None
+    if isinstance(first, dict) and isinstance(second, dict):
+        return _mapping_diff(first, second) or None
+    return ValueDifference(first, second)
+
+
+def _format_value(value: Any) -> str:
+    # objects without a custom __repr__ are shown by their attributes rather than their id
+    if type(value).__repr__ is object.__repr__ and hasattr(value, "__dict__"):
+        return f"{type(value).__name__}({pformat(vars(value))})"
+    return pformat(value)
+
+
+def format_structural_diff(diff: dict[str, Any] | ValueDifference) -> str:
+    """
+    Formats a structural diff as one line per differing leaf, e.g.
+    `[0].postings[1].amount: first=Decimal('1') second=Decimal('2')`
+    """
+    lines = []
+
+    def _format(path: str, node: dict[str, Any] | ValueDifference) -> None:
+        if isinstance(node, ValueDifference):
+            lines.append(
+                f"{path or '<root>'}: first={_format_value(node.first)} "
+                f"second={_format_value(node.second)}"
+            )
+            return
+        for key, child in node.items():
+            _format(path + (key if key.startswith("[") or not path else f".{key}"), child)
+
+    _format("", diff)
+    return "\n".join(lines)
@@ -0,0 +1,127 @@
+# standard libs
+from collections import defaultdict
+from datetime import datetime, timedelta
+from decimal import Decimal
+from typing import Any
+from unittest import TestCase
+from zoneinfo import ZoneInfo
+
+# contracts api
+from contracts_api import (
+    DEFAULT_ADDRESS,
+    DEFAULT_ASSET,
+    Balance,
+    BalanceCoordinate,
+    BalanceTimeseries,
+    FlagTimeseries,
+    ParameterTimeseries,
+    Phase,
+    Tside,
+)
+
+# inception sdk
+from inception_sdk.test_framework.common.benchmark import run_benchmark
+from inception_sdk.test_framework.contracts.unit.common import ContractTest
+
+START_DATETIME = datetime(2023, 1, 1, tzinfo=ZoneInfo("UTC"))
+# emulates a suite of unit tests that each create a vault from a shared fixture, varying a single
+# parameter, and make a few lookups as a hook would
+SUITE_SIZES = [10, 100]
+# a year of daily values, e.g. balances fetched for a schedule
+TIMESERIES_LENGTH = 365
+PARAMETER_NAMES = [f"parameter_{i}" for i in range(20)]
+FLAG_NAMES = [f"&{{FLAG_{i}}}" for i in range(5)]
+COORDINATES = [
+    BalanceCoordinate(address, DEFAULT_ASSET, "GBP", Phase.COMMITTED)
+    for address in [DEFAULT_ADDRESS, "PRINCIPAL", "INTEREST", "PENALTIES"]
+]
+LOOKUP_DATETIMES = [START_DATETIME + timedelta(days=day) for day in range(0, 365, 30)]
+
+
+def _fixture() -> dict[str, Any]:
+    datetimes = [START_DATETIME + timedelta(days=day) for day in range(TIMESERIES_LENGTH)]
+    return dict(
+        parameter_ts={
+            name: ParameterTimeseries([(at, Decimal(day)) for day, at in enumerate(datetimes)])
+            for name in PARAMETER_NAMES
+        },
+        flags_ts={
+            name: FlagTimeseries([(at, day % 2 == 0) for day, at in enumerate(datetimes)])
+            for name in FLAG_NAMES
+        },
+        balances_interval_fetchers_mapping={
+            "EFFECTIVE_FETCHER": defaultdict(
+                BalanceTimeseries,
+                {
+                    coordinate: BalanceTimeseries(
+                        [(at, Balance(net=Decimal(day))) for day, at in enumerate(datetimes)]
+                    )
+                    for coordinate in COORDINATES
+                },
+            )
+        },
+    )
+
+
+def _lookups(vault: Any) -> list:
+    balances = vault.get_balances_timeseries(fetcher_id="EFFECTIVE_FETCHER")
+    return [
+        [
+            vault.get_parameter_timeseries(name=name).at(at_datetime=at_datetime)
+            for name in PARAMETER_NAMES
+        ]
+        + [vault.get_flag_timeseries(flag=flag).at(at_datetime=at_datetime) for flag in FLAG_NAMES]
+        + [balances[coordinate].at(at_datetime=at_datetime).net for coordinate in COORDINATES]
+        for at_datetime in LOOKUP_DATETIMES
+    ]
+
+
+class FakeVaultPerformanceTest(TestCase):
+    """
+    Compares creating Mock vault objects with create_mock against cloning a shared FakeVault
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        cls.test_case = ContractTest()
+        cls.test_case.tside = Tside.ASSET
+        cls.fixture = _fixture()
+        cls.overridden_parameter = PARAMETER_NAMES[0]
+
+    def _parameter_override(self, test_number: int) -> dict[str, ParameterTimeseries]:
+        return {
+            **self.fixture["parameter_ts"],
+            self.overridden_parameter: ParameterTimeseries([(START_DATETIME, test_number)]),
+        }
+
+    def _run_suite_with_mocks(self, suite_size: int) -> list:
+        return [
+            _lookups(
+                self.test_case.create_mock(
+                    **{**self.fixture, "parameter_ts": self._parameter_override(test_number)}
+                )
+            )
+            for test_number in range(suite_size)
+        ]
+
+    def _run_suite_with_fake_vaults(self, suite_size: int) -> list:
+        shared_vault = self.test_case.create_fake_vault(**self.fixture)
+        return [
+            _lookups(shared_vault.clone(parameter_ts=self._parameter_override(test_number)))
+            for test_number in range(suite_size)
+        ]
+
+    def test_benchmark_suite(self):
+        for suite_size in SUITE_SIZES:
+            with self.subTest(suite_size=suite_size):
+                mocks = run_benchmark(
+                    f"{suite_size} tests with create_mock",
+                    lambda: self._run_suite_with_mocks(suite_size),
+                    repeat=3,
+                )
+                fake_vaults = run_benchmark(
+                    f"{suite_size} tests with cloned fake vaults",
+                    lambda: self._run_suite_with_fake_vaults(suite_size),
+                    repeat=3,
+                )
+                self.assertListEqual(fake_vaults.return_value, mocks.return_value)
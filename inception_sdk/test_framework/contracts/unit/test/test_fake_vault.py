@@ -0,0 +1,290 @@
+# standard libs
+from collections import defaultdict
+from datetime import datetime, timedelta
+from decimal import Decimal
+from typing import Any, Callable
+from unittest import TestCase
+from zoneinfo import ZoneInfo
+
+# contracts api
+from contracts_api import (
+    DEFAULT_ADDRESS,
+    DEFAULT_ASSET,
+    Balance,
+    BalanceCoordinate,
+    BalanceTimeseries,
+    CalendarEvent,
+    FlagTimeseries,
+    ParameterTimeseries,
+    Phase,
+    Tside,
+)
+
+# inception sdk
+from inception_sdk.test_framework.contracts.unit.common import ContractTest
+from inception_sdk.test_framework.contracts.unit.fake_vault import (
+    FakeVault,
+    IndexedParameterTimeseries,
+    index_timeseries,
+)
+
+DEFAULT_DATETIME = datetime(2023, 1, 1, tzinfo=ZoneInfo("UTC"))
+DEFAULT_COORDINATE = BalanceCoordinate(DEFAULT_ADDRESS, DEFAULT_ASSET, "GBP", Phase.COMMITTED)
+
+
+def _parameter_ts() -> dict[str, ParameterTimeseries]:
+    return {
+        "interest_rate": ParameterTimeseries(
+            [
+                (DEFAULT_DATETIME, Decimal("0.01")),
+                (DEFAULT_DATETIME + timedelta(days=10), Decimal("0.02")),
+                (DEFAULT_DATETIME + timedelta(days=20), Decimal("0.03")),
+            ]
+        )
+    }
+
+
+def _calendar_events() -> list[CalendarEvent]:
+    return [
+        CalendarEvent(
+            id=str(i),
+            calendar_id=calendar_id,
+            start_datetime=DEFAULT_DATETIME + timedelta(days=i),
+            end_datetime=DEFAULT_DATETIME + timedelta(days=i + 1),
+        )
+        for i, calendar_id in enumerate(["&{RED}", "GREEN", "RED", "BLUE"])
+    ]
+
+
+def _balances() -> defaultdict[BalanceCoordinate, BalanceTimeseries]:
+    return defaultdict(
+        BalanceTimeseries,
+        {
+            DEFAULT_COORDINATE: BalanceTimeseries(
+                [(DEFAULT_DATETIME + timedelta(days=i), Balance(net=Decimal(i))) for i in range(5)]
+            )
+        },
+    )
+
+
+class FakeVaultTest(TestCase):
+    def setUp(self) -> None:
+        self.test_case = ContractTest()
+        self.test_case.tside = Tside.ASSET
+        self.inputs: dict[str, Any] = dict(
+            balances_interval_fetchers_mapping={"EFFECTIVE_FETCHER": _balances()},
+            calendar_events=_calendar_events(),
+            flags_ts={
+                "&{REPAYMENT_HOLIDAY}": FlagTimeseries([(DEFAULT_DATETIME, True)]),
+                "DORMANT": FlagTimeseries([(DEFAULT_DATETIME, True)]),
+            },
+            last_execution_datetimes={"ACCRUE_INTEREST": DEFAULT_DATETIME},
+            parameter_ts=_parameter_ts(),
+            postings_interval_mapping={"POSTINGS_FETCHER": []},
+        )
+        self.mock_vault = self.test_case.create_mock(**self.inputs)
+        self.fake_vault = self.test_case.create_fake_vault(**self.inputs)
+
+    def assert_same_behaviour(self, call: Callable[[Any], Any]) -> Any:
+        try:
+            expected = call(self.mock_vault)
+        except Exception as e:
+            with self.assertRaises(type(e)) as context:
+                call(self.fake_vault)
+            self.assertEqual(context.exception.args, e.args)
+            return None
+        result = call(self.fake_vault)
+        self.assertEqual(result, expected)
+        return result
+
+    def test_attributes(self):
+        for attribute in ["account_id", "tside", "events_timezone"]:
+            with self.subTest(attribute=attribute):
+                self.assert_same_behaviour(lambda vault: getattr(vault, attribute))
+
+    def test_parameter_lookups(self):
+        for days in [-1, 0, 5, 10, 15, 20, 25]:
+            at_datetime = DEFAULT_DATETIME + timedelta(days=days)
+            with self.subTest(days=days):
+                parameter_ts = self.fake_vault.get_parameter_timeseries(name="interest_rate")
+                mock_parameter_ts = self.mock_vault.get_parameter_timeseries(name="interest_rate")
+                if days >= 0:
+                    self.assertEqual(
+                        parameter_ts.at(at_datetime=at_datetime),
+                        mock_parameter_ts.at(at_datetime=at_datetime),
+                    )
+                if days > 0:
+                    self.assertEqual(
+                        parameter_ts.before(at_datetime=at_datetime),
+                        mock_parameter_ts.before(at_datetime=at_datetime),
+                    )
+        self.assert_same_behaviour(lambda vault: vault.get_parameter_timeseries(name="missing"))
+
+    def test_flag_lookups(self):
+        for flag in [
+            "REPAYMENT_HOLIDAY",
+            "&{REPAYMENT_HOLIDAY}",
+            "DORMANT",
+            "&{DORMANT}",
+            "MISSING_FLAG",
+            "&{MISSING_FLAG}",
+        ]:
+            with self.subTest(flag=flag):
+                self.assert_same_behaviour(
+                    lambda vault: vault.get_flag_timeseries(flag=flag).at(
+                        at_datetime=DEFAULT_DATETIME
+                    )
+                )
+
+    def test_missing_flag_timeseries_are_not_shared(self):
+        flag_timeseries = self.fake_vault.get_flag_timeseries(flag="MISSING_FLAG")
+        flag_timeseries.append((DEFAULT_DATETIME + timedelta(days=1), True))
+
+        self.assertEqual(
+            self.fake_vault.get_flag_timeseries(flag="MISSING_FLAG").latest(),
+            self.mock_vault.get_flag_timeseries(flag="MISSING_FLAG").latest(),
+        )
+        self.assertFalse(self.fake_vault.get_flag_timeseries(flag="OTHER_FLAG").latest())
+
+    def test_balance_lookups(self):
+        balances = self.assert_same_behaviour(
+            lambda vault: vault.get_balances_timeseries(fetcher_id="EFFECTIVE_FETCHER")
+        )
+        self.assertEqual(
+            balances[DEFAULT_COORDINATE].at(at_datetime=DEFAULT_DATETIME + timedelta(days=2)).net,
+            Decimal("2"),
+        )
+        self.assertEqual(balances[DEFAULT_COORDINATE].latest().net, Decimal("4"))
+        self.assertEqual(len(balances["missing coordinate"]), 0)
+        self.assert_same_behaviour(lambda vault: vault.get_balances_timeseries(fetcher_id="X"))
+        self.assert_same_behaviour(lambda vault: vault.get_balances_timeseries())
+
+    def test_calendar_event_lookups(self):
+        for calendar_ids in [
+            ["RED"],
+            ["&{RED}"],
+            ["&{RED}", "BLUE"],
+            ["RED", "&{RED}"],
+            ["BLUE", "GREEN", "RED"],
+            ["PINK"],
+            [],
+        ]:
+            with self.subTest(calendar_ids=calendar_ids):
+                # calendar events are compared by identity, so their attributes are compared
+                self.assert_same_behaviour(
+                    lambda vault: [
+                        (event.id, event.calendar_id, event.start_datetime, event.end_datetime)
+                        for event in vault.get_calendar_events(calendar_ids=calendar_ids)
+                    ]
+                )
+
+    def test_other_lookups(self):
+        lookups: list[Callable[[Any], Any]] = [
+            lambda vault: vault.get_account_creation_datetime(),
+            lambda vault: vault.get_hook_execution_id(),
+            lambda vault: vault.get_permitted_denominations(),
+            lambda vault: vault.get_last_execution_datetime(event_type="ACCRUE_INTEREST"),
+            lambda vault: vault.get_last_execution_datetime(event_type="MISSING"),
+            lambda vault: vault.get_posting_instructions(fetcher_id="POSTINGS_FETCHER"),
+            lambda vault: vault.get_posting_instructions(fetcher_id="MISSING"),
+            lambda vault: vault.get_client_transactions(fetcher_id="MISSING"),
+            lambda vault: vault.get_balances_observation(fetcher_id="MISSING"),
+            lambda vault: vault.get_alias(),
+            lambda vault: vault.get_hook_result(),
+        ]
+        for i, lookup in enumerate(lookups):
+            with self.subTest(lookup=i):
+                self.assert_same_behaviour(lookup)
+
+    def test_supervisee_lookups(self):
+        inputs = dict(
+            is_supervisee_vault=True,
+            supervisee_alias="loan",
+            requires_fetched_balances=_balances(),
+            requires_fetched_postings=[],
+        )
+        self.mock_vault = self.test_case.create_mock(**inputs)
+        self.fake_vault = self.test_case.create_fake_vault(**inputs)
+        lookups: list[Callable[[Any], Any]] = [
+            lambda vault: vault.get_alias(),
+            lambda vault: vault.get_hook_result(),
+            lambda vault: vault.get_balances_timeseries(),
+            lambda vault: vault.get_posting_instructions(),
+            lambda vault: vault.get_client_transactions(),
+            lambda vault: vault.get_client_transactions(fetcher_id="FETCHER"),
+        ]
+        for i, lookup in enumerate(lookups):
+            with self.subTest(lookup=i):
+                self.assert_same_behaviour(lookup)
+
+    def test_clone_shares_unchanged_inputs(self):
+        clone = self.fake_vault.clone(
+            account_id="other_account", flags_ts={}, calendar_events=_calendar_events()[:1]
+        )
+
+        self.assertIsInstance(clone, FakeVault)
+        self.assertEqual(clone.account_id, "other_account")
+        self.assertFalse(clone.get_flag_timeseries(flag="REPAYMENT_HOLIDAY").latest())
+        self.assertEqual(len(clone.get_calendar_events(calendar_ids=["RED"])), 1)
+        self.assertIs(
+            clone.get_posting_instructions(fetcher_id="POSTINGS_FETCHER"),
+            self.fake_vault.get_posting_instructions(fetcher_id="POSTINGS_FETCHER"),
+        )
+        # the original is unchanged
+        self.assertEqual(self.fake_vault.account_id, "default_account")
+        self.assertTrue(self.fake_vault.get_flag_timeseries(flag="REPAYMENT_HOLIDAY").latest())
+        self.assertEqual(len(self.fake_vault.get_calendar_events(calendar_ids=["RED"])), 2)
+
+    def test_clone_without_timeseries_overrides_does_not_reindex(self):
+        clone = self.fake_vault.clone(last_execution_datetimes={})
+
+        self.assertIs(
+            clone.get_parameter_timeseries(name="interest_rate"),
+            self.fake_vault.get_parameter_timeseries(name="interest_rate"),
+        )
+        self.assertIsNot(
+            self.fake_vault.clone(parameter_ts=_parameter_ts()).get_parameter_timeseries(
+                name="interest_rate"
+            ),
+            self.fake_vault.get_parameter_timeseries(name="interest_rate"),
+        )
+
+    def test_clone_raises_on_unknown_inputs(self):
+        with self.assertRaisesRegex(TypeError, r"Unexpected FakeVault inputs \['foo'\]"):
+            self.fake_vault.clone(foo="bar")
+
+
+class IndexedTimeseriesTest(TestCase):
+    def test_index_timeseries_preserves_type_and_items(self):
+        parameter_ts = _parameter_ts()["interest_rate"]
+
+        indexed = index_timeseries(parameter_ts)
+
+        self.assertIsInstance(indexed, IndexedParameterTimeseries)
+        self.assertIsInstance(indexed, ParameterTimeseries)
+        self.assertEqual(list(indexed), list(parameter_ts))
+        self.assertIs(index_timeseries(indexed), indexed)
+
+    def test_index_is_rebuilt_after_items_are_added(self):
+        indexed = index_timeseries(FlagTimeseries([(DEFAULT_DATETIME, False)]))
+        indexed.extend(FlagTimeseries([(DEFAULT_DATETIME + timedelta(days=1), True)]))
+
+        self.assertTrue(indexed.at(at_datetime=DEFAULT_DATETIME + timedelta(days=1)))
+        self.assertFalse(indexed.before(at_datetime=DEFAULT_DATETIME + timedelta(days=1)))
+
+    def test_empty_timeseries_behaviour_is_preserved(self):
+        self.assertFalse(index_timeseries(FlagTimeseries()).at(at_datetime=DEFAULT_DATETIME))
+        self.assertEqual(
+            index_timeseries(BalanceTimeseries()).at(at_datetime=DEFAULT_DATETIME), Balance()
+        )
+        with self.assertRaisesRegex(Exception, "No values provided as of date"):
+            index_timeseries(_parameter_ts()["interest_rate"]).at(
+                at_datetime=DEFAULT_DATETIME - timedelta(days=1)
+            )
+
+    def test_non_utc_datetimes_are_rejected(self):
+        with self.assertRaises(Exception) as context:
+            index_timeseries(_parameter_ts()["interest_rate"]).at(
+                at_datetime=datetime(2023, 1, 1, tzinfo=ZoneInfo("Europe/London"))
+            )
+        self.assertIn("UTC", str(context.exception))
@@ -0,0 +1,149 @@
+# standard libs
+import json
+import re
+import sys
+from unittest import TestCase
+from unittest.mock import Mock
+
+# inception sdk
+from inception_sdk.test_framework.contracts.unit.hook_profiler import HookProfiler, profile_hook
+
+# the json package stands in for library features, as its functions are python
+FEATURE_PACKAGE = "json"
+HOOK = f"{__name__}:_hook"
+
+
+def _factorial(n: int) -> int:
+    return 1 if n <= 1 else n * _factorial(n - 1)
+
+
+def _allocate() -> list[int]:
+    return list(range(100_000))
+
+
+def _hook(vault, hook_arguments):
+    parameter = vault.get_parameter_timeseries(name="limit").latest()
+    vault.get_parameter_timeseries(name="denomination")
+    vault.get_balances_observation(fetcher_id="live")
+    encoded = json.dumps({"parameter": parameter, "factorial": _factorial(hook_arguments)})
+    return json.loads(encoded)
+
+
+class HookProfilerTest(TestCase):
+    def setUp(self) -> None:
+        self.vault = Mock()
+        self.vault.get_parameter_timeseries.return_value.latest.return_value = 10
+
+    def test_functions_and_modules_are_profiled(self):
+        profile = profile_hook(_hook, self.vault, 5, runs=2, feature_package=FEATURE_PACKAGE)
+
+        self.assertEqual(profile.hook, HOOK)
+        self.assertEqual(profile.runs, 2)
+        self.assertEqual(profile.result, {"parameter": 10, "factorial": 120})
+        self.assertEqual(profile.functions[HOOK].calls, 2)
+        self.assertEqual(profile.functions[f"{__name__}:_factorial"].calls, 10)
+        self.assertEqual(profile.functions["json:dumps"].calls, 2)
+        self.assertEqual(profile.functions["json:loads"].calls, 2)
+        # the hook module is called into once per run, and the json package twice
+        self.assertEqual(profile.modules[__name__].calls, 2)
+        self.assertEqual(profile.modules["json"].calls, 4)
+        # the hook includes everything it calls, and recursive calls are only counted once
+        hook_stats = profile.functions[HOOK]
+        factorial_stats = profile.functions[f"{__name__}:_factorial"]
+        self.assertGreater(hook_stats.total_time, hook_stats.self_time)
+        self.assertLess(factorial_stats.total_time, hook_stats.total_time)
+        self.assertGreaterEqual(profile.wall_time, hook_stats.total_time)
+
+    def test_feature_modules_and_functions(self):
+        profile = profile_hook(_hook, self.vault, 1, feature_package=FEATURE_PACKAGE)
+
+        self.assertEqual(
+            sorted(profile.feature_modules()), ["json", "json.decoder", "json.encoder"]
+        )
+        self.assertIn("json.encoder:JSONEncoder.encode", profile.feature_functions())
+        self.assertNotIn(HOOK, profile.feature_functions())
+
+    def test_vault_calls_are_counted_and_mock_frames_are_ignored(self):
+        profile = profile_hook(_hook, self.vault, 1, runs=3, feature_package=FEATURE_PACKAGE)
+
+        self.assertEqual(
+            profile.vault_calls,
+            {"get_parameter_timeseries": 6, "get_balances_observation": 3},
+        )
+        self.assertEqual(profile.functions["vault.get_parameter_timeseries"].calls, 6)
+        self.assertEqual(profile.modules["vault"].calls, 9)
+        self.assertFalse([module for module in profile.modules if module.startswith("unittest")])
+        self.assertIn((HOOK, "vault.get_balances_observation"), profile.stacks)
+
+    def test_supervisee_vault_calls_are_counted(self):
+        supervisee = Mock()
+        self.vault.supervisees = {"loan": supervisee}
+
+        def supervisor_hook(vault, hook_arguments):
+            return vault.supervisees["loan"].get_hook_result()
+
+        profile = HookProfiler().profile(supervisor_hook, self.vault, None)
+
+        self.assertEqual(profile.vault_calls, {"get_hook_result": 1})
+        self.assertIs(profile.result, supervisee.get_hook_result.return_value)
+
+    def test_allocations_are_attributed_to_the_allocating_function(self):
+        def hook(vault, hook_arguments):
+            return _allocate()
+
+        profile = HookProfiler().profile(hook, self.vault, None)
+
+        allocate_stats = profile.functions[f"{__name__}:_allocate"]
+        self.assertGreater(allocate_stats.self_allocated_bytes, 100_000 * 8)
+        self.assertEqual(
+            profile.functions[f"{__name__}:{hook.__qualname__}"].allocated_bytes,
+            profile.functions[f"{__name__}:{hook.__qualname__}"].self_allocated_bytes
+            + allocate_stats.allocated_bytes,
+        )
+
+    def test_allocations_can_be_skipped(self):
+        profile = HookProfiler(trace_allocations=False).profile(_hook, self.vault, 1)
+
+        self.assertEqual(profile.functions[HOOK].allocated_bytes, 0)
+
+    def test_collapsed_stacks(self):
+        profile = profile_hook(_hook, self.vault, 50, runs=10, feature_package=FEATURE_PACKAGE)
+
+        lines = profile.collapsed_stacks().splitlines()
+
+        self.assertTrue(lines)
+        for line in lines:
+            self.assertRegex(line, r"^[^; ]+(;[^; ]+)* \d+$")
+            self.assertTrue(line.startswith(HOOK))
+        total_us = sum(int(line.rpartition(" ")[2]) for line in lines)
+        self.assertLessEqual(total_us, profile.functions[HOOK].total_time * 1e6 + len(lines))
+
+    def test_json_summary(self):
+        profile = profile_hook(_hook, self.vault, 1, feature_package=FEATURE_PACKAGE)
+
+        summary = json.loads(profile.to_json())
+        features_summary = profile.to_dict(features_only=True)
+
+        self.assertEqual(
+            sorted(summary),
+            ["functions", "hook", "modules", "runs", "vault_calls", "wall_time"],
+        )
+        self.assertEqual(summary["functions"]["json:dumps"]["calls"], 1)
+        self.assertEqual(
+            sorted(summary["functions"]["json:dumps"]),
+            ["allocated_bytes", "calls", "self_allocated_bytes", "self_time", "total_time"],
+        )
+        self.assertEqual(summary["vault_calls"], profile.to_dict()["vault_calls"])
+        self.assertTrue(
+            all(re.match(r"^json[.:]", function) for function in features_summary["functions"])
+        )
+        self.assertNotIn(__name__, features_summary["modules"])
+
+    def test_profiler_is_removed_when_the_hook_raises(self):
+        def hook(vault, hook_arguments):
+            raise ValueError("hook failed")
+
+        with self.assertRaisesRegex(ValueError, "hook failed"):
+            HookProfiler().profile(hook, self.vault, None)
+
+        self.assertIsNone(sys.getprofile())
@@ -0,0 +1,161 @@
+# standard libs
+import io
+from contextlib import redirect_stdout
+from decimal import Decimal
+from unittest import TestCase
+
+# contracts api
+from contracts_api import DEFAULT_ASSET, CustomInstruction, Phase, Posting
+
+# inception sdk
+from inception_sdk.test_framework.contracts.unit.common import ContractTest
+from inception_sdk.test_framework.contracts.unit.contracts_api_extension import (
+    CustomInstruction as CustomInstructionExtended,
+    PostingInstructionsDirective,
+)
+from inception_sdk.test_framework.contracts.unit.structural_equality import (
+    MISSING,
+    StructuralAssertionError,
+    ValueDifference,
+    format_structural_diff,
+    get_comparison_plan,
+    structural_diff,
+    structurally_equal,
+)
+
+
+def _posting(amount: str, credit: bool = True) -> Posting:
+    return Posting(
+        credit=credit,
+        amount=Decimal(amount),
+        denomination="GBP",
+        account_id="some_account_id",
+        account_address="some_address",
+        asset=DEFAULT_ASSET,
+        phase=Phase.COMMITTED,
+    )
+
+
+def _custom_instruction(amount: str, extended: bool = True) -> CustomInstruction:
+    instruction_type = CustomInstructionExtended if extended else CustomInstruction
+    return instruction_type(
+        postings=[_posting(amount), _posting(amount, credit=False)],
+        instruction_details={"description": "test"},
+    )
+
+
+def _directive(amounts: list[str], extended: bool = True) -> PostingInstructionsDirective:
+    return PostingInstructionsDirective(
+        posting_instructions=[_custom_instruction(amount, extended) for amount in amounts],
+        value_datetime=None,
+    )
+
+
+class StructuralEqualityTest(TestCase):
+    def test_plan_is_resolved_for_base_and_extension_classes(self):
+        plan = get_comparison_plan(CustomInstructionExtended)
+
+        self.assertIsNotNone(plan)
+        self.assertIs(get_comparison_plan(CustomInstruction), plan)
+        self.assertIsNone(get_comparison_plan(Decimal))
+
+    def test_equality_does_not_print(self):
+        output = io.StringIO()
+        with redirect_stdout(output):
+            self.assertFalse(_custom_instruction("1") == _custom_instruction("2", extended=False))
+            self.assertFalse(_custom_instruction("1") == _posting("1"))
+
+        self.assertEqual(output.getvalue(), "")
+
+    def test_structurally_equal_with_base_class_first(self):
+        self.assertTrue(
+            structurally_equal(_custom_instruction("1", extended=False), _custom_instruction("1"))
+        )
+        self.assertFalse(
+            structurally_equal(_custom_instruction("1", extended=False), _custom_instruction("2"))
+        )
+
+    def test_structural_diff_of_equal_values(self):
+        self.assertIsNone(structural_diff(_directive(["1", "2"]), _directive(["1", "2"], False)))
+
+    def test_structural_diff_only_includes_differences(self):
+        diff = structural_diff(_directive(["1", "2"]), _directive(["1", "3"], extended=False))
+
+        self.assertEqual(
+            diff,
+            {
+                "posting_instructions": {
+                    "[1]": {
+                        "postings": {
+                            "[0]": {"amount": ValueDifference(Decimal("2"), Decimal("3"))},
+                            "[1]": {"amount": ValueDifference(Decimal("2"), Decimal("3"))},
+                        }
+                    }
+                }
+            },
+        )
+
+    def test_structural_diff_of_sequences_with_different_lengths(self):
+        diff = structural_diff([1, 2], [1, 2, 3])
+
+        self.assertEqual(
+            diff, {"length": ValueDifference(2, 3), "[2]": ValueDifference(MISSING, 3)}
+        )
+
+    def test_structural_diff_of_mappings(self):
+        diff = structural_diff({"a": 1, "b": 2}, {"a": 1, "c": 2})
+
+        self.assertEqual(
+            diff, {"['b']": ValueDifference(2, MISSING), "['c']": ValueDifference(MISSING, 2)}
+        )
+
+    def test_structural_diff_of_different_types(self):
+        diff = structural_diff(_custom_instruction("1"), _posting("1"))
+
+        self.assertEqual(diff, {"type": ValueDifference("CustomInstruction", "Posting")})
+
+    def test_format_structural_diff(self):
+        diff = structural_diff([_directive(["1"])], [_directive(["2"], extended=False)])
+
+        self.assertEqual(
+            format_structural_diff(diff),
+            "[0].posting_instructions[0].postings[0].amount: first=Decimal('1') "
+            "second=Decimal('2')\n"
+            "[0].posting_instructions[0].postings[1].amount: first=Decimal('1') "
+            "second=Decimal('2')",
+        )
+
+    def test_format_structural_diff_of_root_value(self):
+        self.assertEqual(format_structural_diff(ValueDifference(1, 2)), "<root>: first=1 second=2")
+
+
+class ContractTestStructuralDiffTest(TestCase):
+    def setUp(self) -> None:
+        self.contract_test = ContractTest()
+
+    def test_assert_equal_failure_includes_structural_diff(self):
+        with self.assertRaises(StructuralAssertionError) as context:
+            self.contract_test.assertEqual(
+                [_directive(["1", "2"])], [_directive(["1", "3"], extended=False)]
+            )
+
+        self.assertIn(
+            "Structural diff:\n[0].posting_instructions[1].postings[0].amount: "
+            "first=Decimal('2') second=Decimal('3')",
+            str(context.exception),
+        )
+
+    def test_assert_dict_equal_failure_includes_structural_diff(self):
+        with self.assertRaises(StructuralAssertionError) as context:
+            self.contract_test.assertDictEqual(
+                {"directives": [_directive(["1"])]}, {"directives": [_directive(["1", "2"])]}
+            )
+
+        self.assertIn(
+            "['directives'][0].posting_instructions.length: first=1 second=2",
+            str(context.exception),
+        )
+
+    def test_assert_equal_passes(self):
+        self.contract_test.assertEqual([_directive(["1"])], [_directive(["1"], extended=False)])
+        self.contract_test.assertIn(_directive(["2"]), [_directive(["1"]), _directive(["2"])])
@@ -9,7 +9,6 @@ from functools import partial, wraps
 from time import sleep
 from typing import TYPE_CHECKING, Any, Callable
 
-
 # third party
 import requests
 from requests.exceptions import HTTPError
@@ -19,6 +18,10 @@ if TYPE_CHECKING:
     # a container
     import confluent_kafka
 
+    from inception_sdk.test_framework.endtoend.workflow_state_watcher import (
+        WorkflowStateWatcher,
+    )
+
 # inception sdk
 import inception_sdk.test_framework.endtoend as endtoend
 from inception_sdk.test_framework.common.config import (
@@ -241,6 +244,10 @@ class TestInstance:
         # This is simply a merged version of the other id mapping dictionaries to avoid having to
         # repeat the merge in different helpers
         self.clu_reference_mappings: dict = {}
+        # Optional watcher that workflows_helper.wait_for_state delegates to, so that concurrent
+        # tests share a single subscription to workflow state changes instead of each polling
+        # Populated by the test writer in each test class
+        self.workflow_state_watcher: "WorkflowStateWatcher | None" = None
 
 
 def setup_environments(environment_purpose: EnvironmentPurpose, environment_name: str = ""):
@@ -366,6 +373,8 @@ def teardown_shared_resources():
     """
     endtoend.workflows_helper.delete_all_workflows()
     endtoend.contracts_helper.deactivate_all_calendars()
+    if endtoend.testhandle.workflow_state_watcher:
+        endtoend.testhandle.workflow_state_watcher.stop()
     if endtoend.testhandle.use_kafka:
         # As setup can fail both consumer and producer could not be properly initialised yet
         # so we check they are non-None
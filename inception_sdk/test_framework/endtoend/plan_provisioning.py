@@ -0,0 +1,277 @@
+# Copyright @ 2024 Thought Machine Group Limited. All rights reserved.
+# standard libs
+import logging
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Callable, Iterable, Iterator, TypeVar
+
+# inception sdk
+import inception_sdk.test_framework.endtoend as endtoend
+import inception_sdk.test_framework.endtoend.supervisors_helper as supervisors_helper
+
+log = logging.getLogger(__name__)
+logging.basicConfig(
+    level=os.environ.get("LOGLEVEL", "INFO"),
+    format="%(asctime)s.%(msecs)03d - %(levelname)s: %(message)s",
+    datefmt="%Y-%m-%d %H:%M:%S",
+)
+
+# Default maximum number of Core API requests that are in flight at once
+DEFAULT_MAX_IN_FLIGHT = 10
+
+CREATE_PLANS_STAGE = "create_plans"
+WAIT_FOR_ACTIVATIONS_STAGE = "wait_for_activations"
+ASSOCIATE_ACCOUNTS_STAGE = "associate_accounts"
+WAIT_FOR_ASSOCIATIONS_STAGE = "wait_for_associations"
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+@dataclass
+class PlanTopology:
+    # supervisor contract name, as per the `supervisorcontract_name_to_id` mapping
+    supervisor_contract: str
+    # ids of the accounts to associate to the plan, in order
+    account_ids: list[str] = field(default_factory=list)
+    plan_id: str | None = None
+    details: dict[str, str] | None = None
+
+
+@dataclass
+class ProvisionedPlan:
+    topology: PlanTopology
+    plan_id: str
+    activation_update_id: str = ""
+    # account id to the id of the plan update that associated it to the plan
+    association_update_ids: dict[str, str] = field(default_factory=dict)
+
+
+@dataclass
+class StageLatency:
+    name: str
+    # wall clock duration of the stage, in seconds
+    duration: float
+    # latency of each individual request sent during the stage, in seconds
+    request_latencies: list[float] = field(default_factory=list)
+
+    @property
+    def request_count(self) -> int:
+        return len(self.request_latencies)
+
+    @property
+    def mean_request_latency(self) -> float:
+        return sum(self.request_latencies) / self.request_count if self.request_latencies else 0
+
+    @property
+    def max_request_latency(self) -> float:
+        return max(self.request_latencies, default=0)
+
+
+@dataclass
+class ProvisioningReport:
+    stages: list[StageLatency] = field(default_factory=list)
+
+    @property
+    def duration(self) -> float:
+        return sum(stage.duration for stage in self.stages)
+
+    def get_stage(self, name: str) -> StageLatency:
+        return next(stage for stage in self.stages if stage.name == name)
+
+    def summary(self) -> str:
+        lines = [f"Provisioning took {self.duration:.3f}s"]
+        lines.extend(
+            f"  {stage.name}: {stage.duration:.3f}s for {stage.request_count} request(s) "
+            f"(mean {stage.mean_request_latency:.3f}s, max {stage.max_request_latency:.3f}s)"
+            for stage in self.stages
+        )
+        return "\n".join(lines)
+
+
+@dataclass
+class ProvisioningResult:
+    plans: list[ProvisionedPlan]
+    report: ProvisioningReport
+
+
+class CoreApiPlanClient:
+    """
+    The Core API calls made while provisioning plans. Tests can provide a subclass that fakes
+    the Core API instead
+    """
+
+    def get_supervisor_contract_version_id(self, supervisor_contract: str) -> str:
+        return endtoend.testhandle.supervisorcontract_name_to_id[supervisor_contract]
+
+    def create_plan(
+        self,
+        supervisor_contract_version_id: str,
+        plan_id: str | None = None,
+        details: dict[str, str] | None = None,
+    ) -> str:
+        """
+        Creates a plan without waiting for it to be activated
+        :return: the plan id
+        """
+        return supervisors_helper.create_plan(
+            supervisor_contract_version_id=supervisor_contract_version_id,
+            plan_id=plan_id,
+            details=details,
+            wait_for_activation=False,
+        )["id"]
+
+    def get_activation_update_id(self, plan_id: str) -> str:
+        return supervisors_helper.get_latest_plan_update_id_by_type(plan_id, "activation_update")
+
+    def create_association(self, plan_id: str, account_id: str) -> str:
+        """
+        Creates the plan update associating an account to a plan, without waiting for it
+        :return: the plan update id
+        """
+        return supervisors_helper.create_plan_update(
+            plan_id=plan_id,
+            plan_update_type="associate_account_update",
+            update={"account_id": account_id},
+        )["id"]
+
+    def wait_for_plan_updates(self, plan_update_ids: list[str]) -> None:
+        supervisors_helper.wait_for_plan_updates(plan_update_ids=plan_update_ids)
+
+
+class PlanProvisioner:
+    """
+    Provisions plans and their account associations in bulk. Requests are sent concurrently,
+    with at most `max_in_flight` outstanding at once, and each stage waits for all of its plan
+    updates at once, rather than one at a time
+    """
+
+    def __init__(
+        self,
+        client: CoreApiPlanClient | None = None,
+        max_in_flight: int = DEFAULT_MAX_IN_FLIGHT,
+    ):
+        """
+        :param client: the client to send requests with. Defaults to the real Core API
+        :param max_in_flight: maximum number of concurrent requests
+        """
+        if max_in_flight < 1:
+            raise ValueError(f"max_in_flight must be at least 1, got {max_in_flight}")
+        self.client = client or CoreApiPlanClient()
+        self.max_in_flight = max_in_flight
+
+    def provision(self, topologies: Iterable[PlanTopology]) -> ProvisioningResult:
+        """
+        Creates the plans, waits for them to be activated, then associates their accounts and
+        waits for the associations to complete
+        :param topologies: the plans to create
+        :return: the provisioned plans, in the same order as the topologies, and the latency of
+        each stage
+        """
+        topologies = list(topologies)
+        report = ProvisioningReport()
+
+        with ThreadPoolExecutor(max_workers=self.max_in_flight) as executor:
+            with _record_stage(report, CREATE_PLANS_STAGE) as latencies:
+                plan_ids = _timed_map(executor, self._create_plan, topologies, latencies)
+            plans = [
+                ProvisionedPlan(topology=topology, plan_id=plan_id)
+                for topology, plan_id in zip(topologies, plan_ids)
+            ]
+
+            with _record_stage(report, WAIT_FOR_ACTIVATIONS_STAGE) as latencies:
+                activation_update_ids = _timed_map(
+                    executor, self.client.get_activation_update_id, plan_ids, latencies
+                )
+                self._wait_for_plan_updates(activation_update_ids)
+            for plan, activation_update_id in zip(plans, activation_update_ids):
+                plan.activation_update_id = activation_update_id
+
+            associations = [
+                (plan.plan_id, account_id)
+                for plan in plans
+                for account_id in plan.topology.account_ids
+            ]
+            with _record_stage(report, ASSOCIATE_ACCOUNTS_STAGE) as latencies:
+                association_update_ids = _timed_map(
+                    executor,
+                    lambda association: self.client.create_association(*association),
+                    associations,
+                    latencies,
+                )
+
+        with _record_stage(report, WAIT_FOR_ASSOCIATIONS_STAGE):
+            self._wait_for_plan_updates(association_update_ids)
+
+        plans_by_id = {plan.plan_id: plan for plan in plans}
+        for (plan_id, account_id), plan_update_id in zip(associations, association_update_ids):
+            plans_by_id[plan_id].association_update_ids[account_id] = plan_update_id
+
+        log.info(report.summary())
+        return ProvisioningResult(plans=plans, report=report)
+
+    def _create_plan(self, topology: PlanTopology) -> str:
+        return self.client.create_plan(
+            supervisor_contract_version_id=self.client.get_supervisor_contract_version_id(
+                topology.supervisor_contract
+            ),
+            plan_id=topology.plan_id,
+            details=topology.details,
+        )
+
+    def _wait_for_plan_updates(self, plan_update_ids: list[str]) -> None:
+        # all updates are waited for at once, so only one consumer is needed
+        if plan_update_ids:
+            self.client.wait_for_plan_updates(plan_update_ids)
+
+
+@contextmanager
+def _record_stage(report: ProvisioningReport, name: str) -> Iterator[list[float]]:
+    """
+    Records the duration of a stage, and the request latencies appended to the yielded list. The
+    stage is recorded even if it fails
+    """
+    request_latencies: list[float] = []
+    start = time.perf_counter()
+    try:
+        yield request_latencies
+    finally:
+        report.stages.append(StageLatency(name, time.perf_counter() - start, request_latencies))
+
+
+def _timed_map(
+    executor: ThreadPoolExecutor,
+    func: Callable[[T], R],
+    items: list[T],
+    request_latencies: list[float],
+) -> list[R]:
+    """
+    Calls func for each item concurrently, preserving order and recording each call's latency.
+    The first exception raised by func is re-raised
+    """
+
+    def timed(item: T) -> R:
+        start = time.perf_counter()
+        result = func(item)
+        request_latencies.append(time.perf_counter() - start)
+        return result
+
+    return list(executor.map(timed, items))
+
+
+def provision_plans(
+    topologies: Iterable[PlanTopology],
+    max_in_flight: int = DEFAULT_MAX_IN_FLIGHT,
+    client: CoreApiPlanClient | None = None,
+) -> ProvisioningResult:
+    """
+    Bulk equivalent of `supervisors_helper.link_accounts_to_supervisor` for many plans
+    :param topologies: the plans to create and the accounts to associate to each of them
+    :param max_in_flight: maximum number of concurrent Core API requests
+    :param client: the client to send requests with. Defaults to the real Core API
+    :return: the provisioned plans and the latency of each stage
+    """
+    return PlanProvisioner(client=client, max_in_flight=max_in_flight).provision(topologies)
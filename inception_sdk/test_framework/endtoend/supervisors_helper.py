@@ -192,6 +192,23 @@ def get_plan_updates_by_ids(plan_update_ids: list[str]) -> dict[str, dict]:
     return resp["plan_updates"]
 
 
+def get_latest_plan_update_id_by_type(plan_id: str, plan_update_type: str) -> str:
+    """
+    Gets the id of the latest plan update of a given type, retrying until one exists
+    :param plan_id: the plan id to get the plan update for
+    :param plan_update_type: the plan update type, e.g. `activation_update`
+    :return: the plan update id
+    """
+    plan_updates = endtoend.helper.retry_call(
+        func=get_plan_updates_by_type,
+        f_kwargs={"plan_id": plan_id, "update_types": [plan_update_type]},
+        expected_result=True,
+        result_wrapper=lambda x: len(x) > 0,
+        failure_message=f"No plan updates for plan {plan_id} could be found.",
+    )
+    return plan_updates[-1]["id"]
+
+
 def create_plan_update(
     plan_id: str,
     plan_update_type: str,
@@ -234,14 +251,7 @@ def wait_for_plan_update(
     """
 
     if not plan_update_id:
-        plan_updates = endtoend.helper.retry_call(
-            func=get_plan_updates_by_type,
-            f_kwargs={"plan_id": plan_id, "update_types": [plan_update_type]},
-            expected_result=True,
-            result_wrapper=lambda x: len(x) > 0,
-            failure_message=f"No plan updates for plan {plan_id} could be found.",
-        )[-1]
-        plan_update_id = plan_updates["id"]
+        plan_update_id = get_latest_plan_update_id_by_type(plan_id, plan_update_type)
 
     wait_for_plan_updates(plan_update_ids=[plan_update_id], target_status=target_status)
 
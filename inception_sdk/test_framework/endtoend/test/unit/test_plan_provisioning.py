@@ -0,0 +1,256 @@
+# standard libs
+import threading
+import time
+from unittest import TestCase
+from unittest.mock import patch
+
+# inception sdk
+import inception_sdk.test_framework.endtoend as endtoend
+import inception_sdk.test_framework.endtoend.supervisors_helper as supervisors_helper
+from inception_sdk.test_framework.endtoend.plan_provisioning import (
+    ASSOCIATE_ACCOUNTS_STAGE,
+    CREATE_PLANS_STAGE,
+    WAIT_FOR_ACTIVATIONS_STAGE,
+    WAIT_FOR_ASSOCIATIONS_STAGE,
+    CoreApiPlanClient,
+    PlanProvisioner,
+    PlanTopology,
+    ProvisioningReport,
+    _record_stage,
+    provision_plans,
+)
+
+
+class FakeCoreApiPlanClient(CoreApiPlanClient):
+    """
+    In-process fake of the Core API plan endpoints that tracks how many requests are in flight
+    """
+
+    def __init__(self, request_latency: float = 0.01, failing_account_ids: set[str] | None = None):
+        self.request_latency = request_latency
+        self.failing_account_ids = failing_account_ids or set()
+        self.plans: dict[str, str] = {}
+        self.plan_updates: dict[str, dict[str, str]] = {}
+        self.wait_calls: list[list[str]] = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self._lock = threading.Lock()
+
+    def _request(self) -> None:
+        with self._lock:
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        time.sleep(self.request_latency)
+        with self._lock:
+            self.in_flight -= 1
+
+    def _add_plan_update(self, plan_id: str, plan_update_type: str) -> str:
+        with self._lock:
+            plan_update_id = f"plan_update_{len(self.plan_updates)}"
+            self.plan_updates[plan_update_id] = {"plan_id": plan_id, "type": plan_update_type}
+        return plan_update_id
+
+    def get_supervisor_contract_version_id(self, supervisor_contract: str) -> str:
+        return f"{supervisor_contract}_version"
+
+    def create_plan(self, supervisor_contract_version_id, plan_id=None, details=None) -> str:
+        self._request()
+        with self._lock:
+            final_plan_id = plan_id or f"plan_{len(self.plans)}"
+            self.plans[final_plan_id] = supervisor_contract_version_id
+        self._add_plan_update(final_plan_id, "activation_update")
+        return final_plan_id
+
+    def get_activation_update_id(self, plan_id: str) -> str:
+        self._request()
+        return next(
+            plan_update_id
+            for plan_update_id, plan_update in self.plan_updates.items()
+            if plan_update == {"plan_id": plan_id, "type": "activation_update"}
+        )
+
+    def create_association(self, plan_id: str, account_id: str) -> str:
+        self._request()
+        if account_id in self.failing_account_ids:
+            raise Exception(f"Account {account_id} could not be associated")
+        return self._add_plan_update(plan_id, f"associate_account_update_{account_id}")
+
+    def wait_for_plan_updates(self, plan_update_ids: list[str]) -> None:
+        self.wait_calls.append(plan_update_ids)
+
+
+class PlanProvisionerTest(TestCase):
+    def setUp(self) -> None:
+        self.client = FakeCoreApiPlanClient()
+        self.topologies = [
+            PlanTopology(
+                supervisor_contract="loc",
+                account_ids=[f"loc_{i}"] + [f"loan_{i}_{j}" for j in range(5)],
+            )
+            for i in range(4)
+        ]
+
+    def test_plans_are_provisioned_in_topology_order(self):
+        topologies = [
+            PlanTopology(supervisor_contract="loc", account_ids=["account_1", "account_2"]),
+            PlanTopology(supervisor_contract="offset", account_ids=[], plan_id="my_plan"),
+        ]
+
+        result = PlanProvisioner(client=self.client).provision(topologies)
+
+        self.assertEqual([plan.topology for plan in result.plans], topologies)
+        self.assertEqual(result.plans[1].plan_id, "my_plan")
+        self.assertEqual(self.client.plans[result.plans[0].plan_id], "loc_version")
+        self.assertEqual(self.client.plans["my_plan"], "offset_version")
+        for plan in result.plans:
+            self.assertEqual(
+                self.client.plan_updates[plan.activation_update_id],
+                {"plan_id": plan.plan_id, "type": "activation_update"},
+            )
+        self.assertEqual(list(result.plans[0].association_update_ids), ["account_1", "account_2"])
+        self.assertEqual(
+            self.client.plan_updates[result.plans[0].association_update_ids["account_2"]],
+            {"plan_id": result.plans[0].plan_id, "type": "associate_account_update_account_2"},
+        )
+        self.assertEqual(result.plans[1].association_update_ids, {})
+
+    def test_each_stage_waits_for_all_plan_updates_at_once(self):
+        result = PlanProvisioner(client=self.client).provision(self.topologies)
+
+        self.assertEqual(
+            self.client.wait_calls,
+            [
+                [plan.activation_update_id for plan in result.plans],
+                [
+                    plan_update_id
+                    for plan in result.plans
+                    for plan_update_id in plan.association_update_ids.values()
+                ],
+            ],
+        )
+
+    def test_requests_are_concurrent_within_in_flight_limit(self):
+        result = PlanProvisioner(client=self.client, max_in_flight=3).provision(self.topologies)
+
+        self.assertEqual(self.client.max_in_flight, 3)
+        self.assertEqual(len(result.plans), 4)
+
+    def test_requests_are_sequential_with_in_flight_limit_of_one(self):
+        PlanProvisioner(client=self.client, max_in_flight=1).provision(self.topologies)
+
+        self.assertEqual(self.client.max_in_flight, 1)
+
+    def test_invalid_in_flight_limit_raises(self):
+        with self.assertRaisesRegex(ValueError, "max_in_flight must be at least 1, got 0"):
+            PlanProvisioner(client=self.client, max_in_flight=0)
+
+    def test_report_includes_each_stage(self):
+        report = PlanProvisioner(client=self.client).provision(self.topologies).report
+
+        self.assertEqual(
+            [stage.name for stage in report.stages],
+            [
+                CREATE_PLANS_STAGE,
+                WAIT_FOR_ACTIVATIONS_STAGE,
+                ASSOCIATE_ACCOUNTS_STAGE,
+                WAIT_FOR_ASSOCIATIONS_STAGE,
+            ],
+        )
+        self.assertEqual(
+            [stage.request_count for stage in report.stages],
+            [4, 4, 24, 0],
+        )
+        associate_stage = report.get_stage(ASSOCIATE_ACCOUNTS_STAGE)
+        self.assertGreaterEqual(associate_stage.max_request_latency, 0.01)
+        self.assertGreaterEqual(
+            associate_stage.max_request_latency, associate_stage.mean_request_latency
+        )
+        self.assertAlmostEqual(report.duration, sum(stage.duration for stage in report.stages))
+        self.assertIn("associate_accounts", report.summary())
+
+    def test_association_failure_is_raised_without_waiting(self):
+        client = FakeCoreApiPlanClient(failing_account_ids={"loan_1_2"})
+
+        with self.assertRaisesRegex(Exception, "Account loan_1_2 could not be associated"):
+            PlanProvisioner(client=client).provision(self.topologies)
+
+        self.assertEqual(len(client.wait_calls), 1)
+
+    def test_failed_stage_is_recorded(self):
+        report = ProvisioningReport()
+
+        with self.assertRaisesRegex(ValueError, "request failed"):
+            with _record_stage(report, CREATE_PLANS_STAGE) as latencies:
+                latencies.append(0.01)
+                raise ValueError("request failed")
+
+        self.assertEqual([stage.name for stage in report.stages], [CREATE_PLANS_STAGE])
+        self.assertEqual(report.stages[0].request_latencies, [0.01])
+
+    def test_empty_topology_does_not_wait(self):
+        result = PlanProvisioner(client=self.client).provision([])
+
+        self.assertEqual(result.plans, [])
+        self.assertEqual(self.client.wait_calls, [])
+
+
+class CoreApiPlanClientTest(TestCase):
+    @patch.object(supervisors_helper, "create_plan")
+    def test_create_plan_does_not_wait_for_activation(self, mock_create_plan):
+        mock_create_plan.return_value = {"id": "plan_1"}
+
+        self.assertEqual(CoreApiPlanClient().create_plan("version_1"), "plan_1")
+        mock_create_plan.assert_called_once_with(
+            supervisor_contract_version_id="version_1",
+            plan_id=None,
+            details=None,
+            wait_for_activation=False,
+        )
+
+    @patch.object(supervisors_helper, "create_plan_update")
+    def test_create_association(self, mock_create_plan_update):
+        mock_create_plan_update.return_value = {"id": "plan_update_1"}
+
+        self.assertEqual(
+            CoreApiPlanClient().create_association("plan_1", "account_1"), "plan_update_1"
+        )
+        mock_create_plan_update.assert_called_once_with(
+            plan_id="plan_1",
+            plan_update_type="associate_account_update",
+            update={"account_id": "account_1"},
+        )
+
+    def test_supervisor_contract_version_id_is_looked_up_by_name(self):
+        with patch.object(
+            endtoend.testhandle, "supervisorcontract_name_to_id", {"loc": "loc_version_id"}
+        ):
+            self.assertEqual(
+                CoreApiPlanClient().get_supervisor_contract_version_id("loc"), "loc_version_id"
+            )
+
+    @patch.object(supervisors_helper, "wait_for_plan_updates")
+    @patch.object(supervisors_helper, "create_plan_update")
+    @patch.object(supervisors_helper, "get_latest_plan_update_id_by_type")
+    @patch.object(supervisors_helper, "create_plan")
+    def test_provision_plans_uses_core_api_by_default(
+        self,
+        mock_create_plan,
+        mock_get_latest_plan_update_id_by_type,
+        mock_create_plan_update,
+        mock_wait_for_plan_updates,
+    ):
+        mock_create_plan.return_value = {"id": "plan_1"}
+        mock_get_latest_plan_update_id_by_type.return_value = "activation_1"
+        mock_create_plan_update.return_value = {"id": "association_1"}
+
+        with patch.object(endtoend.testhandle, "supervisorcontract_name_to_id", {"loc": "v1"}):
+            result = provision_plans([PlanTopology("loc", ["account_1"])])
+
+        self.assertEqual(result.plans[0].association_update_ids, {"account_1": "association_1"})
+        mock_get_latest_plan_update_id_by_type.assert_called_once_with(
+            "plan_1", "activation_update"
+        )
+        self.assertEqual(
+            [call.kwargs for call in mock_wait_for_plan_updates.call_args_list],
+            [{"plan_update_ids": ["activation_1"]}, {"plan_update_ids": ["association_1"]}],
+        )
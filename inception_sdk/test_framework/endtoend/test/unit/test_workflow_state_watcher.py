@@ -0,0 +1,295 @@
+# standard libs
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from typing import Any
+from unittest import TestCase
+from unittest.mock import Mock, patch
+
+# inception sdk
+import inception_sdk.test_framework.endtoend as endtoend
+import inception_sdk.test_framework.endtoend.workflow_state_watcher as workflow_state_watcher
+import inception_sdk.test_framework.endtoend.workflows_helper as workflows_helper
+from inception_sdk.test_framework.endtoend.workflow_state_watcher import (
+    PollingEventSource,
+    QueueEventSource,
+    WorkflowStateEvent,
+    WorkflowStateWatcher,
+)
+
+
+def _state(state_id: str, state_name: str, age: timedelta = timedelta()) -> dict[str, Any]:
+    return {
+        "id": state_id,
+        "state_name": state_name,
+        "timestamp": (datetime.utcnow() - age).strftime("%Y-%m-%dT%H:%M:%S.%fZ"),
+    }
+
+
+class FakeWorkflows:
+    """
+    In-process fake of the workflows API, publishing state changes to a QueueEventSource
+    """
+
+    def __init__(self):
+        self.event_source = QueueEventSource()
+        self.latest_states: dict[str, dict[str, Any]] = {}
+        self.get_latest_state_calls = 0
+
+    def transition(self, instance_id: str, state_id: str, state_name: str, **kwargs) -> None:
+        self.latest_states[instance_id] = _state(state_id, state_name, **kwargs)
+        self.event_source.publish(WorkflowStateEvent(instance_id, self.latest_states[instance_id]))
+
+    def get_latest_state(self, instance_id: str) -> dict[str, Any]:
+        self.get_latest_state_calls += 1
+        return self.latest_states[instance_id]
+
+
+class WorkflowStateWatcherTest(TestCase):
+    def setUp(self) -> None:
+        self.workflows = FakeWorkflows()
+        self.watcher = WorkflowStateWatcher(
+            event_source=self.workflows.event_source,
+            poll_timeout=0.05,
+            get_latest_state=self.workflows.get_latest_state,
+        )
+        self.addCleanup(self.watcher.stop)
+
+    def _wait_in_background(self, executor: ThreadPoolExecutor, instance_id: str, state: str):
+        future = executor.submit(self.watcher.wait_for_state, instance_id, state, overall_timeout=5)
+        # wait for the waiter to be registered before transitioning
+        while instance_id not in self.watcher._waiters:
+            threading.Event().wait(0.01)
+        return future
+
+    def test_returns_immediately_if_already_in_state(self):
+        self.workflows.latest_states["wf_1"] = _state("state_1", "done")
+
+        self.assertEqual(self.watcher.wait_for_state("wf_1", "done")["id"], "state_1")
+
+    def test_concurrent_waiters_are_completed_from_one_event_source(self):
+        instance_ids = [f"wf_{i}" for i in range(10)]
+        for instance_id in instance_ids:
+            self.workflows.latest_states[instance_id] = _state(f"{instance_id}_0", "start")
+
+        with ThreadPoolExecutor(max_workers=len(instance_ids)) as executor:
+            futures = [
+                self._wait_in_background(executor, instance_id, "done")
+                for instance_id in instance_ids
+            ]
+            for instance_id in instance_ids:
+                self.workflows.transition(instance_id, f"{instance_id}_1", "middle")
+                self.workflows.transition(instance_id, f"{instance_id}_2", "done")
+
+            results = [future.result(timeout=5) for future in futures]
+
+        self.assertEqual([result["id"] for result in results], [f"{i}_2" for i in instance_ids])
+        # the latest state is only fetched once per waiter, when the instance is first watched
+        self.assertEqual(self.workflows.get_latest_state_calls, len(instance_ids))
+        self.assertEqual(self.watcher._waiters, {})
+
+    def test_intermediate_states_are_matched(self):
+        self.workflows.latest_states["wf_1"] = _state("state_0", "start")
+
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            future = self._wait_in_background(executor, "wf_1", "middle")
+            self.workflows.transition("wf_1", "state_1", "middle")
+            self.workflows.transition("wf_1", "state_2", "done")
+
+            self.assertEqual(future.result(timeout=5)["id"], "state_1")
+
+    def test_starting_state_is_ignored(self):
+        self.workflows.latest_states["wf_1"] = _state("state_1", "waiting")
+
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            future = executor.submit(
+                self.watcher.wait_for_state, "wf_1", "waiting", starting_state_id="state_1"
+            )
+            while "wf_1" not in self.watcher._waiters:
+                threading.Event().wait(0.01)
+            self.workflows.transition("wf_1", "state_2", "waiting")
+
+            self.assertEqual(future.result(timeout=5)["id"], "state_2")
+
+    def test_technical_error_raises(self):
+        self.workflows.latest_states["wf_1"] = _state("state_0", "start")
+
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            future = self._wait_in_background(executor, "wf_1", "done")
+            self.workflows.transition("wf_1", "state_1", "technical_error")
+
+            with self.assertRaisesRegex(
+                workflows_helper.WorkflowStuckError, "stuck in state technical_error"
+            ):
+                future.result(timeout=5)
+
+    def test_overall_timeout_raises(self):
+        self.workflows.latest_states["wf_1"] = _state("state_0", "start")
+
+        with self.assertRaisesRegex(workflows_helper.WorkflowStuckError, "overall timeout"):
+            self.watcher.wait_for_state("wf_1", "done", overall_timeout=0.1)  # type: ignore
+
+    def test_stale_events_do_not_replace_the_latest_state(self):
+        latest_state = _state("state_2", "done")
+        self.watcher.handle_event(WorkflowStateEvent("wf_1", latest_state))
+        self.watcher.handle_event(
+            WorkflowStateEvent("wf_1", _state("state_1", "start", age=timedelta(seconds=5)))
+        )
+
+        self.assertEqual(self.watcher._latest_states["wf_1"], latest_state)
+
+    @patch.object(workflows_helper, "get_child_workflow_id")
+    def test_stuck_parent_checks_child_and_caches_lookup(self, mock_get_child_workflow_id: Mock):
+        mock_get_child_workflow_id.return_value = "child_wf"
+        overdue_state = _state("parent_state", "create_child", age=timedelta(seconds=60))
+        self.workflows.latest_states["child_wf"] = _state("child_state", "processing")
+
+        for _ in range(3):
+            self.assertFalse(self.watcher.is_instance_stuck("parent_wf", overdue_state, 30))
+
+        mock_get_child_workflow_id.assert_called_once_with(
+            "parent_wf", "create_child", wait_for_parent_state=False
+        )
+        self.assertEqual(self.workflows.get_latest_state_calls, 3)
+
+    @patch.object(workflows_helper, "get_child_workflow_id")
+    def test_stuck_parent_checks_the_latest_child_state(self, mock_get_child_workflow_id: Mock):
+        mock_get_child_workflow_id.side_effect = [
+            "child_wf",
+            workflows_helper.ChildWorkflowError("no child"),
+        ]
+        overdue_state = _state("parent_state", "create_child", age=timedelta(seconds=60))
+        # the watcher has recorded a recent child state, but the child has since made no progress
+        self.watcher.handle_event(
+            WorkflowStateEvent("child_wf", _state("child_state", "processing"))
+        )
+        self.workflows.latest_states["child_wf"] = _state(
+            "child_state_2", "waiting", age=timedelta(seconds=60)
+        )
+
+        self.assertTrue(self.watcher.is_instance_stuck("parent_wf", overdue_state, 30))
+        self.assertEqual(self.workflows.get_latest_state_calls, 1)
+
+    @patch.object(workflow_state_watcher, "STUCK_RECHECK_INTERVAL_SECS", 0.01)
+    @patch.object(workflows_helper, "get_child_workflow_id")
+    def test_wait_for_state_raises_if_parent_and_child_are_stuck(
+        self, mock_get_child_workflow_id: Mock
+    ):
+        mock_get_child_workflow_id.side_effect = [
+            "child_wf",
+            workflows_helper.ChildWorkflowError("no child"),
+        ]
+        self.workflows.latest_states["parent_wf"] = _state(
+            "parent_state", "create_child", age=timedelta(seconds=60)
+        )
+        # the watcher has recorded a recent child state, but the child has since made no progress
+        self.watcher.handle_event(
+            WorkflowStateEvent("child_wf", _state("child_state", "processing"))
+        )
+        self.workflows.latest_states["child_wf"] = _state(
+            "child_state_2", "waiting", age=timedelta(seconds=60)
+        )
+
+        with self.assertRaisesRegex(
+            workflows_helper.WorkflowStuckError, "parent_wf stuck in state create_child"
+        ):
+            self.watcher.wait_for_state(
+                "parent_wf", "done", transition_timeout=30, overall_timeout=5
+            )
+
+    @patch.object(workflow_state_watcher, "STUCK_RECHECK_INTERVAL_SECS", 0.01)
+    @patch.object(workflows_helper, "get_child_workflow_id")
+    def test_wait_for_state_waits_for_parent_while_child_progresses(
+        self, mock_get_child_workflow_id: Mock
+    ):
+        mock_get_child_workflow_id.return_value = "child_wf"
+        self.workflows.latest_states["parent_wf"] = _state(
+            "parent_state", "create_child", age=timedelta(seconds=60)
+        )
+        self.workflows.latest_states["child_wf"] = _state("child_state", "processing")
+
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            future = executor.submit(
+                self.watcher.wait_for_state,
+                "parent_wf",
+                "done",
+                transition_timeout=30,
+                overall_timeout=5,
+            )
+            # wait for the parent to be checked against its child at least once
+            while self.workflows.get_latest_state_calls < 2:
+                threading.Event().wait(0.01)
+            self.workflows.transition("parent_wf", "parent_state_2", "done")
+
+            self.assertEqual(future.result(timeout=5)["id"], "parent_state_2")
+
+    @patch.object(workflows_helper, "get_child_workflow_id")
+    def test_stuck_parent_without_child_is_stuck(self, mock_get_child_workflow_id: Mock):
+        mock_get_child_workflow_id.side_effect = workflows_helper.ChildWorkflowError("no child")
+        overdue_state = _state("parent_state", "waiting", age=timedelta(seconds=60))
+
+        self.assertTrue(self.watcher.is_instance_stuck("parent_wf", overdue_state, 30))
+        self.assertTrue(self.watcher.is_instance_stuck("parent_wf", overdue_state, 30))
+        self.assertFalse(self.watcher.is_instance_stuck("parent_wf", overdue_state, 120))
+        mock_get_child_workflow_id.assert_called_once()
+
+    def test_watcher_can_be_restarted(self):
+        self.workflows.latest_states["wf_1"] = _state("state_1", "done")
+        self.watcher.wait_for_state("wf_1", "done")
+        self.watcher.stop()
+
+        self.assertEqual(self.watcher.wait_for_state("wf_1", "done")["id"], "state_1")
+
+
+class PollingEventSourceTest(TestCase):
+    def setUp(self) -> None:
+        self.latest_states = {"wf_1": _state("state_1", "start")}
+        self.source = PollingEventSource(
+            min_interval=0.01,
+            max_interval=0.04,
+            get_latest_state=lambda instance_id: self.latest_states[instance_id],
+        )
+
+    def test_only_changes_are_returned(self):
+        self.assertEqual(len(self.source.poll(["wf_1"], timeout=1)), 1)
+        self.assertEqual(self.source.poll(["wf_1"], timeout=1), [])
+
+        self.latest_states["wf_1"] = _state("state_2", "done")
+
+        self.assertEqual(
+            self.source.poll(["wf_1"], timeout=1),
+            [WorkflowStateEvent("wf_1", self.latest_states["wf_1"])],
+        )
+
+    def test_interval_backs_off_without_changes_and_resets(self):
+        self.source.poll(["wf_1"], timeout=1)
+        intervals = []
+        for _ in range(4):
+            self.source.poll(["wf_1"], timeout=1)
+            intervals.append(self.source.interval)
+
+        self.assertEqual(intervals, [0.02, 0.04, 0.04, 0.04])
+
+        self.latest_states["wf_1"] = _state("state_2", "done")
+        self.source.poll(["wf_1"], timeout=1)
+        self.assertEqual(self.source.interval, 0.01)
+
+        self.source.poll(["wf_1"], timeout=1)
+        self.source.watch("wf_2")
+        self.assertEqual(self.source.interval, 0.01)
+
+
+class WaitForStateTest(TestCase):
+    def test_wait_for_state_delegates_to_watcher(self):
+        mock_watcher = Mock()
+        with patch.object(endtoend.testhandle, "workflow_state_watcher", mock_watcher):
+            result = workflows_helper.wait_for_state("wf_1", "done", starting_state_id="state_1")
+
+        self.assertEqual(result, mock_watcher.wait_for_state.return_value)
+        mock_watcher.wait_for_state.assert_called_once_with(
+            "wf_1",
+            "done",
+            starting_state_id="state_1",
+            transition_timeout=workflows_helper.DEFAULT_TIMEOUT_SECS,
+            overall_timeout=120,
+        )
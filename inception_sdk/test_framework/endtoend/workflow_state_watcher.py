@@ -0,0 +1,376 @@
+# Copyright @ 2024 Thought Machine Group Limited. All rights reserved.
+# standard libs
+import logging
+import os
+import queue
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import defaultdict
+from concurrent.futures import Future, TimeoutError as FutureTimeoutError
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Callable, Collection
+
+# inception sdk
+import inception_sdk.test_framework.endtoend.workflows_api_helper as workflows_api
+import inception_sdk.test_framework.endtoend.workflows_helper as workflows_helper
+
+log = logging.getLogger(__name__)
+logging.basicConfig(
+    level=os.environ.get("LOGLEVEL", "INFO"),
+    format="%(asctime)s.%(msecs)03d - %(levelname)s: %(message)s",
+    datefmt="%Y-%m-%d %H:%M:%S",
+)
+
+# Minimum time between checks for stuck workflows while a state is awaited, in seconds
+STUCK_RECHECK_INTERVAL_SECS = 1.0
+
+
+def get_latest_state(instance_id: str) -> dict[str, Any]:
+    return workflows_api.get_workflow_instance_states(
+        instance_id,
+        workflows_api.WorkflowStateOrderBy.ORDER_BY_TIMESTAMP_DESC,
+        result_limit=1,
+    )[0]
+
+
+@dataclass
+class WorkflowStateEvent:
+    workflow_instance_id: str
+    # the state the instance transitioned to, as per the workflow instance states API. Must include
+    # the `id`, `state_name` and `timestamp` keys
+    state: dict[str, Any]
+
+
+class WorkflowStateEventSource(ABC):
+    """
+    Source of workflow state changes that a WorkflowStateWatcher subscribes to
+    """
+
+    @abstractmethod
+    def poll(self, instance_ids: Collection[str], timeout: float) -> list[WorkflowStateEvent]:
+        """
+        Waits for state changes
+        :param instance_ids: ids of the instances that are being watched. Sources may return
+        events for other instances too
+        :param timeout: max number of seconds to wait for events
+        :return: the events received, which may be empty
+        """
+
+    def watch(self, instance_id: str) -> None:
+        """
+        Called when an instance starts being watched
+        :param instance_id: the instance id
+        """
+
+    def close(self) -> None:
+        pass
+
+
+class QueueEventSource(WorkflowStateEventSource):
+    """
+    In-process source that events are published to, e.g. by a Kafka consumer callback or a test
+    """
+
+    def __init__(self):
+        self._events: queue.Queue[WorkflowStateEvent] = queue.Queue()
+
+    def publish(self, event: WorkflowStateEvent) -> None:
+        self._events.put(event)
+
+    def poll(self, instance_ids: Collection[str], timeout: float) -> list[WorkflowStateEvent]:
+        try:
+            events = [self._events.get(timeout=timeout)]
+        except queue.Empty:
+            return []
+        # drain any other events so that they are handled in a single batch
+        while True:
+            try:
+                events.append(self._events.get_nowait())
+            except queue.Empty:
+                return events
+
+
+class PollingEventSource(WorkflowStateEventSource):
+    """
+    Fallback source that polls the latest state of each watched instance. The polling interval
+    backs off while no state changes are seen, and is reset as soon as a change is seen or a new
+    instance is watched
+    """
+
+    def __init__(
+        self,
+        min_interval: float = 0.1,
+        max_interval: float = 2.0,
+        backoff_factor: float = 2.0,
+        get_latest_state: Callable[[str], dict[str, Any]] = get_latest_state,
+    ):
+        """
+        :param min_interval: the initial polling interval, in seconds
+        :param max_interval: the max polling interval, in seconds
+        :param backoff_factor: the interval is multiplied by this after each poll without changes
+        :param get_latest_state: returns the latest state of an instance
+        """
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.backoff_factor = backoff_factor
+        self.interval = min_interval
+        self._get_latest_state = get_latest_state
+        # instance id to the id of the latest state that was seen
+        self._latest_state_ids: dict[str, str] = {}
+        self._wake = threading.Event()
+
+    def watch(self, instance_id: str) -> None:
+        self.interval = self.min_interval
+        self._wake.set()
+
+    def close(self) -> None:
+        self._wake.set()
+
+    def poll(self, instance_ids: Collection[str], timeout: float) -> list[WorkflowStateEvent]:
+        self._wake.clear()
+        events = []
+        for instance_id in instance_ids:
+            latest_state = self._get_latest_state(instance_id)
+            if latest_state["id"] != self._latest_state_ids.get(instance_id):
+                self._latest_state_ids[instance_id] = latest_state["id"]
+                events.append(WorkflowStateEvent(instance_id, latest_state))
+        if events:
+            self.interval = self.min_interval
+        else:
+            self._wake.wait(min(self.interval, timeout))
+            self.interval = min(self.interval * self.backoff_factor, self.max_interval)
+        return events
+
+
+@dataclass
+class _StateWaiter:
+    state_name: str
+    starting_state_id: str
+    future: Future = field(default_factory=Future)
+
+    def matches(self, state: dict[str, Any]) -> bool:
+        return state["state_name"] == self.state_name and state["id"] != self.starting_state_id
+
+
+class WorkflowStateWatcher:
+    """
+    Consumes workflow state changes from a single event source on a background thread and fans them
+    out to any number of callers waiting for workflow states, e.g. concurrent e2e tests
+    """
+
+    def __init__(
+        self,
+        event_source: WorkflowStateEventSource | None = None,
+        poll_timeout: float = 0.5,
+        get_latest_state: Callable[[str], dict[str, Any]] = get_latest_state,
+    ):
+        """
+        :param event_source: the source of state changes. Defaults to a PollingEventSource
+        :param poll_timeout: max number of seconds the background thread waits for events before
+        checking whether it was stopped
+        :param get_latest_state: returns the latest state of an instance. Used once per watched
+        instance, as the state may have been reached before the instance was watched, and for each
+        check of whether a child workflow is stuck
+        """
+        self.event_source = event_source or PollingEventSource(get_latest_state=get_latest_state)
+        self.poll_timeout = poll_timeout
+        self._get_latest_state = get_latest_state
+        self._condition = threading.Condition()
+        self._waiters: defaultdict[str, list[_StateWaiter]] = defaultdict(list)
+        self._latest_states: dict[str, dict[str, Any]] = {}
+        # (parent instance id, parent state id) to the child instance id, or None if the state
+        # does not spawn children. A given state of an instance always spawns the same children
+        self._child_workflow_ids: dict[tuple[str, str], str | None] = {}
+        self._thread: threading.Thread | None = None
+        self._stopped = False
+
+    def start(self) -> None:
+        with self._condition:
+            if self._thread is not None:
+                return
+            self._stopped = False
+            self._thread = threading.Thread(
+                target=self._run, name="workflow-state-watcher", daemon=True
+            )
+            self._thread.start()
+
+    def stop(self) -> None:
+        with self._condition:
+            thread = self._thread
+            self._stopped = True
+            self._thread = None
+            self._condition.notify_all()
+        self.event_source.close()
+        if thread is not None:
+            thread.join()
+
+    def _run(self) -> None:
+        while True:
+            with self._condition:
+                # the event source is only polled while there are callers waiting
+                while not self._waiters and not self._stopped:
+                    self._condition.wait()
+                if self._stopped:
+                    return
+                instance_ids = list(self._waiters)
+            try:
+                events = self.event_source.poll(instance_ids, self.poll_timeout)
+            except Exception as e:
+                # waiters fail on their own timeouts rather than being interrupted
+                log.warning(f"Failed to poll workflow state events: {e!r}")
+                time.sleep(self.poll_timeout)
+                continue
+            for event in events:
+                self.handle_event(event)
+
+    def handle_event(self, event: WorkflowStateEvent) -> None:
+        """
+        Records a state change and completes the waiters it satisfies. Events may be handled out of
+        order, e.g. if the initial state of an instance is fetched while events are received
+        :param event: the state change
+        """
+        instance_id = event.workflow_instance_id
+        state = event.state
+        with self._condition:
+            latest_state = self._latest_states.get(instance_id)
+            if latest_state is None or workflows_helper.parse_state_timestamp(
+                state["timestamp"]
+            ) >= workflows_helper.parse_state_timestamp(latest_state["timestamp"]):
+                self._latest_states[instance_id] = state
+            waiters = self._waiters.get(instance_id, [])
+            for waiter in list(waiters):
+                if waiter.future.done():
+                    continue
+                if waiter.matches(state):
+                    waiter.future.set_result(state)
+                # We assume that a workflow in technical_error is stuck, as per is_instance_stuck
+                elif state["state_name"] == workflows_api.STATE_TECHNICAL_ERROR:
+                    waiter.future.set_exception(
+                        workflows_helper.WorkflowStuckError(
+                            f"{datetime.utcnow()} - Workflow {instance_id} stuck in state "
+                            f'{state["state_name"]} since {state["timestamp"]}'
+                        )
+                    )
+
+    def _add_waiter(self, instance_id: str, waiter: _StateWaiter) -> None:
+        with self._condition:
+            self._waiters[instance_id].append(waiter)
+            self._condition.notify_all()
+        self.event_source.watch(instance_id)
+
+    def _remove_waiter(self, instance_id: str, waiter: _StateWaiter) -> None:
+        with self._condition:
+            waiters = self._waiters.get(instance_id, [])
+            if waiter in waiters:
+                waiters.remove(waiter)
+            if not waiters:
+                self._waiters.pop(instance_id, None)
+
+    def get_child_workflow_id(self, parent_instance_id: str, parent_state: dict[str, Any]) -> str:
+        """
+        Cached version of workflows_helper.get_child_workflow_id for a parent that is already in
+        the given state
+        :param parent_instance_id: the parent workflow instance id
+        :param parent_state: the current state of the parent instance
+        :return: the child workflow id
+        """
+        key = (parent_instance_id, parent_state["id"])
+        if key not in self._child_workflow_ids:
+            try:
+                self._child_workflow_ids[key] = workflows_helper.get_child_workflow_id(
+                    parent_instance_id, parent_state["state_name"], wait_for_parent_state=False
+                )
+            except workflows_helper.ChildWorkflowError:
+                self._child_workflow_ids[key] = None
+        child_workflow_id = self._child_workflow_ids[key]
+        if child_workflow_id is None:
+            raise workflows_helper.ChildWorkflowError(
+                f"State {parent_state['state_name']} of instance {parent_instance_id} doesn't "
+                f"instantiate a child workflow"
+            )
+        return child_workflow_id
+
+    def is_instance_stuck(
+        self,
+        instance_id: str,
+        latest_state: dict[str, Any],
+        transition_timeout: int = workflows_helper.DEFAULT_TIMEOUT_SECS,
+    ) -> bool:
+        """
+        Equivalent to workflows_helper.is_instance_stuck, but child workflow id lookups are cached.
+        The child's latest state is always fetched
+        """
+        if latest_state["state_name"] == workflows_api.STATE_TECHNICAL_ERROR:
+            return True
+        if not workflows_helper.is_transition_overdue(latest_state, transition_timeout):
+            return False
+        # parent instance only considered stuck if the child is also stuck
+        try:
+            child_workflow_id = self.get_child_workflow_id(instance_id, latest_state)
+        except workflows_helper.ChildWorkflowError:
+            # No child workflow can be found, so parent is genuinely stuck
+            return True
+        # the child isn't necessarily watched, so its recorded state may be stale
+        return self.is_instance_stuck(child_workflow_id, self._get_latest_state(child_workflow_id))
+
+    def wait_for_state(
+        self,
+        wf_id: str,
+        state_name: str,
+        starting_state_id: str = "",
+        transition_timeout: int = workflows_helper.DEFAULT_TIMEOUT_SECS,
+        overall_timeout: int = 120,
+    ) -> dict[str, Any]:
+        """
+        Equivalent to workflows_helper.wait_for_state. The state is matched against every state
+        change received, rather than only the latest state at each poll
+        :param wf_id: the workflow instance id for the instance we're expecting to progress
+        :param state_name: the state we're expecting the workflow to progress to
+        :param starting_state_id: if populated, a state with this id is not matched. This ensures
+        an actual transition occurs before returning
+        :param transition_timeout: time in seconds before we consider workflow to be stuck. Reset
+        every time one or more state transitions are detected
+        :param overall_timeout: time in seconds before we consider workflow to be stuck. Never
+        reset
+        :return: the state that was waited for
+        """
+        start_time = datetime.utcnow()
+        deadline = time.monotonic() + overall_timeout
+        waiter = _StateWaiter(state_name=state_name, starting_state_id=starting_state_id)
+        self.start()
+        self._add_waiter(wf_id, waiter)
+        try:
+            # the instance may already be in the state, in which case no event will be received
+            self.handle_event(WorkflowStateEvent(wf_id, self._get_latest_state(wf_id)))
+            while True:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    raise workflows_helper.WorkflowStuckError(
+                        f"{datetime.utcnow()} - "
+                        f"Workflow {wf_id} failed to reach state {state_name} after"
+                        f" overall timeout of {overall_timeout} seconds"
+                    )
+                latest_state = self._latest_states[wf_id]
+                seconds_until_overdue = (
+                    workflows_helper.parse_state_timestamp(latest_state["timestamp"])
+                    - datetime.utcnow()
+                ).total_seconds() + transition_timeout
+                try:
+                    return waiter.future.result(
+                        timeout=min(
+                            remaining, max(seconds_until_overdue, STUCK_RECHECK_INTERVAL_SECS)
+                        )
+                    )
+                except FutureTimeoutError:
+                    pass
+                latest_state = self._latest_states[wf_id]
+                if self.is_instance_stuck(wf_id, latest_state, transition_timeout):
+                    raise workflows_helper.WorkflowStuckError(
+                        f"{datetime.utcnow()} - "
+                        f'Workflow {wf_id} stuck in state {latest_state["state_name"]}'
+                        f' since {latest_state["timestamp"]}. Started checks at {start_time}'
+                    )
+        finally:
+            self._remove_waiter(wf_id, waiter)
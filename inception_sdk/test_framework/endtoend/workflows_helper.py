@@ -62,6 +62,35 @@ def reload_workflow(wf_id):
     return resp["workflow_instances"][wf_id]
 
 
+def parse_state_timestamp(timestamp: str) -> datetime:
+    """
+    Parses a workflow instance state timestamp
+    :param timestamp: the timestamp, with or without fractional seconds
+    :return: naive datetime representing UTC time
+    """
+    try:
+        return datetime.strptime(timestamp, "%Y-%m-%dT%H:%M:%S.%fZ")
+    except ValueError:
+        return datetime.strptime(timestamp, "%Y-%m-%dT%H:%M:%SZ")
+
+
+def is_transition_overdue(
+    latest_state: dict[str, Any], transition_timeout: int = DEFAULT_TIMEOUT_SECS
+) -> bool:
+    """
+    Determines whether an instance has spent more than transition_timeout seconds in its latest
+    state
+    :param latest_state: the latest workflow state
+    :param transition_timeout: max number of seconds before we expect a transition to occur
+    :return: True if the transition is overdue, False otherwise
+    """
+    # Both naive datetimes representing UTC time
+    return (
+        parse_state_timestamp(latest_state["timestamp"]) + timedelta(seconds=transition_timeout)
+        < datetime.utcnow()
+    )
+
+
 def is_instance_stuck(
     instance_id: str,
     transition_timeout: int = DEFAULT_TIMEOUT_SECS,
@@ -93,12 +122,7 @@ def is_instance_stuck(
         return True
 
     # We consider a workflow to be stuck if it hasn't transitioned in transition_timeout seconds.
-    try:
-        latest_state_ts = datetime.strptime(latest_state["timestamp"], "%Y-%m-%dT%H:%M:%S.%fZ")
-    except ValueError:
-        latest_state_ts = datetime.strptime(latest_state["timestamp"], "%Y-%m-%dT%H:%M:%SZ")
-    # Both naive datetimes representing UTC time
-    if latest_state_ts + timedelta(seconds=transition_timeout) < datetime.utcnow():
+    if is_transition_overdue(latest_state, transition_timeout):
         # parent instance only considered stuck if the child is also stuck
         log.info("checking children")
         try:
@@ -134,6 +158,16 @@ def wait_for_state(
     :return: the state that was waited for
     """
 
+    # state changes are pushed to all waiting tests by a single watcher, if the test class uses one
+    if endtoend.testhandle.workflow_state_watcher is not None:
+        return endtoend.testhandle.workflow_state_watcher.wait_for_state(
+            wf_id,
+            state_name,
+            starting_state_id=starting_state_id,
+            transition_timeout=transition_timeout,
+            overall_timeout=overall_timeout,
+        )
+
     start_time = datetime.utcnow()
 
     while datetime.utcnow() - timedelta(seconds=overall_timeout) < start_time:
@@ -0,0 +1,260 @@
+# standard libs
+import os
+import tempfile
+import threading
+from typing import Any
+from unittest import TestCase
+from unittest.mock import Mock, patch
+
+# third party
+import requests
+from absl.testing import flagsaver
+
+# inception sdk
+import inception_sdk.test_framework.workflows.simulation.workflows_api_test_base as test_base
+from inception_sdk.common.python.flag_utils import FLAGS
+from inception_sdk.test_framework.workflows.simulation.transports import (
+    CachingTransport,
+    HttpTransport,
+    MissingRecordingError,
+    ReplayTransport,
+    ResponseCache,
+    TransportResponse,
+    WorkflowsApiTransport,
+)
+from inception_sdk.test_framework.workflows.simulation.workflows_api_client import (
+    SIMULATE_WORKFLOW_URL,
+    WorkflowsApiClient,
+)
+
+SPECIFICATION = "---\nname: Test Workflow\ninstance_title: Test\n"
+
+
+class FakeTransport(WorkflowsApiTransport):
+    def __init__(self, barrier: threading.Barrier | None = None):
+        self.requests: list[dict[str, Any]] = []
+        self.barrier = barrier
+
+    def post(self, url: str, payload: dict[str, Any]) -> TransportResponse:
+        self.requests.append(payload)
+        if self.barrier:
+            # only completes once enough simulations are in flight at the same time
+            self.barrier.wait(timeout=5)
+        return TransportResponse(
+            status_code=200, body={"steps": [{"state": {"name": payload["starting_state"]}}]}
+        )
+
+
+def _simulation(starting_state: str) -> dict[str, Any]:
+    return {"specification": SPECIFICATION, "starting_state": starting_state}
+
+
+class ResponseCacheTest(TestCase):
+    def test_key_is_independent_of_payload_ordering(self):
+        self.assertEqual(
+            ResponseCache.key("url", {"specification": SPECIFICATION, "events": []}),
+            ResponseCache.key("url", {"events": [], "specification": SPECIFICATION}),
+        )
+
+    def test_key_depends_on_definition_and_request(self):
+        key = ResponseCache.key("url", {"specification": SPECIFICATION, "events": []})
+
+        self.assertNotEqual(
+            key, ResponseCache.key("url", {"specification": SPECIFICATION + "\n", "events": []})
+        )
+        self.assertNotEqual(
+            key, ResponseCache.key("url", {"specification": SPECIFICATION, "events": None})
+        )
+        self.assertNotEqual(
+            key, ResponseCache.key("other", {"specification": SPECIFICATION, "events": []})
+        )
+
+
+class TransportTest(TestCase):
+    def setUp(self) -> None:
+        temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        self.cache_dir = temp_dir.name
+
+    def test_transports_must_implement_post(self):
+        class IncompleteTransport(WorkflowsApiTransport):
+            pass
+
+        with self.assertRaises(TypeError):
+            IncompleteTransport()
+
+    def test_caching_transport_only_sends_uncached_requests(self):
+        fake_transport = FakeTransport()
+        client = WorkflowsApiClient(
+            base_url="",
+            auth_token="",
+            transport=CachingTransport(fake_transport, ResponseCache(self.cache_dir)),
+        )
+
+        first = client.simulate_workflow(specification=SPECIFICATION, starting_state="A")
+        second = client.simulate_workflow(specification=SPECIFICATION, starting_state="A")
+        client.simulate_workflow(specification=SPECIFICATION, starting_state="B")
+
+        self.assertEqual(first, second)
+        self.assertEqual(len(fake_transport.requests), 2)
+        self.assertEqual(len(os.listdir(self.cache_dir)), 2)
+
+    def test_replay_transport_serves_recorded_responses(self):
+        recording_client = WorkflowsApiClient(
+            base_url="",
+            auth_token="",
+            transport=CachingTransport(FakeTransport(), ResponseCache(self.cache_dir)),
+        )
+        recorded = recording_client.simulate_workflow(
+            specification=SPECIFICATION, starting_state="A"
+        )
+
+        replay_client = WorkflowsApiClient(
+            base_url="", auth_token="", transport=ReplayTransport(ResponseCache(self.cache_dir))
+        )
+
+        self.assertEqual(
+            replay_client.simulate_workflow(specification=SPECIFICATION, starting_state="A"),
+            recorded,
+        )
+        with self.assertRaisesRegex(MissingRecordingError, "No recorded response"):
+            replay_client.simulate_workflow(specification=SPECIFICATION, starting_state="B")
+
+    @patch.object(requests.Session, "post")
+    def test_http_transport(self, mock_post: Mock):
+        mock_post.return_value = Mock(status_code=400, json=Mock(return_value={"error": "bad"}))
+        transport = HttpTransport(base_url="https://workflows-api/", auth_token="token")
+
+        response = transport.post_json(SIMULATE_WORKFLOW_URL, {"specification": SPECIFICATION})
+
+        # client errors are returned so that tests can assert on them
+        self.assertEqual(response, {"error": "bad"})
+        mock_post.assert_called_once_with(
+            "https://workflows-api/v1/workflow-instances:simulate",
+            json={"specification": SPECIFICATION},
+        )
+        self.assertEqual(transport._session().headers["X-Auth-Token"], "token")
+
+    def _caching_http_transport(self) -> CachingTransport:
+        return CachingTransport(
+            HttpTransport(base_url="https://workflows-api", auth_token="token"),
+            ResponseCache(self.cache_dir),
+        )
+
+    def _assert_status_code_is_raised(self, mock_post: Mock, status_code: int):
+        mock_post.return_value = Mock(
+            status_code=status_code,
+            raise_for_status=Mock(side_effect=requests.HTTPError(str(status_code))),
+        )
+
+        with self.assertRaisesRegex(requests.HTTPError, str(status_code)):
+            self._caching_http_transport().post_json(
+                SIMULATE_WORKFLOW_URL, {"specification": SPECIFICATION}
+            )
+        self.assertEqual(os.listdir(self.cache_dir), [])
+
+    @patch.object(requests.Session, "post")
+    def test_http_transport_server_errors_are_raised(self, mock_post: Mock):
+        self._assert_status_code_is_raised(mock_post, 503)
+
+    @patch.object(requests.Session, "post")
+    def test_http_transport_auth_errors_are_raised(self, mock_post: Mock):
+        self._assert_status_code_is_raised(mock_post, 401)
+
+    @patch.object(requests.Session, "post")
+    def test_http_transport_rate_limit_errors_are_raised(self, mock_post: Mock):
+        self._assert_status_code_is_raised(mock_post, 429)
+
+    @patch.object(requests.Session, "post")
+    def test_validation_errors_are_cached(self, mock_post: Mock):
+        mock_post.return_value = Mock(status_code=400, json=Mock(return_value={"error": "bad"}))
+        transport = self._caching_http_transport()
+
+        for _ in range(2):
+            response = transport.post_json(SIMULATE_WORKFLOW_URL, {"specification": SPECIFICATION})
+
+        self.assertEqual(response, {"error": "bad"})
+        mock_post.assert_called_once()
+        self.assertEqual(len(os.listdir(self.cache_dir)), 1)
+        self.assertEqual(
+            ReplayTransport(ResponseCache(self.cache_dir)).post(
+                SIMULATE_WORKFLOW_URL, {"specification": SPECIFICATION}
+            ),
+            TransportResponse(status_code=400, body={"error": "bad"}),
+        )
+
+    @patch.object(requests.Session, "post")
+    def test_other_client_errors_are_returned_but_not_cached(self, mock_post: Mock):
+        mock_post.return_value = Mock(
+            status_code=404, json=Mock(return_value={"error": "not found"})
+        )
+        transport = self._caching_http_transport()
+
+        for _ in range(2):
+            response = transport.post_json(SIMULATE_WORKFLOW_URL, {"specification": SPECIFICATION})
+
+        self.assertEqual(response, {"error": "not found"})
+        self.assertEqual(mock_post.call_count, 2)
+        self.assertEqual(os.listdir(self.cache_dir), [])
+
+
+class SimulateWorkflowsTest(TestCase):
+    def test_simulations_run_concurrently(self):
+        fake_transport = FakeTransport(barrier=threading.Barrier(4))
+        client = WorkflowsApiClient(base_url="", auth_token="", transport=fake_transport)
+
+        responses = client.simulate_workflows(
+            [_simulation(state) for state in "ABCD"], max_workers=4
+        )
+
+        self.assertEqual(
+            [response["steps"][0]["state"]["name"] for response in responses], list("ABCD")
+        )
+
+    def test_simulations_run_sequentially_with_one_worker(self):
+        fake_transport = FakeTransport()
+        client = WorkflowsApiClient(base_url="", auth_token="", transport=fake_transport)
+
+        responses = client.simulate_workflows([_simulation(state) for state in "AB"], max_workers=1)
+
+        self.assertEqual(
+            [request["starting_state"] for request in fake_transport.requests], ["A", "B"]
+        )
+        self.assertEqual(len(responses), 2)
+
+
+class ReplayModeTest(TestCase):
+    def setUp(self) -> None:
+        # other modules register flags with validators that a command line parsed here would fail,
+        # so the flags are marked as parsed and only the flags under test are overridden
+        FLAGS.unparse_flags()
+        FLAGS.mark_as_parsed()
+        self.addCleanup(FLAGS.unparse_flags)
+
+    def test_replay_mode_does_not_require_an_environment(self):
+        with tempfile.TemporaryDirectory() as cache_dir:
+            CachingTransport(FakeTransport(), ResponseCache(cache_dir)).post_json(
+                SIMULATE_WORKFLOW_URL,
+                {
+                    "specification": SPECIFICATION,
+                    "events": None,
+                    "environment_variables": None,
+                    "instantiation_context": None,
+                    "starting_state": "A",
+                    "auto_fire_events": None,
+                },
+            )
+            with flagsaver.flagsaver(
+                workflows_simulation_mode="replay", workflows_simulation_cache_dir=cache_dir
+            ), patch.object(test_base.flag_utils, "parse_flags"), patch.object(
+                test_base, "extract_framework_environments_from_config"
+            ) as mock_extract_environments:
+                test_base.WorkflowsApiTestBase.setUpClass()
+            self.addCleanup(delattr, test_base.WorkflowsApiTestBase, "workflows_api_client")
+
+            response = test_base.WorkflowsApiTestBase("run").simulate_workflow(
+                specification=SPECIFICATION, starting_state="A"
+            )
+
+        mock_extract_environments.assert_not_called()
+        self.assertEqual(response, {"steps": [{"state": {"name": "A"}}]})
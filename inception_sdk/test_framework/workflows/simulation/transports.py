@@ -0,0 +1,195 @@
+# standard libs
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import threading
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from typing import Any
+
+# third party
+import requests
+
+log = logging.getLogger(__name__)
+
+# authentication, authorisation, timeout and rate limit errors depend on the environment rather
+# than on the request, so like server errors they are raised instead of being returned to the test
+RAISED_STATUS_CODES = {401, 403, 408, 429}
+# the simulator rejects invalid requests, such as a definition that fails validation, with a 400.
+# These responses are deterministic, so they can be recorded alongside successful responses
+VALIDATION_ERROR_STATUS_CODES = {400}
+
+
+class MissingRecordingError(Exception):
+    pass
+
+
+@dataclass(frozen=True)
+class TransportResponse:
+    status_code: int
+    body: Any
+
+    @property
+    def cacheable(self) -> bool:
+        """
+        Whether the response only depends on the request, so that it can be recorded and replayed
+        """
+        return 200 <= self.status_code < 300 or self.status_code in VALIDATION_ERROR_STATUS_CODES
+
+
+class WorkflowsApiTransport(ABC):
+    """
+    Sends JSON requests to the Workflows API on behalf of a WorkflowsApiClient
+    """
+
+    @abstractmethod
+    def post(self, url: str, payload: dict[str, Any]) -> TransportResponse:
+        """
+        :param url: endpoint url, relative to the Workflows API base url
+        :param payload: the JSON request body
+        :return: the status code and decoded JSON body of the response
+        """
+
+    def post_json(self, url: str, payload: dict[str, Any]) -> Any:
+        """
+        :param url: endpoint url, relative to the Workflows API base url
+        :param payload: the JSON request body
+        :return: the decoded JSON response body
+        """
+        return self.post(url, payload).body
+
+
+class HttpTransport(WorkflowsApiTransport):
+    """
+    Sends requests to a live Workflows API. Each thread uses its own session, so that connections
+    are reused across requests and concurrent simulations do not share session state
+    """
+
+    def __init__(self, base_url: str, auth_token: str):
+        self.base_url = base_url
+        self.auth_token = auth_token
+        self._local = threading.local()
+
+    def _session(self) -> requests.Session:
+        if not hasattr(self._local, "session"):
+            self._local.session = requests.Session()
+            self._local.session.headers.update(
+                {"content-type": "application/json", "X-Auth-Token": self.auth_token}
+            )
+        return self._local.session
+
+    def post(self, url: str, payload: dict[str, Any]) -> TransportResponse:
+        """
+        :raises requests.HTTPError: for server errors and the RAISED_STATUS_CODES, which are
+        transient or depend on the environment. Raising them also prevents them from being cached
+        """
+        response = self._session().post(
+            self.base_url.rstrip("/") + "/" + url.lstrip("/"), json=payload
+        )
+        if response.status_code >= 500 or response.status_code in RAISED_STATUS_CODES:
+            response.raise_for_status()
+        return TransportResponse(status_code=response.status_code, body=response.json())
+
+
+class ResponseCache:
+    """
+    Content-addressed store of Workflows API responses, keyed on the hash of the request url and
+    payload. As simulation requests contain the full workflow specification, any change to the
+    definition or the simulated events results in a different key. Responses are held in memory and
+    persisted to one JSON file per key, so they can be committed and replayed offline.
+    """
+
+    def __init__(self, cache_dir: str):
+        self.cache_dir = cache_dir
+        self._responses: dict[str, TransportResponse] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def key(url: str, payload: dict[str, Any]) -> str:
+        request = json.dumps(
+            {"url": url, "payload": payload}, sort_keys=True, separators=(",", ":")
+        )
+        return hashlib.sha256(request.encode()).hexdigest()
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, f"{key}.json")
+
+    def get(self, key: str) -> TransportResponse | None:
+        with self._lock:
+            if key in self._responses:
+                return self._responses[key]
+        try:
+            with open(self._path(key), "r", encoding="utf-8") as response_file:
+                recording = json.load(response_file)
+        except FileNotFoundError:
+            return None
+        response = TransportResponse(
+            status_code=recording["status_code"], body=recording["response"]
+        )
+        with self._lock:
+            self._responses[key] = response
+        return response
+
+    def put(self, key: str, url: str, payload: dict[str, Any], response: TransportResponse) -> None:
+        with self._lock:
+            self._responses[key] = response
+        os.makedirs(self.cache_dir, exist_ok=True)
+        # write to a temporary file first so that concurrent readers never see partial recordings
+        fd, temp_path = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+        with os.fdopen(fd, "w", encoding="utf-8") as temp_file:
+            # the request is stored alongside the response to make recordings reviewable
+            json.dump(
+                {
+                    "url": url,
+                    "payload": payload,
+                    "status_code": response.status_code,
+                    "response": response.body,
+                },
+                temp_file,
+                indent=2,
+                sort_keys=True,
+            )
+        os.replace(temp_path, self._path(key))
+
+
+class CachingTransport(WorkflowsApiTransport):
+    """
+    Serves responses from a ResponseCache, only sending requests that are not cached yet and
+    recording their responses
+    """
+
+    def __init__(self, transport: WorkflowsApiTransport, cache: ResponseCache):
+        self.transport = transport
+        self.cache = cache
+
+    def post(self, url: str, payload: dict[str, Any]) -> TransportResponse:
+        key = self.cache.key(url, payload)
+        response = self.cache.get(key)
+        if response is None:
+            response = self.transport.post(url, payload)
+            if response.cacheable:
+                self.cache.put(key, url, payload, response)
+        else:
+            log.debug(f"Serving cached response {key} for {url}")
+        return response
+
+
+class ReplayTransport(WorkflowsApiTransport):
+    """
+    Serves recorded responses from a ResponseCache without any network access
+    """
+
+    def __init__(self, cache: ResponseCache):
+        self.cache = cache
+
+    def post(self, url: str, payload: dict[str, Any]) -> TransportResponse:
+        key = self.cache.key(url, payload)
+        response = self.cache.get(key)
+        if response is None:
+            raise MissingRecordingError(
+                f"No recorded response {key} for {url} in {self.cache.cache_dir}. Re-run with "
+                f"caching enabled against a live environment to record it"
+            )
+        return response
@@ -1,13 +1,31 @@
 # Copyright @ 2021 Thought Machine Group Limited. All rights reserved.
 
+# standard libs
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+
 # third party
 import requests
 
+# inception sdk
+from inception_sdk.test_framework.workflows.simulation.transports import (
+    HttpTransport,
+    WorkflowsApiTransport,
+)
+
+SIMULATE_WORKFLOW_URL = "/v1/workflow-instances:simulate"
+DEFAULT_MAX_WORKERS = 8
+
 
 class WorkflowsApiClient:
-    def __init__(self, base_url, auth_token):
+    def __init__(self, base_url, auth_token, transport: WorkflowsApiTransport | None = None):
+        """
+        :param transport: sends simulation requests. Defaults to sending them to the live
+        Workflows API at base_url, see transports.py for caching and replaying responses
+        """
         self.base_url = base_url
         self.auth_token = auth_token
+        self.transport = transport or HttpTransport(base_url=base_url, auth_token=auth_token)
 
     def _create_endpoint_url(self, url):
         if self.base_url[-1] == "/" and url[0] == "/":
@@ -52,8 +70,8 @@ class WorkflowsApiClient:
             simulating a state that has expired.
         """
 
-        response = self.post(
-            url="/v1/workflow-instances:simulate",
+        return self.transport.post_json(
+            url=SIMULATE_WORKFLOW_URL,
             payload={
                 "specification": specification,
                 "events": events,
@@ -62,6 +80,20 @@ class WorkflowsApiClient:
                 "starting_state": starting_state,
                 "auto_fire_events": auto_fire_events,
             },
-            check_status=check_status,
         )
-        return response.json()
+
+    def simulate_workflows(
+        self, simulations: list[dict[str, Any]], max_workers: int = DEFAULT_MAX_WORKERS
+    ) -> list[Any]:
+        """
+        Run independent simulations concurrently
+        :param simulations: keyword arguments for simulate_workflow, one dict per simulation
+        :param max_workers: maximum number of simulations to run at once
+        :return: the simulation responses, in the same order as the simulations
+        """
+        if len(simulations) <= 1 or max_workers <= 1:
+            return [self.simulate_workflow(**simulation) for simulation in simulations]
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(simulations))) as executor:
+            return list(
+                executor.map(lambda simulation: self.simulate_workflow(**simulation), simulations)
+            )
@@ -1,23 +1,66 @@
 # standard libs
+import os
 from typing import Any, Generator
 from unittest import TestCase
 
+# third party
+from absl import flags
+
 # inception sdk
 import inception_sdk.common.python.flag_utils as flag_utils
+from inception_sdk.common.config import FLAG_PREFIX, FLAGS
 from inception_sdk.test_framework.common.config import (
     EnvironmentPurpose,
     extract_framework_environments_from_config,
 )
+from inception_sdk.test_framework.workflows.simulation.transports import (
+    CachingTransport,
+    HttpTransport,
+    ReplayTransport,
+    ResponseCache,
+)
 from inception_sdk.test_framework.workflows.simulation.workflows_api_client import (
+    DEFAULT_MAX_WORKERS,
     WorkflowsApiClient,
 )
 
+SIMULATION_MODE_LIVE = "live"
+SIMULATION_MODE_CACHE = "cache"
+SIMULATION_MODE_REPLAY = "replay"
+
+flags.DEFINE_enum(
+    name="workflows_simulation_mode",
+    default=os.getenv(FLAG_PREFIX + "WORKFLOWS_SIMULATION_MODE", SIMULATION_MODE_LIVE),
+    enum_values=[SIMULATION_MODE_LIVE, SIMULATION_MODE_CACHE, SIMULATION_MODE_REPLAY],
+    help="How workflow simulations are run. `live` sends every simulation to the environment, "
+    "`cache` only sends simulations without a recorded response and records their responses, "
+    "`replay` serves recorded responses only and does not require an environment. Can also be set "
+    f"via env variable {FLAG_PREFIX + 'WORKFLOWS_SIMULATION_MODE'}",
+)
+flags.DEFINE_string(
+    name="workflows_simulation_cache_dir",
+    default=os.getenv(
+        FLAG_PREFIX + "WORKFLOWS_SIMULATION_CACHE_DIR", ".workflows_simulation_cache"
+    ),
+    help="Directory that workflow simulation responses are recorded to and replayed from. Can "
+    f"also be set via env variable {FLAG_PREFIX + 'WORKFLOWS_SIMULATION_CACHE_DIR'}",
+)
+
 
 class WorkflowsApiTestBase(TestCase):
     @classmethod
     def setUpClass(cls):
         flag_utils.parse_flags(allow_unknown=True)
 
+        if FLAGS.workflows_simulation_mode == SIMULATION_MODE_REPLAY:
+            cls.workflows_api_client = WorkflowsApiClient(
+                base_url="",
+                auth_token="",
+                transport=ReplayTransport(ResponseCache(FLAGS.workflows_simulation_cache_dir)),
+            )
+            super().setUpClass()
+            return
+
         environment, _ = extract_framework_environments_from_config(
             environment_purpose=EnvironmentPurpose.SIM
         )
@@ -27,8 +70,13 @@ class WorkflowsApiTestBase(TestCase):
             raise ValueError(
                 "workflow_api_url and/or service_account.token not found in specified config"
             )
+        transport = HttpTransport(base_url=workflow_api_url, auth_token=auth_token)
+        if FLAGS.workflows_simulation_mode == SIMULATION_MODE_CACHE:
+            transport = CachingTransport(
+                transport, ResponseCache(FLAGS.workflows_simulation_cache_dir)
+            )
         cls.workflows_api_client = WorkflowsApiClient(
-            base_url=workflow_api_url, auth_token=auth_token
+            base_url=workflow_api_url, auth_token=auth_token, transport=transport
         )
 
         super().setUpClass()
@@ -54,6 +102,17 @@ class WorkflowsApiTestBase(TestCase):
         )
         return response
 
+    def simulate_workflows(
+        self, simulations: list[dict[str, Any]], max_workers: int = DEFAULT_MAX_WORKERS
+    ) -> list[Any]:
+        """
+        Run independent simulations concurrently
+        :param simulations: keyword arguments for simulate_workflow, one dict per simulation
+        :param max_workers: maximum number of simulations to run at once
+        :return: the simulation responses, in the same order as the simulations
+        """
+        return self.workflows_api_client.simulate_workflows(simulations, max_workers=max_workers)
+
     @staticmethod
     def build_expected_simulator_step(
         state: dict = None,
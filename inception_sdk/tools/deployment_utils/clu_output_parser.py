@@ -0,0 +1,154 @@
+# standard libs
+import logging
+import re
+import threading
+from collections import Counter
+from dataclasses import dataclass
+from typing import IO, Callable
+
+logger = logging.getLogger("deployment_utils")
+
+CLU_ERROR_KEYWORDS = ["FAIL", "failed to", "INVALID"]
+CLU_WARNING_KEYWORDS = ["PARTIAL SUCCESS"]
+
+# e.g. `WORKFLOW_DEFINITION_VERSION with ID CASA_APPLICATION was IMPORTED successfully ...`
+RESOURCE_STATUS_PATTERN = re.compile(
+    r"(?P<resource_type>[A-Z][A-Z_]+) with ID\s+(?P<resource_id>\S+)\s+(?:was|is)\s+"
+    r"(?P<status>NOT [A-Z]+|[A-Z]+)"
+)
+
+EVENT_RESOURCE_STATUS = "resource_status"
+EVENT_ERROR = "error"
+EVENT_WARNING = "warning"
+EVENT_INFO = "info"
+
+
+@dataclass
+class CluEvent:
+    kind: str
+    line: str
+    resource_type: str | None = None
+    resource_id: str | None = None
+    # e.g. IMPORTED, NOT IMPORTED or VALID
+    status: str | None = None
+    # set for successfully deployed workflow definition versions, as per extract_workflow_version_id
+    workflow_version_id: dict[str, str] | None = None
+    # number of resource status events seen so far, including this one
+    resources_processed: int = 0
+
+
+def extract_workflow_version_id(clu_output_line: str) -> dict[str, str]:
+    """
+    Parse a clu output line and extract the workflow version and id
+    """
+    workflow_version_id = clu_output_line.split("ID in Vault: ")[-1].replace('"', "").split(",")
+    workflow_version = workflow_version_id[0]
+    workflow_id = workflow_version_id[1]
+
+    return {"version": workflow_version, "id": workflow_id}
+
+
+def deployment_status_successful(
+    clu_output_line: str, resource_type: str = "WORKFLOW_DEFINITION_VERSION"
+) -> bool:
+    """
+    Checks if CLU line contains a workflow deployment and it's been successful.
+    """
+    # Filter out validation lines and other resource_types
+    if resource_type in clu_output_line and "VALID" not in clu_output_line:
+        if "successfully" in clu_output_line and "NOT IMPORTED" not in clu_output_line:
+            return True
+        logger.info(
+            "The following has failed to deploy. Activation skipped.\n" f"{clu_output_line}"
+        )
+    return False
+
+
+class CluOutputParser:
+    """
+    Incrementally parses CLU text output into structured events. Lines may be fed from multiple
+    threads, e.g. one per output stream.
+    """
+
+    def __init__(self, on_event: Callable[[CluEvent], None] | None = None):
+        """
+        :param on_event: called with each event as soon as its line is parsed
+        """
+        self.on_event = on_event
+        self.workflow_version_ids: list[dict[str, str]] = []
+        self.status_counts: Counter[str] = Counter()
+        self.error_count = 0
+        self.warning_count = 0
+        self._lock = threading.Lock()
+
+    def feed(self, line: str) -> CluEvent:
+        line = line.strip()
+        with self._lock:
+            event = self._parse(line)
+            if self.on_event:
+                self.on_event(event)
+        return event
+
+    def feed_lines(self, lines: list[str]) -> None:
+        for line in lines:
+            self.feed(line)
+
+    def _parse(self, line: str) -> CluEvent:
+        if any(keyword in line for keyword in CLU_ERROR_KEYWORDS):
+            kind = EVENT_ERROR
+            self.error_count += 1
+        elif any(keyword in line for keyword in CLU_WARNING_KEYWORDS):
+            kind = EVENT_WARNING
+            self.warning_count += 1
+        else:
+            kind = EVENT_INFO
+
+        match = RESOURCE_STATUS_PATTERN.search(line)
+        if not match:
+            return CluEvent(kind=kind, line=line)
+
+        self.status_counts[match["status"]] += 1
+        workflow_version_id = None
+        if deployment_status_successful(line):
+            workflow_version_id = extract_workflow_version_id(line)
+            self.workflow_version_ids.append(workflow_version_id)
+
+        return CluEvent(
+            # errors and warnings take precedence so that failed resources are not missed
+            kind=kind if kind != EVENT_INFO else EVENT_RESOURCE_STATUS,
+            line=line,
+            resource_type=match["resource_type"],
+            resource_id=match["resource_id"],
+            status=match["status"],
+            workflow_version_id=workflow_version_id,
+            resources_processed=sum(self.status_counts.values()),
+        )
+
+    def summary(self) -> str:
+        statuses = ", ".join(f"{count} {status}" for status, count in self.status_counts.items())
+        return (
+            f"CLU processed {sum(self.status_counts.values())} resources ({statuses or 'none'}) "
+            f"with {self.error_count} error(s) and {self.warning_count} warning(s)"
+        )
+
+
+def stream_lines(
+    stream: IO[str], parser: CluOutputParser, lines: list[str], name: str = "clu-output"
+) -> threading.Thread:
+    """
+    Consume a stream on a background thread, feeding each line to the parser as it arrives
+    :param stream: the text stream to consume, e.g. a process' stdout
+    :param parser: the parser to feed lines to
+    :param lines: list that the raw lines are appended to
+    :param name: name of the background thread
+    :return: the started thread, which completes once the stream is exhausted
+    """
+
+    def _consume() -> None:
+        for line in stream:
+            lines.append(line)
+            parser.feed(line)
+
+    thread = threading.Thread(target=_consume, name=name, daemon=True)
+    thread.start()
+    return thread
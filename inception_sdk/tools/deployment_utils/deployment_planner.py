@@ -0,0 +1,225 @@
+# standard libs
+import hashlib
+import json
+import logging
+import os
+import re
+import tempfile
+from dataclasses import dataclass, field
+from pathlib import Path
+
+# third party
+import yaml
+
+logger = logging.getLogger("deployment_utils")
+
+RESOURCE_FILE_SUFFIXES = (".resource.yaml", ".resources.yaml")
+# `@{file}` embeds the contents of a file, relative to the resource file, in the resource
+FILE_REFERENCE_PATTERN = re.compile(r"@\{([^}]+)\}")
+# `&{resource_id}` and `&{resource_id:field}` reference another resource in the pack
+RESOURCE_REFERENCE_PATTERN = re.compile(r"&\{([^}:]+)(?::[^}]*)?\}")
+
+
+@dataclass
+class DeploymentResource:
+    id: str
+    # hash of the resource definition and the contents of every file it embeds
+    content_hash: str
+    # ids of the resources this resource references
+    dependencies: set[str] = field(default_factory=set)
+
+
+@dataclass
+class DeploymentPlan:
+    # manifest resource ids, in manifest order
+    manifest_resource_ids: list[str]
+    resources: dict[str, DeploymentResource]
+    # resources that are new or whose content hash differs from the last successful deployment
+    changed: set[str]
+    # unchanged resources that reference a changed resource, directly or transitively
+    dependants: set[str]
+    # unchanged resources referenced by planned resources. These are included so that CLU can
+    # resolve the references, but are not re-imported as CLU skips resources that already exist
+    prerequisites: set[str]
+
+    @property
+    def resource_ids(self) -> list[str]:
+        planned = self.changed | self.dependants | self.prerequisites
+        return [resource_id for resource_id in self.manifest_resource_ids if resource_id in planned]
+
+
+def load_manifest_resource_ids(manifest_path: str) -> list[str]:
+    with open(manifest_path, "r", encoding="utf-8") as manifest_file:
+        return list(yaml.safe_load(manifest_file).get("resource_ids") or [])
+
+
+def _hash_resource(definition: dict, resource_dir: str) -> DeploymentResource:
+    serialised_definition = json.dumps(definition, sort_keys=True, default=str)
+    digest = hashlib.sha256(serialised_definition.encode())
+    dependencies = set(RESOURCE_REFERENCE_PATTERN.findall(serialised_definition))
+    for file_name in FILE_REFERENCE_PATTERN.findall(serialised_definition):
+        file_path = os.path.join(resource_dir, file_name)
+        # a missing file still changes the hash, so that CLU reports the error on import
+        digest.update(file_name.encode())
+        if os.path.isfile(file_path):
+            with open(file_path, "rb") as embedded_file:
+                contents = embedded_file.read()
+            digest.update(contents)
+            # CLU also resolves references within embedded files, e.g. workflow specifications
+            dependencies.update(
+                RESOURCE_REFERENCE_PATTERN.findall(contents.decode("utf-8", errors="replace"))
+            )
+    dependencies.discard(str(definition["id"]))
+    return DeploymentResource(
+        id=str(definition["id"]),
+        content_hash=digest.hexdigest(),
+        dependencies=dependencies,
+    )
+
+
+def load_resources(resource_root: str) -> dict[str, DeploymentResource]:
+    """
+    Load and hash every resource defined in the `.resource.yaml` and `.resources.yaml` files under
+    the resource root
+    :param resource_root: root dir where deployment resources are
+    :return: resource id to resource
+    """
+    resources: dict[str, DeploymentResource] = {}
+    for resource_file_path in sorted(Path(resource_root).rglob("*.yaml")):
+        if not resource_file_path.name.endswith(RESOURCE_FILE_SUFFIXES):
+            continue
+        with open(resource_file_path, "r", encoding="utf-8") as resource_file:
+            documents = [document for document in yaml.safe_load_all(resource_file) if document]
+        for document in documents:
+            for definition in document.get("resources", [document]):
+                resource = _hash_resource(definition, str(resource_file_path.parent))
+                resources[resource.id] = resource
+    return resources
+
+
+def load_record(record_path: str) -> dict[str, str]:
+    """
+    Load the content hashes of the resources in the last successful deployment
+    :param record_path: path to the deployment record
+    :return: resource id to content hash. Empty if there is no record yet
+    """
+    if not os.path.exists(record_path):
+        return {}
+    with open(record_path, "r", encoding="utf-8") as record_file:
+        return json.load(record_file)["resource_hashes"]
+
+
+def save_record(record_path: str, plan: DeploymentPlan) -> None:
+    """
+    Update the deployment record with the content hashes of the planned resources, once they have
+    been successfully deployed
+    :param record_path: path to the deployment record
+    :param plan: the deployed plan
+    """
+    resource_hashes = load_record(record_path)
+    resource_hashes.update(
+        {
+            resource_id: plan.resources[resource_id].content_hash
+            for resource_id in plan.resource_ids
+            if resource_id in plan.resources
+        }
+    )
+    os.makedirs(os.path.dirname(os.path.abspath(record_path)), exist_ok=True)
+    with open(record_path, "w", encoding="utf-8") as record_file:
+        json.dump({"resource_hashes": resource_hashes}, record_file, indent=2, sort_keys=True)
+
+
+def get_record_path(record_dir: str, environment_name: str) -> str:
+    return os.path.join(record_dir, f"{environment_name}.json")
+
+
+def plan_deployment(resource_root: str, manifest_file: str, record_path: str) -> DeploymentPlan:
+    """
+    Determine the minimal set of manifest resources to import, based on the resources' content
+    hashes and the record of the last successful deployment
+    :param resource_root: root dir that contains the manifest and all deployment resources
+    :param manifest_file: name of the manifest file in the resource root
+    :param record_path: path to the deployment record
+    :return: the deployment plan
+    """
+    manifest_resource_ids = load_manifest_resource_ids(os.path.join(resource_root, manifest_file))
+    in_manifest = set(manifest_resource_ids)
+    resources = {
+        resource_id: resource
+        for resource_id, resource in load_resources(resource_root).items()
+        if resource_id in in_manifest
+    }
+    recorded_hashes = load_record(record_path)
+
+    # ids without a resource definition are always planned so that CLU reports them
+    changed = {
+        resource_id
+        for resource_id in manifest_resource_ids
+        if resource_id not in resources
+        or recorded_hashes.get(resource_id) != resources[resource_id].content_hash
+    }
+
+    dependants_by_id: dict[str, set[str]] = {}
+    for resource in resources.values():
+        for dependency in resource.dependencies:
+            dependants_by_id.setdefault(dependency, set()).add(resource.id)
+
+    dependants: set[str] = set()
+    to_visit = list(changed)
+    while to_visit:
+        for dependant in dependants_by_id.get(to_visit.pop(), set()):
+            if dependant not in changed and dependant not in dependants:
+                dependants.add(dependant)
+                to_visit.append(dependant)
+
+    prerequisites: set[str] = set()
+    to_visit = list(changed | dependants)
+    while to_visit:
+        resource_id = to_visit.pop()
+        if resource_id not in resources:
+            continue
+        for dependency in resources[resource_id].dependencies & in_manifest:
+            if dependency not in changed | dependants | prerequisites:
+                prerequisites.add(dependency)
+                to_visit.append(dependency)
+
+    return DeploymentPlan(
+        manifest_resource_ids=manifest_resource_ids,
+        resources=resources,
+        changed=changed,
+        dependants=dependants,
+        prerequisites=prerequisites,
+    )
+
+
+def write_plan_manifest(manifest_path: str, plan: DeploymentPlan) -> None:
+    """
+    Overwrite a manifest so that it only contains the planned resources. The manifest is replaced
+    rather than written to, as staged manifests are hardlinks to the original
+    :param manifest_path: path to the staged manifest
+    :param plan: the deployment plan
+    """
+    with open(manifest_path, "r", encoding="utf-8") as manifest_file:
+        manifest = yaml.safe_load(manifest_file)
+    manifest["resource_ids"] = plan.resource_ids
+
+    fd, temp_path = tempfile.mkstemp(dir=os.path.dirname(manifest_path), suffix=".yaml")
+    with os.fdopen(fd, "w", encoding="utf-8") as temp_file:
+        yaml.safe_dump(manifest, temp_file, sort_keys=False)
+    os.replace(temp_path, manifest_path)
+
+
+def log_plan(plan: DeploymentPlan) -> None:
+    logger.info(
+        f"Planned {len(plan.resource_ids)} of {len(plan.manifest_resource_ids)} manifest resources"
+        f": {len(plan.changed)} changed, {len(plan.dependants)} dependants and "
+        f"{len(plan.prerequisites)} prerequisites"
+    )
+    for resource_id in plan.resource_ids:
+        if resource_id in plan.changed:
+            reason = "changed"
+        elif resource_id in plan.dependants:
+            reason = "depends on a changed resource"
+        else:
+            reason = "referenced by a planned resource"
+        logger.debug(f"{resource_id}: {reason}")
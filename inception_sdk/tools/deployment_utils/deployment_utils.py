@@ -7,23 +7,33 @@ import subprocess
 import tempfile
 import uuid
 from pathlib import Path
-from shutil import copytree
-from typing import IO, Any
+from shutil import copy2, copytree
+from typing import Any
 
 # third party
 import requests
 import yaml
 
 # inception sdk
+import inception_sdk.tools.deployment_utils.deployment_planner as deployment_planner
 from inception_sdk.common.config import extract_environments_from_config
 from inception_sdk.common.python.flag_utils import FLAGS, flags, parse_flags
+from inception_sdk.tools.deployment_utils.clu_output_parser import (  # noqa: F401
+    CLU_ERROR_KEYWORDS,
+    CLU_WARNING_KEYWORDS,
+    EVENT_ERROR,
+    EVENT_WARNING,
+    CluEvent,
+    CluOutputParser,
+    deployment_status_successful,
+    extract_workflow_version_id,
+    stream_lines,
+)
 from inception_sdk.vault.environment import Environment
 
 logging.basicConfig(format="%(asctime)s - %(name)s - %(levelname)s - %(message)s")
 logger = logging.getLogger("deployment_utils")
 
-CLU_ERROR_KEYWORDS = ["FAIL", "failed to", "INVALID"]
-CLU_WARNING_KEYWORDS = ["PARTIAL SUCCESS"]
 EXPECTED_XSRF_TOKEN_LEN = 54
 
 # mapping each type of instantiation config variable to the corresponding Vault object type and keys
@@ -144,7 +154,12 @@ def import_manifest_must_be_set_to_provide_extra_flags(input_dict: dict[str, Any
 
     return input_dict.get("import_manifest") or all(
         input_dict.get(flag) in {None, False, ""}
-        for flag in ["auth_cookie", "activate_workflows", "update_workflows_inst_config"]
+        for flag in [
+            "auth_cookie",
+            "activate_workflows",
+            "update_workflows_inst_config",
+            "incremental",
+        ]
     )
 
 
@@ -189,6 +204,20 @@ flags.DEFINE_string(
     "the Headers of a graphql request and copying the value of the cookie header. "
     "Can only be passed if `import_manifest` is also set",
 )
+flags.DEFINE_bool(
+    name="incremental",
+    default=False,
+    help="Set to only import the resources that changed since the last successful deployment to "
+    "the environment, along with their dependants. Can only be passed if `import_manifest` is "
+    "also set",
+)
+flags.DEFINE_string(
+    name="deployment_record_dir",
+    default=".deployment_records",
+    help="Path to the directory storing the record of the last successful deployment to each "
+    "environment, used by `incremental`. The default directory is relative to the working "
+    "directory and ignored by git",
+)
 
 # Validation
 flags.mark_bool_flags_as_mutual_exclusive(
@@ -200,10 +229,11 @@ flags.register_multi_flags_validator(
         "auth_cookie",
         "update_workflows_inst_config",
         "activate_workflows",
+        "incremental",
     ],
     multi_flags_checker=import_manifest_must_be_set_to_provide_extra_flags,
     message="`import_manifest` must be set if providing one or more of `auth_cookie`, "
-    "`update_workflows_inst_config` and `activate_workflows`",
+    "`update_workflows_inst_config`, `activate_workflows` and `incremental`",
 )
 flags.register_multi_flags_validator(
     flag_names=["auth_cookie", "update_workflows_inst_config"],
@@ -271,17 +301,29 @@ def check_system() -> None:
         raise Exception(f"Unsupported system {current_system}")
 
 
+def _link_or_copy(src: str, dst: str) -> None:
+    """
+    Hardlink a file, falling back to a copy if the filesystem does not support hardlinks or the
+    destination is on a different device
+    """
+    try:
+        os.link(src, dst)
+    except OSError:
+        copy2(src, dst)
+
+
 def copy_resources(temp_dir, resource_root_dir="library") -> str:
     """
     Make a copy of the contents from resource root (where manifest is)
-    and all its subdirs into a temporary directory
+    and all its subdirs into a temporary directory. Files are hardlinked rather than copied, so
+    they must be replaced rather than modified in place
     :param temp_dir: the temporary directory
     :param resource_root_dir: root dir where deployment resources are
     :returns: the destination tmp dir
     """
     src = os.path.join(os.getcwd(), resource_root_dir)
     dst = os.path.join(temp_dir, resource_root_dir)
-    copytree(src, dst)
+    copytree(src, dst, copy_function=_link_or_copy)
     return dst
 
 
@@ -294,12 +336,15 @@ def run_deployment_utils(unknown_args: list[str]):
 
     if FLAGS.validate_manifest:
         logger.info(f"Validating manifest at {FLAGS.manifest}")
+        parser = CluOutputParser(on_event=_log_clu_event)
         run_clu(
             clu_path=FLAGS.clu,
             function="validate",
             manifest_path=FLAGS.manifest,
             additional_args=unknown_args,
+            parser=parser,
         )
+        logger.info(parser.summary())
     elif FLAGS.import_manifest:
         # At this point we have validated that we're in an inception repo, so it's safe to create
         # a temp directory without risking copying huge amounts of data
@@ -309,16 +354,41 @@ def run_deployment_utils(unknown_args: list[str]):
             dst = copy_resources(temp_dir, resource_root)
             manifest_path = os.path.join(dst, file_name)
 
-            logger.info(f"Importing manifest at {manifest_path} to {FLAGS.environment_name}")
             environment, _ = extract_environments_from_config()
 
+            plan = None
+            if FLAGS.incremental:
+                record_path = deployment_planner.get_record_path(
+                    FLAGS.deployment_record_dir, environment.name
+                )
+                plan = deployment_planner.plan_deployment(
+                    resource_root=dst, manifest_file=file_name, record_path=record_path
+                )
+                deployment_planner.log_plan(plan)
+                if not plan.resource_ids:
+                    logger.info("No resources changed since the last successful deployment")
+                    logger.info("Exiting Deployment Utils")
+                    return
+                deployment_planner.write_plan_manifest(manifest_path, plan)
+
+            logger.info(f"Importing manifest at {manifest_path} to {FLAGS.environment_name}")
+            parser = CluOutputParser(on_event=_log_clu_event)
             success, clu_output = run_clu(
                 clu_path=FLAGS.clu,
                 function="import",
                 manifest_path=manifest_path,
                 environment=environment,
                 additional_args=unknown_args,
+                parser=parser,
             )
+            logger.info(parser.summary())
+            if plan is not None:
+                if success and not parser.error_count and not parser.warning_count:
+                    deployment_planner.save_record(record_path, plan)
+                else:
+                    logger.warning(
+                        "Deployment record not updated as not all resources were imported"
+                    )
             if success:
                 post_processing(
                     clu_output=clu_output,
@@ -327,6 +397,7 @@ def run_deployment_utils(unknown_args: list[str]):
                     update_workflows_inst_config=FLAGS.update_workflows_inst_config,
                     auth_cookie=FLAGS.auth_cookie,
                     resource_root=resource_root,
+                    workflow_version_ids=parser.workflow_version_ids,
                 )
             else:
                 logger.warning("Post Processing skipped due to error excuting CLU command")
@@ -340,6 +411,7 @@ def run_clu(
     environment: Environment | None = None,
     additional_args: list[str] | None = None,
     output_format: str = "text",
+    parser: CluOutputParser | None = None,
 ) -> tuple[bool, list[str]]:
     """
     Run the CLU command as per command-line args
@@ -350,23 +422,14 @@ def run_clu(
     :param additional_args: additional arguments to be passed to CLU. Use at your own risk as it
      may disrupt logic (e.g. we parse standard output, so using json will break features)
     :param output_format: 'text' or 'json', as per CLU `output` flag
+    :param parser: parser that `text` output is streamed to as it is produced. Defaults to a
+     parser that logs each line
     :returns: tuple of
     - bool indicating success (true) or failure (false). Always True when using `json` output_format
-    - list of str representing stdout from CLU. Will contain a single string if using
-    `json` output_format
+    - list of str representing stdout from CLU, followed by stderr. Will contain a single string if
+    using `json` output_format
     """
 
-    def _read_lines_from_io(io: IO | None = None) -> list[str]:
-        output = []
-        if io:
-            # This way we output lines one-by-one as we get them from stdout, which provides
-            # faster feedback to human users
-            line = next(io, "")
-            if line:
-                _log_clu_output(line.strip())
-                output.append(line)
-        return output
-
     command = [clu_path, function, manifest_path, f"--output={output_format}"]
     if function != "validate":
         if environment is None:
@@ -381,26 +444,34 @@ def run_clu(
     # Using Popen instead of run to be able to both print and capture stdout
     process = subprocess.Popen(command, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True)
     if output_format == "json":
-        return True, _read_lines_from_io(process.stdout)
-
-    clu_output = []
-    # Print output as we get it until the process is complete
-    # Append each line to list as reading it from process.stdout pops the information
-    while True:
-        # Capture any output before the process has completed
-        clu_output.extend(_read_lines_from_io(process.stdout))
-        return_code = process.poll()
-        if return_code is not None:
-            success = return_code == 0
-            if success:
-                logger.info("Completed CLU command")
-            else:
-                logger.error("Error while executing CLU command")
-            # At this point the process has completed, but we may have missed some output
-            clu_output.extend(_read_lines_from_io(process.stdout))
-            clu_output.extend(_read_lines_from_io(process.stderr))
-            break
-    return success, clu_output
+        line = next(process.stdout, "") if process.stdout else ""
+        if line:
+            _log_clu_output(line.strip())
+        return True, [line] if line else []
+
+    parser = parser or CluOutputParser(on_event=_log_clu_event)
+    # Both streams are consumed on background threads so that output is parsed and logged as CLU
+    # produces it, and so that CLU never blocks on a full stderr pipe
+    stdout_lines: list[str] = []
+    stderr_lines: list[str] = []
+    readers = [
+        stream_lines(stream, parser, lines, name=f"clu-{name}")
+        for name, stream, lines in [
+            ("stdout", process.stdout, stdout_lines),
+            ("stderr", process.stderr, stderr_lines),
+        ]
+        if stream is not None
+    ]
+    return_code = process.wait()
+    for reader in readers:
+        reader.join()
+
+    success = return_code == 0
+    if success:
+        logger.info("Completed CLU command")
+    else:
+        logger.error("Error while executing CLU command")
+    return success, stdout_lines + stderr_lines
 
 
 def post_processing(
@@ -410,6 +481,7 @@ def post_processing(
     update_workflows_inst_config: bool = False,
     auth_cookie: str = "",
     resource_root: str = "library",
+    workflow_version_ids: list[dict[str, str]] | None = None,
 ) -> None:
     """
     :param clu_output: output from CLU deployment
@@ -421,10 +493,12 @@ def post_processing(
     :param auth_cookie: authentication cookie containing three different tokens, used for
     ops-dash login
     :resource_root: root dir that contains manifest.yaml and all deployment resources
+    :param workflow_version_ids: successfully deployed workflow versions, as extracted by a
+    CluOutputParser while CLU was running. If None, they are extracted from clu_output
     """
     logger.info("Starting post processing")
     if activate_workflows:
-        handle_workflow_activation(environment, clu_output)
+        handle_workflow_activation(environment, clu_output, workflow_version_ids)
     if update_workflows_inst_config:
         xsrf_token = extract_xsrf_token_from_cookie(auth_cookie)
         handle_workflows_inst_config(
@@ -433,25 +507,40 @@ def post_processing(
     logger.info("Completed post processing")
 
 
-def _log_clu_output(output: str):
-    if any(keyword in output for keyword in CLU_ERROR_KEYWORDS):
-        logger.error(output)
-    elif any(keyword in output for keyword in CLU_WARNING_KEYWORDS):
-        logger.warning(output)
+def _log_clu_event(event: CluEvent):
+    if event.kind == EVENT_ERROR:
+        logger.error(event.line)
+    elif event.kind == EVENT_WARNING:
+        logger.warning(event.line)
     else:
-        logger.info(output)
+        logger.info(event.line)
 
 
-def handle_workflow_activation(environment: Environment, clu_output: list[str]):
+def _log_clu_output(output: str):
+    _log_clu_event(CluOutputParser().feed(output))
+
+
+def handle_workflow_activation(
+    environment: Environment,
+    clu_output: list[str],
+    workflow_version_ids: list[dict[str, str]] | None = None,
+):
     """
     Handles activating workflow definition versions after a CLU deployment
     :param environment: environment to use for workflow activation
     :param clu_output: list(str), the full output of a CLU deployment run
+    :param workflow_version_ids: successfully deployed workflow versions, as extracted by a
+    CluOutputParser while CLU was running. If None, they are extracted from clu_output
     """
     logger.info("Activating Workflow Versions")
     if clu_output == []:
         logger.error("CLU deployment output is empty! Workflow activation not possible.")
         return
+    if workflow_version_ids is None:
+        parser = CluOutputParser()
+        parser.feed_lines(clu_output)
+        workflow_version_ids = parser.workflow_version_ids
+
     wf_activation_session = requests.sessions.Session()
     wf_activation_session.headers.update(
         {
@@ -460,21 +549,18 @@ def handle_workflow_activation(environment: Environment, clu_output: list[str]):
         }
     )
 
-    for line in clu_output:
-        line_stripped = line.strip()
-        if deployment_status_successful(line_stripped):
-            extracted_workflow_version_id = extract_workflow_version_id(line_stripped)
-            logger.info(
-                f'Setting version {extracted_workflow_version_id.get("version")} '
-                f'of workflow {extracted_workflow_version_id.get("id")} as default.'
-            )
+    for extracted_workflow_version_id in workflow_version_ids:
+        logger.info(
+            f'Setting version {extracted_workflow_version_id.get("version")} '
+            f'of workflow {extracted_workflow_version_id.get("id")} as default.'
+        )
 
-            update_workflow_definition_version(
-                wf_activation_session,
-                workflow_api_url=environment.workflow_api_url,
-                workflow_id=extracted_workflow_version_id["id"],
-                workflow_ver=extracted_workflow_version_id["version"],
-            )
+        update_workflow_definition_version(
+            wf_activation_session,
+            workflow_api_url=environment.workflow_api_url,
+            workflow_id=extracted_workflow_version_id["id"],
+            workflow_ver=extracted_workflow_version_id["version"],
+        )
 
 
 def handle_workflows_inst_config(
@@ -540,33 +626,6 @@ def handle_workflows_inst_config(
         )
 
 
-def extract_workflow_version_id(clu_output_line: str) -> dict[str, str]:
-    """
-    Parse a clu output line and extract the workflow version and id
-    """
-    workflow_version_id = clu_output_line.split("ID in Vault: ")[-1].replace('"', "").split(",")
-    workflow_version = workflow_version_id[0]
-    workflow_id = workflow_version_id[1]
-
-    return {"version": workflow_version, "id": workflow_id}
-
-
-def deployment_status_successful(
-    clu_output_line: str, resource_type: str = "WORKFLOW_DEFINITION_VERSION"
-) -> bool:
-    """
-    Checks if CLU line contains a workflow deployment and it's been successful.
-    """
-    # Filter out validation lines and other resource_types
-    if resource_type in clu_output_line and "VALID" not in clu_output_line:
-        if "successfully" in clu_output_line and "NOT IMPORTED" not in clu_output_line:
-            return True
-        logger.info(
-            "The following has failed to deploy. Activation skipped.\n" f"{clu_output_line}"
-        )
-    return False
-
-
 def update_workflow_definition_version(
     workflow_activation_session: requests.Session,
     workflow_api_url: str,
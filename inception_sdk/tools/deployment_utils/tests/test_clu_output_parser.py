@@ -0,0 +1,187 @@
+# standard libs
+import os
+import stat
+import tempfile
+import threading
+from unittest import TestCase, main
+from unittest.mock import patch
+
+# inception sdk
+import inception_sdk.tools.deployment_utils.deployment_utils as deployment_utils
+from inception_sdk.tools.deployment_utils.clu_output_parser import (
+    EVENT_ERROR,
+    EVENT_INFO,
+    EVENT_RESOURCE_STATUS,
+    EVENT_WARNING,
+    CluEvent,
+    CluOutputParser,
+)
+from inception_sdk.vault.environment import Environment
+
+FIXTURES_DIR = os.path.join(os.path.dirname(__file__), "fixtures")
+IMPORT_LOG = os.path.join(FIXTURES_DIR, "clu_import_output.log")
+VALIDATE_LOG = os.path.join(FIXTURES_DIR, "clu_validate_output.log")
+
+EXPECTED_WORKFLOW_VERSION_IDS = [
+    {"version": "1.0.4", "id": "WALLET_APPLICATION"},
+    {"version": "1.1.0", "id": "WALLET_AUTO_TOP_UP_SWITCH"},
+]
+
+
+def _read_lines(log_path: str) -> list[str]:
+    with open(log_path, "r", encoding="utf-8") as log_file:
+        return log_file.readlines()
+
+
+class CluOutputParserTest(TestCase):
+    def _replay(self, log_path: str) -> tuple[CluOutputParser, list[CluEvent]]:
+        events: list[CluEvent] = []
+        parser = CluOutputParser(on_event=events.append)
+        parser.feed_lines(_read_lines(log_path))
+        return parser, events
+
+    def test_replay_import_output(self):
+        parser, events = self._replay(IMPORT_LOG)
+
+        self.assertEqual(parser.workflow_version_ids, EXPECTED_WORKFLOW_VERSION_IDS)
+        self.assertEqual(parser.status_counts, {"IMPORTED": 7, "NOT IMPORTED": 1})
+        self.assertEqual(parser.error_count, 0)
+        self.assertEqual(parser.warning_count, 1)
+        self.assertEqual(
+            [event.kind for event in events],
+            [EVENT_INFO] * 2 + [EVENT_RESOURCE_STATUS] * 8 + [EVENT_WARNING],
+        )
+        self.assertEqual(
+            parser.summary(),
+            "CLU processed 8 resources (7 IMPORTED, 1 NOT IMPORTED) with 0 error(s) and "
+            "1 warning(s)",
+        )
+
+    def test_replay_import_output_resource_status_events(self):
+        _, events = self._replay(IMPORT_LOG)
+        status_events = [event for event in events if event.kind == EVENT_RESOURCE_STATUS]
+
+        self.assertEqual(
+            status_events[5],
+            CluEvent(
+                kind=EVENT_RESOURCE_STATUS,
+                line=_read_lines(IMPORT_LOG)[7].strip(),
+                resource_type="WORKFLOW_DEFINITION_VERSION",
+                resource_id="WALLET_APPLICATION",
+                status="IMPORTED",
+                workflow_version_id={"version": "1.0.4", "id": "WALLET_APPLICATION"},
+                resources_processed=6,
+            ),
+        )
+        self.assertEqual(status_events[7].resource_id, "WALLET_CLOSURE")
+        self.assertEqual(status_events[7].status, "NOT IMPORTED")
+        self.assertIsNone(status_events[7].workflow_version_id)
+        self.assertEqual([event.resources_processed for event in status_events], list(range(1, 9)))
+
+    def test_replay_validate_output(self):
+        parser, events = self._replay(VALIDATE_LOG)
+
+        # validation lines are never treated as deployed workflow versions
+        self.assertEqual(parser.workflow_version_ids, [])
+        self.assertEqual(parser.status_counts, {"VALID": 3, "INVALID": 1})
+        self.assertEqual(parser.error_count, 1)
+        self.assertEqual(events[-1].kind, EVENT_ERROR)
+        self.assertEqual(events[-1].resource_id, "WALLET_CLOSURE")
+
+    def test_feed_from_multiple_threads(self):
+        lines = _read_lines(IMPORT_LOG)
+        parser = CluOutputParser()
+        threads = [threading.Thread(target=parser.feed_lines, args=(lines,)) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(parser.status_counts, {"IMPORTED": 28, "NOT IMPORTED": 4})
+        self.assertEqual(len(parser.workflow_version_ids), 8)
+
+
+class RunCluReplayTest(TestCase):
+    """
+    Replays recorded CLU output through run_clu using a fake CLU binary
+    """
+
+    def setUp(self) -> None:
+        temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        self.temp_dir = temp_dir.name
+
+    def _fake_clu(self, stdout_path: str, stderr_lines: int = 0, return_code: int = 0) -> str:
+        clu_path = os.path.join(self.temp_dir, "clu")
+        with open(clu_path, "w", encoding="utf-8") as clu_file:
+            clu_file.write(
+                "#!/bin/sh\n"
+                f'i=0; while [ $i -lt {stderr_lines} ]; do echo "stderr line $i" >&2; '
+                "i=$((i+1)); done\n"
+                f'cat "{stdout_path}"\n'
+                f"exit {return_code}\n"
+            )
+        os.chmod(clu_path, os.stat(clu_path).st_mode | stat.S_IEXEC)
+        return clu_path
+
+    def test_replay_validate(self):
+        events: list[CluEvent] = []
+        parser = CluOutputParser(on_event=events.append)
+
+        success, clu_output = deployment_utils.run_clu(
+            clu_path=self._fake_clu(VALIDATE_LOG, return_code=1),
+            function="validate",
+            manifest_path="manifest.yaml",
+            parser=parser,
+        )
+
+        self.assertFalse(success)
+        self.assertEqual(clu_output, _read_lines(VALIDATE_LOG))
+        self.assertEqual(len(events), 5)
+        self.assertEqual(parser.error_count, 1)
+
+    def test_replay_large_output_on_both_streams(self):
+        # enough output to fill the OS pipe buffers, which blocks CLU unless both streams are read
+        stdout_path = os.path.join(self.temp_dir, "large_output.log")
+        import_lines = _read_lines(IMPORT_LOG)
+        with open(stdout_path, "w", encoding="utf-8") as stdout_file:
+            stdout_file.writelines(import_lines * 2000)
+        parser = CluOutputParser()
+
+        success, clu_output = deployment_utils.run_clu(
+            clu_path=self._fake_clu(stdout_path, stderr_lines=5000),
+            function="validate",
+            manifest_path="manifest.yaml",
+            parser=parser,
+        )
+
+        self.assertTrue(success)
+        self.assertEqual(clu_output[: len(import_lines) * 2000], import_lines * 2000)
+        self.assertEqual(len(clu_output), len(import_lines) * 2000 + 5000)
+        self.assertEqual(parser.status_counts, {"IMPORTED": 14000, "NOT IMPORTED": 2000})
+        self.assertEqual(parser.workflow_version_ids, EXPECTED_WORKFLOW_VERSION_IDS * 2000)
+
+    def test_workflow_activation_from_replayed_output(self):
+        lines = _read_lines(IMPORT_LOG)
+        parser = CluOutputParser()
+        parser.feed_lines(lines)
+        environment = Environment(name="test_env")
+
+        # ids extracted while streaming match those extracted from the full output afterwards
+        with patch.object(deployment_utils, "update_workflow_definition_version") as mock_update:
+            deployment_utils.handle_workflow_activation(environment, lines)
+            deployment_utils.handle_workflow_activation(
+                environment, lines, parser.workflow_version_ids
+            )
+
+        self.assertEqual(
+            [
+                (call.kwargs["workflow_id"], call.kwargs["workflow_ver"])
+                for call in mock_update.call_args_list
+            ],
+            [("WALLET_APPLICATION", "1.0.4"), ("WALLET_AUTO_TOP_UP_SWITCH", "1.1.0")] * 2,
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,251 @@
+# standard libs
+import os
+import tempfile
+from textwrap import dedent
+from unittest import TestCase, main
+
+# third party
+import yaml
+
+# inception sdk
+import inception_sdk.tools.deployment_utils.deployment_planner as deployment_planner
+
+MANIFEST = """\
+---
+pack_version: 1.0.0
+pack_name: Test Pack
+resource_ids:
+  - loan
+  - loan_internal_contract
+  - LOAN_INTERNAL_ACCOUNT
+  - LOAN_APPLICATION
+  - LOAN_CLOSURE
+  - LOAN_FLAG
+"""
+
+FIXTURES = {
+    "library_manifest.yaml": MANIFEST,
+    "loan/contracts/loan.resource.yaml": """\
+        ---
+        type: SMART_CONTRACT_VERSION
+        id: loan
+        payload: |
+          product_version:
+              code: '@{loan_rendered.py}'
+              product_id: loan
+        """,
+    "loan/contracts/loan_rendered.py": "api = '4.0.0'\n",
+    "loan/contracts/loan_internal_contract.resource.yaml": """\
+        ---
+        type: SMART_CONTRACT_VERSION
+        id: loan_internal_contract
+        payload: |
+          product_version:
+              code: '@{internal_rendered.py}'
+              product_id: loan_internal_contract
+        """,
+    "loan/contracts/internal_rendered.py": "api = '3.12.0'\n",
+    "loan/internal_accounts/loan_internal_account.resource.yaml": """\
+        ---
+        type: INTERNAL_ACCOUNT
+        id: LOAN_INTERNAL_ACCOUNT
+        payload: |
+          internal_account:
+            product_id: '&{loan_internal_contract:product_id}'
+        """,
+    "loan/workflows/loan_workflows.resources.yaml": """\
+        ---
+        resources:
+          - type: WORKFLOW_DEFINITION_VERSION
+            id: LOAN_APPLICATION
+            payload: |
+              workflow_definition_version:
+                  workflow_definition_id: LOAN_APPLICATION
+                  specification: '@{loan_application.yaml}'
+          - type: WORKFLOW_DEFINITION_VERSION
+            id: LOAN_CLOSURE
+            payload: |
+              workflow_definition_version:
+                  workflow_definition_id: LOAN_CLOSURE
+                  specification: '@{loan_closure.yaml}'
+        """,
+    "loan/workflows/loan_application.yaml": "product_id: '&{loan}'\n",
+    "loan/workflows/loan_closure.yaml": "closure_account: '&{LOAN_INTERNAL_ACCOUNT}'\n",
+    "loan/flag_definitions/loan_flag.resource.yaml": """\
+        ---
+        type: FLAG_DEFINITION
+        id: LOAN_FLAG
+        payload: |
+          flag_definition:
+            id: LOAN_FLAG
+        """,
+    "loan/flag_definitions/unused_flag.resource.yaml": """\
+        ---
+        type: FLAG_DEFINITION
+        id: UNUSED_FLAG
+        payload: |
+          flag_definition:
+            id: UNUSED_FLAG
+        """,
+}
+
+ALL_RESOURCE_IDS = [
+    "loan",
+    "loan_internal_contract",
+    "LOAN_INTERNAL_ACCOUNT",
+    "LOAN_APPLICATION",
+    "LOAN_CLOSURE",
+    "LOAN_FLAG",
+]
+
+
+class DeploymentPlannerTest(TestCase):
+    def setUp(self) -> None:
+        temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        self.resource_root = os.path.join(temp_dir.name, "library")
+        self.record_path = os.path.join(temp_dir.name, "records", "env.json")
+        for file_name, contents in FIXTURES.items():
+            self._write(file_name, dedent(contents))
+
+    def _write(self, file_name: str, contents: str) -> None:
+        file_path = os.path.join(self.resource_root, file_name)
+        os.makedirs(os.path.dirname(file_path), exist_ok=True)
+        with open(file_path, "w", encoding="utf-8") as fixture_file:
+            fixture_file.write(contents)
+
+    def _plan(self) -> deployment_planner.DeploymentPlan:
+        return deployment_planner.plan_deployment(
+            resource_root=self.resource_root,
+            manifest_file="library_manifest.yaml",
+            record_path=self.record_path,
+        )
+
+    def _deploy(self) -> None:
+        deployment_planner.save_record(self.record_path, self._plan())
+
+    def test_load_resources_resolves_dependencies_from_embedded_files(self):
+        resources = deployment_planner.load_resources(self.resource_root)
+
+        self.assertEqual(set(resources), set(ALL_RESOURCE_IDS) | {"UNUSED_FLAG"})
+        self.assertEqual(
+            resources["LOAN_INTERNAL_ACCOUNT"].dependencies, {"loan_internal_contract"}
+        )
+        self.assertEqual(resources["LOAN_APPLICATION"].dependencies, {"loan"})
+        self.assertEqual(resources["LOAN_CLOSURE"].dependencies, {"LOAN_INTERNAL_ACCOUNT"})
+        self.assertEqual(resources["loan"].dependencies, set())
+
+    def test_everything_is_planned_without_a_record(self):
+        plan = self._plan()
+
+        self.assertEqual(plan.resource_ids, ALL_RESOURCE_IDS)
+        self.assertEqual(plan.changed, set(ALL_RESOURCE_IDS))
+
+    def test_nothing_is_planned_if_nothing_changed(self):
+        self._deploy()
+
+        self.assertEqual(self._plan().resource_ids, [])
+
+    def test_changed_embedded_file_plans_resource(self):
+        self._deploy()
+        self._write("loan/contracts/loan_rendered.py", "api = '4.0.0'\nversion = '1.0.1'\n")
+
+        plan = self._plan()
+
+        self.assertEqual(plan.changed, {"loan"})
+        # the application workflow specification references the contract
+        self.assertEqual(plan.dependants, {"LOAN_APPLICATION"})
+        self.assertEqual(plan.resource_ids, ["loan", "LOAN_APPLICATION"])
+
+    def test_changed_resource_plans_dependants_and_their_prerequisites(self):
+        self._deploy()
+        self._write("loan/contracts/internal_rendered.py", "api = '3.12.0'\n# changed\n")
+
+        plan = self._plan()
+
+        self.assertEqual(plan.changed, {"loan_internal_contract"})
+        # the closure workflow depends on the contract via the internal account
+        self.assertEqual(plan.dependants, {"LOAN_INTERNAL_ACCOUNT", "LOAN_CLOSURE"})
+        self.assertEqual(plan.prerequisites, set())
+        self.assertEqual(
+            plan.resource_ids, ["loan_internal_contract", "LOAN_INTERNAL_ACCOUNT", "LOAN_CLOSURE"]
+        )
+
+    def test_changed_resource_plans_unchanged_prerequisites(self):
+        self._deploy()
+        self._write(
+            "loan/internal_accounts/loan_internal_account.resource.yaml",
+            dedent(FIXTURES["loan/internal_accounts/loan_internal_account.resource.yaml"])
+            + "    details: changed\n",
+        )
+
+        plan = self._plan()
+
+        self.assertEqual(plan.changed, {"LOAN_INTERNAL_ACCOUNT"})
+        self.assertEqual(plan.dependants, {"LOAN_CLOSURE"})
+        self.assertEqual(plan.prerequisites, {"loan_internal_contract"})
+        self.assertEqual(
+            plan.resource_ids, ["loan_internal_contract", "LOAN_INTERNAL_ACCOUNT", "LOAN_CLOSURE"]
+        )
+
+    def test_changed_resource_in_multi_resource_file_only_plans_that_resource(self):
+        self._deploy()
+        self._write("loan/workflows/loan_closure.yaml", "closure_account: changed\n")
+
+        plan = self._plan()
+
+        self.assertEqual(plan.resource_ids, ["LOAN_CLOSURE"])
+        self.assertEqual(plan.resources["LOAN_CLOSURE"].dependencies, set())
+
+    def test_resources_outside_manifest_are_ignored(self):
+        self._deploy()
+        self._write(
+            "loan/flag_definitions/unused_flag.resource.yaml",
+            dedent(FIXTURES["loan/flag_definitions/unused_flag.resource.yaml"])
+            + "    description: changed\n",
+        )
+
+        plan = self._plan()
+
+        self.assertEqual(plan.resource_ids, [])
+        self.assertNotIn("UNUSED_FLAG", plan.resources)
+
+    def test_undefined_manifest_resources_are_always_planned(self):
+        self._write("library_manifest.yaml", MANIFEST + "  - MISSING_FLAG\n")
+        self._deploy()
+
+        self.assertEqual(self._plan().resource_ids, ["MISSING_FLAG"])
+        self.assertNotIn("MISSING_FLAG", deployment_planner.load_record(self.record_path))
+
+    def test_save_record_keeps_unplanned_resources(self):
+        self._deploy()
+        recorded_hash = deployment_planner.load_record(self.record_path)["LOAN_FLAG"]
+        self._write("library_manifest.yaml", MANIFEST.replace("  - LOAN_FLAG\n", ""))
+        self._write("loan/contracts/loan_rendered.py", "api = '4.0.0'\n# changed\n")
+
+        self._deploy()
+
+        self.assertEqual(
+            deployment_planner.load_record(self.record_path)["LOAN_FLAG"], recorded_hash
+        )
+
+    def test_write_plan_manifest_does_not_modify_hardlinked_original(self):
+        manifest_path = os.path.join(self.resource_root, "library_manifest.yaml")
+        staged_manifest_path = os.path.join(self.resource_root, "staged_manifest.yaml")
+        os.link(manifest_path, staged_manifest_path)
+        self._deploy()
+        self._write("loan/flag_definitions/loan_flag.resource.yaml", "id: LOAN_FLAG\ntype: FLAG\n")
+
+        deployment_planner.write_plan_manifest(staged_manifest_path, self._plan())
+
+        with open(staged_manifest_path, "r", encoding="utf-8") as staged_manifest:
+            self.assertEqual(
+                yaml.safe_load(staged_manifest),
+                {"pack_version": "1.0.0", "pack_name": "Test Pack", "resource_ids": ["LOAN_FLAG"]},
+            )
+        with open(manifest_path, "r", encoding="utf-8") as manifest:
+            self.assertEqual(manifest.read(), MANIFEST)
+
+
+if __name__ == "__main__":
+    main(DeploymentPlannerTest)
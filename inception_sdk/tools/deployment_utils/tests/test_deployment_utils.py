@@ -1,9 +1,17 @@
 # standard libs
+import os
+import tempfile
 from unittest import TestCase, main
+from unittest.mock import patch
+
+# third party
+import yaml
 
 # inception sdk
 import inception_sdk.tools.deployment_utils.deployment_utils as deployment_utils
 from inception_sdk.common.python.flag_utils import FLAGS, flags, parse_flags
+from inception_sdk.tools.deployment_utils.clu_output_parser import CluOutputParser
+from inception_sdk.vault.environment import Environment
 
 
 class FlagParsingTest(TestCase):
@@ -141,5 +149,86 @@ class DeploymentUtilsTest(TestCase):
         self.assertFalse(deployment_utils.deployment_status_successful(clu_output_2))
 
 
+class IncrementalDeploymentTest(TestCase):
+    def setUp(self) -> None:
+        temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        cwd = os.getcwd()
+        os.chdir(temp_dir.name)
+        self.addCleanup(os.chdir, cwd)
+        os.makedirs("inception_sdk")
+        self._write(
+            "library/manifest.yaml", "pack_name: Test Pack\nresource_ids:\n  - FLAG_A\n  - FLAG_B\n"
+        )
+        self._write("library/flag_a.resource.yaml", "type: FLAG_DEFINITION\nid: FLAG_A\n")
+        self._write("library/flag_b.resource.yaml", "type: FLAG_DEFINITION\nid: FLAG_B\n")
+
+        # other tools register required flags that a command line parsed here would fail, so the
+        # flags are marked as parsed and only the flags under test are set
+        FLAGS.unparse_flags()
+        FLAGS.mark_as_parsed()
+        self.addCleanup(FLAGS.unparse_flags)
+        FLAGS.import_manifest = True
+        FLAGS.incremental = True
+        FLAGS.manifest = "library/manifest.yaml"
+
+        self.imported_resource_ids: list[list[str]] = []
+        self.clu_output = ["FLAG_DEFINITION with ID FLAG_A was IMPORTED successfully"]
+        patch.object(
+            deployment_utils,
+            "extract_environments_from_config",
+            return_value=(Environment(name="test_env"), {}),
+        ).start()
+        self.mock_run_clu = patch.object(
+            deployment_utils, "run_clu", side_effect=self._run_clu
+        ).start()
+        self.addCleanup(patch.stopall)
+
+    @staticmethod
+    def _write(file_path: str, contents: str) -> None:
+        os.makedirs(os.path.dirname(file_path), exist_ok=True)
+        with open(file_path, "w", encoding="utf-8") as resource_file:
+            resource_file.write(contents)
+
+    def _run_clu(self, manifest_path: str, parser: CluOutputParser, **_) -> tuple[bool, list[str]]:
+        with open(manifest_path, "r", encoding="utf-8") as manifest:
+            self.imported_resource_ids.append(yaml.safe_load(manifest)["resource_ids"])
+        parser.feed_lines(self.clu_output)
+        return True, self.clu_output
+
+    def test_copy_resources_hardlinks_files(self):
+        with tempfile.TemporaryDirectory(dir=os.getcwd()) as temp_dir:
+            dst = deployment_utils.copy_resources(temp_dir, "library")
+
+            self.assertTrue(
+                os.path.samefile(
+                    os.path.join(dst, "flag_a.resource.yaml"), "library/flag_a.resource.yaml"
+                )
+            )
+
+    def test_only_changed_resources_are_imported(self):
+        deployment_utils.run_deployment_utils([])
+        self._write("library/flag_b.resource.yaml", "type: FLAG_DEFINITION\nid: FLAG_B\nx: 1\n")
+        deployment_utils.run_deployment_utils([])
+
+        self.assertEqual(self.imported_resource_ids, [["FLAG_A", "FLAG_B"], ["FLAG_B"]])
+        with open("library/manifest.yaml", "r", encoding="utf-8") as manifest:
+            self.assertEqual(yaml.safe_load(manifest)["resource_ids"], ["FLAG_A", "FLAG_B"])
+
+    def test_clu_is_not_run_if_nothing_changed(self):
+        deployment_utils.run_deployment_utils([])
+        deployment_utils.run_deployment_utils([])
+
+        self.mock_run_clu.assert_called_once()
+
+    def test_record_is_not_updated_after_failed_import(self):
+        self.clu_output = ["FLAG_DEFINITION with ID FLAG_A failed to import"]
+        deployment_utils.run_deployment_utils([])
+        deployment_utils.run_deployment_utils([])
+
+        self.assertEqual(self.mock_run_clu.call_count, 2)
+        self.assertFalse(os.path.exists(os.path.join(".deployment_records", "test_env.json")))
+
+
 if __name__ == "__main__":
     main(DeploymentUtilsTest)
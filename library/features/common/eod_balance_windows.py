@@ -0,0 +1,110 @@
+# standard libs
+from datetime import datetime
+from dateutil.relativedelta import relativedelta
+from decimal import Decimal
+from typing import Mapping
+
+# contracts api
+from contracts_api import (
+    DEFAULT_ADDRESS,
+    DEFAULT_ASSET,
+    BalanceCoordinate,
+    BalancesObservation,
+    BalanceTimeseries,
+    Phase,
+)
+
+# An EOD balance window is a list of end-of-day net balances for a single balance coordinate, in
+# reverse chronological order. Position [0] is the most recent EOD, [1] the EOD before, and so on
+
+
+def get_window_from_observations(
+    *,
+    observations: list[BalancesObservation],
+    denomination: str,
+    address: str = DEFAULT_ADDRESS,
+    asset: str = DEFAULT_ASSET,
+    phase: Phase = Phase.COMMITTED,
+) -> list[Decimal]:
+    """
+    Extracts the net balance of a single coordinate from each EOD observation
+    :param observations: EOD balances observations, in reverse chronological order
+    :param denomination: balance denomination
+    :param address: balance address
+    :param asset: balance asset
+    :param phase: balance phase
+    :return: the EOD balance window, in the same order as the observations
+    """
+    coordinate = BalanceCoordinate(address, asset, denomination, phase)
+    return [observation.balances[coordinate].net for observation in observations]
+
+
+def get_window_from_timeseries(
+    *,
+    balances_timeseries: Mapping[BalanceCoordinate, BalanceTimeseries],
+    effective_datetime: datetime,
+    number_of_days: int,
+    denomination: str,
+    address: str = DEFAULT_ADDRESS,
+    asset: str = DEFAULT_ASSET,
+    phase: Phase = Phase.COMMITTED,
+) -> list[Decimal]:
+    """
+    Extracts the net balance of a single coordinate at the same time of day on consecutive days
+    from a single balances timeseries fetch, walking the timeseries once rather than searching it
+    for each day.
+    :param balances_timeseries: map of balance coordinates to balance timeseries, as returned by
+    `vault.get_balances_timeseries()`. It must cover the whole window
+    :param effective_datetime: the most recent EOD datetime. Earlier EODs are at the same time on
+    each of the preceding days
+    :param number_of_days: the number of EOD balances in the window
+    :param denomination: balance denomination
+    :param address: balance address
+    :param asset: balance asset
+    :param phase: balance phase
+    :return: the EOD balance window
+    """
+    coordinate = BalanceCoordinate(address, asset, denomination, phase)
+    timeseries = balances_timeseries.get(coordinate, [])
+    window: list[Decimal] = []
+    # index of the latest timeseries entry that could apply to the current EOD
+    index = len(timeseries) - 1
+    for day in range(number_of_days):
+        eod_datetime = effective_datetime - relativedelta(days=day)
+        while index >= 0 and timeseries[index].at_datetime > eod_datetime:
+            index -= 1
+        window.append(timeseries[index].value.net if index >= 0 else Decimal("0"))
+    return window
+
+
+def get_window_max(*, window: list[Decimal], start: int = 0, end: int | None = None) -> Decimal:
+    """
+    Returns the highest balance in a range of the window
+    :param window: the EOD balance window
+    :param start: the position of the first EOD in the range
+    :param end: the position after the last EOD in the range. Defaults to the end of the window
+    :return: the highest balance in the range, which must not be empty
+    """
+    return max(window[start:end])
+
+
+def get_window_min(*, window: list[Decimal], start: int = 0, end: int | None = None) -> Decimal:
+    """
+    Returns the lowest balance in a range of the window
+    :param window: the EOD balance window
+    :param start: the position of the first EOD in the range
+    :param end: the position after the last EOD in the range. Defaults to the end of the window
+    :return: the lowest balance in the range, which must not be empty
+    """
+    return min(window[start:end])
+
+
+def is_window_negative(*, window: list[Decimal], start: int = 0, end: int | None = None) -> bool:
+    """
+    Determines whether every balance in a range of the window is negative
+    :param window: the EOD balance window
+    :param start: the position of the first EOD in the range
+    :param end: the position after the last EOD in the range. Defaults to the end of the window
+    :return: True if every balance in the range is below zero
+    """
+    return all(balance < 0 for balance in window[start:end])
@@ -5,7 +5,7 @@ Provides commonly used Contracts API v4 helper methods for use with supervisor c
 from datetime import datetime
 from dateutil.relativedelta import relativedelta
 from decimal import Decimal
-from typing import Callable
+from typing import Callable, NamedTuple
 
 # features
 import library.features.common.addresses as addresses
@@ -13,9 +13,12 @@ import library.features.common.utils as utils
 
 # contracts api
 from contracts_api import (
+    DEFAULT_ASSET,
     AccountNotificationDirective,
+    BalanceCoordinate,
     BalanceDefaultDict,
     CustomInstruction,
+    Phase,
     Posting,
     PostingInstructionsDirective,
     PostPostingHookResult,
@@ -37,6 +40,31 @@ from inception_sdk.vault.contracts.extensions.contracts_api_extensions import (
 # an event for synchronising schedules in a supervisor from a supervisee schedule
 SUPERVISEE_SCHEDULE_SYNC_EVENT = "SUPERVISEE_SCHEDULE_SYNC"
 
+SuperviseeBalancesView = NamedTuple(
+    "SuperviseeBalancesView",
+    [
+        # the balances of each supervisee, as of a single effective datetime
+        ("balances", list[BalanceDefaultDict]),
+        # (address, denomination) to the DEFAULT_ASSET COMMITTED net of each supervisee, in the
+        # same order as `balances`. Populated on first use by get_supervisee_nets_from_view
+        ("nets", dict[tuple[str, str], list[Decimal]]),
+    ],
+)
+
+SuperviseeDirectivesIndex = NamedTuple(
+    "SuperviseeDirectivesIndex",
+    [
+        ("notification_directives", dict[str, list[AccountNotificationDirective]]),
+        ("posting_directives", dict[str, list[PostingInstructionsDirective]]),
+        ("update_account_event_type_directives", dict[str, list[UpdateAccountEventTypeDirective]]),
+        # supervisee account id to the posting instructions of its posting directives
+        ("posting_instructions", dict[str, list[CustomInstruction]]),
+        # supervisee account id to the net balances of its posting instructions, keyed by
+        # (address, asset, denomination, phase)
+        ("posting_balances", dict[str, BalanceDefaultDict]),
+    ],
+)
+
 
 def schedule_sync_event_types(product_name: str) -> list[SupervisorContractEventType]:
     return [
@@ -119,11 +147,44 @@ def get_balances_default_dicts_from_timeseries(
     }
 
 
+def create_supervisee_balances_view(
+    balances: list[BalanceDefaultDict],
+) -> SuperviseeBalancesView:
+    """
+    Creates a view over supervisee balances for a single effective datetime. The view should be
+    created once per hook and passed to each helper that needs the supervisee balances, so that
+    each balance is only looked up once regardless of how many helpers use it.
+    :param balances: the balances of each supervisee, e.g. from
+    get_balance_default_dicts_for_supervisees
+    :return: the supervisee balances view
+    """
+    return SuperviseeBalancesView(balances=balances, nets={})
+
+
+def get_supervisee_nets_from_view(
+    balances_view: SuperviseeBalancesView, address: str, denomination: str
+) -> list[Decimal]:
+    """
+    Returns the DEFAULT_ASSET COMMITTED net balance of each supervisee in the view for the given
+    address and denomination, looking up the balances on first use only
+    :param balances_view: the supervisee balances view
+    :param address: the balance address
+    :param denomination: the balance denomination
+    :return: the net balance of each supervisee, in the same order as the view's balances
+    """
+    key = (address, denomination)
+    if key not in balances_view.nets:
+        coordinate = BalanceCoordinate(address, DEFAULT_ASSET, denomination, Phase.COMMITTED)
+        balances_view.nets[key] = [balance[coordinate].net for balance in balances_view.balances]
+    return balances_view.nets[key]
+
+
 def sum_balances_across_supervisees(
     balances: list[BalanceDefaultDict],
     denomination: str,
     addresses: list[str],
     rounding_precision: int = 2,
+    balances_view: SuperviseeBalancesView | None = None,
 ) -> Decimal:
     """
     Sums the net balance values for the addresses across multiple vault objects,
@@ -132,8 +193,25 @@ def sum_balances_across_supervisees(
     :param denomination: the denomination of the balances
     :param addresses: the addresses of the balances
     :param rounding_precision: the precision to which each balance is individually rounded
+    :param balances_view: optional view created from the same balances, which is used instead of
+    looking up the balances again
     :return: the sum of balances across the specified supervisees
     """
+    if balances_view is not None:
+        supervisee_sums = [Decimal(0)] * len(balances_view.balances)
+        for address in addresses:
+            supervisee_nets = get_supervisee_nets_from_view(
+                balances_view=balances_view, address=address, denomination=denomination
+            )
+            for index, net in enumerate(supervisee_nets):
+                supervisee_sums[index] += net
+        return Decimal(
+            sum(
+                utils.round_decimal(supervisee_sum, rounding_precision)
+                for supervisee_sum in supervisee_sums
+            )
+        )
+
     return Decimal(
         sum(
             utils.round_decimal(
@@ -195,6 +273,116 @@ def get_supervisee_directives_mapping(
     )
 
 
+def create_supervisee_directives_index(
+    supervisees: list[SuperviseeContractVault],
+    tside: Tside = Tside.ASSET,
+) -> SuperviseeDirectivesIndex:
+    """
+    Collects the directives of all supervisees in a single pass, along with the net balances of
+    each supervisee's posting instructions. The index should be created once per hook and reused
+    for each event type or aggregation, rather than re-scanning every supervisee's hook result
+
+    :param supervisees: the supervisee vault objects
+    :param tside: the Tside used to calculate the posting instruction balances
+    :return: the supervisee directives index
+    """
+    directives_index = SuperviseeDirectivesIndex(
+        notification_directives={},
+        posting_directives={},
+        update_account_event_type_directives={},
+        posting_instructions={},
+        posting_balances={},
+    )
+    for supervisee in supervisees:
+        (
+            notification_directives,
+            posting_directives,
+            update_account_event_type_directives,
+        ) = get_supervisee_directives_mapping(vault=supervisee)
+        directives_index.notification_directives.update(notification_directives)
+        directives_index.posting_directives.update(posting_directives)
+        directives_index.update_account_event_type_directives.update(
+            update_account_event_type_directives
+        )
+
+        account_id = supervisee.account_id
+        if account_id not in posting_directives:
+            continue
+        posting_instructions = [
+            posting_instruction
+            for posting_directive in posting_directives[account_id]
+            for posting_instruction in posting_directive.posting_instructions
+        ]
+        posting_balances = BalanceDefaultDict()
+        for posting_instruction in posting_instructions:
+            posting_balances += posting_instruction.balances(account_id=account_id, tside=tside)
+        directives_index.posting_instructions[account_id] = posting_instructions
+        directives_index.posting_balances[account_id] = posting_balances
+
+    return directives_index
+
+
+def create_aggregate_posting_instructions_from_index(
+    aggregate_account_id: str,
+    directives_index: SuperviseeDirectivesIndex,
+    prefix: str,
+    balances: BalanceDefaultDict,
+    addresses_to_aggregate: list[str],
+    account_ids: list[str] | None = None,
+    tside: Tside = Tside.ASSET,
+    force_override: bool = True,
+    rounding_precision: int = 2,
+) -> list[CustomInstruction]:
+    """
+    Equivalent to create_aggregate_posting_instructions, but uses the posting balances already
+    summed per supervisee in the directives index. Only the balances at the addresses to aggregate
+    are added, so the cost grows with the number of supervisees rather than with the number of
+    posting instructions each supervisee produced.
+
+    :param aggregate_account_id: The account id of the vault object where the aggregate postings
+    are made (i.e. the "main" account)
+    :param directives_index: The supervisee directives index, which must have been created with the
+    same tside
+    :param prefix: The prefix of the aggregated balances
+    :param balances: The balances of the account where the aggregate postings are made (i.e. the
+    "main" account)
+    :param addresses_to_aggregate: A list of addresses to get aggregate postings for
+    :param account_ids: The supervisee account ids to aggregate postings for. If not provided, all
+    supervisees in the index are aggregated
+    :param tside: The Tside of the account
+    :param force_override: boolean to pass into instruction details to force override hooks
+    :param rounding_precision: The rounding precision to correct for
+    :return: The aggregated custom instructions
+    """
+    if account_ids is None:
+        account_ids = list(directives_index.posting_balances.keys())
+
+    aggregate_balances = BalanceDefaultDict()
+    for account_id in account_ids:
+        for balance_coordinate, balance in directives_index.posting_balances.get(
+            account_id, {}
+        ).items():
+            if balance_coordinate.account_address in addresses_to_aggregate:
+                aggregate_balances[balance_coordinate] = (
+                    aggregate_balances[balance_coordinate] + balance
+                )
+
+    filtered_aggregate_balances = filter_aggregate_balances(
+        aggregate_balances=aggregate_balances,
+        balances=balances,
+        addresses_to_aggregate=addresses_to_aggregate,
+        rounding_precision=rounding_precision,
+    )
+
+    return _create_aggregate_posting_instructions_from_balances(
+        aggregate_account_id=aggregate_account_id,
+        aggregate_balances=filtered_aggregate_balances,
+        prefix=prefix,
+        tside=tside,
+        force_override=force_override,
+    )
+
+
 def create_aggregate_posting_instructions(
     aggregate_account_id: str,
     posting_instructions_by_supervisee: dict[str, list[CustomInstruction]],
@@ -245,10 +433,26 @@ def create_aggregate_posting_instructions(
         rounding_precision=rounding_precision,
     )
 
+    return _create_aggregate_posting_instructions_from_balances(
+        aggregate_account_id=aggregate_account_id,
+        aggregate_balances=filtered_aggregate_balances,
+        prefix=prefix,
+        tside=tside,
+        force_override=force_override,
+    )
+
+
+def _create_aggregate_posting_instructions_from_balances(
+    aggregate_account_id: str,
+    aggregate_balances: BalanceDefaultDict,
+    prefix: str,
+    tside: Tside,
+    force_override: bool,
+) -> list[CustomInstruction]:
     # create postings from the filtered aggregate balances dict
     # two sets of postings (a credit and a debit) are created for each item in the dict
     aggregate_postings: list[Posting] = []
-    for balance_coordinate, balance in filtered_aggregate_balances.items():
+    for balance_coordinate, balance in aggregate_balances.items():
         amount: Decimal = balance.net
         prefixed_address = f"{prefix}_{balance_coordinate.account_address}"
         debit_address = (
@@ -318,12 +522,13 @@ def filter_aggregate_balances(
     :return: A filtered dict of aggregated balances
     """
     filtered_aggregate_balance_mapping = aggregate_balances.copy()
-    new_balance_mapping = aggregate_balances + balances
 
-    for balance_coordinate in aggregate_balances:
+    for balance_coordinate, aggregate_balance in aggregate_balances.items():
         if balance_coordinate.account_address in addresses_to_aggregate:
             current_amount = balances[balance_coordinate].net
-            new_amount = new_balance_mapping[balance_coordinate].net
+            # only the aggregated coordinates are needed, so there is no need to add the
+            # aggregate balances to every balance of the account
+            new_amount = aggregate_balance.net + current_amount
 
             if utils.round_decimal(
                 amount=new_amount, decimal_places=rounding_precision
@@ -0,0 +1,155 @@
+"""
+Micro-benchmarks of the hot common feature helpers, run with
+inception_sdk/test_framework/common/benchmark_runner.py. Timings are compared against
+benchmarks_baseline.json in this directory
+"""
+# standard libs
+from datetime import datetime, timedelta
+from decimal import Decimal
+from functools import partial
+from typing import Any, Callable
+from zoneinfo import ZoneInfo
+
+# features
+import library.features.common.client_transaction_utils as client_transaction_utils
+import library.features.common.utils as utils
+
+# contracts api
+from contracts_api import (
+    DEFAULT_ADDRESS,
+    DEFAULT_ASSET,
+    Balance,
+    BalanceCoordinate,
+    BalanceDefaultDict,
+    ClientTransaction,
+    Phase,
+)
+
+# inception sdk
+from inception_sdk.test_framework.common.benchmark import MicroBenchmark
+from inception_sdk.test_framework.contracts.unit.common import FeatureTest
+
+DENOMINATION = "GBP"
+OTHER_DENOMINATION = "USD"
+START = datetime(2023, 1, 1, tzinfo=ZoneInfo("UTC"))
+# an account's balances usually span a few phases, denominations and many custom addresses
+BALANCE_COUNTS = [10, 100, 1000]
+LOOKUP_ADDRESSES = [DEFAULT_ADDRESS] + [f"ADDRESS_{i}" for i in range(9)]
+CLIENT_TRANSACTION_COUNTS = [10, 100, 1000]
+INSTRUCTION_DETAILS_KEY = "transaction_type"
+INSTRUCTION_DETAILS_VALUES = ["ATM", "POS", "TRANSFER"]
+
+
+def _balances(balance_count: int) -> BalanceDefaultDict:
+    phases = [Phase.COMMITTED, Phase.PENDING_IN, Phase.PENDING_OUT]
+    denominations = [DENOMINATION, OTHER_DENOMINATION]
+    mapping = {}
+    for i in range(balance_count):
+        # each address has a balance in every phase and denomination
+        address_index = i // (len(phases) * len(denominations))
+        address = f"ADDRESS_{address_index - 1}" if address_index else DEFAULT_ADDRESS
+        coordinate = BalanceCoordinate(
+            address, DEFAULT_ASSET, denominations[i % 2], phases[(i // 2) % len(phases)]
+        )
+        mapping[coordinate] = Balance(net=Decimal("123.456789") * (i + 1))
+    return BalanceDefaultDict(mapping=mapping)
+
+
+def _prepare_balance_at_coordinates(
+    balance_count: int, decimal_places: int | None
+) -> Callable[[], Any]:
+    balances = _balances(balance_count)
+
+    def func() -> list[Decimal]:
+        # a mix of present and missing coordinates, as hooks look up addresses that may be unused
+        return [
+            utils.balance_at_coordinates(
+                balances=balances,
+                address=address,
+                denomination=DENOMINATION,
+                decimal_places=decimal_places,
+            )
+            for address in LOOKUP_ADDRESSES
+        ]
+
+    return func
+
+
+def _client_transactions(client_transaction_count: int) -> dict[str, ClientTransaction]:
+    postings = FeatureTest()
+    client_transactions = {}
+    for i in range(client_transaction_count):
+        client_transaction_id = f"client_transaction_{i}"
+        # one in ten is in another denomination, the rest alternate between instruction types
+        denomination = OTHER_DENOMINATION if i % 10 == 9 else DENOMINATION
+        instruction_details = {
+            INSTRUCTION_DETAILS_KEY: INSTRUCTION_DETAILS_VALUES[i % len(INSTRUCTION_DETAILS_VALUES)]
+        }
+        value_datetime = START + timedelta(minutes=i)
+        amount = Decimal(i % 500 + 1)
+        if i % 3 == 0:
+            instruction = postings.outbound_auth(
+                amount=amount,
+                denomination=denomination,
+                client_transaction_id=client_transaction_id,
+                instruction_details=instruction_details,
+                value_datetime=value_datetime,
+            )
+        elif i % 3 == 1:
+            instruction = postings.outbound_hard_settlement(
+                amount=amount,
+                denomination=denomination,
+                client_transaction_id=client_transaction_id,
+                instruction_details=instruction_details,
+                value_datetime=value_datetime,
+            )
+        else:
+            instruction = postings.inbound_hard_settlement(
+                amount=amount,
+                denomination=denomination,
+                client_transaction_id=client_transaction_id,
+                instruction_details=instruction_details,
+                value_datetime=value_datetime,
+            )
+        client_transactions[client_transaction_id] = ClientTransaction(
+            client_transaction_id=client_transaction_id,
+            account_id=instruction.target_account_id,
+            posting_instructions=[instruction],
+        )
+    return client_transactions
+
+
+def _prepare_filter_client_transactions(client_transaction_count: int) -> Callable[[], Any]:
+    client_transactions = _client_transactions(client_transaction_count)
+    # e.g. the client transactions in the posting instructions being processed
+    client_transaction_ids_to_ignore = list(client_transactions)[::10]
+    return lambda: client_transaction_utils.filter_client_transactions(
+        client_transactions=client_transactions,
+        denomination=DENOMINATION,
+        key=INSTRUCTION_DETAILS_KEY,
+        value="ATM",
+        client_transaction_ids_to_ignore=client_transaction_ids_to_ignore,
+    )
+
+
+BENCHMARKS = [
+    *(
+        MicroBenchmark(
+            name=f"utils.balance_at_coordinates {len(LOOKUP_ADDRESSES)} lookups, "
+            f"{balance_count} balances{', rounded' if decimal_places else ''}",
+            prepare=partial(_prepare_balance_at_coordinates, balance_count, decimal_places),
+            number=200,
+        )
+        for balance_count in BALANCE_COUNTS
+        for decimal_places in [None, 2]
+    ),
+    *(
+        MicroBenchmark(
+            name=f"client_transaction_utils.filter_client_transactions "
+            f"{client_transaction_count} client transactions",
+            prepare=partial(_prepare_filter_client_transactions, client_transaction_count),
+            number=max(1, 2000 // client_transaction_count),
+        )
+        for client_transaction_count in CLIENT_TRANSACTION_COUNTS
+    ),
+]
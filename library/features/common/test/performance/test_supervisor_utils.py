@@ -0,0 +1,130 @@
+# standard libs
+from decimal import Decimal
+
+# features
+import library.features.common.addresses as addresses
+import library.features.common.supervisor_utils as supervisor_utils
+
+# contracts api
+from contracts_api import DEFAULT_ADDRESS, DEFAULT_ASSET, BalanceDefaultDict, Phase, Posting
+
+# inception sdk
+from inception_sdk.test_framework.common.benchmark import run_benchmark
+from inception_sdk.test_framework.contracts.unit.contracts_api_extension import (
+    CustomInstruction,
+    PostingInstructionsDirective,
+    ScheduledEventHookResult,
+)
+from inception_sdk.test_framework.contracts.unit.supervisor.common import SupervisorFeatureTest
+
+ADDRESSES_TO_AGGREGATE = [DEFAULT_ADDRESS, addresses.PENALTIES]
+DIRECTIVES_PER_SUPERVISEE = 5
+SUPERVISEE_COUNTS = [10, 100, 1000]
+
+
+class SupervisorDirectivesPerformanceTest(SupervisorFeatureTest):
+    """
+    Compares aggregating supervisee posting directives by scanning each supervisee per event type
+    against building a directives index once and aggregating from it.
+    """
+
+    def _create_supervisees(self, count: int) -> list:
+        supervisees = []
+        for index in range(count):
+            account_id = f"supervisee_{index}"
+            posting_instructions_directives = [
+                PostingInstructionsDirective(
+                    posting_instructions=[  # type: ignore
+                        CustomInstruction(
+                            postings=[
+                                Posting(
+                                    credit=False,
+                                    amount=Decimal("1.001"),
+                                    denomination=self.default_denomination,
+                                    account_id=account_id,
+                                    account_address=address,
+                                    asset=DEFAULT_ASSET,
+                                    phase=Phase.COMMITTED,
+                                ),
+                                Posting(
+                                    credit=True,
+                                    amount=Decimal("1.001"),
+                                    denomination=self.default_denomination,
+                                    account_id=account_id,
+                                    account_address=addresses.INTERNAL_CONTRA,
+                                    asset=DEFAULT_ASSET,
+                                    phase=Phase.COMMITTED,
+                                ),
+                            ]
+                        )
+                        for address in ADDRESSES_TO_AGGREGATE
+                    ]
+                )
+                for _ in range(DIRECTIVES_PER_SUPERVISEE)
+            ]
+            supervisees.append(
+                self.create_supervisee_mock(
+                    supervisee_hook_result=ScheduledEventHookResult(
+                        posting_instructions_directives=posting_instructions_directives
+                    ),
+                    account_id=account_id,
+                )
+            )
+        return supervisees
+
+    def _aggregate_per_address(self, supervisees: list) -> list[list[CustomInstruction]]:
+        # one aggregation per address, as a supervisor does for each of its event types
+        results = []
+        for address in ADDRESSES_TO_AGGREGATE:
+            posting_instructions_by_supervisee: dict[str, list[CustomInstruction]] = {}
+            for supervisee in supervisees:
+                _, posting_directives, _ = supervisor_utils.get_supervisee_directives_mapping(
+                    vault=supervisee
+                )
+                for account_id, directives in posting_directives.items():
+                    posting_instructions_by_supervisee[account_id] = [
+                        posting_instruction
+                        for directive in directives
+                        for posting_instruction in directive.posting_instructions
+                    ]
+            results.append(
+                supervisor_utils.create_aggregate_posting_instructions(
+                    aggregate_account_id="main",
+                    posting_instructions_by_supervisee=posting_instructions_by_supervisee,
+                    prefix="TOTAL",
+                    balances=BalanceDefaultDict(),
+                    addresses_to_aggregate=[address],
+                )
+            )
+        return results
+
+    def _aggregate_per_address_from_index(self, supervisees: list) -> list[list[CustomInstruction]]:
+        directives_index = supervisor_utils.create_supervisee_directives_index(
+            supervisees=supervisees
+        )
+        return [
+            supervisor_utils.create_aggregate_posting_instructions_from_index(
+                aggregate_account_id="main",
+                directives_index=directives_index,
+                prefix="TOTAL",
+                balances=BalanceDefaultDict(),
+                addresses_to_aggregate=[address],
+            )
+            for address in ADDRESSES_TO_AGGREGATE
+        ]
+
+    def test_benchmark_aggregate_posting_instructions(self):
+        for supervisee_count in SUPERVISEE_COUNTS:
+            with self.subTest(supervisee_count=supervisee_count):
+                supervisees = self._create_supervisees(supervisee_count)
+                unindexed = run_benchmark(
+                    f"aggregate {supervisee_count} supervisees without index",
+                    lambda: self._aggregate_per_address(supervisees),
+                    repeat=3,
+                )
+                indexed = run_benchmark(
+                    f"aggregate {supervisee_count} supervisees with index",
+                    lambda: self._aggregate_per_address_from_index(supervisees),
+                    repeat=3,
+                )
+                self.assertListEqual(indexed.return_value, unindexed.return_value)
@@ -0,0 +1,142 @@
+# standard libs
+from datetime import datetime
+from dateutil.relativedelta import relativedelta
+from unittest import TestCase
+from zoneinfo import ZoneInfo
+
+# features
+import library.features.common.utils as utils
+
+# contracts api
+from contracts_api import CalendarEvent, CalendarEvents
+
+# inception sdk
+from inception_sdk.test_framework.common.benchmark import run_benchmark
+
+# fixed-date bank holidays as (month, day)
+BANK_HOLIDAYS = [(1, 1), (4, 10), (4, 13), (5, 4), (5, 25), (8, 31), (12, 25), (12, 26)]
+CALENDAR_YEARS = range(2000, 2050)
+# a long closure, e.g. a branch being closed over the festive period
+CLOSURE_START = datetime(2030, 12, 1, tzinfo=ZoneInfo("UTC"))
+CLOSURE_DAYS = 60
+
+
+def _linear_next_datetime_after_calendar_events(
+    effective_datetime: datetime, calendar_events: CalendarEvents
+) -> datetime:
+    # the previous implementation, which checks every event for each day in turn
+    while utils.falls_on_calendar_events(effective_datetime, calendar_events):
+        effective_datetime += relativedelta(days=1)
+    return effective_datetime
+
+
+class CalendarEventsPerformanceTest(TestCase):
+    """
+    Compares finding the next datetime after calendar events by checking each day against every
+    event against using a calendar events index, for a multi-year bank holiday calendar.
+    """
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        calendar_events = [
+            CalendarEvent(
+                id=f"{year}-{month}-{day}",
+                calendar_id="PUBLIC_HOLIDAYS",
+                start_datetime=datetime(year, month, day, tzinfo=ZoneInfo("UTC")),
+                end_datetime=datetime(year, month, day, 23, 59, 59, tzinfo=ZoneInfo("UTC")),
+            )
+            for year in CALENDAR_YEARS
+            for month, day in BANK_HOLIDAYS
+        ]
+        calendar_events += [
+            CalendarEvent(
+                id=f"CLOSURE_{day}",
+                calendar_id="PUBLIC_HOLIDAYS",
+                start_datetime=CLOSURE_START + relativedelta(days=day),
+                end_datetime=CLOSURE_START + relativedelta(days=day, hours=23, minutes=59),
+            )
+            for day in range(CLOSURE_DAYS)
+        ]
+        cls.calendar_events = CalendarEvents(calendar_events=calendar_events)
+        # schedule datetimes that fall on each bank holiday and on the start of the closure
+        cls.effective_datetimes = [
+            datetime(year, month, day, 9, tzinfo=ZoneInfo("Europe/London"))
+            for year in CALENDAR_YEARS
+            for month, day in BANK_HOLIDAYS
+        ] + [CLOSURE_START + relativedelta(hours=9)]
+
+    def test_benchmark_next_datetime_after_calendar_events(self):
+        linear = run_benchmark(
+            "next datetime after calendar events by linear scan",
+            lambda: [
+                _linear_next_datetime_after_calendar_events(
+                    effective_datetime=effective_datetime, calendar_events=self.calendar_events
+                )
+                for effective_datetime in self.effective_datetimes
+            ],
+            repeat=3,
+        )
+        indexed = run_benchmark(
+            "next datetime after calendar events with index",
+            lambda: [
+                utils.get_next_datetime_after_calendar_events(
+                    effective_datetime=effective_datetime, calendar_events=self.calendar_events
+                )
+                for effective_datetime in self.effective_datetimes
+            ],
+            repeat=3,
+        )
+
+        def next_datetime_after_calendar_events_with_shared_index() -> list[datetime]:
+            calendar_events_index = utils.create_calendar_events_index(
+                calendar_events=self.calendar_events
+            )
+            return [
+                utils.get_next_datetime_after_calendar_events(
+                    effective_datetime=effective_datetime,
+                    calendar_events=self.calendar_events,
+                    calendar_events_index=calendar_events_index,
+                )
+                for effective_datetime in self.effective_datetimes
+            ]
+
+        shared_index = run_benchmark(
+            "next datetime after calendar events with shared index",
+            next_datetime_after_calendar_events_with_shared_index,
+            repeat=3,
+        )
+        self.assertListEqual(indexed.return_value, linear.return_value)
+        self.assertListEqual(shared_index.return_value, linear.return_value)
+        self.assertEqual(
+            indexed.return_value[-1],
+            CLOSURE_START + relativedelta(days=CLOSURE_DAYS, hours=9),
+        )
+
+    def test_benchmark_falls_on_calendar_events(self):
+        linear = run_benchmark(
+            "falls on calendar events by linear scan",
+            lambda: [
+                utils.falls_on_calendar_events(
+                    effective_datetime=effective_datetime, calendar_events=self.calendar_events
+                )
+                for effective_datetime in self.effective_datetimes
+            ],
+            repeat=3,
+        )
+
+        def falls_on_calendar_events_index() -> list[bool]:
+            calendar_events_index = utils.create_calendar_events_index(
+                calendar_events=self.calendar_events
+            )
+            return [
+                utils.falls_on_calendar_events_index(
+                    effective_datetime=effective_datetime,
+                    calendar_events_index=calendar_events_index,
+                )
+                for effective_datetime in self.effective_datetimes
+            ]
+
+        indexed = run_benchmark(
+            "falls on calendar events with index", falls_on_calendar_events_index, repeat=3
+        )
+        self.assertListEqual(indexed.return_value, linear.return_value)
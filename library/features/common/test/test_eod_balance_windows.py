@@ -0,0 +1,174 @@
+# standard libs
+from datetime import datetime
+from decimal import Decimal
+from zoneinfo import ZoneInfo
+
+# features
+import library.features.common.eod_balance_windows as eod_balance_windows
+
+# contracts api
+from contracts_api import (
+    Balance,
+    BalanceDefaultDict,
+    BalancesObservation,
+    BalanceTimeseries,
+    Phase,
+)
+
+# inception sdk
+from inception_sdk.test_framework.contracts.unit.common import FeatureTest
+
+DEFAULT_DATETIME = datetime(2023, 1, 10, 23, 59, 59, 999999, tzinfo=ZoneInfo("UTC"))
+
+
+class GetWindowFromObservationsTest(FeatureTest):
+    def test_get_window_from_observations(self):
+        observations = [
+            BalancesObservation(
+                value_datetime=DEFAULT_DATETIME,
+                balances=BalanceDefaultDict(
+                    mapping={
+                        self.balance_coordinate(): self.balance(net=Decimal(net)),
+                        self.balance_coordinate(account_address="OTHER"): self.balance(
+                            net=Decimal("1000")
+                        ),
+                    }
+                ),
+            )
+            for net in ["-10", "5", "-20"]
+        ]
+
+        result = eod_balance_windows.get_window_from_observations(
+            observations=observations, denomination=self.default_denomination
+        )
+
+        self.assertListEqual(result, [Decimal("-10"), Decimal("5"), Decimal("-20")])
+
+    def test_get_window_from_observations_for_non_default_coordinate(self):
+        observations = [
+            BalancesObservation(
+                value_datetime=DEFAULT_DATETIME,
+                balances=BalanceDefaultDict(
+                    mapping={
+                        self.balance_coordinate(
+                            account_address="OTHER", phase=Phase.PENDING_OUT
+                        ): self.balance(net=Decimal("-3"))
+                    }
+                ),
+            ),
+            BalancesObservation(value_datetime=DEFAULT_DATETIME, balances=BalanceDefaultDict()),
+        ]
+
+        result = eod_balance_windows.get_window_from_observations(
+            observations=observations,
+            denomination=self.default_denomination,
+            address="OTHER",
+            phase=Phase.PENDING_OUT,
+        )
+
+        self.assertListEqual(result, [Decimal("-3"), Decimal("0")])
+
+
+class GetWindowFromTimeseriesTest(FeatureTest):
+    def test_get_window_from_timeseries(self):
+        balances_timeseries = {
+            self.balance_coordinate(): BalanceTimeseries(
+                [
+                    (datetime(2023, 1, 5, tzinfo=ZoneInfo("UTC")), Balance(net=Decimal("-5"))),
+                    (datetime(2023, 1, 7, 12, tzinfo=ZoneInfo("UTC")), Balance(net=Decimal("7"))),
+                    (datetime(2023, 1, 8, 1, tzinfo=ZoneInfo("UTC")), Balance(net=Decimal("-8"))),
+                    (DEFAULT_DATETIME, Balance(net=Decimal("-10"))),
+                ]
+            )
+        }
+
+        result = eod_balance_windows.get_window_from_timeseries(
+            balances_timeseries=balances_timeseries,
+            effective_datetime=DEFAULT_DATETIME,
+            number_of_days=7,
+            denomination=self.default_denomination,
+        )
+
+        # 10th, 9th, 8th, 7th, 6th, 5th and 4th of January
+        self.assertListEqual(
+            result,
+            [
+                Decimal("-10"),
+                Decimal("-8"),
+                Decimal("-8"),
+                Decimal("7"),
+                Decimal("-5"),
+                Decimal("-5"),
+                Decimal("0"),
+            ],
+        )
+
+    def test_get_window_from_timeseries_matches_timeseries_at(self):
+        timeseries = BalanceTimeseries(
+            [
+                (
+                    datetime(2023, 1, day, hour, tzinfo=ZoneInfo("UTC")),
+                    Balance(net=Decimal(day * 100 + hour)),
+                )
+                for day in range(1, 11)
+                for hour in [0, 12, 23]
+            ]
+        )
+
+        result = eod_balance_windows.get_window_from_timeseries(
+            balances_timeseries={self.balance_coordinate(): timeseries},
+            effective_datetime=DEFAULT_DATETIME,
+            number_of_days=9,
+            denomination=self.default_denomination,
+        )
+
+        self.assertListEqual(
+            result,
+            [
+                timeseries.at(
+                    at_datetime=datetime(2023, 1, day, 23, 59, 59, 999999, tzinfo=ZoneInfo("UTC"))
+                ).net
+                for day in range(10, 1, -1)
+            ],
+        )
+
+    def test_get_window_from_timeseries_missing_coordinate(self):
+        result = eod_balance_windows.get_window_from_timeseries(
+            balances_timeseries={},
+            effective_datetime=DEFAULT_DATETIME,
+            number_of_days=2,
+            denomination=self.default_denomination,
+        )
+
+        self.assertListEqual(result, [Decimal("0"), Decimal("0")])
+
+
+class WindowQueriesTest(FeatureTest):
+    window = [Decimal("-10"), Decimal("5"), Decimal("-20"), Decimal("-1"), Decimal("-3")]
+
+    def test_get_window_max(self):
+        self.assertEqual(eod_balance_windows.get_window_max(window=self.window), Decimal("5"))
+
+    def test_get_window_max_of_range(self):
+        self.assertEqual(
+            eod_balance_windows.get_window_max(window=self.window, start=2, end=4), Decimal("-1")
+        )
+
+    def test_get_window_min(self):
+        self.assertEqual(eod_balance_windows.get_window_min(window=self.window), Decimal("-20"))
+
+    def test_get_window_min_of_range(self):
+        self.assertEqual(
+            eod_balance_windows.get_window_min(window=self.window, start=3), Decimal("-3")
+        )
+
+    def test_is_window_negative(self):
+        self.assertFalse(eod_balance_windows.is_window_negative(window=self.window))
+
+    def test_is_window_negative_of_range(self):
+        self.assertTrue(eod_balance_windows.is_window_negative(window=self.window, start=2))
+
+    def test_is_window_negative_zero_balance_is_not_negative(self):
+        self.assertFalse(
+            eod_balance_windows.is_window_negative(window=[Decimal("-1"), Decimal("0")])
+        )
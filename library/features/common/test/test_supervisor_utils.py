@@ -26,6 +26,7 @@ from contracts_api import (
 # inception sdk
 from inception_sdk.test_framework.contracts.unit.contracts_api_extension import (
     CustomInstruction,
+    PostingInstructionsDirective,
     ScheduledEvent,
     ScheduledEventHookResult,
     SupervisorContractEventType,
@@ -299,6 +300,82 @@ class SumBalancesAcrossSuperviseesTest(SupervisorFeatureTest):
         self.assertEqual(result, expected)
 
 
+class SuperviseeBalancesViewTest(SupervisorFeatureTest):
+    def setUp(self) -> None:
+        self.balances = [
+            BalanceDefaultDict(
+                mapping={
+                    DEFAULT_COORDINATE: self.balance(net=Decimal("5.235")),
+                    BalanceCoordinate(
+                        addresses.PENALTIES, DEFAULT_ASSET, DEFAULT_DENOMINATION, Phase.COMMITTED
+                    ): self.balance(net=Decimal("100")),
+                }
+            ),
+            BalanceDefaultDict(
+                mapping={
+                    DEFAULT_COORDINATE: self.balance(net=Decimal("9.825")),
+                }
+            ),
+        ]
+        return super().setUp()
+
+    def test_create_supervisee_balances_view_has_no_nets(self):
+        balances_view = supervisor_utils.create_supervisee_balances_view(balances=self.balances)
+
+        self.assertEqual(balances_view.balances, self.balances)
+        self.assertDictEqual(balances_view.nets, {})
+
+    def test_get_supervisee_nets_from_view_returns_net_per_supervisee(self):
+        balances_view = supervisor_utils.create_supervisee_balances_view(balances=self.balances)
+
+        result = supervisor_utils.get_supervisee_nets_from_view(
+            balances_view=balances_view,
+            address=addresses.PENALTIES,
+            denomination=DEFAULT_DENOMINATION,
+        )
+
+        self.assertListEqual(result, [Decimal("100"), DECIMAL_ZERO])
+
+    def test_get_supervisee_nets_from_view_only_looks_up_balances_once(self):
+        balances_view = supervisor_utils.create_supervisee_balances_view(balances=self.balances)
+        supervisor_utils.get_supervisee_nets_from_view(
+            balances_view=balances_view,
+            address=DEFAULT_ADDRESS,
+            denomination=DEFAULT_DENOMINATION,
+        )
+        # any further lookups must be served from the view rather than the balances
+        balances_view.balances.clear()
+
+        result = supervisor_utils.get_supervisee_nets_from_view(
+            balances_view=balances_view,
+            address=DEFAULT_ADDRESS,
+            denomination=DEFAULT_DENOMINATION,
+        )
+
+        self.assertListEqual(result, [Decimal("5.235"), Decimal("9.825")])
+
+    def test_sum_balances_across_supervisees_with_view_rounds_each_supervisee(self):
+        balances_view = supervisor_utils.create_supervisee_balances_view(balances=self.balances)
+
+        result = supervisor_utils.sum_balances_across_supervisees(
+            balances=self.balances,
+            denomination=DEFAULT_DENOMINATION,
+            addresses=[DEFAULT_ADDRESS, addresses.PENALTIES],
+            balances_view=balances_view,
+        )
+
+        # (5.235 + 100 = 105.235 -> 105.24) + (9.825 -> 9.83)
+        self.assertEqual(result, Decimal("115.07"))
+        self.assertEqual(
+            result,
+            supervisor_utils.sum_balances_across_supervisees(
+                balances=self.balances,
+                denomination=DEFAULT_DENOMINATION,
+                addresses=[DEFAULT_ADDRESS, addresses.PENALTIES],
+            ),
+        )
+
+
 class GetSuperviseeMappingTest(SupervisorFeatureTest):
     def test_blank_dict_returned_when_no_directives(self):
         # construct mocks
@@ -399,6 +476,157 @@ class GetSuperviseeMappingTest(SupervisorFeatureTest):
         self.assertTupleEqual(result, expected_result)
 
 
+class SuperviseeDirectivesIndexTest(SupervisorFeatureTest):
+    def _posting_instruction(self, account_id: str, address: str, amount: str) -> CustomInstruction:
+        return self.custom_instruction(
+            postings=[
+                Posting(
+                    credit=False,
+                    amount=Decimal(amount),
+                    denomination=DEFAULT_DENOMINATION,
+                    account_id=account_id,
+                    account_address=address,
+                    asset=DEFAULT_ASSET,
+                    phase=Phase.COMMITTED,
+                ),
+                Posting(
+                    credit=True,
+                    amount=Decimal(amount),
+                    denomination=DEFAULT_DENOMINATION,
+                    account_id=account_id,
+                    account_address=addresses.INTERNAL_CONTRA,
+                    asset=DEFAULT_ASSET,
+                    phase=Phase.COMMITTED,
+                ),
+            ]
+        )
+
+    def setUp(self) -> None:
+        self.posting_instructions = {
+            "supervisee_1": [
+                self._posting_instruction("supervisee_1", DEFAULT_ADDRESS, "10.004"),
+                self._posting_instruction("supervisee_1", addresses.PENALTIES, "5"),
+            ],
+            "supervisee_2": [
+                self._posting_instruction("supervisee_2", DEFAULT_ADDRESS, "0.003"),
+            ],
+        }
+        self.supervisees = [
+            self.create_supervisee_mock(
+                supervisee_hook_result=ScheduledEventHookResult(
+                    account_notification_directives=[SentinelAccountNotificationDirective("1")],
+                    posting_instructions_directives=[
+                        PostingInstructionsDirective(
+                            posting_instructions=[posting_instruction]  # type: ignore
+                        )
+                        for posting_instruction in self.posting_instructions["supervisee_1"]
+                    ],
+                ),
+                account_id="supervisee_1",
+            ),
+            self.create_supervisee_mock(
+                supervisee_hook_result=ScheduledEventHookResult(
+                    posting_instructions_directives=[
+                        PostingInstructionsDirective(
+                            posting_instructions=self.posting_instructions[  # type: ignore
+                                "supervisee_2"
+                            ]
+                        )
+                    ],
+                    update_account_event_type_directives=[
+                        SentinelUpdateAccountEventTypeDirective("2")
+                    ],
+                ),
+                account_id="supervisee_2",
+            ),
+            self.create_supervisee_mock(
+                supervisee_hook_result=ScheduledEventHookResult(),
+                account_id="supervisee_3",
+            ),
+        ]
+        return super().setUp()
+
+    def test_directives_and_posting_balances_are_indexed_per_supervisee(self):
+        result = supervisor_utils.create_supervisee_directives_index(supervisees=self.supervisees)
+
+        self.assertDictEqual(
+            result.notification_directives,
+            {"supervisee_1": [SentinelAccountNotificationDirective("1")]},
+        )
+        self.assertListEqual(
+            list(result.posting_directives.keys()), ["supervisee_1", "supervisee_2"]
+        )
+        self.assertDictEqual(
+            result.update_account_event_type_directives,
+            {"supervisee_2": [SentinelUpdateAccountEventTypeDirective("2")]},
+        )
+        self.assertDictEqual(result.posting_instructions, self.posting_instructions)
+        self.assertDictEqual(
+            result.posting_balances["supervisee_1"],
+            {
+                DEFAULT_COORDINATE: Balance(
+                    credit=DECIMAL_ZERO, debit=Decimal("10.004"), net=Decimal("10.004")
+                ),
+                BalanceCoordinate(
+                    addresses.PENALTIES, DEFAULT_ASSET, DEFAULT_DENOMINATION, Phase.COMMITTED
+                ): Balance(credit=DECIMAL_ZERO, debit=Decimal("5"), net=Decimal("5")),
+                BalanceCoordinate(
+                    addresses.INTERNAL_CONTRA, DEFAULT_ASSET, DEFAULT_DENOMINATION, Phase.COMMITTED
+                ): Balance(credit=Decimal("15.004"), debit=DECIMAL_ZERO, net=Decimal("-15.004")),
+            },
+        )
+        self.assertNotIn("supervisee_3", result.posting_balances)
+
+    def test_aggregate_posting_instructions_from_index_match_unindexed_aggregation(self):
+        directives_index = supervisor_utils.create_supervisee_directives_index(
+            supervisees=self.supervisees
+        )
+        main_balances = BalanceDefaultDict(
+            mapping={DEFAULT_COORDINATE: self.balance(net=Decimal("0.001"))}
+        )
+
+        for addresses_to_aggregate in [
+            [DEFAULT_ADDRESS],
+            [DEFAULT_ADDRESS, addresses.PENALTIES],
+            [addresses.PENALTIES, addresses.INTERNAL_CONTRA],
+        ]:
+            with self.subTest(addresses_to_aggregate=addresses_to_aggregate):
+                expected = supervisor_utils.create_aggregate_posting_instructions(
+                    aggregate_account_id="main",
+                    posting_instructions_by_supervisee=self.posting_instructions,
+                    prefix="TOTAL",
+                    balances=main_balances,
+                    addresses_to_aggregate=addresses_to_aggregate,
+                )
+
+                result = supervisor_utils.create_aggregate_posting_instructions_from_index(
+                    aggregate_account_id="main",
+                    directives_index=directives_index,
+                    prefix="TOTAL",
+                    balances=main_balances,
+                    addresses_to_aggregate=addresses_to_aggregate,
+                )
+
+                self.assertListEqual(result, expected)
+
+    def test_aggregate_posting_instructions_from_index_for_subset_of_supervisees(self):
+        directives_index = supervisor_utils.create_supervisee_directives_index(
+            supervisees=self.supervisees
+        )
+
+        result = supervisor_utils.create_aggregate_posting_instructions_from_index(
+            aggregate_account_id="main",
+            directives_index=directives_index,
+            prefix="TOTAL",
+            balances=BalanceDefaultDict(),
+            addresses_to_aggregate=[DEFAULT_ADDRESS],
+            account_ids=["supervisee_2", "supervisee_3"],
+        )
+
+        # 0.003 rounds to 0, so no aggregate posting is needed
+        self.assertListEqual(result, [])
+
+
 @patch.object(supervisor_utils, "filter_aggregate_balances")
 @patch.object(supervisor_utils.utils, "create_postings")
 class CreateAggregatePostingInstructionsTest(SupervisorFeatureTest):
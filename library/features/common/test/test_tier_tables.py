@@ -0,0 +1,217 @@
+# standard libs
+from datetime import datetime
+from decimal import Decimal
+from unittest.mock import MagicMock, call, patch
+from zoneinfo import ZoneInfo
+
+# features
+import library.features.common.tier_tables as tier_tables
+
+# inception sdk
+from inception_sdk.test_framework.contracts.unit.common import FeatureTest
+
+DEFAULT_TIERED_RATES = {
+    "0.00": "0.01",
+    "1000.00": "0.02",
+    "3000.00": "0.035",
+    "7500.00": "0.05",
+    "10000.00": "0.06",
+}
+
+
+class CompileTierTableTest(FeatureTest):
+    def test_compile_tier_table(self):
+        result = tier_tables.compile_tier_table(tiered_rates={"1000": "0.02", "0": "0.01"})
+
+        self.assertEqual(
+            result,
+            tier_tables.TierTable(
+                tier_mins=[Decimal("0"), Decimal("1000")],
+                tier_maxes=[Decimal("1000"), None],
+                rates=[Decimal("0.01"), Decimal("0.02")],
+                capacities=[Decimal("1000"), None],
+                is_ascending=True,
+                daily_rates={},
+            ),
+        )
+
+    def test_compile_tier_table_with_negative_tiers_is_not_ascending(self):
+        result = tier_tables.compile_tier_table(tiered_rates={"-1000": "0.01", "-0": "0.02"})
+
+        self.assertFalse(result.is_ascending)
+
+    def test_compile_tier_table_with_descending_tiers_is_not_ascending(self):
+        result = tier_tables.compile_tier_table(tiered_rates={"1000": "0.01", "0": "0.02"})
+
+        self.assertFalse(result.is_ascending)
+
+
+class GetTierBalancesTest(FeatureTest):
+    def test_tier_balances_are_split_across_reached_tiers(self):
+        tier_table = tier_tables.compile_tier_table(tiered_rates=DEFAULT_TIERED_RATES)
+
+        result = tier_tables.get_tier_balances(tier_table=tier_table, balance=Decimal("5000"))
+
+        self.assertListEqual(
+            result, [(0, Decimal("1000")), (1, Decimal("2000")), (2, Decimal("2000"))]
+        )
+
+    def test_no_tier_balances_for_zero_or_negative_balance(self):
+        tier_table = tier_tables.compile_tier_table(tiered_rates=DEFAULT_TIERED_RATES)
+
+        for balance in ["0", "-0", "-10"]:
+            with self.subTest(balance=balance):
+                self.assertListEqual(
+                    tier_tables.get_tier_balances(tier_table=tier_table, balance=Decimal(balance)),
+                    [],
+                )
+
+    def test_tier_balances_match_determine_tier_balance_for_each_tier(self):
+        for tiered_rates in [
+            DEFAULT_TIERED_RATES,
+            {"0": "0.01"},
+            {"100": "0.01", "50": "0.02"},
+            {"-1000": "0.01", "-500": "0.02", "-0": "0.03"},
+            {"0": "0.03", "500": "0.02", "1000": "0.01"},
+        ]:
+            tier_table = tier_tables.compile_tier_table(tiered_rates=tiered_rates)
+            for balance in ["-1500", "-500", "-0.01", "0", "0.01", "50", "999.99", "1000", "12000"]:
+                with self.subTest(tiered_rates=tiered_rates, balance=balance):
+                    expected = []
+                    for index, tier_min in enumerate(tier_table.tier_mins):
+                        tier_balance = tier_tables.determine_tier_balance(
+                            effective_balance=Decimal(balance),
+                            tier_min=tier_min,
+                            tier_max=tier_table.tier_maxes[index],
+                        )
+                        if tier_balance != Decimal(0):
+                            expected.append((index, tier_balance))
+
+                    result = tier_tables.get_tier_balances(
+                        tier_table=tier_table, balance=Decimal(balance)
+                    )
+
+                    self.assertListEqual(result, expected)
+
+
+@patch.object(tier_tables.utils, "yearly_to_daily_rate")
+class GetDailyRatesTest(FeatureTest):
+    def test_daily_rates_are_converted_once_per_tier_days_in_year_and_year(
+        self, mock_yearly_to_daily_rate: MagicMock
+    ):
+        mock_yearly_to_daily_rate.side_effect = lambda effective_date, yearly_rate, days_in_year: (
+            yearly_rate / 100
+        )
+        tier_table = tier_tables.compile_tier_table(
+            tiered_rates={"0": "1", "1000": "2", "2000": "3"}
+        )
+        effective_datetime = datetime(2020, 1, 1, tzinfo=ZoneInfo("UTC"))
+
+        first_result = tier_tables.get_daily_rates(
+            tier_table=tier_table,
+            tier_count=1,
+            effective_datetime=effective_datetime,
+            days_in_year="actual",
+        )
+        self.assertListEqual(first_result, [Decimal("0.01")])
+        result = tier_tables.get_daily_rates(
+            tier_table=tier_table,
+            tier_count=2,
+            effective_datetime=effective_datetime,
+            days_in_year="actual",
+        )
+        tier_tables.get_daily_rates(
+            tier_table=tier_table,
+            tier_count=1,
+            effective_datetime=effective_datetime,
+            days_in_year="actual",
+        )
+        tier_tables.get_daily_rates(
+            tier_table=tier_table,
+            tier_count=1,
+            effective_datetime=datetime(2021, 1, 1, tzinfo=ZoneInfo("UTC")),
+            days_in_year="actual",
+        )
+
+        self.assertListEqual(result, [Decimal("0.01"), Decimal("0.02")])
+        # the last tier is never converted as its rate is not used
+        self.assertEqual(mock_yearly_to_daily_rate.call_count, 3)
+        mock_yearly_to_daily_rate.assert_has_calls(
+            [
+                call(
+                    effective_date=effective_datetime,
+                    yearly_rate=Decimal("1"),
+                    days_in_year="actual",
+                ),
+                call(
+                    effective_date=effective_datetime,
+                    yearly_rate=Decimal("2"),
+                    days_in_year="actual",
+                ),
+                call(
+                    effective_date=datetime(2021, 1, 1, tzinfo=ZoneInfo("UTC")),
+                    yearly_rate=Decimal("1"),
+                    days_in_year="actual",
+                ),
+            ]
+        )
+
+
+class CompileTierTableIfLargeTest(FeatureTest):
+    def test_few_tiers_are_not_compiled(self):
+        self.assertIsNone(
+            tier_tables.compile_tier_table_if_large(tiered_rates=DEFAULT_TIERED_RATES)
+        )
+
+    def test_many_tiers_are_compiled(self):
+        tiered_rates = {str(tier * 1000): str(tier / 100) for tier in range(6)}
+
+        result = tier_tables.compile_tier_table_if_large(tiered_rates=tiered_rates)
+
+        self.assertEqual(result, tier_tables.compile_tier_table(tiered_rates=tiered_rates))
+
+
+class GetTierBalancesAndRatesTest(FeatureTest):
+    def _tier_accruals(self, tiered_rates: dict[str, str], balance: str, **kwargs):
+        balance_per_tier, rates, daily_rates = tier_tables.get_tier_balances_and_rates(
+            tiered_rates=tiered_rates,
+            balance=Decimal(balance),
+            effective_datetime=datetime(2020, 1, 1, tzinfo=ZoneInfo("UTC")),
+            days_in_year="365",
+            **kwargs,
+        )
+        return [
+            (rates[index], tier_balance, daily_rates[index])
+            for index, tier_balance in balance_per_tier
+        ]
+
+    def test_uncompiled_and_compiled_tiers_give_the_same_balances_and_rates(self):
+        for tiered_rates in [
+            DEFAULT_TIERED_RATES,
+            {"-1000": "0.01", "-0": "0.02"},
+            {"1000": "0.01", "0": "0.02"},
+        ]:
+            for balance in ["-1500", "-500", "0", "500", "1000", "2000.50", "12000"]:
+                with self.subTest(tiered_rates=tiered_rates, balance=balance):
+                    uncompiled = self._tier_accruals(tiered_rates, balance)
+                    compiled = self._tier_accruals(
+                        tiered_rates,
+                        balance,
+                        tier_table=tier_tables.compile_tier_table(tiered_rates=tiered_rates),
+                    )
+
+                    self.assertListEqual(uncompiled, compiled)
+
+    @patch.object(tier_tables, "compile_tier_table", wraps=tier_tables.compile_tier_table)
+    def test_tier_table_is_only_compiled_for_many_tiers(self, mock_compile_tier_table: MagicMock):
+        many_tiered_rates = {str(tier * 1000): str(tier / 100) for tier in range(6)}
+
+        self._tier_accruals(DEFAULT_TIERED_RATES, "5000")
+        mock_compile_tier_table.assert_not_called()
+
+        result = self._tier_accruals(many_tiered_rates, "1500")
+        mock_compile_tier_table.assert_called_once_with(tiered_rates=many_tiered_rates)
+        self.assertListEqual(
+            [(rate, tier_balance) for rate, tier_balance, _ in result],
+            [(Decimal("0.0"), Decimal("1000")), (Decimal("0.01"), Decimal("500"))],
+        )
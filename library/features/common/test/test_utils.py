@@ -1458,6 +1458,116 @@ class GetNextScheduleDateCalendarAwareTest(FeatureTest):
         self.assertEqual(get_next_datetime_after_calendar_events, expected_effective_datetime)
 
 
+class CalendarEventsIndexTest(FeatureTest):
+    calendar_events = CalendarEvents(
+        calendar_events=[
+            CalendarEvent(
+                id="3",
+                calendar_id="CALENDAR",
+                start_datetime=datetime(2020, 1, 10, tzinfo=ZoneInfo("UTC")),
+                end_datetime=datetime(2020, 1, 10, 23, 59, 59, tzinfo=ZoneInfo("UTC")),
+            ),
+            CalendarEvent(
+                id="1",
+                calendar_id="CALENDAR",
+                start_datetime=datetime(2020, 1, 2, tzinfo=ZoneInfo("UTC")),
+                end_datetime=datetime(2020, 1, 3, tzinfo=ZoneInfo("UTC")),
+            ),
+            # overlaps the first event and ends on the start of the next, so all three are merged
+            CalendarEvent(
+                id="2",
+                calendar_id="CALENDAR",
+                start_datetime=datetime(2020, 1, 2, 12, tzinfo=ZoneInfo("UTC")),
+                end_datetime=datetime(2020, 1, 4, tzinfo=ZoneInfo("UTC")),
+            ),
+            CalendarEvent(
+                id="4",
+                calendar_id="CALENDAR",
+                start_datetime=datetime(2020, 1, 4, tzinfo=ZoneInfo("UTC")),
+                end_datetime=datetime(2020, 1, 5, 23, 59, 59, tzinfo=ZoneInfo("UTC")),
+            ),
+        ]
+    )
+
+    def test_calendar_events_are_sorted_and_merged(self):
+        result = utils.create_calendar_events_index(calendar_events=self.calendar_events)
+
+        self.assertEqual(
+            result,
+            utils.CalendarEventsIndex(
+                start_datetimes=[
+                    datetime(2020, 1, 2, tzinfo=ZoneInfo("UTC")),
+                    datetime(2020, 1, 10, tzinfo=ZoneInfo("UTC")),
+                ],
+                end_datetimes=[
+                    datetime(2020, 1, 5, 23, 59, 59, tzinfo=ZoneInfo("UTC")),
+                    datetime(2020, 1, 10, 23, 59, 59, tzinfo=ZoneInfo("UTC")),
+                ],
+            ),
+        )
+
+    def test_empty_calendar_events_index(self):
+        calendar_events_index = utils.create_calendar_events_index(
+            calendar_events=CalendarEvents(calendar_events=[])
+        )
+
+        self.assertFalse(
+            utils.falls_on_calendar_events_index(
+                effective_datetime=datetime(2020, 1, 1, tzinfo=ZoneInfo("UTC")),
+                calendar_events_index=calendar_events_index,
+            )
+        )
+
+    def test_falls_on_calendar_events_index_matches_falls_on_calendar_events(self):
+        calendar_events_index = utils.create_calendar_events_index(
+            calendar_events=self.calendar_events
+        )
+
+        effective_datetime = datetime(2020, 1, 1, tzinfo=ZoneInfo("UTC"))
+        while effective_datetime < datetime(2020, 1, 12, tzinfo=ZoneInfo("UTC")):
+            with self.subTest(effective_datetime=effective_datetime):
+                self.assertEqual(
+                    utils.falls_on_calendar_events_index(
+                        effective_datetime=effective_datetime,
+                        calendar_events_index=calendar_events_index,
+                    ),
+                    utils.falls_on_calendar_events(
+                        effective_datetime=effective_datetime,
+                        calendar_events=self.calendar_events,
+                    ),
+                )
+            effective_datetime += relativedelta(hours=6)
+
+    def test_get_next_datetime_after_merged_calendar_events(self):
+        result = utils.get_next_datetime_after_calendar_events(
+            effective_datetime=datetime(2020, 1, 2, 3, 4, 5, tzinfo=ZoneInfo("UTC")),
+            calendar_events=self.calendar_events,
+        )
+
+        # whole days are added until the datetime is after the merged 2nd to 5th Jan events
+        self.assertEqual(result, datetime(2020, 1, 6, 3, 4, 5, tzinfo=ZoneInfo("UTC")))
+
+    def test_get_next_datetime_after_calendar_events_across_dst_change(self):
+        calendar_events = CalendarEvents(
+            calendar_events=[
+                CalendarEvent(
+                    id="1",
+                    calendar_id="CALENDAR",
+                    start_datetime=datetime(2020, 3, 20, tzinfo=ZoneInfo("UTC")),
+                    end_datetime=datetime(2020, 4, 2, 0, 30, tzinfo=ZoneInfo("UTC")),
+                ),
+            ]
+        )
+
+        result = utils.get_next_datetime_after_calendar_events(
+            effective_datetime=datetime(2020, 3, 20, 1, 15, tzinfo=ZoneInfo("Europe/London")),
+            calendar_events=calendar_events,
+        )
+
+        # 1:15 BST on 2nd April is 0:15 UTC, which is still within the event
+        self.assertEqual(result, datetime(2020, 4, 3, 1, 15, tzinfo=ZoneInfo("Europe/London")))
+
+
 class EndOfTimeScheduleTest(FeatureTest):
     def test_skipped_end_of_times_schedule(self):
         expected_schedule = ScheduledEvent(
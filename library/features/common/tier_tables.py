@@ -0,0 +1,245 @@
+# standard libs
+from datetime import datetime
+from decimal import Decimal
+from typing import NamedTuple
+
+# features
+import library.features.common.utils as utils
+
+TierTable = NamedTuple(
+    "TierTable",
+    [
+        # the minimum balance of each tier, in the order the tiers are applied
+        ("tier_mins", list[Decimal]),
+        # the maximum balance of each tier, which is the next tier's minimum. None for the last tier
+        ("tier_maxes", list[Decimal | None]),
+        ("rates", list[Decimal]),
+        # the balance each tier can hold (i.e. tier max - tier min). None for the last tier
+        ("capacities", list[Decimal | None]),
+        # whether the tier minimums are non-negative and strictly increasing, in which case the
+        # tiers that apply to a balance can be found by binary search
+        ("is_ascending", bool),
+        # (days_in_year, year) to the daily rates of the first tiers, extended as higher tiers are
+        # reached
+        ("daily_rates", dict[tuple[str, int], list[Decimal]]),
+    ],
+)
+
+# Up to this many tiers, parsing the tiered rates for each balance is cheaper than compiling and
+# searching a tier table
+MAX_UNCOMPILED_TIERS = 5
+
+
+def compile_tier_table(tiered_rates: dict[str, str]) -> TierTable:
+    """
+    Parses and sorts a tiered rates parameter so that it can be applied to any number of balances
+    without re-parsing. The table should be compiled once per parameter value and reused.
+    :param tiered_rates: mapping of tier minimum balance to yearly rate, as strings. Tiers are
+    applied in order of rate, with each tier's maximum being the next tier's minimum
+    :return: the compiled tier table
+    """
+    sorted_tiers = sorted(tiered_rates.items(), key=lambda x: x[1])
+    tier_mins = [Decimal(tier_min) for tier_min, _ in sorted_tiers]
+    capacities = [tier_max - tier_min for tier_min, tier_max in zip(tier_mins, tier_mins[1:])]
+
+    return TierTable(
+        tier_mins=tier_mins,
+        tier_maxes=[*tier_mins[1:], None],
+        rates=[Decimal(tier_rate) for _, tier_rate in sorted_tiers],
+        capacities=[*capacities, None],
+        # if the minimums are strictly increasing, they are all non-negative when the first one is
+        is_ascending=not (tier_mins and tier_mins[0].is_signed())
+        and not (capacities and min(capacities) <= 0),
+        daily_rates={},
+    )
+
+
+def compile_tier_table_if_large(tiered_rates: dict[str, str]) -> TierTable | None:
+    """
+    Compiles the tier table if there are enough tiers for it to be worthwhile. Hooks should call
+    this once and pass the result to each accrual calculation.
+    :param tiered_rates: mapping of tier minimum balance to yearly rate, as strings
+    :return: the compiled tier table, or None if there are MAX_UNCOMPILED_TIERS tiers or fewer
+    """
+    if len(tiered_rates) <= MAX_UNCOMPILED_TIERS:
+        return None
+    return compile_tier_table(tiered_rates=tiered_rates)
+
+
+def get_daily_rates(
+    tier_table: TierTable, tier_count: int, effective_datetime: datetime, days_in_year: str
+) -> list[Decimal]:
+    """
+    Returns the daily rates of the first tiers, converting each tier's yearly rate on first use
+    only. Tiers above the highest tier that a balance has reached are not converted.
+    :param tier_table: the compiled tier table
+    :param tier_count: the number of tiers, from the first, whose daily rates are needed
+    :param effective_datetime: the date as of which the conversion happens. Only the year is used
+    and only if `days_in_year` is `actual`
+    :param days_in_year: the days in year convention, as per utils.yearly_to_daily_rate
+    :return: the daily rates of at least the first `tier_count` tiers, in the table's tier order
+    """
+    key = (days_in_year, effective_datetime.year)
+    daily_rates = tier_table.daily_rates.get(key)
+    if daily_rates is None:
+        daily_rates = tier_table.daily_rates[key] = []
+    if len(daily_rates) < tier_count:
+        daily_rates.extend(
+            utils.yearly_to_daily_rate(
+                effective_date=effective_datetime, yearly_rate=rate, days_in_year=days_in_year
+            )
+            for rate in tier_table.rates[len(daily_rates) : tier_count]
+        )
+    return daily_rates
+
+
+def get_tier_balances_and_rates(
+    *,
+    tiered_rates: dict[str, str],
+    balance: Decimal,
+    effective_datetime: datetime,
+    days_in_year: str,
+    tier_table: TierTable | None = None,
+) -> tuple[list[tuple[int, Decimal]], list[Decimal], list[Decimal] | dict[int, Decimal]]:
+    """
+    Splits a balance across the tiers and determines the daily rates of the tiers it reaches
+    :param tiered_rates: mapping of tier minimum balance to yearly rate, as strings. Tiers are
+    applied in order of rate, with each tier's maximum being the next tier's minimum
+    :param balance: the balance to split across tiers
+    :param effective_datetime: the date as of which yearly rates are converted to daily rates
+    :param days_in_year: the days in year convention, as per utils.yearly_to_daily_rate
+    :param tier_table: the tier table compiled from the tiered_rates, e.g. by
+    compile_tier_table_if_large. If not provided, the tiered rates are parsed directly when there are
+    few tiers, and compiled otherwise
+    :return: the index and balance of each tier with a non-zero balance, in tier order, and the
+    yearly and daily rates of those tiers by index
+    """
+    if tier_table is None:
+        if len(tiered_rates) <= MAX_UNCOMPILED_TIERS:
+            return _get_uncompiled_tier_balances_and_rates(
+                tiered_rates=tiered_rates,
+                balance=balance,
+                effective_datetime=effective_datetime,
+                days_in_year=days_in_year,
+            )
+        tier_table = compile_tier_table(tiered_rates=tiered_rates)
+
+    balance_per_tier = get_tier_balances(tier_table=tier_table, balance=balance)
+    daily_rates = get_daily_rates(
+        tier_table=tier_table,
+        tier_count=balance_per_tier[-1][0] + 1 if balance_per_tier else 0,
+        effective_datetime=effective_datetime,
+        days_in_year=days_in_year,
+    )
+    return balance_per_tier, tier_table.rates, daily_rates
+
+
+def _get_uncompiled_tier_balances_and_rates(
+    tiered_rates: dict[str, str], balance: Decimal, effective_datetime: datetime, days_in_year: str
+) -> tuple[list[tuple[int, Decimal]], list[Decimal], dict[int, Decimal]]:
+    sorted_tiers = sorted(tiered_rates.items(), key=lambda x: x[1])
+    rates = [Decimal(tier_rate) for _, tier_rate in sorted_tiers]
+    balance_per_tier = []
+    daily_rates = {}
+    for index, (tier_min, _) in enumerate(sorted_tiers):
+        # Tier max is next tier 'min value' if exists
+        tier_max = Decimal(sorted_tiers[index + 1][0]) if index + 1 < len(sorted_tiers) else None
+        tier_balance = determine_tier_balance(
+            effective_balance=balance, tier_min=Decimal(tier_min), tier_max=tier_max
+        )
+        if tier_balance != Decimal(0):
+            balance_per_tier.append((index, tier_balance))
+            daily_rates[index] = utils.yearly_to_daily_rate(
+                effective_date=effective_datetime,
+                yearly_rate=rates[index],
+                days_in_year=days_in_year,
+            )
+    return balance_per_tier, rates, daily_rates
+
+
+def get_tier_balances(tier_table: TierTable, balance: Decimal) -> list[tuple[int, Decimal]]:
+    """
+    Splits a balance across the tiers in the table. This gives the same result as calling
+    determine_tier_balance for each tier, but only visits the tiers that the balance reaches when the
+    tiers are ascending.
+    :param tier_table: the compiled tier table
+    :param balance: the balance to split across tiers
+    :return: the index and balance of each tier with a non-zero balance, in tier order
+    """
+    if not tier_table.is_ascending:
+        tier_balances = []
+        for index, tier_min in enumerate(tier_table.tier_mins):
+            tier_balance = determine_tier_balance(
+                effective_balance=balance,
+                tier_min=tier_min,
+                tier_max=tier_table.tier_maxes[index],
+            )
+            if tier_balance != Decimal(0):
+                tier_balances.append((index, tier_balance))
+        return tier_balances
+
+    # binary search for the number of tiers whose minimum is below the balance, as these are the
+    # only tiers with a non-zero balance
+    low, high = 0, len(tier_table.tier_mins)
+    while low < high:
+        middle = (low + high) // 2
+        if tier_table.tier_mins[middle] < balance:
+            low = middle + 1
+        else:
+            high = middle
+
+    # all but the highest of these tiers are full
+    tier_balances = [(index, tier_table.capacities[index]) for index in range(low - 1)]
+    if low > 0:
+        tier_max = tier_table.tier_maxes[low - 1]
+        top_balance = balance if tier_max is None else min(balance, tier_max)
+        tier_balances.append((low - 1, top_balance - tier_table.tier_mins[low - 1]))
+    return tier_balances  # type: ignore
+
+
+def determine_tier_balance(
+    effective_balance: Decimal,
+    tier_min: Decimal | None = None,
+    tier_max: Decimal | None = None,
+) -> Decimal:
+    """
+    Determines a tier's balance based on min and max. Min and max must be of same sign or
+    zero is returned (use Decimal("-0") if required). If neither are provided, zero is returned
+    :param tier_min: the minimum balance in the tier, exclusive. Any amount at or below is excluded.
+    Defaults to 0 if tier_max is +ve, unbounded is tier_max is -ve
+    :param tier_max: the maximum balance included in the tier, inclusive. Any amount greater is
+    excluded. Defaults to Decimal("-0") if tier_min is -ve,  unbounded if tier_min is +ve
+    :param effective_balance: the balance to check against the tier min/max
+    :return: the portion of the effective balance that is included in the tier
+    """
+    # Could be expressed more simply, but this provides clearer coverage and type checks
+    if tier_min is None:
+        if tier_max is None:
+            return Decimal("0")
+        if tier_max.is_signed():
+            tier_min = effective_balance
+        else:
+            tier_min = Decimal("0")
+    if tier_max is None:
+        if tier_min.is_signed():
+            tier_max = Decimal("-0")
+        else:
+            tier_max = effective_balance
+
+    # we don't handle ranges where min and max have different signs
+    # is_signed() detects negative 0 whereas < 0 comparison does not
+    if tier_max.is_signed() ^ tier_min.is_signed():
+        return Decimal("0")
+
+    if tier_max.is_signed():
+        # Next statement could go positive otherwise
+        if tier_min >= tier_max:
+            return Decimal("0")
+
+        return max(effective_balance, tier_min) - max(effective_balance, tier_max)
+    else:
+        # Next statement could go negative otherwise
+        if tier_max <= tier_min:
+            return Decimal("0")
+
+        return min(effective_balance, tier_max) - min(effective_balance, tier_min)
@@ -10,7 +10,7 @@ from datetime import datetime
 from dateutil.relativedelta import relativedelta
 from decimal import ROUND_HALF_UP, Decimal
 from json import loads
-from typing import Any, Iterable, Mapping
+from typing import Any, Iterable, Mapping, NamedTuple
 from zoneinfo import ZoneInfo
 
 # contracts api
@@ -79,6 +79,16 @@ PostingsTypeAlias = (
 
 ParameterValueTypeAlias = Decimal | str | datetime | OptionalValue | UnionItemValue | int
 
+CalendarEventsIndex = NamedTuple(
+    "CalendarEventsIndex",
+    [
+        # start and end datetimes of the merged calendar event intervals, sorted by start datetime.
+        # Intervals never overlap, so the end datetimes are sorted too
+        ("start_datetimes", list[datetime]),
+        ("end_datetimes", list[datetime]),
+    ],
+)
+
 
 # yearly_to_daily_rate
 VALID_DAYS_IN_YEAR = ["360", "365", "366", "actual"]
@@ -463,6 +473,7 @@ def get_next_schedule_date_calendar_aware(
     schedule_frequency: str,
     intended_day: int,
     calendar_events: CalendarEvents,
+    calendar_events_index: CalendarEventsIndex | None = None,
 ) -> datetime:
     """
     Calculate next valid date for schedule based on required frequency; day of month; and calendar.
@@ -470,6 +481,8 @@ def get_next_schedule_date_calendar_aware(
     :param start_datetime: datetime, date after which the next schedule datetime must be
     :param schedule_frequency: str, either 'monthly', 'quarterly' or 'annually'
     :param intended_day: int, day of month the scheduled date should fall on
+    :param calendar_events_index: optional index created from the calendar events, for callers
+    calculating many schedule dates against the same calendar events
     :return: datetime, next occurrence of schedule
     """
     frequency_map = {"monthly": 1, "quarterly": 3, "annually": 12}
@@ -483,14 +496,17 @@ def get_next_schedule_date_calendar_aware(
     else:
         next_date = start_datetime + relativedelta(months=number_of_months, day=intended_day)
 
-    while falls_on_calendar_events(next_date, calendar_events):
-        next_date += relativedelta(days=1)
-    return next_date
+    return get_next_datetime_after_calendar_events(
+        effective_datetime=next_date,
+        calendar_events=calendar_events,
+        calendar_events_index=calendar_events_index,
+    )
 
 
 def get_next_datetime_after_calendar_events(
     effective_datetime: datetime,
     calendar_events: CalendarEvents,
+    calendar_events_index: CalendarEventsIndex | None = None,
 ) -> datetime:
     """
     Calculate the next datetime after the given calendar events. If the effective
@@ -498,10 +514,27 @@ def get_next_datetime_after_calendar_events(
     until this condition is met.
     :param effective_datetime: the datetime to be pushed to after calendar events
     :param calendar_events: events that the schedule date should not fall on
+    :param calendar_events_index: optional index created from the calendar events, for callers
+    calculating many datetimes against the same calendar events
     :return: the next non-calendar day
     """
-    while falls_on_calendar_events(effective_datetime, calendar_events):
-        effective_datetime += relativedelta(days=1)
+    if calendar_events_index is None:
+        # most datetimes don't fall on a calendar event, in which case indexing isn't needed
+        if not falls_on_calendar_events(effective_datetime, calendar_events):
+            return effective_datetime
+        calendar_events_index = create_calendar_events_index(calendar_events=calendar_events)
+
+    while (
+        interval := _get_calendar_events_interval(effective_datetime, calendar_events_index)
+    ) is not None:
+        # skip straight past the end of the interval, while still moving in whole days
+        interval_end = calendar_events_index.end_datetimes[interval]
+        days = max((interval_end - effective_datetime).days, 1)
+        while days > 1 and effective_datetime + relativedelta(days=days - 1) > interval_end:
+            days -= 1
+        while effective_datetime + relativedelta(days=days) <= interval_end:
+            days += 1
+        effective_datetime += relativedelta(days=days)
     return effective_datetime
 
 
@@ -516,6 +549,60 @@ def falls_on_calendar_events(effective_datetime: datetime, calendar_events: Cale
     )
 
 
+def create_calendar_events_index(calendar_events: CalendarEvents) -> CalendarEventsIndex:
+    """
+    Sorts and merges calendar events into non-overlapping intervals, so that checking whether a
+    datetime falls on a calendar event doesn't need to consider every event. Worthwhile when
+    checking many datetimes against the same calendar events.
+    :param calendar_events: the calendar events to index
+    :return: the calendar events index
+    """
+    start_datetimes: list[datetime] = []
+    end_datetimes: list[datetime] = []
+    for calendar_event in sorted(calendar_events, key=lambda event: event.start_datetime):
+        # intervals are inclusive, so an event starting on the previous end is merged too
+        if end_datetimes and calendar_event.start_datetime <= end_datetimes[-1]:
+            end_datetimes[-1] = max(end_datetimes[-1], calendar_event.end_datetime)
+        else:
+            start_datetimes.append(calendar_event.start_datetime)
+            end_datetimes.append(calendar_event.end_datetime)
+
+    return CalendarEventsIndex(start_datetimes=start_datetimes, end_datetimes=end_datetimes)
+
+
+def falls_on_calendar_events_index(
+    effective_datetime: datetime, calendar_events_index: CalendarEventsIndex
+) -> bool:
+    """
+    Equivalent to falls_on_calendar_events, using a binary search of the calendar events index
+    :param effective_datetime: the datetime to check
+    :param calendar_events_index: the index created from the calendar events
+    :return: True if the datetime is on or between a calendar event's start and end, inclusive
+    """
+    return _get_calendar_events_interval(effective_datetime, calendar_events_index) is not None
+
+
+def _get_calendar_events_interval(
+    effective_datetime: datetime, calendar_events_index: CalendarEventsIndex
+) -> int | None:
+    """
+    Returns the position of the calendar events index interval that includes the datetime, if any
+    """
+    # binary search for the number of intervals starting at or before the datetime
+    low, high = 0, len(calendar_events_index.start_datetimes)
+    while low < high:
+        middle = (low + high) // 2
+        if calendar_events_index.start_datetimes[middle] <= effective_datetime:
+            low = middle + 1
+        else:
+            high = middle
+
+    # only the last of these intervals can include the datetime
+    if low > 0 and effective_datetime <= calendar_events_index.end_datetimes[low - 1]:
+        return low - 1
+    return None
+
+
 ## Denomination helpers
 def validate_denomination(
     posting_instructions: list[PostingInstructionTypeAlias],
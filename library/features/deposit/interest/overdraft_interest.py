@@ -170,7 +170,9 @@ def accrue_interest(
             interest_free_amount=interest_free_amount,
             interest_free_days=interest_free_days,
             denomination=denomination,
-            observations=_retrieve_eod_observations(vault=vault),
+            observations=_retrieve_eod_observations(
+                vault=vault, number_of_days=interest_free_days + 1
+            ),
         )
         if accrual_balance < 0:
             days_in_year = str(utils.get_parameter(vault, "days_in_year", is_union=True))
@@ -203,18 +205,22 @@ def accrue_interest(
     return []
 
 
-def _retrieve_eod_observations(*, vault: SmartContractVault) -> list[BalancesObservation]:
+def _retrieve_eod_observations(
+    *, vault: SmartContractVault, number_of_days: int | None = None
+) -> list[BalancesObservation]:
     """
     Retrieves the last 6 End-Of-Day Observations balances to be used in the determination of what
     should be the overdraft balance used in the interest calculation.
     Positions:[0] - current EOD, [1] - Previous Day, [2] - 2 Days Ago, ... , [5] - 5 Days Ago
 
     :param vault: the vault object used to for retrieving the balance data
+    :param number_of_days: the number of most recent observations to retrieve, e.g. the current EOD
+    and the interest free buffer days. If not provided all 6 are retrieved
     :return: list of observation balances ordered in reverse chronological order
     """
     return [
         vault.get_balances_observation(fetcher_id=fetcher.fetcher_id)
-        for fetcher in overdraft_accrual_data_fetchers
+        for fetcher in overdraft_accrual_data_fetchers[:number_of_days]
     ]
 
 
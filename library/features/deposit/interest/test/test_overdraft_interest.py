@@ -66,6 +66,21 @@ class TestRetrieveEODObservations(TestOverdraftInterest):
             ],
         )
 
+    def test_retrieve_eod_balances_for_number_of_days(self):
+        current_eod_observation = SentinelBalancesObservation("current_eod_observation")
+        previous_day1_observation = SentinelBalancesObservation("previous_day1_observation")
+
+        # only the requested fetchers are set up, so retrieving any other observation would raise
+        test_balance_observation_fetcher_mapping = {
+            overdraft_interest.fetchers.EOD_FETCHER_ID: current_eod_observation,
+            overdraft_interest.fetchers.PREVIOUS_EOD_1_FETCHER_ID: previous_day1_observation,
+        }
+        mock_vault = self.create_mock(
+            balances_observation_fetchers_mapping=test_balance_observation_fetcher_mapping,
+        )
+        result = overdraft_interest._retrieve_eod_observations(vault=mock_vault, number_of_days=2)
+        self.assertEqual(result, [current_eod_observation, previous_day1_observation])
+
 
 @patch.object(overdraft_interest.utils, "balance_at_coordinates")
 class TestCalculateAccrualBalance(TestOverdraftInterest):
@@ -888,7 +903,7 @@ class TestAccrueInterest(TestOverdraftInterest):
             denomination=sentinel.denomination,
             observations=sentinel.eod_observations,
         )
-        mock_retrieve_eod_observations.assert_called_once_with(vault=mock_vault)
+        mock_retrieve_eod_observations.assert_called_once_with(vault=mock_vault, number_of_days=4)
         self.assertListEqual(
             result,
             [
@@ -906,6 +921,38 @@ class TestAccrueInterest(TestOverdraftInterest):
             ],
         )
 
+    def test_accrue_interest_only_retrieves_eod_observations_for_interest_free_days(
+        self,
+        mock_get_parameter: MagicMock,
+        mock_retrieve_eod_observations: MagicMock,
+        mock_calculate_accrual_balance: MagicMock,
+    ):
+        mock_get_parameter.side_effect = mock_utils_get_parameter(
+            {
+                "denomination": sentinel.denomination,
+                "overdraft_interest_rate": Decimal("0.05"),
+                "overdraft_interest_receivable_account": "INTERNAL_ACCOUNT",
+                "interest_free_buffer_amount": Decimal("10"),
+                "interest_free_buffer_days": int("0"),
+            }
+        )
+        mock_retrieve_eod_observations.return_value = sentinel.eod_observations
+        mock_calculate_accrual_balance.return_value = DECIMAL_ZERO
+        result = overdraft_interest.accrue_interest(
+            vault=sentinel.vault,
+            effective_datetime=sentinel.effective_datetime,
+        )
+        self.assertListEqual(result, [])
+        mock_retrieve_eod_observations.assert_called_once_with(
+            vault=sentinel.vault, number_of_days=1
+        )
+        mock_calculate_accrual_balance.assert_called_once_with(
+            interest_free_amount=Decimal("10"),
+            interest_free_days=0,
+            denomination=sentinel.denomination,
+            observations=sentinel.eod_observations,
+        )
+
 
 @patch.object(overdraft_interest.accruals, "accrual_application_custom_instruction")
 @patch.object(overdraft_interest.utils, "standard_instruction_details")
@@ -19,6 +19,7 @@ ACCRUED_INTEREST_RECEIVABLE = tiered_interest_accrual.ACCRUED_INTEREST_RECEIVABL
 ACCRUED_INTEREST_PAYABLE = tiered_interest_accrual.ACCRUED_INTEREST_PAYABLE
 
 
+@patch.object(tiered_interest_accrual.tier_tables, "compile_tier_table_if_large")
 @patch.object(tiered_interest_accrual, "get_tiered_accrual_amount")
 @patch.object(tiered_interest_accrual, "get_accrual_capital")
 @patch.object(tiered_interest_accrual.accruals, "accrual_custom_instruction")
@@ -39,7 +40,9 @@ class TestInterestAccrual(FeatureTest):
         mock_accrual_cis: MagicMock,
         mock_accrual_capital: MagicMock,
         mock_tiered_accrual_amount: MagicMock,
+        mock_compile_tier_table_if_large: MagicMock,
     ):
+        mock_compile_tier_table_if_large.return_value = sentinel.tier_table
         mock_tiered_accrual_amount.return_value = Decimal("1"), "some description"
         mock_get_parameter.side_effect = mock_utils_get_parameter(self.common_params)
         mock_accrual_cis.return_value = [sentinel.accrual_cis]
@@ -61,7 +64,9 @@ class TestInterestAccrual(FeatureTest):
             tiered_interest_rates=sentinel.tiered_rates,
             days_in_year="365",
             precision=5,
+            tier_table=sentinel.tier_table,
         )
+        mock_compile_tier_table_if_large.assert_called_once_with(tiered_rates=sentinel.tiered_rates)
 
         mock_accrual_cis.assert_called_once_with(
             customer_account=mock_vault.account_id,
@@ -82,7 +87,9 @@ class TestInterestAccrual(FeatureTest):
         mock_accrual_cis: MagicMock,
         mock_accrual_capital: MagicMock,
         mock_tiered_accrual_amount: MagicMock,
+        mock_compile_tier_table_if_large: MagicMock,
     ):
+        mock_compile_tier_table_if_large.return_value = sentinel.tier_table
         mock_tiered_accrual_amount.return_value = Decimal("-1"), "some description"
         mock_get_parameter.side_effect = mock_utils_get_parameter(self.common_params)
         mock_accrual_cis.return_value = [sentinel.accrual_cis]
@@ -104,7 +111,9 @@ class TestInterestAccrual(FeatureTest):
             tiered_interest_rates=sentinel.tiered_rates,
             days_in_year="365",
             precision=5,
+            tier_table=sentinel.tier_table,
         )
+        mock_compile_tier_table_if_large.assert_called_once_with(tiered_rates=sentinel.tiered_rates)
 
         mock_accrual_cis.assert_called_once_with(
             customer_account=mock_vault.account_id,
@@ -121,24 +130,15 @@ class TestInterestAccrual(FeatureTest):
 
 
 class TestTieredAccrualAmount(FeatureTest):
-    @patch.object(tiered_interest_accrual.utils, "yearly_to_daily_rate")
-    @patch.object(tiered_interest_accrual, "determine_tier_balance")
-    def test_accrue_interest_with_multiple_tiers(
-        self, mock_determine_tier_balance: MagicMock, mock_yearly_to_daily_rate: MagicMock
-    ):
-        mock_determine_tier_balance.side_effect = [
-            Decimal("4"),
-            Decimal("6"),
-            Decimal("90"),
-            Decimal("0"),
-        ]
+    @patch.object(tiered_interest_accrual.tier_tables.utils, "yearly_to_daily_rate")
+    def test_accrue_interest_with_multiple_tiers(self, mock_yearly_to_daily_rate: MagicMock):
         # last tier has no balance, so no yearly->daily needed
         # made numbers == yearly rate for simplicity
         mock_yearly_to_daily_rate.side_effect = [Decimal("0.01"), Decimal("0.02"), Decimal("0.03")]
 
         accrual_amount, description = tiered_interest_accrual.get_tiered_accrual_amount(
             effective_balance=Decimal("100"),
-            effective_datetime=sentinel.effective_datetime,
+            effective_datetime=DEFAULT_DATETIME,
             tiered_interest_rates={"0": "0.01", "4": "0.02", "10": "0.03", "1000": "0.04"},
             days_in_year=sentinel.days_in_year,
         )
@@ -151,35 +151,37 @@ class TestTieredAccrualAmount(FeatureTest):
             "Accrual on 90.00 at annual rate of 3.00%. ",
         )
 
-        mock_determine_tier_balance.assert_has_calls(
-            [
-                call(effective_balance=Decimal(100), tier_min=Decimal("0"), tier_max=Decimal("4")),
-                call(effective_balance=Decimal(100), tier_min=Decimal("4"), tier_max=Decimal("10")),
-                call(
-                    effective_balance=Decimal(100), tier_min=Decimal("10"), tier_max=Decimal("1000")
-                ),
-                call(effective_balance=Decimal(100), tier_min=Decimal("1000"), tier_max=None),
-            ]
-        )
         mock_yearly_to_daily_rate.assert_has_calls(
             [
                 call(
-                    effective_date=sentinel.effective_datetime,
-                    yearly_rate=Decimal("0.01"),
+                    effective_date=DEFAULT_DATETIME,
+                    yearly_rate=Decimal(rate),
                     days_in_year=sentinel.days_in_year,
-                ),
-                call(
-                    effective_date=sentinel.effective_datetime,
-                    yearly_rate=Decimal("0.02"),
-                    days_in_year=sentinel.days_in_year,
-                ),
-                call(
-                    effective_date=sentinel.effective_datetime,
-                    yearly_rate=Decimal("0.03"),
-                    days_in_year=sentinel.days_in_year,
-                ),
+                )
+                for rate in ["0.01", "0.02", "0.03"]
             ]
         )
+        self.assertEqual(mock_yearly_to_daily_rate.call_count, 3)
+
+    def test_precompiled_tier_table_is_used(self):
+        tier_table = tiered_interest_accrual.tier_tables.compile_tier_table(
+            tiered_rates={"0": "0.365", "1000": "0.730"}
+        )
+
+        with patch.object(
+            tiered_interest_accrual.tier_tables, "compile_tier_table"
+        ) as mock_compile_tier_table:
+            accrual_amount, _ = tiered_interest_accrual.get_tiered_accrual_amount(
+                effective_balance=Decimal("2000"),
+                effective_datetime=DEFAULT_DATETIME,
+                tiered_interest_rates=sentinel.tiered_interest_rates,
+                days_in_year="365",
+                tier_table=tier_table,
+            )
+
+        # 1000 * 0.001 + 1000 * 0.002
+        self.assertEqual(accrual_amount, Decimal("3"))
+        mock_compile_tier_table.assert_not_called()
 
 
 class DetermineTierBalance(FeatureTest):
@@ -13,6 +13,7 @@ from json import dumps
 import library.features.common.accruals as accruals
 import library.features.common.common_parameters as common_parameters
 import library.features.common.interest_accrual_common as interest_accrual_common
+import library.features.common.tier_tables as tier_tables
 import library.features.common.utils as utils
 import library.features.deposit.interest.deposit_interest_accrual_common as deposit_interest_accrual_common  # noqa: E501
 
@@ -74,6 +75,7 @@ event_types = interest_accrual_common.event_types
 scheduled_events = interest_accrual_common.scheduled_events
 get_accrual_capital = deposit_interest_accrual_common.get_accrual_capital
 get_interest_reversal_postings = deposit_interest_accrual_common.get_interest_reversal_postings
+determine_tier_balance = tier_tables.determine_tier_balance
 
 
 # Parameter Getters
@@ -120,6 +122,7 @@ def accrue_interest(
         tiered_interest_rates=tiered_rates,
         days_in_year=days_in_year,
         precision=rounding_precision,
+        tier_table=tier_tables.compile_tier_table_if_large(tiered_rates=tiered_rates),
     )
 
     instruction_details = {"description": instruction_detail.strip(), "event": ACCRUAL_EVENT}
@@ -148,6 +151,7 @@ def get_tiered_accrual_amount(
     tiered_interest_rates: dict[str, str],
     days_in_year: str,
     precision: int = 5,
+    tier_table: tier_tables.TierTable | None = None,
 ) -> tuple[Decimal, str]:
     """
     Calculate the amount to accrue on each balance portion by tier rate (to defined precision).
@@ -158,86 +162,30 @@ def get_tiered_accrual_amount(
     :param tiered_interest_rates: tiered interest rates parameter
     :param days_in_year: days in year parameter
     :param accrual_precision: accrual precision parameter
+    :param tier_table: the tier table compiled from the tiered_interest_rates, as per
+    tier_tables.compile_tier_table_if_large. If not provided, it is compiled on each call if there
+    are enough tiers
     :return: rounded accrual_amount and instruction_details
     """
     daily_accrual_amount = Decimal("0")
     instruction_detail = ""
 
-    tiered_interest_rates = dict(sorted(tiered_interest_rates.items(), key=lambda x: x[1]))
-    for index, (tier_min, tier_rate) in enumerate(tiered_interest_rates.items()):
-        rate = Decimal(tier_rate)
-        # Tier max is next tier 'min value' if exists
-        tier_max = determine_tier_max(list(tiered_interest_rates.keys()), index)
-
-        tier_balances = determine_tier_balance(
-            effective_balance=effective_balance, tier_min=Decimal(tier_min), tier_max=tier_max
+    balance_per_tier, rates, daily_rates = tier_tables.get_tier_balances_and_rates(
+        tiered_rates=tiered_interest_rates,
+        balance=effective_balance,
+        effective_datetime=effective_datetime,
+        days_in_year=days_in_year,
+        tier_table=tier_table,
+    )
+    for index, tier_balances in balance_per_tier:
+        rate = rates[index]
+        daily_accrual_amount += tier_balances * daily_rates[index]
+        instruction_detail = (
+            f"{instruction_detail}Accrual on {tier_balances:.2f} "
+            f"at annual rate of {rate*100:.2f}%. "
         )
-        if tier_balances != Decimal(0):
-            daily_rate = utils.yearly_to_daily_rate(
-                effective_date=effective_datetime,
-                yearly_rate=rate,
-                days_in_year=days_in_year,
-            )
-
-            daily_accrual_amount += tier_balances * daily_rate
-            instruction_detail = (
-                f"{instruction_detail}Accrual on {tier_balances:.2f} "
-                f"at annual rate of {rate*100:.2f}%. "
-            )
 
     return (
         utils.round_decimal(amount=daily_accrual_amount, decimal_places=precision),
         instruction_detail,
     )
-
-
-def determine_tier_max(tier_range_list: list[str], index: int) -> Decimal | None:
-    return Decimal(tier_range_list[index + 1]) if (index + 1) < len(tier_range_list) else None
-
-
-def determine_tier_balance(
-    effective_balance: Decimal,
-    tier_min: Decimal | None = None,
-    tier_max: Decimal | None = None,
-) -> Decimal:
-    """
-    Determines a tier's balance based on min and max. Min and max must be of same sign or
-    zero is returned (use Decimal("-0") if required). If neither are provided, zero is returned
-    :param tier_min: the minimum balance in the tier, exclusive. Any amount at or below is excluded.
-    Defaults to 0 if tier_max is +ve, unbounded is tier_max is -ve
-    :param tier_max: the maximum balance included in the tier, inclusive. Any amount greater is
-    excluded. Defaults to Decimal("-0") if tier_min is -ve,  unbounded if tier_min is +ve
-    :param effective_balance: the balance to check against the tier min/max
-    :return: the portion of the effective balance that is included in the tier
-    """
-    # Could be expressed more simply, but this provides clearer coverage and type checks
-    if tier_min is None:
-        if tier_max is None:
-            return Decimal("0")
-        if tier_max.is_signed():
-            tier_min = effective_balance
-        else:
-            tier_min = Decimal("0")
-    if tier_max is None:
-        if tier_min.is_signed():
-            tier_max = Decimal("-0")
-        else:
-            tier_max = effective_balance
-
-    # we don't handle ranges where min and max have different signs
-    # is_signed() detects negative 0 whereas < 0 comparison does not
-    if tier_max.is_signed() ^ tier_min.is_signed():
-        return Decimal("0")
-
-    if tier_max.is_signed():
-        # Next statement could go positive otherwise
-        if tier_min >= tier_max:
-            return Decimal("0")
-
-        return max(effective_balance, tier_min) - max(effective_balance, tier_max)
-    else:
-        # Next statement could go negative otherwise
-        if tier_max <= tier_min:
-            return Decimal("0")
-
-        return min(effective_balance, tier_max) - min(effective_balance, tier_min)
@@ -0,0 +1,72 @@
+"""
+Micro-benchmarks of the hot deposit feature helpers, run with
+inception_sdk/test_framework/common/benchmark_runner.py. Timings are compared against
+benchmarks_baseline.json in this directory
+"""
+# standard libs
+from datetime import datetime
+from decimal import Decimal
+from functools import partial
+from typing import Any, Callable
+from zoneinfo import ZoneInfo
+
+# features
+import library.features.common.tier_tables as tier_tables
+import library.features.deposit.interest.tiered_interest_accrual as tiered_interest_accrual
+
+# inception sdk
+from inception_sdk.test_framework.common.benchmark import MicroBenchmark
+
+EFFECTIVE_DATETIME = datetime(2024, 3, 1, tzinfo=ZoneInfo("UTC"))
+# products typically have a handful of tiers, but some savings products have dozens
+TIER_COUNTS = [3, 10, 50]
+TIER_SIZE = Decimal("5000")
+# balances accrued on per call, e.g. the accounts accrued on by a scheduled job
+BALANCE_COUNT = 20
+
+
+def _tiered_interest_rates(tier_count: int) -> dict[str, str]:
+    return {
+        str(TIER_SIZE * tier): str(Decimal("0.005") + Decimal("0.0025") * tier)
+        for tier in range(tier_count)
+    }
+
+
+def _effective_balances(tier_count: int) -> list[Decimal]:
+    # spread from the first tier to beyond the last, with pence so that rounding is exercised
+    step = TIER_SIZE * (tier_count + 1) / BALANCE_COUNT
+    return [step * (i + 1) + Decimal("0.37") for i in range(BALANCE_COUNT)]
+
+
+def _prepare_get_tiered_accrual_amount(
+    tier_count: int, days_in_year: str, precompile: bool
+) -> Callable[[], Any]:
+    tiered_interest_rates = _tiered_interest_rates(tier_count)
+    effective_balances = _effective_balances(tier_count)
+    tier_table = (
+        tier_tables.compile_tier_table(tiered_rates=tiered_interest_rates) if precompile else None
+    )
+    return lambda: [
+        tiered_interest_accrual.get_tiered_accrual_amount(
+            effective_balance=effective_balance,
+            effective_datetime=EFFECTIVE_DATETIME,
+            tiered_interest_rates=tiered_interest_rates,
+            days_in_year=days_in_year,
+            tier_table=tier_table,
+        )
+        for effective_balance in effective_balances
+    ]
+
+
+BENCHMARKS = [
+    MicroBenchmark(
+        name=f"tiered_interest_accrual.get_tiered_accrual_amount {BALANCE_COUNT} balances, "
+        f"{tier_count} tiers, days in year {days_in_year}"
+        f"{', precompiled tier table' if precompile else ''}",
+        prepare=partial(_prepare_get_tiered_accrual_amount, tier_count, days_in_year, precompile),
+        number=max(1, 100 // tier_count),
+    )
+    for tier_count in TIER_COUNTS
+    for days_in_year in ["365", "actual"]
+    for precompile in [False, True]
+]
@@ -82,6 +82,9 @@ def validate(
     loan_balances = supervisor_utils.get_balance_default_dicts_for_supervisees(
         supervisees=loans, fetcher_id=LIVE_BALANCES_BOF_ID
     )
+    # the view is shared by all of the calculations below so that each loan balance is only
+    # looked up once
+    loan_balances_view = supervisor_utils.create_supervisee_balances_view(balances=loan_balances)
     denomination = _get_denomination_parameter(vault=main_vault)
 
     associated_original_principal = calculate_associated_original_principal(loans=loans)
@@ -91,6 +94,7 @@ def validate(
         denomination=denomination,
         associated_original_principal=associated_original_principal,
         non_repayable_addresses=non_repayable_addresses,
+        loan_balances_view=loan_balances_view,
     )
 
     credit_limit = _get_credit_limit_parameter(vault=main_vault)
@@ -102,6 +106,7 @@ def validate(
         denomination=denomination,
         associated_original_principal=associated_original_principal,
         unassociated_principal=unassociated_principal,
+        loan_balances_view=loan_balances_view,
     )
 
     posting_amount = utils.get_available_balance(
@@ -129,6 +134,7 @@ def calculate_unassociated_principal(
     denomination: str,
     associated_original_principal: Decimal,
     non_repayable_addresses: list[str] | None = None,
+    loan_balances_view: supervisor_utils.SuperviseeBalancesView | None = None,
 ) -> Decimal:
     # Drawdown requests can be determined from the default balance as:
     # default balance = drawdown requests - repayments
@@ -148,6 +154,7 @@ def calculate_unassociated_principal(
         balances=loan_balances,
         denomination=denomination,
         addresses=non_repayable_addresses,
+        balances_view=loan_balances_view,
     )
 
     main_vault_default_net = utils.balance_at_coordinates(
@@ -167,6 +174,7 @@ def calculate_available_credit_limit(
     denomination: str,
     associated_original_principal: Decimal,
     unassociated_principal: Decimal,
+    loan_balances_view: supervisor_utils.SuperviseeBalancesView | None = None,
 ) -> Decimal:
     # Remaining credit limit is defined as:
     # credit limit - associated principal - unassociated original principal, where:
@@ -184,6 +192,7 @@ def calculate_available_credit_limit(
             balances=loan_balances,
             denomination=denomination,
             addresses=addresses.ALL_PRINCIPAL,
+            balances_view=loan_balances_view,
         )
         available_credit_limit -= associated_outstanding_principal
 
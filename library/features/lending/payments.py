@@ -39,6 +39,19 @@ RepaymentAmounts = NamedTuple(
     ],
 )
 
+RepaymentAllocationTable = NamedTuple(
+    "RepaymentAllocationTable",
+    [
+        # the repayment target account ids, in the order they are repaid
+        ("targets", list[str]),
+        # (target account id, addresses) in the order in which repayments are distributed
+        ("hierarchy", list[tuple[str, list[str]]]),
+        # (target account id, address) to the unrounded and 2 decimal point rounded outstanding
+        # amounts
+        ("outstanding", dict[tuple[str, str], RepaymentAmounts]),
+    ],
+)
+
 
 def redistribute_postings(
     debit_account: str,
@@ -196,6 +209,132 @@ def distribute_repayment_for_multiple_targets(
     return repayments_per_target, remaining_repayment_amount
 
 
+def create_repayment_allocation_table(
+    balances_per_target: dict[str, BalanceDefaultDict],
+    denomination: str,
+    repayment_hierarchy: list[list[str]],
+    phase: Phase = Phase.COMMITTED,
+) -> RepaymentAllocationTable:
+    """
+    Resolves and rounds the outstanding amount of each repayment hierarchy address for each target
+    once, so that one or more repayments can be allocated without building balance coordinates or
+    rounding balances per repayment. Allocations against the table are identical to those of
+    distribute_repayment_for_multiple_targets for the same balances.
+    :param balances_per_target: a dictionary where the key is the repayment target account id and
+    the value is its balances. This should be sorted in order of which target should be repaid
+    first.
+    :param denomination: the denomination of the repayments
+    :param repayment_hierarchy: The order in which a repayment amount is to be distributed across
+    addresses for one or more targets, as per distribute_repayment_for_multiple_targets
+    :param phase: The balance phase of the balances fetched to get amounts from
+    :return: the repayment allocation table
+    """
+    outstanding: dict[tuple[str, str], RepaymentAmounts] = {}
+    for target_account_id, balances in balances_per_target.items():
+        for address_list in repayment_hierarchy:
+            for address in address_list:
+                if (target_account_id, address) in outstanding:
+                    continue
+                unrounded_amount = balances[
+                    BalanceCoordinate(address, DEFAULT_ASSET, denomination, phase)
+                ].net
+                outstanding[(target_account_id, address)] = RepaymentAmounts(
+                    unrounded_amount=unrounded_amount,
+                    rounded_amount=utils.round_decimal(unrounded_amount, 2),
+                )
+
+    targets = list(balances_per_target.keys())
+    return RepaymentAllocationTable(
+        targets=targets,
+        hierarchy=[
+            (target_account_id, address_list)
+            for address_list in repayment_hierarchy
+            for target_account_id in targets
+        ],
+        outstanding=outstanding,
+    )
+
+
+def allocate_repayment(
+    allocation_table: RepaymentAllocationTable,
+    repayment_amount: Decimal,
+) -> tuple[dict[str, dict[str, RepaymentAmounts]], Decimal]:
+    """
+    Determines how a repayment amount should be distributed across the targets in the allocation
+    table. The table is not modified.
+    :param allocation_table: the table created by create_repayment_allocation_table
+    :param repayment_amount: repayment amount to distribute
+    :return: A tuple containing
+        - a dictionary where the key is the target account id and the value is the repayment
+    amounts for each address.
+        - the remaining repayment amount.
+    """
+    remaining_repayment_amount = repayment_amount
+    repayments_per_target: dict[str, dict[str, RepaymentAmounts]] = {
+        target: {} for target in allocation_table.targets
+    }
+
+    for target_account_id, address_list in allocation_table.hierarchy:
+        for address in address_list:
+            outstanding_amounts = allocation_table.outstanding[(target_account_id, address)]
+            rounded_repayment_amount = min(
+                outstanding_amounts.rounded_amount, remaining_repayment_amount
+            )
+            # can't repay a balance that is < 2 decimal points
+            if rounded_repayment_amount == Decimal(0):
+                continue
+
+            # ensure that the unrounded repayment amount is <= unrounded address amount
+            unrounded_repayment_amount = (
+                outstanding_amounts.unrounded_amount
+                if outstanding_amounts.rounded_amount <= remaining_repayment_amount
+                else remaining_repayment_amount
+            )
+            repayments_per_target[target_account_id][address] = RepaymentAmounts(
+                unrounded_amount=unrounded_repayment_amount,
+                rounded_amount=rounded_repayment_amount,
+            )
+            remaining_repayment_amount -= rounded_repayment_amount
+
+        if remaining_repayment_amount == Decimal("0"):
+            return repayments_per_target, Decimal("0")
+
+    return repayments_per_target, remaining_repayment_amount
+
+
+def allocate_repayments(
+    allocation_table: RepaymentAllocationTable,
+    repayment_amounts: list[Decimal],
+) -> list[tuple[dict[str, dict[str, RepaymentAmounts]], Decimal]]:
+    """
+    Allocates repayments in order, with each repayment distributed against the amounts left
+    outstanding by the previous ones. The outstanding amounts in the table are reduced by the
+    unrounded repayment amounts, so the result for each repayment is the same as calling
+    distribute_repayment_for_multiple_targets with balances that include the previous repayments.
+    :param allocation_table: the table created by create_repayment_allocation_table. This is
+    updated in place
+    :param repayment_amounts: the repayment amounts to distribute, in the order they are made
+    :return: the result of allocate_repayment for each repayment amount
+    """
+    allocations: list[tuple[dict[str, dict[str, RepaymentAmounts]], Decimal]] = []
+    for repayment_amount in repayment_amounts:
+        repayments_per_target, remaining_repayment_amount = allocate_repayment(
+            allocation_table=allocation_table, repayment_amount=repayment_amount
+        )
+        for target_account_id, repayment_per_address in repayments_per_target.items():
+            for address, repayment_amounts_for_address in repayment_per_address.items():
+                outstanding_amount = (
+                    allocation_table.outstanding[(target_account_id, address)].unrounded_amount
+                    - repayment_amounts_for_address.unrounded_amount
+                )
+                allocation_table.outstanding[(target_account_id, address)] = RepaymentAmounts(
+                    unrounded_amount=outstanding_amount,
+                    rounded_amount=utils.round_decimal(outstanding_amount, 2),
+                )
+        allocations.append((repayments_per_target, remaining_repayment_amount))
+    return allocations
+
+
 def generate_repayment_postings(
     vault: SmartContractVault,
     hook_arguments: PostPostingHookArguments,
@@ -0,0 +1,106 @@
+"""
+Micro-benchmarks of the hot lending feature helpers, run with
+inception_sdk/test_framework/common/benchmark_runner.py. Timings are compared against
+benchmarks_baseline.json in this directory
+"""
+# standard libs
+from decimal import Decimal
+from functools import partial
+from typing import Any, Callable
+
+# features
+import library.features.common.utils as utils
+import library.features.lending.lending_addresses as lending_addresses
+import library.features.lending.payments as payments
+
+# contracts api
+from contracts_api import DEFAULT_ASSET, Balance, BalanceCoordinate, BalanceDefaultDict, Phase
+
+# inception sdk
+from inception_sdk.test_framework.common.benchmark import MicroBenchmark
+
+DENOMINATION = "GBP"
+# loans accumulate balances at tracker and accrual addresses as well as the repayment hierarchy
+OTHER_ADDRESS_COUNTS = [0, 100, 1000]
+TARGET_COUNTS = [10, 100]
+# repaid per call, from a partial repayment of the first address to overpaying every address
+REPAYMENT_COUNT = 10
+REPAYMENT_HIERARCHY = [[address] for address in lending_addresses.REPAYMENT_HIERARCHY]
+
+
+def _loan_balances(other_address_count: int) -> BalanceDefaultDict:
+    mapping = {
+        BalanceCoordinate(address, DEFAULT_ASSET, DENOMINATION, Phase.COMMITTED): Balance(
+            net=Decimal("12.345") * (index + 1)
+        )
+        for index, address in enumerate(lending_addresses.REPAYMENT_HIERARCHY)
+    }
+    mapping.update(
+        {
+            BalanceCoordinate(
+                f"ADDRESS_{i}", DEFAULT_ASSET, DENOMINATION, Phase.COMMITTED
+            ): Balance(net=Decimal(i))
+            for i in range(other_address_count)
+        }
+    )
+    return BalanceDefaultDict(mapping=mapping)
+
+
+def _outstanding() -> Decimal:
+    # the amount repaid across the hierarchy, as each address' balance is rounded for repayment
+    return sum(
+        (utils.round_decimal(balance.net, 2) for balance in _loan_balances(0).values()),
+        start=Decimal("0"),
+    )
+
+
+def _repayment_amounts(total_outstanding: Decimal) -> list[Decimal]:
+    step = total_outstanding / (REPAYMENT_COUNT - 1)
+    return [round(Decimal("1.23") + step * i, 2) for i in range(REPAYMENT_COUNT)]
+
+
+def _prepare_distribute_repayment_for_single_target(other_address_count: int) -> Callable[[], Any]:
+    balances = _loan_balances(other_address_count)
+    repayment_amounts = _repayment_amounts(_outstanding())
+    return lambda: [
+        payments.distribute_repayment_for_single_target(
+            balances=balances, repayment_amount=repayment_amount, denomination=DENOMINATION
+        )
+        for repayment_amount in repayment_amounts
+    ]
+
+
+def _prepare_distribute_repayment_for_multiple_targets(target_count: int) -> Callable[[], Any]:
+    balances_per_target = {f"loan_{target}": _loan_balances(0) for target in range(target_count)}
+    repayment_amounts = _repayment_amounts(target_count * _outstanding())
+    return lambda: [
+        payments.distribute_repayment_for_multiple_targets(
+            balances_per_target=balances_per_target,
+            repayment_amount=repayment_amount,
+            denomination=DENOMINATION,
+            repayment_hierarchy=REPAYMENT_HIERARCHY,
+        )
+        for repayment_amount in repayment_amounts
+    ]
+
+
+BENCHMARKS = [
+    *(
+        MicroBenchmark(
+            name=f"payments.distribute_repayment_for_single_target {REPAYMENT_COUNT} repayments, "
+            f"{other_address_count} other addresses",
+            prepare=partial(_prepare_distribute_repayment_for_single_target, other_address_count),
+            number=20,
+        )
+        for other_address_count in OTHER_ADDRESS_COUNTS
+    ),
+    *(
+        MicroBenchmark(
+            name=f"payments.distribute_repayment_for_multiple_targets {REPAYMENT_COUNT} "
+            f"repayments, {target_count} targets",
+            prepare=partial(_prepare_distribute_repayment_for_multiple_targets, target_count),
+            number=max(1, 20 // target_count),
+        )
+        for target_count in TARGET_COUNTS
+    ),
+]
@@ -0,0 +1,82 @@
+# standard libs
+from decimal import Decimal
+from unittest import TestCase
+
+# features
+import library.features.lending.lending_addresses as lending_addresses
+import library.features.lending.payments as payments
+
+# contracts api
+from contracts_api import DEFAULT_ASSET, Balance, BalanceCoordinate, BalanceDefaultDict, Phase
+
+# inception sdk
+from inception_sdk.test_framework.common.benchmark import run_benchmark
+
+DENOMINATION = "GBP"
+REPAYMENT_COUNT = 50
+REPAYMENT_HIERARCHY = [[address] for address in lending_addresses.REPAYMENT_HIERARCHY]
+TARGET_COUNTS = [10, 100, 1000]
+
+
+class RepaymentAllocationPerformanceTest(TestCase):
+    """
+    Compares distributing many repayments across many targets with
+    distribute_repayment_for_multiple_targets against allocating them from a repayment allocation
+    table created once.
+    """
+
+    def _balances_per_target(self, target_count: int) -> dict[str, BalanceDefaultDict]:
+        return {
+            f"loan_{target}": BalanceDefaultDict(
+                mapping={
+                    BalanceCoordinate(
+                        address, DEFAULT_ASSET, DENOMINATION, Phase.COMMITTED
+                    ): Balance(net=Decimal("1.2345") * (index + 1))
+                    for index, address in enumerate(lending_addresses.REPAYMENT_HIERARCHY)
+                }
+            )
+            for target in range(target_count)
+        }
+
+    def test_benchmark_repayment_distribution(self):
+        for target_count in TARGET_COUNTS:
+            with self.subTest(target_count=target_count):
+                balances_per_target = self._balances_per_target(target_count)
+                # repayments large enough to reach every target
+                repayment_amounts = [
+                    Decimal("10") * target_count + repayment for repayment in range(REPAYMENT_COUNT)
+                ]
+
+                current = run_benchmark(
+                    f"distribute {REPAYMENT_COUNT} repayments across {target_count} targets",
+                    lambda: [
+                        payments.distribute_repayment_for_multiple_targets(
+                            balances_per_target=balances_per_target,
+                            repayment_amount=repayment_amount,
+                            denomination=DENOMINATION,
+                            repayment_hierarchy=REPAYMENT_HIERARCHY,
+                        )
+                        for repayment_amount in repayment_amounts
+                    ],
+                    repeat=3,
+                )
+
+                def allocate_from_table() -> list:
+                    allocation_table = payments.create_repayment_allocation_table(
+                        balances_per_target=balances_per_target,
+                        denomination=DENOMINATION,
+                        repayment_hierarchy=REPAYMENT_HIERARCHY,
+                    )
+                    return [
+                        payments.allocate_repayment(
+                            allocation_table=allocation_table, repayment_amount=repayment_amount
+                        )
+                        for repayment_amount in repayment_amounts
+                    ]
+
+                table = run_benchmark(
+                    f"allocate {REPAYMENT_COUNT} repayments across {target_count} targets",
+                    allocate_from_table,
+                    repeat=3,
+                )
+                self.assertListEqual(table.return_value, current.return_value)
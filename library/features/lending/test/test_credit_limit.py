@@ -187,6 +187,9 @@ class ValidateCreditLimitTest(FeatureTest):
             denomination=sentinel.denomination,
             associated_original_principal=sentinel.associated_original_principal,
             non_repayable_addresses=None,
+            loan_balances_view=credit_limit.supervisor_utils.SuperviseeBalancesView(
+                balances=sentinel.balance_default_dicts, nets={}
+            ),
         )
 
         mock_calculate_available_credit_limit.assert_called_once_with(
@@ -196,6 +199,9 @@ class ValidateCreditLimitTest(FeatureTest):
             denomination=sentinel.denomination,
             associated_original_principal=sentinel.associated_original_principal,
             unassociated_principal=sentinel.unassociated_principal,
+            loan_balances_view=credit_limit.supervisor_utils.SuperviseeBalancesView(
+                balances=sentinel.balance_default_dicts, nets={}
+            ),
         )
 
     def test_posting_less_than_credit_limit_returns_none(
@@ -242,6 +248,9 @@ class ValidateCreditLimitTest(FeatureTest):
             denomination=sentinel.denomination,
             associated_original_principal=sentinel.associated_original_principal,
             non_repayable_addresses=None,
+            loan_balances_view=credit_limit.supervisor_utils.SuperviseeBalancesView(
+                balances=sentinel.balance_default_dicts, nets={}
+            ),
         )
 
         mock_calculate_available_credit_limit.assert_called_once_with(
@@ -251,6 +260,9 @@ class ValidateCreditLimitTest(FeatureTest):
             denomination=sentinel.denomination,
             associated_original_principal=sentinel.associated_original_principal,
             unassociated_principal=sentinel.unassociated_principal,
+            loan_balances_view=credit_limit.supervisor_utils.SuperviseeBalancesView(
+                balances=sentinel.balance_default_dicts, nets={}
+            ),
         )
 
     def test_posting_equal_to_credit_limit_returns_none(
@@ -297,6 +309,9 @@ class ValidateCreditLimitTest(FeatureTest):
             denomination=sentinel.denomination,
             associated_original_principal=sentinel.associated_original_principal,
             non_repayable_addresses=None,
+            loan_balances_view=credit_limit.supervisor_utils.SuperviseeBalancesView(
+                balances=sentinel.balance_default_dicts, nets={}
+            ),
         )
 
         mock_calculate_available_credit_limit.assert_called_once_with(
@@ -306,6 +321,9 @@ class ValidateCreditLimitTest(FeatureTest):
             denomination=sentinel.denomination,
             associated_original_principal=sentinel.associated_original_principal,
             unassociated_principal=sentinel.unassociated_principal,
+            loan_balances_view=credit_limit.supervisor_utils.SuperviseeBalancesView(
+                balances=sentinel.balance_default_dicts, nets={}
+            ),
         )
 
 
@@ -840,6 +840,111 @@ class DistributeRepaymentsMultipleTargetsTest(PaymentsTestCommon):
         mock_distribute_repayment_for_single_target.assert_has_calls(calls)
 
 
+class RepaymentAllocationTableTest(PaymentsTestCommon):
+    repayment_hierarchy = [["ADDRESS_1"], ["ADDRESS_2", "ADDRESS_3"]]
+
+    def _balances(self, *amounts: str) -> BalanceDefaultDict:
+        return BalanceDefaultDict(
+            mapping={
+                BalanceCoordinate(
+                    f"ADDRESS_{index}", DEFAULT_ASSET, self.default_denomination, Phase.COMMITTED
+                ): Balance(net=Decimal(amount))
+                for index, amount in enumerate(amounts, start=1)
+            }
+        )
+
+    def setUp(self) -> None:
+        self.balances_per_target = {
+            "loan_1": self._balances("10.004", "1.005", "0.015"),
+            "loan_2": self._balances("5.555", "0.004", "2"),
+            "loan_3": self._balances("0", "-1.50", "3.333"),
+        }
+        return super().setUp()
+
+    def test_create_repayment_allocation_table(self):
+        result = payments.create_repayment_allocation_table(
+            balances_per_target={"loan_1": self.balances_per_target["loan_1"]},
+            denomination=self.default_denomination,
+            repayment_hierarchy=self.repayment_hierarchy,
+        )
+
+        self.assertEqual(
+            result,
+            payments.RepaymentAllocationTable(
+                targets=["loan_1"],
+                hierarchy=[("loan_1", ["ADDRESS_1"]), ("loan_1", ["ADDRESS_2", "ADDRESS_3"])],
+                outstanding={
+                    ("loan_1", "ADDRESS_1"): payments.RepaymentAmounts(
+                        unrounded_amount=Decimal("10.004"), rounded_amount=Decimal("10.00")
+                    ),
+                    ("loan_1", "ADDRESS_2"): payments.RepaymentAmounts(
+                        unrounded_amount=Decimal("1.005"), rounded_amount=Decimal("1.01")
+                    ),
+                    ("loan_1", "ADDRESS_3"): payments.RepaymentAmounts(
+                        unrounded_amount=Decimal("0.015"), rounded_amount=Decimal("0.02")
+                    ),
+                },
+            ),
+        )
+
+    def test_allocate_repayment_matches_distribute_repayment_for_multiple_targets(self):
+        allocation_table = payments.create_repayment_allocation_table(
+            balances_per_target=self.balances_per_target,
+            denomination=self.default_denomination,
+            repayment_hierarchy=self.repayment_hierarchy,
+        )
+
+        for repayment_amount in ["0.01", "10", "15.56", "16.99", "18", "25", "100"]:
+            with self.subTest(repayment_amount=repayment_amount):
+                expected = payments.distribute_repayment_for_multiple_targets(
+                    balances_per_target=self.balances_per_target,
+                    repayment_amount=Decimal(repayment_amount),
+                    denomination=self.default_denomination,
+                    repayment_hierarchy=self.repayment_hierarchy,
+                )
+
+                result = payments.allocate_repayment(
+                    allocation_table=allocation_table, repayment_amount=Decimal(repayment_amount)
+                )
+
+                self.assertEqual(result, expected)
+
+    def test_allocate_repayments_allocates_against_remaining_outstanding_amounts(self):
+        allocation_table = payments.create_repayment_allocation_table(
+            balances_per_target=self.balances_per_target,
+            denomination=self.default_denomination,
+            repayment_hierarchy=self.repayment_hierarchy,
+        )
+        repayment_amounts = [Decimal("10.005"), Decimal("7"), Decimal("20")]
+
+        result = payments.allocate_repayments(
+            allocation_table=allocation_table, repayment_amounts=repayment_amounts
+        )
+
+        # each repayment is distributed against balances reduced by the previous repayments
+        balances_per_target = self.balances_per_target
+        for repayment_amount, allocation in zip(repayment_amounts, result):
+            expected = payments.distribute_repayment_for_multiple_targets(
+                balances_per_target=balances_per_target,
+                repayment_amount=repayment_amount,
+                denomination=self.default_denomination,
+                repayment_hierarchy=self.repayment_hierarchy,
+            )
+            self.assertEqual(allocation, expected)
+            balances_per_target = {
+                target: balances
+                + BalanceDefaultDict(
+                    mapping={
+                        BalanceCoordinate(
+                            address, DEFAULT_ASSET, self.default_denomination, Phase.COMMITTED
+                        ): Balance(net=-repayment.unrounded_amount)
+                        for address, repayment in expected[0][target].items()
+                    }
+                )
+                for target, balances in balances_per_target.items()
+            }
+
+
 @patch.object(payments.early_repayment, "is_posting_an_early_repayment")
 @patch.object(payments, "distribute_repayment_for_single_target")
 @patch.object(payments.utils, "get_parameter")
@@ -6,6 +6,7 @@ from json import dumps
 # features
 import library.features.common.accruals as accruals
 import library.features.common.fetchers as fetchers
+import library.features.common.tier_tables as tier_tables
 import library.features.common.utils as utils
 import library.features.shariah.shariah_interfaces as shariah_interfaces
 
@@ -196,6 +197,7 @@ def accrue_profit(
         tiered_profit_rates=tiered_rates,
         days_in_year=days_in_year,
         precision=rounding_precision,
+        tier_table=tier_tables.compile_tier_table_if_large(tiered_rates=tiered_rates),
     )
 
     if account_type is None:
@@ -229,6 +231,7 @@ def get_tiered_accrual_amount(
     tiered_profit_rates: dict[str, str],
     days_in_year: str,
     precision: int = 5,
+    tier_table: tier_tables.TierTable | None = None,
 ) -> tuple[Decimal, str]:
     """
     Calculate the amount to accrue on each balance portion by tier rate (to defined precision).
@@ -239,32 +242,28 @@ def get_tiered_accrual_amount(
     :param tiered_profit_rates: tiered profit rates parameter
     :param days_in_year: days in year parameter
     :param accrual_precision: accrual precision parameter
+    :param tier_table: the tier table compiled from the tiered_profit_rates, as per
+    tier_tables.compile_tier_table_if_large. If not provided, it is compiled on each call if there
+    are enough tiers
     :return: rounded accrual_amount and instruction_details
     """
     daily_accrual_amount = Decimal("0")
     instruction_detail = ""
 
-    tiered_profit_rates = dict(sorted(tiered_profit_rates.items(), key=lambda x: x[1]))
-    for index, (tier_min, tier_rate) in enumerate(tiered_profit_rates.items()):
-        rate = Decimal(tier_rate)
-        # Tier max is next tier 'min value' if exists
-        tier_max = determine_tier_max(list(tiered_profit_rates.keys()), index)
-
-        tier_balances = determine_tier_balance(
-            effective_balance=effective_balance, tier_min=Decimal(tier_min), tier_max=tier_max
+    balance_per_tier, rates, daily_rates = tier_tables.get_tier_balances_and_rates(
+        tiered_rates=tiered_profit_rates,
+        balance=effective_balance,
+        effective_datetime=effective_datetime,
+        days_in_year=days_in_year,
+        tier_table=tier_table,
+    )
+    for index, tier_balances in balance_per_tier:
+        rate = rates[index]
+        daily_accrual_amount += tier_balances * daily_rates[index]
+        instruction_detail = (
+            f"{instruction_detail}Accrual on {tier_balances:.2f} "
+            f"at annual rate of {rate*100:.2f}%. "
         )
-        if tier_balances != Decimal(0):
-            daily_rate = utils.yearly_to_daily_rate(
-                effective_date=effective_datetime,
-                yearly_rate=rate,
-                days_in_year=days_in_year,
-            )
-
-            daily_accrual_amount += tier_balances * daily_rate
-            instruction_detail = (
-                f"{instruction_detail}Accrual on {tier_balances:.2f} "
-                f"at annual rate of {rate*100:.2f}%. "
-            )
 
     return (
         utils.round_decimal(amount=daily_accrual_amount, decimal_places=precision),
@@ -272,56 +271,7 @@ def get_tiered_accrual_amount(
     )
 
 
-def determine_tier_max(tier_range_list: list[str], index: int) -> Decimal | None:
-    return Decimal(tier_range_list[index + 1]) if (index + 1) < len(tier_range_list) else None
-
-
-def determine_tier_balance(
-    effective_balance: Decimal,
-    tier_min: Decimal | None = None,
-    tier_max: Decimal | None = None,
-) -> Decimal:
-    """
-    Determines a tier's balance based on min and max. Min and max must be of same sign or
-    zero is returned (use Decimal("-0") if required). If neither are provided, zero is returned
-    :param tier_min: the minimum balance included in the tier. Any amount below is excluded.
-    Defaults to 0 if tier_max is +ve or unbounded if tier_max is -ve
-    :param tier_max: the maximum balance included in the tier, exclusive. Any amount greater is
-    excluded. Defaults to Decimal("-0") if tier_min is -ve or unbounded if tier_min is +ve
-    :param effective_balance: the balance to check against the tier min/max
-    :return: the portion of the effective balance that is included in the tier
-    """
-    # Could be expressed more simply, but this provides clearer coverage and type checks
-    if tier_min is None:
-        if tier_max is None:
-            return Decimal("0")
-        if tier_max.is_signed():
-            tier_min = effective_balance
-        else:
-            tier_min = Decimal("0")
-    if tier_max is None:
-        if tier_min.is_signed():
-            tier_max = Decimal("-0")
-        else:
-            tier_max = effective_balance
-
-    # we don't handle ranges where min and max have different signs
-    # is_signed() detects negative 0 whereas < 0 comparison does not
-    if tier_max.is_signed() ^ tier_min.is_signed():
-        return Decimal("0")
-
-    if tier_max.is_signed():
-        # Next statement could go positive otherwise
-        if tier_min >= tier_max:
-            return Decimal("0")
-
-        return max(effective_balance, tier_min) - max(effective_balance, tier_max)
-    else:
-        # Next statement could go negative otherwise
-        if tier_max <= tier_min:
-            return Decimal("0")
-
-        return min(effective_balance, tier_max) - min(effective_balance, tier_min)
+determine_tier_balance = tier_tables.determine_tier_balance
 
 
 def get_accrual_capital(
@@ -0,0 +1,87 @@
+# standard libs
+import json
+import logging
+from decimal import Decimal
+
+# library
+import library.wallet.contracts.template.wallet as contract
+from library.wallet.test.unit.test_wallet_common import DEFAULT_DATETIME, WalletTestBase
+
+# features
+import library.features.common.fetchers as fetchers
+
+# contracts api
+from contracts_api import BalanceDefaultDict, BalancesObservation, PrePostingHookArguments
+
+# inception sdk
+from inception_sdk.test_framework.contracts.unit.common import construct_parameter_timeseries
+from inception_sdk.test_framework.contracts.unit.hook_profiler import profile_hook
+
+log = logging.getLogger(__name__)
+
+DENOMINATION = "GBP"
+ADDITIONAL_DENOMINATIONS = ["USD", "EUR"]
+POSTINGS_PER_BATCH = 20
+RUNS = 20
+
+
+class WalletHookProfileTest(WalletTestBase):
+    """
+    Profiles the pre-posting hook against a fake vault to see which features dominate its cost
+    """
+
+    def test_profile_pre_posting_hook(self):
+        vault = self.create_fake_vault(
+            parameter_ts=construct_parameter_timeseries(
+                {
+                    "denomination": DENOMINATION,
+                    "daily_spending_limit": Decimal("100000"),
+                    "additional_denominations": json.dumps(ADDITIONAL_DENOMINATIONS),
+                },
+                default_datetime=DEFAULT_DATETIME,
+            ),
+            balances_observation_fetchers_mapping={
+                fetchers.LIVE_BALANCES_BOF_ID: BalancesObservation(
+                    balances=BalanceDefaultDict(
+                        mapping={
+                            self.balance_coordinate(denomination=denomination): self.balance(
+                                net=Decimal("1000")
+                            )
+                            for denomination in [DENOMINATION] + ADDITIONAL_DENOMINATIONS
+                        }
+                    ),
+                    value_datetime=DEFAULT_DATETIME,
+                )
+            },
+        )
+        hook_arguments = PrePostingHookArguments(
+            effective_datetime=DEFAULT_DATETIME,
+            posting_instructions=[
+                self.outbound_hard_settlement(amount=Decimal("1"), denomination=DENOMINATION)
+                for _ in range(POSTINGS_PER_BATCH)
+            ],
+            client_transactions={},
+        )
+
+        profile = profile_hook(contract.pre_posting_hook, vault, hook_arguments, runs=RUNS)
+
+        self.assertIsNone(profile.result)
+        self.assertEqual(
+            profile.vault_calls,
+            {
+                "get_parameter_timeseries": 3 * RUNS,
+                "get_balances_observation": RUNS,
+                "get_flag_timeseries": RUNS,
+            },
+        )
+        self.assertEqual(
+            profile.functions["library.features.common.utils:get_parameter"].calls, 3 * RUNS
+        )
+        for module, stats in sorted(
+            profile.feature_modules().items(), key=lambda item: -item[1].total_time
+        ):
+            log.info(
+                f"{module}: {stats.calls / RUNS:.0f} calls, "
+                f"{stats.total_time / RUNS * 1e6:.1f}us total, "
+                f"{stats.self_time / RUNS * 1e6:.1f}us self per run"
+            )
@@ -0,0 +1,59 @@
+# standard libs
+import hashlib
+import json
+import os
+import tempfile
+from functools import lru_cache
+from pathlib import Path
+
+from linters.flake8.common import ErrorType
+
+DEFAULT_CACHE_DIR = ".contract_linter_cache"
+LINTERS_DIR = Path(__file__).resolve().parent.parent
+
+
+@lru_cache(maxsize=1)
+def linter_fingerprint() -> str:
+    """
+    Hash of the linter source code, so that cached results are invalidated whenever the rules
+    change
+    """
+    digest = hashlib.sha256()
+    for path in sorted((LINTERS_DIR / "flake8").glob("*.py")) + [
+        LINTERS_DIR / "flake8_contracts.py"
+    ]:
+        digest.update(path.read_bytes())
+    return digest.hexdigest()
+
+
+class LintResultCache:
+    """
+    On-disk cache of contract linter results keyed on the content hash of the linted file. Each
+    entry is stored in its own file so that concurrent flake8 workers never contend on a shared
+    index.
+    """
+
+    def __init__(self, cache_dir: str = DEFAULT_CACHE_DIR):
+        self.cache_dir = Path(cache_dir)
+
+    @staticmethod
+    def key(source: str) -> str:
+        return hashlib.sha256((linter_fingerprint() + source).encode()).hexdigest()
+
+    def _entry_path(self, key: str) -> Path:
+        return self.cache_dir / f"{key}.json"
+
+    def get(self, key: str) -> list[ErrorType] | None:
+        try:
+            entries = json.loads(self._entry_path(key).read_text())
+        except (OSError, ValueError):
+            return None
+        return [(line, col, msg) for line, col, msg in entries]
+
+    def set(self, key: str, results: list[ErrorType]) -> None:
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        # write to a temporary file first so that readers never see partially written entries
+        fd, temp_path = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+        with os.fdopen(fd, "w") as temp_file:
+            json.dump(results, temp_file)
+        os.replace(temp_path, self._entry_path(key))
@@ -0,0 +1,30 @@
+# standard libs
+import ast
+from typing import Any
+
+from linters.flake8.common import ErrorType
+from linters.flake8.dispatcher import ContractVisitor
+
+ERRORS_CTR012 = (
+    "CTR012 Do not deepcopy inside contracts (e.g. BalanceDefaultDict), build a new object instead"
+)
+
+
+class DeepcopyVisitor(ContractVisitor):
+    """
+    Raise an error if `deepcopy()`/`copy.deepcopy()` is used within a contract. Deep-copying
+    contract types such as BalanceDefaultDict recursively copies every Balance and is far more
+    expensive than constructing the required object
+    """
+
+    def __init__(self):
+        self.violations: list[ErrorType] = []
+
+    def visit_Call(self, node: ast.Call) -> Any:
+        if (isinstance(node.func, ast.Name) and node.func.id == "deepcopy") or (
+            isinstance(node.func, ast.Attribute)
+            and node.func.attr == "deepcopy"
+            and isinstance(node.func.value, ast.Name)
+            and node.func.value.id == "copy"
+        ):
+            self.violations.append((node.lineno, node.col_offset, ERRORS_CTR012))
@@ -0,0 +1,70 @@
+# standard libs
+import ast
+from typing import Callable, Iterable
+
+NodeHandler = Callable[[ast.AST], None]
+
+
+class ContractVisitor:
+    """
+    Base class for contract lint rules. Subclasses define `visit_<NodeType>` handlers that are
+    called when a node of that type is entered and optional `leave_<NodeType>` handlers that are
+    called once all of the node's children have been visited. Handlers must not recurse into
+    children themselves, as the traversal is owned by the VisitorDispatcher so that many visitors
+    can share a single walk of the tree.
+    """
+
+    def visit(self, tree: ast.AST) -> None:
+        """
+        Convenience method to run this visitor on its own
+        """
+        VisitorDispatcher([self]).run(tree)
+
+    def finalise(self) -> None:
+        """
+        Called once the traversal is complete, for visitors that need to resolve violations using
+        information gathered from the whole tree
+        """
+
+
+class VisitorDispatcher:
+    """
+    Walks an ast tree once, dispatching each node to the handlers registered by the visitors for
+    that node type.
+    """
+
+    def __init__(self, visitors: Iterable[ContractVisitor]):
+        self.visitors = list(visitors)
+        self._enter_handlers: dict[type, list[NodeHandler]] = {}
+        self._leave_handlers: dict[type, list[NodeHandler]] = {}
+        for visitor in self.visitors:
+            self._register(visitor)
+
+    def _register(self, visitor: ContractVisitor) -> None:
+        for attr_name in dir(visitor):
+            if attr_name.startswith("visit_"):
+                handlers = self._enter_handlers
+            elif attr_name.startswith("leave_"):
+                handlers = self._leave_handlers
+            else:
+                continue
+            node_type = getattr(ast, attr_name[6:], None)
+            if not (isinstance(node_type, type) and issubclass(node_type, ast.AST)):
+                raise ValueError(
+                    f"{type(visitor).__name__}.{attr_name} does not refer to an ast node type"
+                )
+            handlers.setdefault(node_type, []).append(getattr(visitor, attr_name))
+
+    def run(self, tree: ast.AST) -> None:
+        self._dispatch(tree)
+        for visitor in self.visitors:
+            visitor.finalise()
+
+    def _dispatch(self, node: ast.AST) -> None:
+        node_type = type(node)
+        for handler in self._enter_handlers.get(node_type, ()):
+            handler(node)
+        for child in ast.iter_child_nodes(node):
+            self._dispatch(child)
+        for handler in self._leave_handlers.get(node_type, ()):
+            handler(node)
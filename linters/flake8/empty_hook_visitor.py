@@ -7,11 +7,12 @@ from linters.flake8.common import (
     ErrorType,
     SmartContractFileType,
 )
+from linters.flake8.dispatcher import ContractVisitor
 
 ERRORS_CTR005 = "CTR005 do not add empty hooks to contracts"
 
 
-class EmptyHookVisitor(ast.NodeVisitor):
+class EmptyHookVisitor(ContractVisitor):
     """
     Raise an error if empty hooks are added to a contract/supervisor contract
     """
@@ -30,7 +31,6 @@ class EmptyHookVisitor(ast.NodeVisitor):
         # we could optimise and return early for non-contracts/supervisors
         if node.name in self.hook_mapping:
             self._raise_hook_errors(node)
-        self.generic_visit(node)
 
     def _raise_hook_errors(self, node: ast.FunctionDef) -> None:
         error = ERRORS_CTR005
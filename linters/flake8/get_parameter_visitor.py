@@ -3,6 +3,7 @@ import ast
 from typing import Any
 
 from linters.flake8.common import ErrorType
+from linters.flake8.dispatcher import ContractVisitor
 
 ERRORS_CTR006 = (
     "CTR006 Call 'utils.get_parameter()' with the parameter constant rather than hard-coded string"
@@ -11,7 +12,7 @@ ERRORS_CTR006 = (
 ERRORS_CTR006B = "CTR006B Pass parameter name as kwarg into 'utils.get_parameter()'"
 
 
-class GetParameterVisitor(ast.NodeVisitor):
+class GetParameterVisitor(ContractVisitor):
     """
     Raise an error if 'utils.get_parameter()' is called with name="string_name"
     rather than name=PARAM_NAME_CONSTANT
@@ -43,4 +44,3 @@ class GetParameterVisitor(ast.NodeVisitor):
 
             else:
                 self.violations.append((node.lineno, node.col_offset, ERRORS_CTR006B))
-        self.generic_visit(node)
@@ -3,13 +3,14 @@ import ast
 from typing import Any
 
 from linters.flake8.common import HOOK_FUNCTIONS, ErrorType
+from linters.flake8.dispatcher import ContractVisitor
 
 ERRORS_CTR002 = (
     "CTR002 List-type metadata objects should be extended using the unpacking operator (*)"
 )
 
 
-class ListMetadataVisitor(ast.NodeVisitor):
+class ListMetadataVisitor(ContractVisitor):
     """
     Raise an error if list-type metadata objects are extended not using the unpacking operator (*).
     This includes using .append(), .extend(), +=, list slicing, and modification within a root
@@ -26,61 +27,85 @@ class ListMetadataVisitor(ast.NodeVisitor):
         "data_fetchers",
     ]
 
-    def __init__(self, tree: ast.Module, contract_version: str):
-        self.tree = tree
+    def __init__(self, contract_version: str):
         self.version = contract_version
         self.violations: list[ErrorType] = []
         self.metadata_count = {obj: 0 for obj in self.METADATA_LISTS}
-        # track context name and set of names marked as `global`
+        # track context name and set of names marked as `global`. Function contexts include the
+        # function name as we only know whether they behave as global once the whole tree is visited
         self.context = ["global"]
-        # get a list of non-hook functions on instantiation
-        self.non_hook_non_helper_funcs = self.get_non_hook_non_helper_funcs()
-
-    def get_non_hook_non_helper_funcs(self) -> set:
-        all_functions = set(n.name for n in ast.walk(self.tree) if isinstance(n, ast.FunctionDef))
-
+        # metadata object references and the context they were found in, resolved in finalise()
+        self._metadata_references: list[tuple[ast.Name, str]] = []
+        self._all_functions: set[str] = set()
+        # functions called from within each root level function, in order of definition
+        self._root_function_calls: list[tuple[str, list[str]]] = []
+        self._root_level_nodes: set[int] = set()
+        self._current_root_function: ast.FunctionDef | None = None
+        self.non_hook_non_helper_funcs: set[str] = set()
+
+    def finalise(self) -> None:
         hook_and_helper_functions = HOOK_FUNCTIONS.copy()
-        for node in self.tree.body:
-            if isinstance(node, ast.FunctionDef) and node.name in hook_and_helper_functions:
-                called_functions = [
-                    n.func.id
-                    for n in ast.walk(node)
-                    if (isinstance(n, ast.Call) and isinstance(n.func, ast.Name))
-                ]
+        for function_name, called_functions in self._root_function_calls:
+            if function_name in hook_and_helper_functions:
                 # add called functions to set of hook & helper functions
                 hook_and_helper_functions.update(called_functions)
 
         # return only functions that are not hooks and not hook-helpers
-        return all_functions - hook_and_helper_functions
+        self.non_hook_non_helper_funcs = self._all_functions - hook_and_helper_functions
+        for node, context in self._metadata_references:
+            # consider non-hook/non-helper functions as in the global space
+            if context == "global" or (
+                context.startswith("function:")
+                and context.removeprefix("function:") in self.non_hook_non_helper_funcs
+            ):
+                self.metadata_count[node.id] += 1
+                if self.metadata_count[node.id] > 1:
+                    self.violations.append((node.lineno, node.col_offset, ERRORS_CTR002))
+
+    def visit_Module(self, node: ast.Module) -> Any:
+        self._root_level_nodes = {id(statement) for statement in node.body}
 
     def visit_Name(self, node: ast.Name) -> Any:
         # only check global level changes to list-type metadata objects
-        if node.id in self.METADATA_LISTS and self.context[-1] == "global":
-            self.metadata_count[node.id] += 1
-            if self.metadata_count[node.id] > 1:
-                self.violations.append((node.lineno, node.col_offset, ERRORS_CTR002))
-        self.generic_visit(node)
+        if node.id in self.METADATA_LISTS:
+            self._metadata_references.append((node, self.context[-1]))
+
+    def visit_Call(self, node: ast.Call) -> Any:
+        if self._current_root_function is not None and isinstance(node.func, ast.Name):
+            self._root_function_calls[-1][1].append(node.func.id)
 
     def visit_FunctionDef(self, node: ast.FunctionDef) -> Any:
-        if node.name in self.non_hook_non_helper_funcs:
-            # consider non-hook/non-helper functions as in the global space
-            self._non_global_logic(node, "global")
-        else:
-            self._non_global_logic(node, "function")
+        self._all_functions.add(node.name)
+        if id(node) in self._root_level_nodes:
+            self._current_root_function = node
+            self._root_function_calls.append((node.name, []))
+        self.context.append(f"function:{node.name}")
+
+    def leave_FunctionDef(self, node: ast.FunctionDef) -> Any:
+        if node is self._current_root_function:
+            self._current_root_function = None
+        self.context.pop()
 
     def visit_AsyncFunctionDef(self, node: ast.AsyncFunctionDef) -> Any:
-        self._non_global_logic(node, "async_function")
+        self.context.append("async_function")
 
     def visit_ClassDef(self, node: ast.ClassDef) -> Any:
-        self._non_global_logic(node, "class")
+        self.context.append("class")
 
     def visit_Lambda(self, node: ast.Lambda) -> Any:
-        self._non_global_logic(node, "lambda")
+        self.context.append("lambda")
 
     def visit_For(self, node: ast.For) -> Any:
-        self._non_global_logic(node, "for")
+        self.context.append("for")
+
+    def leave_AsyncFunctionDef(self, node: ast.AsyncFunctionDef) -> Any:
+        self.context.pop()
+
+    def leave_ClassDef(self, node: ast.ClassDef) -> Any:
+        self.context.pop()
+
+    def leave_Lambda(self, node: ast.Lambda) -> Any:
+        self.context.pop()
 
-    def _non_global_logic(self, node, context: str) -> Any:
-        self.context.append(context)
-        self.generic_visit(node)
+    def leave_For(self, node: ast.For) -> Any:
         self.context.pop()
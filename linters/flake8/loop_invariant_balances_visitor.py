@@ -0,0 +1,112 @@
+# standard libs
+import ast
+from dataclasses import dataclass, field
+from typing import Any
+
+from linters.flake8.common import ErrorType
+from linters.flake8.dispatcher import ContractVisitor
+
+ERRORS_CTR011 = (
+    "CTR011 Do not call .balances() on the same posting instruction inside a loop, "
+    "compute the balances once before the loop"
+)
+
+
+@dataclass
+class _Loop:
+    # names (re)bound on each iteration, either as loop targets or by assignment in the loop
+    bound_names: set[str] = field(default_factory=set)
+    # ids of nodes that are only evaluated once, before the first iteration
+    evaluated_once: set[int] = field(default_factory=set)
+    # `<name>.balances()` calls executed on each iteration of this loop
+    balances_calls: list[tuple[ast.Call, str]] = field(default_factory=list)
+
+
+class LoopInvariantBalancesVisitor(ContractVisitor):
+    """
+    Raise an error if `<posting_instruction>.balances()` is called inside a loop or comprehension
+    on a posting instruction that does not change between iterations. Each call recomputes the
+    balances for every posting in the instruction.
+    """
+
+    def __init__(self):
+        self.violations: list[ErrorType] = []
+        self.loops: list[_Loop] = []
+
+    def finalise(self) -> None:
+        self.violations.sort()
+
+    def _enter_loop(self, evaluated_once: ast.AST | None = None) -> None:
+        loop = _Loop()
+        if evaluated_once is not None:
+            loop.evaluated_once = {id(node) for node in ast.walk(evaluated_once)}
+        self.loops.append(loop)
+
+    def _leave_loop(self) -> None:
+        loop = self.loops.pop()
+        for call, name in loop.balances_calls:
+            if name not in loop.bound_names:
+                self.violations.append((call.lineno, call.col_offset, ERRORS_CTR011))
+        if self.loops:
+            # names rebound in a nested loop also change between iterations of the outer loop
+            self.loops[-1].bound_names.update(loop.bound_names)
+
+    def visit_Name(self, node: ast.Name) -> Any:
+        if self.loops and isinstance(node.ctx, ast.Store):
+            self.loops[-1].bound_names.add(node.id)
+
+    def visit_Call(self, node: ast.Call) -> Any:
+        if (
+            isinstance(node.func, ast.Attribute)
+            and node.func.attr == "balances"
+            and isinstance(node.func.value, ast.Name)
+            and not node.args
+            and not node.keywords
+        ):
+            # the call belongs to the innermost loop that evaluates it on each iteration
+            for loop in reversed(self.loops):
+                if id(node) not in loop.evaluated_once:
+                    loop.balances_calls.append((node, node.func.value.id))
+                    break
+
+    def visit_For(self, node: ast.For) -> Any:
+        self._enter_loop(evaluated_once=node.iter)
+
+    def visit_AsyncFor(self, node: ast.AsyncFor) -> Any:
+        self._enter_loop(evaluated_once=node.iter)
+
+    def visit_While(self, node: ast.While) -> Any:
+        self._enter_loop()
+
+    def visit_ListComp(self, node: ast.ListComp) -> Any:
+        self._enter_loop(evaluated_once=node.generators[0].iter)
+
+    def visit_SetComp(self, node: ast.SetComp) -> Any:
+        self._enter_loop(evaluated_once=node.generators[0].iter)
+
+    def visit_DictComp(self, node: ast.DictComp) -> Any:
+        self._enter_loop(evaluated_once=node.generators[0].iter)
+
+    def visit_GeneratorExp(self, node: ast.GeneratorExp) -> Any:
+        self._enter_loop(evaluated_once=node.generators[0].iter)
+
+    def leave_For(self, node: ast.For) -> Any:
+        self._leave_loop()
+
+    def leave_AsyncFor(self, node: ast.AsyncFor) -> Any:
+        self._leave_loop()
+
+    def leave_While(self, node: ast.While) -> Any:
+        self._leave_loop()
+
+    def leave_ListComp(self, node: ast.ListComp) -> Any:
+        self._leave_loop()
+
+    def leave_SetComp(self, node: ast.SetComp) -> Any:
+        self._leave_loop()
+
+    def leave_DictComp(self, node: ast.DictComp) -> Any:
+        self._leave_loop()
+
+    def leave_GeneratorExp(self, node: ast.GeneratorExp) -> Any:
+        self._leave_loop()
@@ -3,11 +3,12 @@ import ast
 from typing import Any
 
 from linters.flake8.common import ErrorType
+from linters.flake8.dispatcher import ContractVisitor
 
 ERRORS_CTR009 = "CTR009 set value_datetime on PID/PIB by default"
 
 
-class PidVisitor(ast.NodeVisitor):
+class PidVisitor(ContractVisitor):
     """
     Raise an error if PostingInstructionDirective don't set value_datetime
     """
@@ -21,4 +22,3 @@ class PidVisitor(ast.NodeVisitor):
         }:
             if not any(kw.arg == "value_datetime" for kw in node.keywords):
                 self.violations.append((node.lineno, node.col_offset, ERRORS_CTR009))
-        self.generic_visit(node)
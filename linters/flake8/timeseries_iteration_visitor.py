@@ -0,0 +1,40 @@
+# standard libs
+import ast
+from typing import Any
+
+from linters.flake8.common import ErrorType
+from linters.flake8.dispatcher import ContractVisitor
+
+ERRORS_CTR010 = (
+    "CTR010 Do not iterate over a full Timeseries inside contracts, use .at()/.before()/.latest()"
+)
+
+
+class TimeseriesIterationVisitor(ContractVisitor):
+    """
+    Raise an error if a loop or comprehension iterates over `<timeseries>.all()`, which
+    materialises every entry in the timeseries on each hook execution
+    """
+
+    def __init__(self):
+        self.violations: list[ErrorType] = []
+
+    @staticmethod
+    def _is_all_call(node: ast.expr) -> bool:
+        return (
+            isinstance(node, ast.Call)
+            and isinstance(node.func, ast.Attribute)
+            and node.func.attr == "all"
+            and not node.args
+            and not node.keywords
+        )
+
+    def _check_iterable(self, node: ast.expr) -> None:
+        if self._is_all_call(node):
+            self.violations.append((node.lineno, node.col_offset, ERRORS_CTR010))
+
+    def visit_For(self, node: ast.For) -> Any:
+        self._check_iterable(node.iter)
+
+    def visit_comprehension(self, node: ast.comprehension) -> Any:
+        self._check_iterable(node.iter)
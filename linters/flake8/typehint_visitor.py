@@ -7,12 +7,13 @@ from linters.flake8.common import (
     ErrorType,
     SmartContractFileType,
 )
+from linters.flake8.dispatcher import ContractVisitor
 
 ERRORS_CTR003 = "CTR003 Typehints should be used"
 ERRORS_CTR004 = f"{ERRORS_CTR003[:5]}4{ERRORS_CTR003[6:]}"
 
 
-class TypehintVisitor(ast.NodeVisitor):
+class TypehintVisitor(ContractVisitor):
     """
     Raise an error if typehints are missing
     """
@@ -32,7 +33,6 @@ class TypehintVisitor(ast.NodeVisitor):
 
     def visit_FunctionDef(self, node: ast.FunctionDef):
         self._generate_errors(node)
-        self.generic_visit(node)
 
     def _generate_errors(
         self,
@@ -0,0 +1,35 @@
+# standard libs
+import ast
+from typing import Any
+
+from linters.flake8.common import ErrorType
+from linters.flake8.dispatcher import ContractVisitor
+
+ERRORS_CTR013 = (
+    "CTR013 Pass a fetcher_id when retrieving client transactions/posting instructions "
+    "rather than iterating over the full history"
+)
+
+
+class UnboundedFetchVisitor(ContractVisitor):
+    """
+    Raise an error if `vault.get_client_transactions()` or `vault.get_posting_instructions()` is
+    called without a `fetcher_id`. Without a fetcher the hook receives every client transaction in
+    the `@requires` window, which grows with the account's activity
+    """
+
+    UNBOUNDED_FETCH_METHODS = {"get_client_transactions", "get_posting_instructions"}
+
+    def __init__(self):
+        self.violations: list[ErrorType] = []
+
+    def visit_Call(self, node: ast.Call) -> Any:
+        if (
+            isinstance(node.func, ast.Attribute)
+            and node.func.attr in self.UNBOUNDED_FETCH_METHODS
+            and isinstance(node.func.value, ast.Name)
+            and node.func.value.id.endswith("vault")
+            # a `**kwargs` keyword has no arg and may contain the fetcher_id
+            and not any(kw.arg in {"fetcher_id", None} for kw in node.keywords)
+        ):
+            self.violations.append((node.lineno, node.col_offset, ERRORS_CTR013))
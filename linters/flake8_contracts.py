@@ -2,15 +2,21 @@
 import ast
 from typing import Any, Generator, Type
 
-from linters.flake8.common import SUPERVISOR_TYPES, SmartContractFileType
+from linters.flake8.cache import DEFAULT_CACHE_DIR, LintResultCache
+from linters.flake8.common import SUPERVISOR_TYPES, ErrorType, SmartContractFileType
 from linters.flake8.datetime_visitor import DatetimeVisitor
+from linters.flake8.deepcopy_visitor import DeepcopyVisitor
+from linters.flake8.dispatcher import ContractVisitor, VisitorDispatcher
 from linters.flake8.empty_hook_visitor import EmptyHookVisitor
 from linters.flake8.get_parameter_visitor import GetParameterVisitor
 from linters.flake8.list_metadata_visitor import ListMetadataVisitor
+from linters.flake8.loop_invariant_balances_visitor import LoopInvariantBalancesVisitor
 from linters.flake8.parameter_display_name_visitor import ParameterDisplayNameVisitor
 from linters.flake8.parameter_name_visitor import ParameterNameVisitor
 from linters.flake8.pid_visitor import PidVisitor
+from linters.flake8.timeseries_iteration_visitor import TimeseriesIterationVisitor
 from linters.flake8.typehint_visitor import TypehintVisitor
+from linters.flake8.unbounded_fetch_visitor import UnboundedFetchVisitor
 
 # inception sdk
 from inception_sdk.vault.contracts.utils import (
@@ -25,9 +31,13 @@ class ContractLinter(object):
     name = "flake8_contracts"
     version = __version__
 
-    def __init__(self, tree, filename=""):
+    # set by parse_options when running as a flake8 plugin
+    cache: LintResultCache | None = None
+
+    def __init__(self, tree, filename="", lines=None):
         self.tree: ast.Module = tree
         self.filename: str = filename
+        self.lines: list[str] | None = lines
         self.contract_file_type = self._determine_type()
         self._contract_version = "4"
 
@@ -61,61 +71,93 @@ class ContractLinter(object):
         else:
             return SmartContractFileType.CONTRACT
 
-    def run(self) -> Generator[tuple[int, int, str, Type[Any]], None, None]:
+    @classmethod
+    def add_options(cls, option_manager: Any) -> None:
+        option_manager.add_option(
+            "--contract-linter-cache-dir",
+            default=DEFAULT_CACHE_DIR,
+            parse_from_config=True,
+            help="Directory used to cache contract linter results keyed on file content hash",
+        )
+        option_manager.add_option(
+            "--no-contract-linter-cache",
+            action="store_true",
+            default=False,
+            parse_from_config=True,
+            help="Disable caching of contract linter results",
+        )
+
+    @classmethod
+    def parse_options(cls, options: Any) -> None:
+        cls.cache = (
+            None
+            if options.no_contract_linter_cache
+            else LintResultCache(options.contract_linter_cache_dir)
+        )
+
+    def _get_visitors(self) -> list[ContractVisitor]:
+        # Checks for CTR001
+        visitors: list[ContractVisitor] = [DatetimeVisitor()]
+
+        # Checks for CTR002
+        visitors.append(ListMetadataVisitor(contract_version=self._contract_version))
+
+        # Checks for CTR003-4
+        visitors.append(TypehintVisitor(contract_file_type=self.contract_file_type))
+
+        # Checks for CTR005
+        if self.contract_file_type in {
+            SmartContractFileType.SUPERVISOR_CONTRACT,
+            SmartContractFileType.CONTRACT,
+        }:
+            visitors.append(EmptyHookVisitor(contract_file_type=self.contract_file_type))
+
+        # Checks for CTR006
+        if self.contract_file_type == SmartContractFileType.CONTRACT:
+            visitors.append(GetParameterVisitor())
+
+        # Checks for CTR007
+        if self._contract_version == "4":
+            visitors.append(ParameterNameVisitor())
+
+        # Checks for CTR008
+        visitors.append(ParameterDisplayNameVisitor())
+
+        # Checks for CTR009
+        visitors.append(PidVisitor())
+
+        # Checks for CTR010-13
+        visitors.extend(
+            [
+                TimeseriesIterationVisitor(),
+                LoopInvariantBalancesVisitor(),
+                DeepcopyVisitor(),
+                UnboundedFetchVisitor(),
+            ]
+        )
+
+        return visitors
+
+    def _lint(self) -> list[ErrorType]:
         # Check if this is looks like a contract file
-        if self.contract_file_type is not SmartContractFileType.UNKNOWN:
-            # Checks for CTR001
-            datetime_visitor = DatetimeVisitor()
-            datetime_visitor.visit(self.tree)
-            for line, col, msg in datetime_visitor.violations:
-                yield line, col, msg, type(self)
-
-            # Checks for CTR002
-            list_metadata_visitor = ListMetadataVisitor(
-                self.tree, contract_version=self._contract_version
-            )
-            list_metadata_visitor.visit(self.tree)
-            for line, col, msg in list_metadata_visitor.violations:
-                yield line, col, msg, type(self)
-
-            # Checks for CTR003-4
-            typehint_visitor = TypehintVisitor(contract_file_type=self.contract_file_type)
-            typehint_visitor.visit(self.tree)
-            for line, col, msg in typehint_visitor.violations:
-                yield line, col, msg, type(self)
-
-            # Checks for CTR005
-            if self.contract_file_type in {
-                SmartContractFileType.SUPERVISOR_CONTRACT,
-                SmartContractFileType.CONTRACT,
-            }:
-                empty_hook_visitor = EmptyHookVisitor(contract_file_type=self.contract_file_type)
-                empty_hook_visitor.visit(self.tree)
-                for line, col, msg in empty_hook_visitor.violations:
-                    yield line, col, msg, type(self)
-
-            # Checks for CTR006
-            if self.contract_file_type == SmartContractFileType.CONTRACT:
-                get_parameter_visitor = GetParameterVisitor()
-                get_parameter_visitor.visit(self.tree)
-                for line, col, msg in get_parameter_visitor.violations:
-                    yield line, col, msg, type(self)
-
-            # Checks for CTR007
-            if self._contract_version == "4":
-                parameter_name_visitor = ParameterNameVisitor()
-                parameter_name_visitor.visit(self.tree)
-                for line, col, msg in parameter_name_visitor.violations:
-                    yield line, col, msg, type(self)
-
-            # Checks for CTR008
-            parameter_display_name_visitor = ParameterDisplayNameVisitor()
-            parameter_display_name_visitor.visit(self.tree)
-            for line, col, msg in parameter_display_name_visitor.violations:
-                yield line, col, msg, type(self)
-
-            # Checks for CTR009
-            pid_visitor = PidVisitor()
-            pid_visitor.visit(self.tree)
-            for line, col, msg in pid_visitor.violations:
-                yield line, col, msg, type(self)
+        if self.contract_file_type is SmartContractFileType.UNKNOWN:
+            return []
+
+        # All visitors share a single traversal of the tree
+        visitors = self._get_visitors()
+        VisitorDispatcher(visitors).run(self.tree)
+        return [violation for visitor in visitors for violation in visitor.violations]
+
+    def run(self) -> Generator[tuple[int, int, str, Type[Any]], None, None]:
+        # flake8 only provides the lines when running as a plugin, so results are only cached then
+        if self.cache is None or self.lines is None:
+            violations = self._lint()
+        else:
+            cache_key = self.cache.key("".join(self.lines))
+            violations = self.cache.get(cache_key)
+            if violations is None:
+                violations = self._lint()
+                self.cache.set(cache_key, violations)
+
+        for line, col, msg in violations:
+            yield line, col, msg, type(self)
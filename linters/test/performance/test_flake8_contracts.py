@@ -0,0 +1,83 @@
+# standard libs
+import ast
+import tempfile
+from pathlib import Path
+from unittest import TestCase
+from unittest.mock import patch
+
+from linters.flake8.cache import LintResultCache
+from linters.flake8.dispatcher import VisitorDispatcher
+from linters.flake8_contracts import ContractLinter, SmartContractFileType
+
+# inception sdk
+from inception_sdk.test_framework.common.benchmark import run_benchmark
+
+LIBRARY_DIR = Path("library")
+
+
+class ContractLinterPerformanceTest(TestCase):
+    """
+    Lints every python file in the library to ensure the cost of linting grows with the size of the
+    library rather than with the number of rules, and that unchanged files are not re-linted when
+    results are cached.
+    """
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.files: dict[str, tuple[ast.Module, list[str]]] = {}
+        for path in sorted(LIBRARY_DIR.rglob("*.py")):
+            source = path.read_text()
+            cls.files[str(path)] = (ast.parse(source), source.splitlines(keepends=True))
+
+    def setUp(self) -> None:
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.temp_dir.cleanup)
+
+    def _lint_library(self, cache: LintResultCache | None) -> dict[str, list]:
+        results = {}
+        with patch.object(ContractLinter, "cache", cache):
+            for filename, (tree, lines) in self.files.items():
+                linter = ContractLinter(tree, filename=filename, lines=lines)
+                results[filename] = list(linter.run())
+        return results
+
+    def test_each_node_is_dispatched_once(self):
+        expected_node_count = 0
+        for filename, (tree, _) in self.files.items():
+            if ContractLinter(tree, filename).contract_file_type != SmartContractFileType.UNKNOWN:
+                expected_node_count += sum(1 for _ in ast.walk(tree))
+
+        with patch.object(
+            VisitorDispatcher,
+            "_dispatch",
+            autospec=True,
+            side_effect=VisitorDispatcher._dispatch,
+        ) as mock_dispatch:
+            self._lint_library(cache=None)
+
+        self.assertGreater(expected_node_count, 0)
+        self.assertEqual(mock_dispatch.call_count, expected_node_count)
+
+    def test_unchanged_files_are_not_relinted(self):
+        cache = LintResultCache(self.temp_dir.name)
+        uncached_results = self._lint_library(cache=None)
+        cold_results = self._lint_library(cache=cache)
+
+        with patch.object(VisitorDispatcher, "run") as mock_run:
+            warm_results = self._lint_library(cache=cache)
+
+        mock_run.assert_not_called()
+        self.assertDictEqual(cold_results, uncached_results)
+        self.assertDictEqual(warm_results, uncached_results)
+
+    def test_benchmark_library(self):
+        cache = LintResultCache(self.temp_dir.name)
+        uncached = run_benchmark(
+            "lint library without cache", lambda: self._lint_library(cache=None), repeat=3
+        )
+        # populate the cache before timing warm runs
+        self._lint_library(cache=cache)
+        warm = run_benchmark(
+            "lint library with warm cache", lambda: self._lint_library(cache=cache), repeat=3
+        )
+        self.assertDictEqual(warm.return_value, uncached.return_value)
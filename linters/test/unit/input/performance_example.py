@@ -0,0 +1,52 @@
+# Copyright @ 2021 Thought Machine Group Limited. All rights reserved.
+# standard libs
+import copy
+from copy import deepcopy
+
+# contracts api
+from contracts_api import BalanceDefaultDict
+
+
+def timeseries_iteration(vault, timeseries):
+    for entry in timeseries.all():
+        print(entry)
+    values = [entry.value for entry in vault.get_parameter_timeseries(name="param").all()]
+    latest = timeseries.latest()  # fine, only the latest entry is retrieved
+    entries = timeseries.all()  # fine, not iterated over
+    return values, latest, entries
+
+
+def loop_invariant_balances(postings, posting, denomination):
+    total = BalanceDefaultDict()
+    for coordinate in posting.balances():  # fine, evaluated once before the loop
+        print(coordinate)
+    for other_posting in postings:
+        total += other_posting.balances()  # fine, a different posting on each iteration
+        print(posting.balances())
+    amounts = [posting.balances()[key] for key in denomination]
+    while postings:
+        current = postings.pop()
+        print(current.balances())  # fine, rebound on each iteration
+        print(posting.balances())
+    for other_posting in postings:
+        for _ in range(2):
+            print(other_posting.balances())
+    return total, amounts
+
+
+def deepcopy_balances(balances: BalanceDefaultDict):
+    copied_balances = deepcopy(balances)
+    other_copied_balances = copy.deepcopy(balances)
+    shallow_copy = copy.copy(balances)  # fine, not a deepcopy
+    return copied_balances, other_copied_balances, shallow_copy
+
+
+def unbounded_fetch(vault, supervisee_vault):
+    client_transactions = vault.get_client_transactions()
+    posting_instructions = vault.get_posting_instructions()
+    supervisee_transactions = supervisee_vault.get_client_transactions()
+    bounded_transactions = vault.get_client_transactions(fetcher_id="fetcher")  # fine
+    return client_transactions, posting_instructions, supervisee_transactions, bounded_transactions
+
+
+# flake8: noqa
@@ -4,11 +4,15 @@ import unittest
 from collections import defaultdict
 
 from linters.flake8.datetime_visitor import ERRORS_CTR001
+from linters.flake8.deepcopy_visitor import ERRORS_CTR012
 from linters.flake8.empty_hook_visitor import EmptyHookVisitor
 from linters.flake8.get_parameter_visitor import ERRORS_CTR006, ERRORS_CTR006B, GetParameterVisitor
 from linters.flake8.list_metadata_visitor import ERRORS_CTR002, ListMetadataVisitor
+from linters.flake8.loop_invariant_balances_visitor import ERRORS_CTR011
 from linters.flake8.pid_visitor import ERRORS_CTR009, PidVisitor
+from linters.flake8.timeseries_iteration_visitor import ERRORS_CTR010
 from linters.flake8.typehint_visitor import ERRORS_CTR003, ERRORS_CTR004
+from linters.flake8.unbounded_fetch_visitor import ERRORS_CTR013
 from linters.flake8_contracts import ContractLinter, SmartContractFileType
 
 # inception sdk
@@ -20,6 +24,7 @@ CONTRACT_FILE = "linters/test/unit/input/dummy_contract.py"
 FEATURE_FILE = "linters/test/unit/input/dummy_feature.py"
 GET_PARAMETER_EXAMPLE_FILE = "linters/test/unit/input/get_parameter_example.py"
 PID_EXAMPLE_FILE = "linters/test/unit/input/pid_example.py"
+PERFORMANCE_EXAMPLE_FILE = "linters/test/unit/input/performance_example.py"
 
 
 class SupervisorLinterTest(unittest.TestCase):
@@ -203,7 +208,7 @@ class ListMetadataVisitorTest(unittest.TestCase):
     @classmethod
     def setUpClass(cls):
         tree = ast.parse(load_file_contents(CONTRACT_FILE))
-        cls.visitor = ListMetadataVisitor(tree, contract_version="3")
+        cls.visitor = ListMetadataVisitor(contract_version="3")
         cls.outputs = defaultdict(lambda: [])
         cls.visitor.visit(tree)
         for line, col, msg in cls.visitor.violations:
@@ -253,6 +258,54 @@ class PidVisitorTest(unittest.TestCase):
         self.assertListEqual(ctr009_errors, expected_errors)
 
 
+class PerformanceLinterTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        tree = ast.parse(load_file_contents(PERFORMANCE_EXAMPLE_FILE))
+        cls.linter = ContractLinter(tree)
+        cls.outputs = defaultdict(lambda: [])
+        for line, col, msg, _ in cls.linter.run():
+            cls.outputs[msg].append({"line": line, "col": col})
+
+    def test_file_is_linted_as_feature(self):
+        self.assertEqual(self.linter.contract_file_type, SmartContractFileType.FEATURE)
+
+    def test_ctr010_timeseries_iteration(self):
+        ctr010_errors = self.outputs[ERRORS_CTR010]
+        expected_errors = [
+            {"line": 11, "col": 17},  # for loop over .all()
+            {"line": 13, "col": 39},  # comprehension over .all()
+        ]
+        self.assertListEqual(ctr010_errors, expected_errors)
+
+    def test_ctr011_loop_invariant_balances(self):
+        ctr011_errors = self.outputs[ERRORS_CTR011]
+        expected_errors = [
+            {"line": 25, "col": 14},  # for loop
+            {"line": 26, "col": 15},  # comprehension
+            {"line": 30, "col": 14},  # while loop
+            {"line": 33, "col": 18},  # posting only rebound by outer loop
+        ]
+        self.assertListEqual(ctr011_errors, expected_errors)
+
+    def test_ctr012_deepcopy(self):
+        ctr012_errors = self.outputs[ERRORS_CTR012]
+        expected_errors = [
+            {"line": 38, "col": 22},  # deepcopy()
+            {"line": 39, "col": 28},  # copy.deepcopy()
+        ]
+        self.assertListEqual(ctr012_errors, expected_errors)
+
+    def test_ctr013_unbounded_fetch(self):
+        ctr013_errors = self.outputs[ERRORS_CTR013]
+        expected_errors = [
+            {"line": 45, "col": 26},  # client transactions without fetcher
+            {"line": 46, "col": 27},  # posting instructions without fetcher
+            {"line": 47, "col": 30},  # supervisee vault
+        ]
+        self.assertListEqual(ctr013_errors, expected_errors)
+
+
 class EmptyHookVistorTest(unittest.TestCase):
     def test_empty_hook_visitor_raises_if_not_contract_or_supervisor(self):
         with self.assertRaises(ValueError):